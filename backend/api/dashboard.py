@@ -7,8 +7,8 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import func, case
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from backend.db.session import SessionLocal
@@ -16,6 +16,8 @@ from backend.db.models.news import NewsArticle
 from backend.db.models.stock import Stock, StockPrice
 from backend.db.models.market_data import StockCurrentPrice, InvestorTrading, StockInfo
 from backend.db.models.prediction import Prediction
+from backend.services.signal_rollup import get_signal_counts, get_top_signal_stocks
+from backend.services.response_cache import TAG_DASHBOARD, get_response_cache
 from backend.scheduler.crawler_scheduler import get_crawler_scheduler
 
 
@@ -34,12 +36,23 @@ def get_db():
 
 
 @router.get("/dashboard/summary")
-async def get_dashboard_summary(db: Session = Depends(get_db)):
+async def get_dashboard_summary(request: Request, db: Session = Depends(get_db)):
     """
     대시보드 요약 통계
 
     오늘의 예측 수, 평균 신뢰도, 총 예측 건수, 예측 방향 분포 등을 반환합니다.
+    (응답 캐시: 시장 단계별 TTL, 뉴스/예측 저장 시 무효화)
     """
+    return await get_response_cache().respond(
+        request,
+        key="dashboard:summary",
+        compute=lambda: _build_dashboard_summary(db),
+        tags=(TAG_DASHBOARD,),
+    )
+
+
+async def _build_dashboard_summary(db: Session) -> Dict[str, Any]:
+    """대시보드 요약 통계 계산"""
     try:
         # 오늘 날짜 (UTC 기준)
         today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
@@ -278,12 +291,38 @@ async def check_data_availability(db: Session = Depends(get_db)):
 
 
 @router.get("/dashboard/market-momentum")
-async def get_market_momentum(db: Session = Depends(get_db)):
+async def get_market_momentum(request: Request, db: Session = Depends(get_db)):
     """
     실시간 시장 모멘텀 데이터 (KIS API 기반)
 
     급등/급락 종목, 투자자 동향, AI 시그널 등을 반환합니다.
+    (응답 캐시: 시장 단계별 TTL, 뉴스/예측 저장 시 무효화)
     """
+    try:
+        return await get_response_cache().respond(
+            request,
+            key="dashboard:market-momentum",
+            compute=lambda: _build_market_momentum(db),
+            tags=(TAG_DASHBOARD,),
+        )
+    except Exception:
+        # 에러 시 빈 데이터 반환 (캐시하지 않음 - 일시적인 KIS 오류가 TTL 동안 유지되지 않도록)
+        return _empty_market_momentum()
+
+
+def _empty_market_momentum() -> Dict[str, Any]:
+    """시장 모멘텀 조회 실패 시 응답"""
+    return {
+        'top_gainers': [],
+        'top_losers': [],
+        'foreign_buying': [],
+        'institution_buying': [],
+        'sector_trends': []
+    }
+
+
+async def _build_market_momentum(db: Session) -> Dict[str, Any]:
+    """시장 모멘텀 데이터 계산 (KIS API + AI 시그널 집계)"""
     try:
         from backend.crawlers.kis_client import get_kis_client
         from backend.utils.stock_mapping import get_stock_mapper
@@ -299,26 +338,20 @@ async def get_market_momentum(db: Session = Depends(get_db)):
             sort_type="4"   # 변동율 (변동폭이 큰 순서)
         )
 
+        movers = movers_response.get("output", []) if movers_response.get("rt_cd") == "0" else []
+
+        # AI 시그널 조회 (집계 테이블 IN 조회 1회)
+        signal_counts = get_signal_counts(db, [stock["stck_shrn_iscd"] for stock in movers])
+
         def process_stock(stock):
             """종목 데이터 처리"""
             stock_code = stock["stck_shrn_iscd"]
             change_rate = float(stock["prdy_ctrt"])
 
-            # AI 시그널 조회 (우리 DB)
-            positive_signals = db.query(func.count(Prediction.id)).filter(
-                Prediction.stock_code == stock_code,
-                Prediction.sentiment_direction == 'positive'
-            ).scalar() or 0
-
-            negative_signals = db.query(func.count(Prediction.id)).filter(
-                Prediction.stock_code == stock_code,
-                Prediction.sentiment_direction == 'negative'
-            ).scalar() or 0
-
-            avg_sentiment = db.query(func.avg(Prediction.sentiment_score)).filter(
-                Prediction.stock_code == stock_code,
-                Prediction.sentiment_score.isnot(None)
-            ).scalar()
+            signals = signal_counts.get(stock_code, {})
+            positive_signals = signals.get("positive", 0)
+            negative_signals = signals.get("negative", 0)
+            avg_sentiment = signals.get("avg_sentiment")
 
             return {
                 'stock_code': stock_code,
@@ -332,10 +365,7 @@ async def get_market_momentum(db: Session = Depends(get_db)):
             }
 
         # 변동율순 데이터를 급등/급락으로 분리
-        all_movers = []
-        if movers_response.get("rt_cd") == "0":
-            for stock in movers_response.get("output", []):
-                all_movers.append(process_stock(stock))
+        all_movers = [process_stock(stock) for stock in movers]
 
         # 급등/급락 분리
         gainers = sorted([m for m in all_movers if m['change_rate'] > 0],
@@ -383,33 +413,16 @@ async def get_market_momentum(db: Session = Depends(get_db)):
                                 key=lambda x: x[1]['amount'], reverse=True)[:3]
 
         # 3. AI 시그널이 많은 종목 TOP 5 (섹터 대신)
-        # 전체 기간 AI 시그널 많은 종목
-        signal_counts = db.query(
-            Prediction.stock_code,
-            func.count(Prediction.id).label('total'),
-            func.sum(case(
-                (Prediction.sentiment_direction == 'positive', 1),
-                else_=0
-            )).label('positive'),
-            func.sum(case(
-                (Prediction.sentiment_direction == 'negative', 1),
-                else_=0
-            )).label('negative')
-        ).group_by(
-            Prediction.stock_code
-        ).order_by(
-            func.count(Prediction.id).desc()
-        ).limit(5).all()
-
+        # 전체 기간 AI 시그널 많은 종목 (집계 테이블 기준)
         sector_trends = []
-        for row in signal_counts:
-            stock_name = stock_mapper.get_company_name(row.stock_code)
-            sentiment = 'positive' if row.positive > row.negative else 'negative'
+        for row in get_top_signal_stocks(db, limit=5):
+            stock_name = stock_mapper.get_company_name(row['stock_code'])
+            sentiment = 'positive' if row['positive'] > row['negative'] else 'negative'
             sector_trends.append({
-                'sector': stock_name or row.stock_code,  # 종목명을 섹터처럼 표시
-                'positive_signals': row.positive or 0,
-                'negative_signals': row.negative or 0,
-                'total_signals': row.total,
+                'sector': stock_name or row['stock_code'],  # 종목명을 섹터처럼 표시
+                'positive_signals': row['positive'],
+                'negative_signals': row['negative'],
+                'total_signals': row['total'],
                 'sentiment': sentiment
             })
 
@@ -429,14 +442,7 @@ async def get_market_momentum(db: Session = Depends(get_db)):
 
     except Exception as e:
         logger.error(f"시장 모멘텀 조회 실패: {e}", exc_info=True)
-        # 에러 시 빈 데이터 반환
-        return {
-            'top_gainers': [],
-            'top_losers': [],
-            'foreign_buying': [],
-            'institution_buying': [],
-            'sector_trends': []
-        }
+        raise
 
 
 @router.post("/reports/force-update")
@@ -9,11 +9,11 @@ from datetime import datetime
 
 from fastapi import APIRouter, HTTPException
 from sqlalchemy import text
-from pymilvus import connections, Collection
 import redis
 
 from backend.config import settings
 from backend.db.session import SessionLocal
+from backend.db.milvus_client import get_milvus_manager
 from backend.db.models.news import NewsArticle
 from backend.db.models.stock import StockPrice
 from backend.db.models.match import NewsStockMatch
@@ -39,32 +39,11 @@ def check_postgres() -> Dict[str, Any]:
 
 
 def check_milvus() -> Dict[str, Any]:
-    """Milvus 연결 상태 확인"""
-    try:
-        # 기존 연결이 있으면 재사용
-        try:
-            connections.connect(
-                alias="health_check",
-                host=settings.MILVUS_HOST,
-                port=settings.MILVUS_PORT,
-            )
-        except Exception:
-            # 이미 연결되어 있으면 무시
-            pass
-
-        # 컬렉션 존재 확인
-        collection = Collection("news_embeddings", using="health_check")
-        collection.load()
-        count = collection.num_entities
-
-        return {
-            "status": "healthy",
-            "error": None,
-            "embeddings_count": count
-        }
-    except Exception as e:
-        logger.error(f"Milvus 연결 실패: {e}")
-        return {"status": "unhealthy", "error": str(e)}
+    """Milvus 연결 상태 확인 (공유 연결 풀, 실패 시 재연결 시도)"""
+    result = get_milvus_manager().health_check("news_embeddings")
+    if result["status"] != "healthy":
+        logger.error(f"Milvus 연결 실패: {result['error']}")
+    return result
 
 
 def check_redis() -> Dict[str, Any]:
@@ -113,6 +92,52 @@ async def health_check():
     }
 
 
+@router.get("/health/kis-rate-limit")
+async def kis_rate_limit():
+    """
+    KIS API Rate Limiter 지표
+
+    현재 프로세스의 토큰 획득/대기(throttle) 통계를 반환합니다.
+    """
+    from backend.crawlers.kis_client import get_kis_client
+
+    client = await get_kis_client()
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "rate_limiter": client.rate_limiter.get_metrics(),
+    }
+
+
+@router.get("/health/embedding-cache")
+async def embedding_cache():
+    """
+    임베딩 캐시 지표
+
+    현재 프로세스의 LRU/Redis 히트, 미스, 히트율을 반환합니다.
+    """
+    from backend.llm.embedding_cache import get_embedding_cache
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "embedding_cache": get_embedding_cache().get_metrics(),
+    }
+
+
+@router.get("/health/response-cache")
+async def response_cache():
+    """
+    API 응답 캐시 지표
+
+    현재 프로세스의 히트/미스/동시 요청 병합 수, 히트율, 절약한 계산 시간을 반환합니다.
+    """
+    from backend.services.response_cache import get_response_cache
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "response_cache": get_response_cache().get_metrics(),
+    }
+
+
 @router.get("/health/liveness")
 async def liveness():
     """
@@ -169,14 +194,9 @@ async def get_stats():
 
         # Milvus 임베딩 통계
         try:
-            connections.connect(
-                alias="stats",
-                host=settings.MILVUS_HOST,
-                port=settings.MILVUS_PORT,
+            embeddings_count = get_milvus_manager().execute(
+                "news_embeddings", lambda collection: collection.num_entities, load=False
             )
-            collection = Collection("news_embeddings")
-            embeddings_count = collection.num_entities
-            connections.disconnect("stats")
         except Exception as e:
             logger.warning(f"Milvus 통계 조회 실패: {e}")
             embeddings_count = 0
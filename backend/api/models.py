@@ -322,8 +322,17 @@ async def delete_model(model_id: int):
         # 4. 예측 데이터 삭제
         if predictions:
             logger.info(f"\n🔄 예측 데이터 {len(predictions)}개 삭제 중...")
-            # 효율성을 위해 bulk delete 사용
+            # 효율성을 위해 bulk delete 사용 (AI 시그널 집계 / 종목별 예측 통계에서도 차감)
+            from backend.services.signal_rollup import SignalRollupDelta
+            from backend.services.stock_prediction_stats import StockPredictionStatsDelta
+            rollup = SignalRollupDelta()
+            stats = StockPredictionStatsDelta()
+            for prediction in predictions:
+                rollup.remove(prediction)
+                stats.remove(prediction)
             db.query(Prediction).filter(Prediction.model_id == model_id).delete()
+            rollup.apply(db)
+            stats.apply(db)
             logger.info(f"  ✅ 예측 데이터 {len(predictions)}개 삭제 완료")
 
         # 5. 모델 삭제
@@ -10,6 +10,7 @@ from pydantic import BaseModel, Field
 
 from backend.db.session import get_db
 from backend.db.models.stock import Stock
+from backend.utils.stock_mapping import reload_stock_mapper
 
 router = APIRouter(prefix="/api/admin/stocks", tags=["stock-management"])
 
@@ -76,6 +77,7 @@ def create_stock(stock: StockCreate, db: Session = Depends(get_db)):
     db.add(new_stock)
     db.commit()
     db.refresh(new_stock)
+    reload_stock_mapper()
 
     return new_stock
 
@@ -166,6 +168,7 @@ def update_stock(
 
     db.commit()
     db.refresh(stock)
+    reload_stock_mapper()
 
     return stock
 
@@ -188,5 +191,6 @@ def delete_stock(stock_code: str, db: Session = Depends(get_db)):
     # 소프트 삭제 (비활성화)
     stock.is_active = False
     db.commit()
+    reload_stock_mapper()
 
     return None
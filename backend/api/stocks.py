@@ -4,10 +4,10 @@
 종목별 통계 및 주가 정보를 제공합니다.
 """
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
@@ -21,6 +21,9 @@ from backend.services.stock_analysis_service import (
     update_stock_analysis_summary,
 )
 from backend.services.price_service import get_current_price, get_market_status
+from backend.services.indicator_store import get_indicator_store
+from backend.services.stock_prediction_stats import get_stock_prediction_stats
+from backend.services.response_cache import TAG_STOCKS, get_response_cache, stock_tag
 
 
 logger = logging.getLogger(__name__)
@@ -210,12 +213,23 @@ def _generate_investment_summary(
 
 
 @router.get("/summary")
-async def get_stocks_summary(db: Session = Depends(get_db)):
+async def get_stocks_summary(request: Request, db: Session = Depends(get_db)):
     """
     종목별 요약 통계
 
     모든 종목의 뉴스 건수, 알림 건수 등을 반환합니다.
+    (응답 캐시: 시장 단계별 TTL, 뉴스/예측 저장 시 무효화)
     """
+    return await get_response_cache().respond(
+        request,
+        key="stocks:summary",
+        compute=lambda: _build_stocks_summary(db),
+        tags=(TAG_STOCKS,),
+    )
+
+
+async def _build_stocks_summary(db: Session) -> List[Dict[str, Any]]:
+    """종목별 요약 통계 계산"""
     try:
         # 종목별 뉴스 건수 집계
         stock_stats = db.query(
@@ -258,13 +272,25 @@ async def get_stocks_summary(db: Session = Depends(get_db)):
 @router.get("/{stock_code}")
 async def get_stock_detail(
     stock_code: str,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
     종목 상세 정보
 
     특정 종목의 상세 통계 및 최신 주가를 반환합니다.
+    (응답 캐시: 시장 단계별 TTL, 해당 종목 뉴스/예측 저장 시 무효화)
     """
+    return await get_response_cache().respond(
+        request,
+        key=f"stocks:{stock_code}",
+        compute=lambda: _build_stock_detail(stock_code, db),
+        tags=(stock_tag(stock_code),),
+    )
+
+
+async def _build_stock_detail(stock_code: str, db: Session) -> Dict[str, Any]:
+    """종목 상세 정보 계산"""
     try:
         # 종목명 조회
         stock_mapper = get_stock_mapper()
@@ -283,108 +309,15 @@ async def get_stock_detail(
             NewsArticle.notified_at.isnot(None)
         ).scalar() or 0
 
-        # 예측 통계 (신 스키마 사용: sentiment_direction)
-        # sentiment_score는 -1.0~1.0이므로 평균을 0~1로 정규화
-        avg_sentiment = db.query(func.avg(Prediction.sentiment_score)).filter(
-            Prediction.stock_code == stock_code,
-            Prediction.sentiment_score.isnot(None)
-        ).scalar()
-
-        # 0~1 범위로 정규화 (-1~1 → 0~1)
-        avg_confidence = ((avg_sentiment + 1) / 2) if avg_sentiment is not None else None
-
-        # 방향 분포 (sentiment_direction 사용: positive/negative/neutral → up/down/hold 매핑)
-        direction_counts = db.query(
-            Prediction.sentiment_direction,
-            func.count(Prediction.id)
-        ).filter(
-            Prediction.stock_code == stock_code,
-            Prediction.sentiment_direction.isnot(None)
-        ).group_by(Prediction.sentiment_direction).all()
-
-        direction_distribution = {
-            "up": 0,
-            "down": 0,
-            "hold": 0
-        }
-        # sentiment_direction을 direction으로 매핑
-        sentiment_to_direction = {
-            "positive": "up",
-            "negative": "down",
-            "neutral": "hold"
-        }
-        for sentiment, count in direction_counts:
-            direction = sentiment_to_direction.get(sentiment)
-            if direction and direction in direction_distribution:
-                direction_distribution[direction] = count
-
-        # Phase 2: 전체 예측의 종합 통계 계산
-        all_predictions = db.query(Prediction).filter(
-            Prediction.stock_code == stock_code
-        ).all()
-
-        # 신뢰도 breakdown 평균 계산
-        confidence_breakdown_avg = {
-            "similar_news_quality": None,
-            "pattern_consistency": None,
-            "disclosure_impact": None,
-        }
-
-        breakdown_counts = {"similar_news_quality": 0, "pattern_consistency": 0, "disclosure_impact": 0}
-        breakdown_sums = {"similar_news_quality": 0.0, "pattern_consistency": 0.0, "disclosure_impact": 0.0}
-
-        for pred in all_predictions:
-            if pred.confidence_breakdown:
-                for key in ["similar_news_quality", "pattern_consistency", "disclosure_impact"]:
-                    val = pred.confidence_breakdown.get(key)
-                    if val is not None:
-                        try:
-                            # 문자열로 저장된 경우를 대비해 float로 변환
-                            val_float = float(val)
-                            breakdown_sums[key] += val_float
-                            breakdown_counts[key] += 1
-                        except (ValueError, TypeError):
-                            # 변환 실패 시 건너뛰기
-                            continue
-
-        for key in ["similar_news_quality", "pattern_consistency", "disclosure_impact"]:
-            if breakdown_counts[key] > 0:
-                confidence_breakdown_avg[key] = round(breakdown_sums[key] / breakdown_counts[key], 1)
-
-        # 패턴 분석 평균 계산
-        pattern_analysis_avg = {
-            "avg_1d": None,
-            "avg_2d": None,
-            "avg_3d": None,
-            "avg_5d": None,
-            "avg_10d": None,
-            "avg_20d": None,
-        }
-
-        pattern_counts = {"avg_1d": 0, "avg_2d": 0, "avg_3d": 0, "avg_5d": 0, "avg_10d": 0, "avg_20d": 0}
-        pattern_sums = {"avg_1d": 0.0, "avg_2d": 0.0, "avg_3d": 0.0, "avg_5d": 0.0, "avg_10d": 0.0, "avg_20d": 0.0}
-
-        for pred in all_predictions:
-            if pred.pattern_analysis:
-                for key in ["avg_1d", "avg_2d", "avg_3d", "avg_5d", "avg_10d", "avg_20d"]:
-                    val = pred.pattern_analysis.get(key)
-                    if val is not None and val != 0.0:  # 0.0은 제외 (의미 없는 데이터)
-                        try:
-                            # 문자열로 저장된 경우를 대비해 float로 변환
-                            val_float = float(val)
-                            if val_float != 0.0:
-                                pattern_sums[key] += val_float
-                                pattern_counts[key] += 1
-                        except (ValueError, TypeError):
-                            # 변환 실패 시 건너뛰기
-                            continue
-
-        for key in ["avg_1d", "avg_2d", "avg_3d", "avg_5d", "avg_10d", "avg_20d"]:
-            if pattern_counts[key] > 0:
-                pattern_analysis_avg[key] = round(pattern_sums[key] / pattern_counts[key], 2)
+        # 예측 통계 (종목별 집계 테이블 단건 조회, 예측 수와 무관)
+        prediction_stats = get_stock_prediction_stats(db, stock_code)
+        avg_confidence = prediction_stats["avg_confidence"]
+        direction_distribution = prediction_stats["direction_distribution"]
+        confidence_breakdown_avg = prediction_stats["confidence_breakdown_avg"]
+        pattern_analysis_avg = prediction_stats["pattern_analysis_avg"]
 
         # AI 투자 의견 계산
-        total_predictions = direction_distribution["up"] + direction_distribution["down"] + direction_distribution["hold"]
+        total_predictions = prediction_stats["total_predictions"]
         investment_opinion = None
         opinion_confidence = None
 
@@ -456,6 +389,9 @@ async def get_stock_detail(
         if current_price:
             current_price["market_status"] = market_status
 
+        # 기술적 지표 (MA/RSI/볼린저 밴드/MACD)
+        technical_indicators = get_indicator_store().get(stock_code, db)
+
         # 최근 뉴스 (5건) + 예측 정보
         recent_news = db.query(NewsArticle).filter(
             NewsArticle.stock_code == stock_code
@@ -516,6 +452,7 @@ async def get_stock_detail(
             # Phase 2: LLM 기반 AI 투자 분석 요약 (별도 필드로 분리)
             "analysis_summary": analysis_summary,
             "current_price": current_price,
+            "technical_indicators": technical_indicators,
             "recent_news": recent_news_list,
         }
 
@@ -3,7 +3,7 @@ Craveny 애플리케이션 설정 관리
 모든 환경 변수는 이 파일을 통해 접근
 """
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 
 
 class Settings(BaseSettings):
@@ -28,6 +28,7 @@ class Settings(BaseSettings):
     # Milvus
     MILVUS_HOST: str = "localhost"
     MILVUS_PORT: int = 19530
+    MILVUS_POOL_SIZE: int = 4  # 프로세스 공유 Milvus 연결(alias) 수
 
     # Redis
     REDIS_HOST: str = "localhost"
@@ -44,6 +45,30 @@ class Settings(BaseSettings):
     OPENAI_MODEL: str = "gpt-4o"
     OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-small"
 
+    # 임베딩 배치 요청
+    EMBEDDING_BATCH_MAX_INPUTS: int = 256  # 요청당 최대 입력 수 (API 한도 2048)
+    EMBEDDING_BATCH_MAX_TOKENS: int = 200000  # 요청당 최대 토큰 수 (API 한도 300,000)
+    EMBEDDING_MAX_INPUT_TOKENS: int = 8000  # 입력당 최대 토큰, 초과분은 절단 (API 한도 8192)
+    EMBEDDING_MAX_RETRIES: int = 5  # 429/일시 오류 재시도 횟수
+    EMBEDDING_RETRY_BASE_SECONDS: float = 1.0  # 재시도 지수 백오프 기본 대기 (초)
+
+    # 임베딩 캐시 (모델/차원/정규화 텍스트 해시 키, 프로세스 LRU → Redis)
+    EMBEDDING_CACHE_LRU_SIZE: int = 4096  # 프로세스 내 LRU 항목 수
+    EMBEDDING_CACHE_REDIS: bool = True  # Redis 공유 캐시 사용
+    EMBEDDING_CACHE_TTL_SECONDS: int = 604800  # Redis TTL (7일)
+
+    # API 응답 캐시 (대시보드/종목 API, 시장 단계별 TTL, 동일 요청 단일 계산)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024  # 프로세스 내 최대 캐시 항목 수
+
+    # 벡터 저장소 (유사 뉴스 검색/중복 검사)
+    VECTOR_STORE_BACKEND: str = "milvus"  # "milvus" 또는 "local" (Milvus 없는 개발/테스트 환경)
+    LOCAL_VECTOR_STORE_PATH: str = "data/vector_store"  # 로컬 인덱스 디렉터리 (memmap)
+    LOCAL_VECTOR_STORE_WINDOW_DAYS: int = 30  # 로컬 인덱스 보관 기간 (일)
+    VECTOR_HOT_CACHE_ENABLED: bool = False  # Milvus 사용 시 최근 뉴스 로컬 핫 캐시
+    VECTOR_HOT_CACHE_PATH: str = "data/vector_hot_cache"  # 핫 캐시 디렉터리 (memmap)
+    VECTOR_HOT_CACHE_HOURS: int = 24  # 핫 캐시 보관/조회 기간 (중복 검사 기간)
+
     # OpenRouter (Primary LLM)
     OPENROUTER_API_KEY: str = ""
     LLM_PROVIDER: str = "openai"  # "openai" or "openrouter"
@@ -56,10 +81,23 @@ class Settings(BaseSettings):
     MODEL_B_PROVIDER: str = "openrouter"
     MODEL_B_NAME: str = "deepseek/deepseek-v3.2-exp"
 
+    # 멀티모델 예측 동시 실행
+    LLM_MAX_CONCURRENCY: int = 4  # 전체 동시 LLM 호출 수
+    LLM_PROVIDER_CONCURRENCY: Dict[str, int] = {"openai": 2, "openrouter": 2}  # 프로바이더별 동시 호출 상한
+    LLM_REQUEST_TIMEOUT: float = 30.0  # 모델별 요청 타임아웃 (초, 프로바이더 슬롯 획득 후부터)
+    LLM_REQUEST_MAX_RETRIES: int = 1  # 모델별 요청 재시도 횟수 (타임아웃 포함)
+
     # 텔레그램
     TELEGRAM_BOT_TOKEN: str
     TELEGRAM_CHAT_ID: str
 
+    # 자동 알림 파이프라인 (단계별 워커 수 / 단계 간 큐 크기)
+    AUTO_NOTIFY_DEDUP_WORKERS: int = 2  # 알림 중복 검사
+    AUTO_NOTIFY_RETRIEVAL_WORKERS: int = 2  # 유사 뉴스 검색
+    AUTO_NOTIFY_PREDICTION_WORKERS: int = 2  # 멀티모델 예측
+    AUTO_NOTIFY_SEND_WORKERS: int = 1  # 텔레그램 전송
+    AUTO_NOTIFY_QUEUE_SIZE: int = 16
+
     # 인증 (Authentication)
     SECRET_KEY: str = "your-secret-key-change-this-in-production"
     ADMIN_DEFAULT_PASSWORD: str = "admin123"
@@ -97,6 +135,14 @@ class Settings(BaseSettings):
     KIS_WEBSOCKET_URL: str = "wss://openapi.koreainvestment.com:9443"
     KIS_MOCK_MODE: bool = True  # True: 모의투자, False: 실전투자
 
+    # KIS HTTP 연결 풀
+    KIS_HTTP_MAX_CONNECTIONS: int = 20  # 최대 동시 연결 수
+    KIS_HTTP_MAX_KEEPALIVE: int = 10  # 유지할 keep-alive 연결 수
+    KIS_HTTP_KEEPALIVE_EXPIRY: float = 30.0  # keep-alive 유휴 만료 (초)
+    KIS_HTTP_TIMEOUT: float = 30.0  # 요청 타임아웃 (초)
+    KIS_HTTP2: bool = False  # HTTP/2 사용 (h2 패키지 필요)
+    KIS_RATE_LIMIT_SHARED: bool = True  # Redis 공유 토큰 버킷 (여러 프로세스가 초당 한도 공유)
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -5,8 +5,10 @@ OAuth 2.0 인증, Rate Limiting, Token 자동 갱신 기능 포함
 """
 import logging
 import asyncio
+import threading
 import time
 import json
+import weakref
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 
@@ -18,61 +20,176 @@ from backend.config import settings
 logger = logging.getLogger(__name__)
 
 
+# 공유 토큰 버킷 Lua 스크립트 (Redis 서버 시간 기준, 원자적 충전 + 예약)
+# 토큰을 음수까지 예약하고 부족분만큼의 대기 시간(초)을 문자열로 반환합니다.
+TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate) - 1
+redis.call('HSET', KEYS[1], 'tokens', string.format('%.6f', tokens), 'ts', string.format('%.6f', now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 60)
+if tokens < 0 then
+    return tostring(-tokens / rate)
+end
+return '0'
+"""
+
+
 class RateLimiter:
-    """Rate Limiter (Sliding Window 알고리즘)"""
+    """
+    Rate Limiter (Token Bucket 알고리즘)
 
-    def __init__(self, max_requests: int = 20, window_seconds: float = 1.0):
+    - 로컬 버킷: 스레드 락 안에서 O(1) 충전/예약 후, 락 밖에서 대기
+      (대기 중인 요청끼리 직렬화되지 않으며 이벤트 루프가 달라도 안전)
+    - 공유 버킷(선택): Redis Lua 스크립트로 여러 프로세스/워커가 하나의 예산 공유,
+      Redis 장애 시 일정 시간 로컬 버킷으로 대체 (Redis 호출은 스레드에서 실행)
+    """
+
+    # Redis 장애 후 공유 버킷 재시도까지 대기 (초)
+    REDIS_RETRY_SECONDS = 30.0
+
+    def __init__(
+        self,
+        max_requests: int = 20,
+        window_seconds: float = 1.0,
+        redis_client: Optional[redis.Redis] = None,
+        redis_key: Optional[str] = None,
+    ):
         """
         Args:
-            max_requests: 시간 창 내 최대 요청 수
+            max_requests: 시간 창 내 최대 요청 수 (버킷 용량)
             window_seconds: 시간 창 (초)
+            redis_client: 공유 버킷용 Redis 클라이언트 (None이면 로컬 버킷만 사용)
+            redis_key: 공유 버킷 Redis 키
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = []
-        self._lock = None  # Lazy initialization to avoid event loop binding issues
+        self.rate = max_requests / window_seconds
+        self.capacity = float(max_requests)
+
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.redis_client = redis_client
+        self.redis_key = redis_key or "kis:rate_limit"
+        self._script = redis_client.register_script(TOKEN_BUCKET_LUA) if redis_client is not None else None
+        self._redis_disabled_until = 0.0
+
+        self._metrics = {
+            "acquired": 0,
+            "throttled": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "redis_errors": 0,
+        }
+
+    def _reserve_local(self) -> float:
+        """로컬 버킷에서 토큰 1개 예약 후 대기 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate) - 1
+            self._updated_at = now
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def _reserve_shared(self) -> Optional[float]:
+        """공유 버킷에서 토큰 1개 예약 (Redis 사용 불가 시 None)"""
+        if not self._shared_available():
+            return None
+
+        try:
+            return float(self._script(keys=[self.redis_key], args=[self.rate, self.capacity]))
+        except redis.RedisError as e:
+            self._redis_disabled_until = time.monotonic() + self.REDIS_RETRY_SECONDS
+            with self._lock:
+                self._metrics["redis_errors"] += 1
+            logger.warning(
+                f"⚠️  공유 Rate Limit(Redis) 사용 불가, "
+                f"{self.REDIS_RETRY_SECONDS:.0f}초간 로컬 버킷 사용: {e}"
+            )
+            return None
+
+    def _shared_available(self) -> bool:
+        return self._script is not None and time.monotonic() >= self._redis_disabled_until
 
     async def acquire(self):
         """Rate limit 획득 (필요 시 대기)"""
-        # Lazy initialization: Lock 생성 (event loop가 실행 중일 때만)
-        if self._lock is None:
-            self._lock = asyncio.Lock()
-
-        async with self._lock:
-            now = time.time()
-
-            # 시간 창 밖의 요청 제거
-            self.requests = [
-                req_time for req_time in self.requests
-                if now - req_time < self.window_seconds
-            ]
-
-            # 제한 확인
-            if len(self.requests) >= self.max_requests:
-                # 가장 오래된 요청이 만료될 때까지 대기
-                oldest = self.requests[0]
-                wait_time = self.window_seconds - (now - oldest)
-
-                if wait_time > 0:
-                    logger.debug(f"Rate limit 대기: {wait_time:.2f}초")
-                    await asyncio.sleep(wait_time)
+        wait_time = None
+        if self._shared_available():
+            # 동기 Redis 호출이 이벤트 루프를 막지 않도록 스레드에서 실행
+            wait_time = await asyncio.to_thread(self._reserve_shared)
+        if wait_time is None:
+            wait_time = self._reserve_local()
+
+        with self._lock:
+            self._metrics["acquired"] += 1
+            if wait_time > 0:
+                self._metrics["throttled"] += 1
+                self._metrics["total_wait_seconds"] += wait_time
+                self._metrics["max_wait_seconds"] = max(self._metrics["max_wait_seconds"], wait_time)
+
+        if wait_time > 0:
+            logger.debug(f"Rate limit 대기: {wait_time:.2f}초")
+            await asyncio.sleep(wait_time)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Rate limiter 지표 조회
 
-                # 재확인
-                now = time.time()
-                self.requests = [
-                    req_time for req_time in self.requests
-                    if now - req_time < self.window_seconds
-                ]
+        Returns:
+            {acquired, throttled, total_wait_seconds, max_wait_seconds,
+             avg_wait_seconds, redis_errors, shared}
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+
+        metrics["avg_wait_seconds"] = (
+            metrics["total_wait_seconds"] / metrics["throttled"] if metrics["throttled"] else 0.0
+        )
+        metrics["shared"] = self._script is not None
+        return metrics
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    KIS API용 연결 풀 AsyncClient 생성
+
+    설정(KIS_HTTP_*)에 따라 연결 수/keep-alive/HTTP2를 구성합니다.
+    HTTP/2가 켜져 있어도 h2 패키지가 없으면 HTTP/1.1로 동작합니다.
 
-            # 현재 요청 추가
-            self.requests.append(now)
+    Returns:
+        httpx.AsyncClient
+    """
+    http2 = settings.KIS_HTTP2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("⚠️  h2 패키지 없음, HTTP/1.1로 연결 (pip install 'httpx[http2]')")
+            http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.KIS_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.KIS_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=settings.KIS_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=settings.KIS_HTTP_TIMEOUT,
+    )
 
 
 class TokenManager:
     """OAuth 2.0 Token 관리자 (싱글톤, Redis 기반)"""
 
     _instance = None
-    _lock = None  # Lazy initialization to avoid event loop binding issues
+    # 이벤트 루프별 갱신 락 (asyncio.Lock은 생성된 루프에서만 사용 가능)
+    _locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
     REDIS_KEY = "kis:access_token"
     REDIS_EXPIRY_KEY = "kis:token_expires_at"
 
@@ -103,20 +220,25 @@ class TokenManager:
         self.initialized = True
         logger.info("🔑 TokenManager 싱글톤 초기화 완료 (Redis 연동)")
 
-    async def get_access_token(self) -> str:
+    async def get_access_token(self, http_client: Optional[httpx.AsyncClient] = None) -> str:
         """
         Access Token 조회 (필요 시 자동 갱신)
 
         Redis에서 토큰을 조회하고, 없거나 만료 임박 시 갱신
 
+        Args:
+            http_client: 토큰 발급에 사용할 연결 풀 (None이면 임시 클라이언트)
+
         Returns:
             유효한 Access Token
         """
-        # Lazy initialization: Lock 생성 (event loop가 실행 중일 때만)
-        if TokenManager._lock is None:
-            TokenManager._lock = asyncio.Lock()
+        # 현재 이벤트 루프의 Lock (루프가 바뀌어도 다른 루프에 묶인 Lock을 쓰지 않음)
+        loop = asyncio.get_running_loop()
+        lock = TokenManager._locks.get(loop)
+        if lock is None:
+            lock = TokenManager._locks[loop] = asyncio.Lock()
 
-        async with TokenManager._lock:
+        async with lock:
             try:
                 # Redis에서 토큰 조회
                 access_token = self.redis_client.get(self.REDIS_KEY)
@@ -138,14 +260,19 @@ class TokenManager:
 
             # 토큰 갱신
             logger.info("🔑 Access Token 갱신 중...")
-            await self._refresh_token()
+            await self._refresh_token(http_client)
 
             # Redis에서 다시 조회하여 반환
             access_token = self.redis_client.get(self.REDIS_KEY)
             return access_token
 
-    async def _refresh_token(self):
-        """Access Token 갱신 및 Redis 저장"""
+    async def _refresh_token(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Access Token 갱신 및 Redis 저장
+
+        Args:
+            http_client: KISClient 연결 풀 (None이면 임시 클라이언트 생성)
+        """
         url = f"{self.base_url}/oauth2/tokenP"
 
         payload = {
@@ -155,36 +282,39 @@ class TokenManager:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=payload, timeout=10.0)
+            if http_client is not None:
+                response = await http_client.post(url, json=payload, timeout=10.0)
+            else:
+                async with httpx.AsyncClient() as client:
+                    response = await client.post(url, json=payload, timeout=10.0)
 
-                if response.status_code != 200:
-                    raise Exception(f"Token 발급 실패: {response.status_code}, {response.text}")
+            if response.status_code != 200:
+                raise Exception(f"Token 발급 실패: {response.status_code}, {response.text}")
 
-                data = response.json()
+            data = response.json()
 
-                access_token = data["access_token"]
-                expires_in = int(data.get("expires_in", 86400))  # 기본 24시간
-                token_expires_at = datetime.now() + timedelta(seconds=expires_in)
+            access_token = data["access_token"]
+            expires_in = int(data.get("expires_in", 86400))  # 기본 24시간
+            token_expires_at = datetime.now() + timedelta(seconds=expires_in)
 
-                # Redis에 저장
-                try:
-                    self.redis_client.set(self.REDIS_KEY, access_token)
-                    self.redis_client.set(self.REDIS_EXPIRY_KEY, token_expires_at.isoformat())
+            # Redis에 저장
+            try:
+                self.redis_client.set(self.REDIS_KEY, access_token)
+                self.redis_client.set(self.REDIS_EXPIRY_KEY, token_expires_at.isoformat())
 
-                    # TTL 설정 (만료 시간 + 버퍼 10분)
-                    ttl_seconds = expires_in + 600
-                    self.redis_client.expire(self.REDIS_KEY, ttl_seconds)
-                    self.redis_client.expire(self.REDIS_EXPIRY_KEY, ttl_seconds)
+                # TTL 설정 (만료 시간 + 버퍼 10분)
+                ttl_seconds = expires_in + 600
+                self.redis_client.expire(self.REDIS_KEY, ttl_seconds)
+                self.redis_client.expire(self.REDIS_EXPIRY_KEY, ttl_seconds)
 
-                    logger.info(
-                        f"✅ Access Token 발급 및 Redis 저장 완료 "
-                        f"(만료: {token_expires_at.strftime('%Y-%m-%d %H:%M:%S')})"
-                    )
+                logger.info(
+                    f"✅ Access Token 발급 및 Redis 저장 완료 "
+                    f"(만료: {token_expires_at.strftime('%Y-%m-%d %H:%M:%S')})"
+                )
 
-                except redis.RedisError as e:
-                    logger.error(f"❌ Redis 저장 실패: {e}")
-                    raise
+            except redis.RedisError as e:
+                logger.error(f"❌ Redis 저장 실패: {e}")
+                raise
 
         except Exception as e:
             logger.error(f"❌ Token 발급 실패: {e}")
@@ -210,19 +340,58 @@ class KISClient:
             mock_mode=self.mock_mode
         )
 
-        # Rate Limiter
-        if self.mock_mode:
-            # 모의투자: 초당 5건
-            self.rate_limiter = RateLimiter(max_requests=5, window_seconds=1.0)
-        else:
-            # 실전투자: 초당 20건
-            self.rate_limiter = RateLimiter(max_requests=20, window_seconds=1.0)
+        # Rate Limiter (KIS_RATE_LIMIT_SHARED면 Redis로 전 프로세스 공유)
+        mode = "mock" if self.mock_mode else "real"
+        self.rate_limiter = RateLimiter(
+            # 모의투자: 초당 5건, 실전투자: 초당 20건
+            max_requests=5 if self.mock_mode else 20,
+            window_seconds=1.0,
+            redis_client=self.token_manager.redis_client if settings.KIS_RATE_LIMIT_SHARED else None,
+            redis_key=f"kis:rate_limit:{mode}",
+        )
+
+        # HTTP 연결 풀 (이벤트 루프별 지연 생성: 스케줄러 루프 / FastAPI 루프)
+        self._http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
 
         logger.info(
             f"KIS API Client 초기화 완료 "
             f"(모드: {'모의투자' if self.mock_mode else '실전투자'})"
         )
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        현재 이벤트 루프의 연결 풀 AsyncClient 반환 (없으면 생성)
+
+        httpx 연결은 생성된 이벤트 루프에 묶이므로 루프별로 풀을 유지합니다.
+        (스케줄러 영속 루프와 FastAPI 루프가 각자의 풀을 계속 재사용)
+        """
+        loop = asyncio.get_running_loop()
+        client = self._http_clients.get(loop)
+        if client is None or client.is_closed:
+            client = create_http_client()
+            self._http_clients[loop] = client
+        return client
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """공유 연결 풀로 HTTP 요청 전송"""
+        client = self._get_http_client()
+
+        if method.upper() == "GET":
+            return await client.get(url, headers=headers, params=params)
+        elif method.upper() == "POST":
+            return await client.post(url, headers=headers, json=data)
+        else:
+            raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
+
     async def request(
         self,
         method: str,
@@ -249,8 +418,8 @@ class KISClient:
         # Rate Limiting
         await self.rate_limiter.acquire()
 
-        # Access Token 획득
-        access_token = await self.token_manager.get_access_token()
+        # Access Token 획득 (토큰 발급도 같은 연결 풀 사용)
+        access_token = await self.token_manager.get_access_token(self._get_http_client())
 
         # Headers
         headers = {
@@ -267,53 +436,37 @@ class KISClient:
         # 재시도 로직 (Exponential Backoff)
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient() as client:
-                    if method.upper() == "GET":
-                        response = await client.get(
-                            url,
-                            headers=headers,
-                            params=params,
-                            timeout=30.0
-                        )
-                    elif method.upper() == "POST":
-                        response = await client.post(
-                            url,
-                            headers=headers,
-                            json=data,
-                            timeout=30.0
-                        )
-                    else:
-                        raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
-
-                    # 응답 처리
-                    if response.status_code == 200:
-                        result = response.json()
-
-                        # API 성공 여부 확인
-                        rt_cd = result.get("rt_cd", "1")
-                        if rt_cd == "0":
-                            return result
-                        else:
-                            # API 에러
-                            msg1 = result.get("msg1", "")
-                            msg_cd = result.get("msg_cd", "")
-                            raise Exception(
-                                f"API 에러: rt_cd={rt_cd}, msg_cd={msg_cd}, msg1={msg1}, "
-                                f"response={result}"
-                            )
-
-                    elif response.status_code == 429:
-                        # Rate Limit 초과
-                        wait_time = 2 ** attempt  # Exponential Backoff
-                        logger.warning(f"Rate Limit 초과, {wait_time}초 대기 중...")
-                        await asyncio.sleep(wait_time)
-                        continue
+                response = await self._send(method, url, headers, params=params, data=data)
+
+                # 응답 처리
+                if response.status_code == 200:
+                    result = response.json()
 
+                    # API 성공 여부 확인
+                    rt_cd = result.get("rt_cd", "1")
+                    if rt_cd == "0":
+                        return result
                     else:
+                        # API 에러
+                        msg1 = result.get("msg1", "")
+                        msg_cd = result.get("msg_cd", "")
                         raise Exception(
-                            f"HTTP 에러: {response.status_code}, {response.text}"
+                            f"API 에러: rt_cd={rt_cd}, msg_cd={msg_cd}, msg1={msg1}, "
+                            f"response={result}"
                         )
 
+                elif response.status_code == 429:
+                    # Rate Limit 초과
+                    wait_time = 2 ** attempt  # Exponential Backoff
+                    logger.warning(f"Rate Limit 초과, {wait_time}초 대기 중...")
+                    await asyncio.sleep(wait_time)
+                    continue
+
+                else:
+                    raise Exception(
+                        f"HTTP 에러: {response.status_code}, {response.text}"
+                    )
+
             except Exception as e:
                 if attempt == max_retries - 1:
                     # 최종 실패
@@ -976,7 +1129,10 @@ class KISClient:
         )
 
     async def close(self):
-        """리소스 정리"""
+        """리소스 정리 (현재 이벤트 루프의 연결 풀 종료)"""
+        client = self._http_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
         logger.info("KIS API Client 종료")
 
 
@@ -995,3 +1151,9 @@ async def get_kis_client() -> KISClient:
     if _kis_client is None:
         _kis_client = KISClient()
     return _kis_client
+
+
+async def close_kis_client() -> None:
+    """KIS Client 싱글톤의 연결 풀 종료 (애플리케이션 종료 시 호출)"""
+    if _kis_client is not None:
+        await _kis_client.close()
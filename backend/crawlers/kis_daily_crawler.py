@@ -14,6 +14,8 @@ from sqlalchemy.orm import Session
 from backend.crawlers.kis_client import get_kis_client
 from backend.db.models.stock import Stock, StockPrice
 from backend.db.session import SessionLocal
+from backend.db.bulk_upsert import upsert_rows
+from backend.services.indicator_store import get_indicator_store
 
 
 logger = logging.getLogger(__name__)
@@ -91,7 +93,7 @@ class KISDailyCrawler:
         db: Session
     ) -> int:
         """
-        일봉 데이터를 DB에 저장
+        일봉 데이터를 DB에 저장 (기존 일자는 갱신)
 
         Args:
             stock_code: 종목 코드
@@ -101,47 +103,32 @@ class KISDailyCrawler:
         Returns:
             저장된 레코드 수
         """
-        saved_count = 0
-
         try:
-            for _, row in df.iterrows():
-                # 중복 체크
-                existing = db.query(StockPrice).filter(
-                    StockPrice.stock_code == stock_code,
-                    StockPrice.date == row["date"],
-                    StockPrice.source == self.source
-                ).first()
-
-                if existing:
-                    # 기존 데이터 업데이트
-                    existing.open = row["open"]
-                    existing.high = row["high"]
-                    existing.low = row["low"]
-                    existing.close = row["close"]
-                    existing.volume = row["volume"]
-                    logger.debug(f"업데이트: {stock_code} {row['date'].date()}")
-                else:
-                    # 새 데이터 삽입
-                    price = StockPrice(
-                        stock_code=stock_code,
-                        date=row["date"],
-                        open=row["open"],
-                        high=row["high"],
-                        low=row["low"],
-                        close=row["close"],
-                        volume=row["volume"],
-                        source=self.source
-                    )
-                    db.add(price)
-                    logger.debug(f"삽입: {stock_code} {row['date'].date()}")
-
-                saved_count += 1
+            # 배치 전체 1회 저장 (INSERT ... ON CONFLICT DO UPDATE)
+            saved_count = upsert_rows(db, StockPrice, {
+                "stock_code": [stock_code] * len(df),
+                "date": list(df["date"].dt.to_pydatetime()),
+                "open": df["open"].astype(float).tolist(),
+                "high": df["high"].astype(float).tolist(),
+                "low": df["low"].astype(float).tolist(),
+                "close": df["close"].astype(float).tolist(),
+                "volume": df["volume"].astype(int).tolist(),
+                "source": [self.source] * len(df),
+            })
+
+            # 기술적 지표 증분 갱신 (SAVEPOINT, 실패해도 가격 저장은 유지)
+            get_indicator_store().apply_daily_bars(
+                db,
+                stock_code,
+                zip(df["date"], df["close"], df["volume"]),
+            )
 
             db.commit()
             logger.info(f"✅ {stock_code} DB 저장 완료: {saved_count}건")
 
         except Exception as e:
             db.rollback()
+            get_indicator_store().invalidate(stock_code)
             logger.error(f"❌ {stock_code} DB 저장 실패: {e}")
             return 0
 
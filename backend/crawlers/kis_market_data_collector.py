@@ -8,8 +8,8 @@ import asyncio
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
-from sqlalchemy.exc import IntegrityError
 from backend.db.session import SessionLocal
+from backend.db.bulk_upsert import insert_new_rows, upsert_rows
 from backend.db.models.stock import Stock
 from backend.db.models.market_data import (
     StockOrderbook,
@@ -17,6 +17,7 @@ from backend.db.models.market_data import (
     InvestorTrading,
     StockInfo,
     SectorIndex,
+    StockOvertimePrice,
 )
 from backend.crawlers.kis_client import get_kis_client
 
@@ -75,61 +76,60 @@ class OrderbookCollector:
             }
 
     async def _save_to_db(self, stock_code: str, data: Dict[str, Any]) -> None:
-        """호가 데이터를 DB에 저장"""
+        """호가 데이터를 DB에 저장 (INSERT ... ON CONFLICT)"""
         db = SessionLocal()
         try:
-            orderbook = StockOrderbook(
-                stock_code=stock_code,
-                datetime=datetime.now(),
+            upsert_rows(db, StockOrderbook, [{
+                "stock_code": stock_code,
+                "datetime": datetime.now(),
                 # 매도 호가
-                askp1=float(data.get("askp1", 0) or 0),
-                askp2=float(data.get("askp2", 0) or 0),
-                askp3=float(data.get("askp3", 0) or 0),
-                askp4=float(data.get("askp4", 0) or 0),
-                askp5=float(data.get("askp5", 0) or 0),
-                askp6=float(data.get("askp6", 0) or 0),
-                askp7=float(data.get("askp7", 0) or 0),
-                askp8=float(data.get("askp8", 0) or 0),
-                askp9=float(data.get("askp9", 0) or 0),
-                askp10=float(data.get("askp10", 0) or 0),
+                "askp1": float(data.get("askp1", 0) or 0),
+                "askp2": float(data.get("askp2", 0) or 0),
+                "askp3": float(data.get("askp3", 0) or 0),
+                "askp4": float(data.get("askp4", 0) or 0),
+                "askp5": float(data.get("askp5", 0) or 0),
+                "askp6": float(data.get("askp6", 0) or 0),
+                "askp7": float(data.get("askp7", 0) or 0),
+                "askp8": float(data.get("askp8", 0) or 0),
+                "askp9": float(data.get("askp9", 0) or 0),
+                "askp10": float(data.get("askp10", 0) or 0),
                 # 매도 호가 잔량
-                askp_rsqn1=int(data.get("askp_rsqn1", 0) or 0),
-                askp_rsqn2=int(data.get("askp_rsqn2", 0) or 0),
-                askp_rsqn3=int(data.get("askp_rsqn3", 0) or 0),
-                askp_rsqn4=int(data.get("askp_rsqn4", 0) or 0),
-                askp_rsqn5=int(data.get("askp_rsqn5", 0) or 0),
-                askp_rsqn6=int(data.get("askp_rsqn6", 0) or 0),
-                askp_rsqn7=int(data.get("askp_rsqn7", 0) or 0),
-                askp_rsqn8=int(data.get("askp_rsqn8", 0) or 0),
-                askp_rsqn9=int(data.get("askp_rsqn9", 0) or 0),
-                askp_rsqn10=int(data.get("askp_rsqn10", 0) or 0),
+                "askp_rsqn1": int(data.get("askp_rsqn1", 0) or 0),
+                "askp_rsqn2": int(data.get("askp_rsqn2", 0) or 0),
+                "askp_rsqn3": int(data.get("askp_rsqn3", 0) or 0),
+                "askp_rsqn4": int(data.get("askp_rsqn4", 0) or 0),
+                "askp_rsqn5": int(data.get("askp_rsqn5", 0) or 0),
+                "askp_rsqn6": int(data.get("askp_rsqn6", 0) or 0),
+                "askp_rsqn7": int(data.get("askp_rsqn7", 0) or 0),
+                "askp_rsqn8": int(data.get("askp_rsqn8", 0) or 0),
+                "askp_rsqn9": int(data.get("askp_rsqn9", 0) or 0),
+                "askp_rsqn10": int(data.get("askp_rsqn10", 0) or 0),
                 # 매수 호가
-                bidp1=float(data.get("bidp1", 0) or 0),
-                bidp2=float(data.get("bidp2", 0) or 0),
-                bidp3=float(data.get("bidp3", 0) or 0),
-                bidp4=float(data.get("bidp4", 0) or 0),
-                bidp5=float(data.get("bidp5", 0) or 0),
-                bidp6=float(data.get("bidp6", 0) or 0),
-                bidp7=float(data.get("bidp7", 0) or 0),
-                bidp8=float(data.get("bidp8", 0) or 0),
-                bidp9=float(data.get("bidp9", 0) or 0),
-                bidp10=float(data.get("bidp10", 0) or 0),
+                "bidp1": float(data.get("bidp1", 0) or 0),
+                "bidp2": float(data.get("bidp2", 0) or 0),
+                "bidp3": float(data.get("bidp3", 0) or 0),
+                "bidp4": float(data.get("bidp4", 0) or 0),
+                "bidp5": float(data.get("bidp5", 0) or 0),
+                "bidp6": float(data.get("bidp6", 0) or 0),
+                "bidp7": float(data.get("bidp7", 0) or 0),
+                "bidp8": float(data.get("bidp8", 0) or 0),
+                "bidp9": float(data.get("bidp9", 0) or 0),
+                "bidp10": float(data.get("bidp10", 0) or 0),
                 # 매수 호가 잔량
-                bidp_rsqn1=int(data.get("bidp_rsqn1", 0) or 0),
-                bidp_rsqn2=int(data.get("bidp_rsqn2", 0) or 0),
-                bidp_rsqn3=int(data.get("bidp_rsqn3", 0) or 0),
-                bidp_rsqn4=int(data.get("bidp_rsqn4", 0) or 0),
-                bidp_rsqn5=int(data.get("bidp_rsqn5", 0) or 0),
-                bidp_rsqn6=int(data.get("bidp_rsqn6", 0) or 0),
-                bidp_rsqn7=int(data.get("bidp_rsqn7", 0) or 0),
-                bidp_rsqn8=int(data.get("bidp_rsqn8", 0) or 0),
-                bidp_rsqn9=int(data.get("bidp_rsqn9", 0) or 0),
-                bidp_rsqn10=int(data.get("bidp_rsqn10", 0) or 0),
+                "bidp_rsqn1": int(data.get("bidp_rsqn1", 0) or 0),
+                "bidp_rsqn2": int(data.get("bidp_rsqn2", 0) or 0),
+                "bidp_rsqn3": int(data.get("bidp_rsqn3", 0) or 0),
+                "bidp_rsqn4": int(data.get("bidp_rsqn4", 0) or 0),
+                "bidp_rsqn5": int(data.get("bidp_rsqn5", 0) or 0),
+                "bidp_rsqn6": int(data.get("bidp_rsqn6", 0) or 0),
+                "bidp_rsqn7": int(data.get("bidp_rsqn7", 0) or 0),
+                "bidp_rsqn8": int(data.get("bidp_rsqn8", 0) or 0),
+                "bidp_rsqn9": int(data.get("bidp_rsqn9", 0) or 0),
+                "bidp_rsqn10": int(data.get("bidp_rsqn10", 0) or 0),
                 # 총 호가 잔량
-                total_askp_rsqn=int(data.get("total_askp_rsqn", 0) or 0),
-                total_bidp_rsqn=int(data.get("total_bidp_rsqn", 0) or 0),
-            )
-            db.add(orderbook)
+                "total_askp_rsqn": int(data.get("total_askp_rsqn", 0) or 0),
+                "total_bidp_rsqn": int(data.get("total_bidp_rsqn", 0) or 0),
+            }])
             db.commit()
         except Exception as e:
             db.rollback()
@@ -222,25 +222,24 @@ class CurrentPriceCollector:
             }
 
     async def _save_to_db(self, stock_code: str, data: Dict[str, Any]) -> None:
-        """현재가 데이터를 DB에 저장"""
+        """현재가 데이터를 DB에 저장 (INSERT ... ON CONFLICT)"""
         db = SessionLocal()
         try:
-            current_price = StockCurrentPrice(
-                stock_code=stock_code,
-                datetime=datetime.now(),
-                stck_prpr=float(data.get("stck_prpr", 0) or 0),
-                prdy_vrss=float(data.get("prdy_vrss", 0) or 0),
-                prdy_vrss_sign=data.get("prdy_vrss_sign"),
-                prdy_ctrt=float(data.get("prdy_ctrt", 0) or 0),
-                acml_vol=int(data.get("acml_vol", 0) or 0),
-                acml_tr_pbmn=int(data.get("acml_tr_pbmn", 0) or 0),
-                per=float(data.get("per", 0) or 0) if data.get("per") else None,
-                pbr=float(data.get("pbr", 0) or 0) if data.get("pbr") else None,
-                eps=float(data.get("eps", 0) or 0) if data.get("eps") else None,
-                bps=float(data.get("bps", 0) or 0) if data.get("bps") else None,
-                hts_avls=int(data.get("hts_avls", 0) or 0) if data.get("hts_avls") else None,
-            )
-            db.add(current_price)
+            upsert_rows(db, StockCurrentPrice, [{
+                "stock_code": stock_code,
+                "datetime": datetime.now(),
+                "stck_prpr": float(data.get("stck_prpr", 0) or 0),
+                "prdy_vrss": float(data.get("prdy_vrss", 0) or 0),
+                "prdy_vrss_sign": data.get("prdy_vrss_sign"),
+                "prdy_ctrt": float(data.get("prdy_ctrt", 0) or 0),
+                "acml_vol": int(data.get("acml_vol", 0) or 0),
+                "acml_tr_pbmn": int(data.get("acml_tr_pbmn", 0) or 0),
+                "per": float(data.get("per", 0) or 0) if data.get("per") else None,
+                "pbr": float(data.get("pbr", 0) or 0) if data.get("pbr") else None,
+                "eps": float(data.get("eps", 0) or 0) if data.get("eps") else None,
+                "bps": float(data.get("bps", 0) or 0) if data.get("bps") else None,
+                "hts_avls": int(data.get("hts_avls", 0) or 0) if data.get("hts_avls") else None,
+            }])
             db.commit()
         except Exception as e:
             db.rollback()
@@ -332,40 +331,28 @@ class InvestorTradingCollector:
             }
 
     async def _save_to_db(self, stock_code: str, data: List[Dict[str, Any]]) -> int:
-        """투자자별 매매동향을 DB에 저장"""
+        """투자자별 매매동향을 DB에 저장 (기존 일자는 유지, 1회 INSERT ... ON CONFLICT DO NOTHING)"""
         db = SessionLocal()
-        saved_count = 0
         try:
+            records = []
             for item in data:
                 date_str = item.get("stck_bsop_date")
                 if not date_str:
                     continue
 
-                trade_date = datetime.strptime(date_str, "%Y%m%d")
-
-                # 중복 체크
-                existing = db.query(InvestorTrading).filter(
-                    InvestorTrading.stock_code == stock_code,
-                    InvestorTrading.date == trade_date
-                ).first()
-
-                if existing:
-                    continue
-
-                investor_trading = InvestorTrading(
-                    stock_code=stock_code,
-                    date=trade_date,
-                    stck_clpr=float(item.get("stck_clpr", 0) or 0),
-                    prsn_ntby_qty=int(item.get("prsn_ntby_qty", 0) or 0),
-                    frgn_ntby_qty=int(item.get("frgn_ntby_qty", 0) or 0),
-                    orgn_ntby_qty=int(item.get("orgn_ntby_qty", 0) or 0),
-                    prsn_ntby_tr_pbmn=int(item.get("prsn_ntby_tr_pbmn", 0) or 0),
-                    frgn_ntby_tr_pbmn=int(item.get("frgn_ntby_tr_pbmn", 0) or 0),
-                    orgn_ntby_tr_pbmn=int(item.get("orgn_ntby_tr_pbmn", 0) or 0),
-                )
-                db.add(investor_trading)
-                saved_count += 1
-
+                records.append({
+                    "stock_code": stock_code,
+                    "date": datetime.strptime(date_str, "%Y%m%d"),
+                    "stck_clpr": float(item.get("stck_clpr", 0) or 0),
+                    "prsn_ntby_qty": int(item.get("prsn_ntby_qty", 0) or 0),
+                    "frgn_ntby_qty": int(item.get("frgn_ntby_qty", 0) or 0),
+                    "orgn_ntby_qty": int(item.get("orgn_ntby_qty", 0) or 0),
+                    "prsn_ntby_tr_pbmn": int(item.get("prsn_ntby_tr_pbmn", 0) or 0),
+                    "frgn_ntby_tr_pbmn": int(item.get("frgn_ntby_tr_pbmn", 0) or 0),
+                    "orgn_ntby_tr_pbmn": int(item.get("orgn_ntby_tr_pbmn", 0) or 0),
+                })
+
+            saved_count = len(insert_new_rows(db, InvestorTrading, records))
             db.commit()
             return saved_count
 
@@ -690,51 +677,29 @@ class OvertimePriceCollector:
             }
 
     async def _save_to_db(self, stock_code: str, data: List[Dict[str, Any]]) -> int:
-        """시간외 거래 데이터를 DB에 저장 (일자별)"""
-        from backend.db.models.market_data import StockOvertimePrice
-
+        """시간외 거래 데이터를 DB에 저장 (일자별, 1회 INSERT ... ON CONFLICT DO UPDATE)"""
         db = SessionLocal()
-        saved_count = 0
 
         try:
+            records = []
             for item in data:
                 # 날짜 파싱
                 date_str = item.get("stck_bsop_date")
                 if not date_str:
                     continue
 
-                trade_date = datetime.strptime(date_str, "%Y%m%d").date()
-
-                # 중복 체크
-                existing = db.query(StockOvertimePrice).filter(
-                    StockOvertimePrice.stock_code == stock_code,
-                    StockOvertimePrice.date == trade_date
-                ).first()
-
-                if existing:
-                    # 기존 데이터 업데이트
-                    existing.ovtm_untp_prpr = float(item.get("ovtm_untp_prpr", 0) or 0) if item.get("ovtm_untp_prpr") else None
-                    existing.ovtm_untp_prdy_vrss = float(item.get("ovtm_untp_prdy_vrss", 0) or 0) if item.get("ovtm_untp_prdy_vrss") else None
-                    existing.prdy_vrss_sign = item.get("prdy_vrss_sign")
-                    existing.ovtm_untp_prdy_ctrt = float(item.get("ovtm_untp_prdy_ctrt", 0) or 0) if item.get("ovtm_untp_prdy_ctrt") else None
-                    existing.acml_vol = int(item.get("acml_vol", 0) or 0) if item.get("acml_vol") else None
-                    existing.acml_tr_pbmn = int(item.get("acml_tr_pbmn", 0) or 0) if item.get("acml_tr_pbmn") else None
-                else:
-                    # 새 데이터 삽입
-                    overtime_price = StockOvertimePrice(
-                        stock_code=stock_code,
-                        date=trade_date,
-                        ovtm_untp_prpr=float(item.get("ovtm_untp_prpr", 0) or 0) if item.get("ovtm_untp_prpr") else None,
-                        ovtm_untp_prdy_vrss=float(item.get("ovtm_untp_prdy_vrss", 0) or 0) if item.get("ovtm_untp_prdy_vrss") else None,
-                        prdy_vrss_sign=item.get("prdy_vrss_sign"),
-                        ovtm_untp_prdy_ctrt=float(item.get("ovtm_untp_prdy_ctrt", 0) or 0) if item.get("ovtm_untp_prdy_ctrt") else None,
-                        acml_vol=int(item.get("acml_vol", 0) or 0) if item.get("acml_vol") else None,
-                        acml_tr_pbmn=int(item.get("acml_tr_pbmn", 0) or 0) if item.get("acml_tr_pbmn") else None,
-                    )
-                    db.add(overtime_price)
-
-                saved_count += 1
-
+                records.append({
+                    "stock_code": stock_code,
+                    "date": datetime.strptime(date_str, "%Y%m%d").date(),
+                    "ovtm_untp_prpr": float(item.get("ovtm_untp_prpr", 0) or 0) if item.get("ovtm_untp_prpr") else None,
+                    "ovtm_untp_prdy_vrss": float(item.get("ovtm_untp_prdy_vrss", 0) or 0) if item.get("ovtm_untp_prdy_vrss") else None,
+                    "prdy_vrss_sign": item.get("prdy_vrss_sign"),
+                    "ovtm_untp_prdy_ctrt": float(item.get("ovtm_untp_prdy_ctrt", 0) or 0) if item.get("ovtm_untp_prdy_ctrt") else None,
+                    "acml_vol": int(item.get("acml_vol", 0) or 0) if item.get("acml_vol") else None,
+                    "acml_tr_pbmn": int(item.get("acml_tr_pbmn", 0) or 0) if item.get("acml_tr_pbmn") else None,
+                })
+
+            saved_count = upsert_rows(db, StockOvertimePrice, records)
             db.commit()
             return saved_count
 
@@ -8,10 +8,11 @@ import asyncio
 from typing import List, Dict, Any
 from datetime import datetime
 
-from sqlalchemy.exc import IntegrityError
 from backend.db.session import SessionLocal
+from backend.db.bulk_upsert import insert_new_rows
 from backend.db.models.stock import Stock, StockPriceMinute
 from backend.crawlers.kis_client import get_kis_client
+from backend.services.indicator_store import get_indicator_store
 
 
 logger = logging.getLogger(__name__)
@@ -94,9 +95,9 @@ class MinutePriceCollector:
             저장된 레코드 수
         """
         db = SessionLocal()
-        saved_count = 0
 
         try:
+            records = []
             for bar in data:
                 # datetime 파싱
                 date_str = bar.get("stck_bsop_date")  # YYYYMMDD
@@ -105,54 +106,33 @@ class MinutePriceCollector:
                 if not date_str or not time_str or len(time_str) < 6:
                     continue
 
-                dt = datetime.strptime(
-                    f"{date_str}{time_str}",
-                    "%Y%m%d%H%M%S"
-                )
-
-                # OHLCV 파싱
-                open_price = float(bar.get("stck_oprc", 0))
-                high_price = float(bar.get("stck_hgpr", 0))
-                low_price = float(bar.get("stck_lwpr", 0))
-                close_price = float(bar.get("stck_prpr", 0))
-                volume = int(bar.get("cntg_vol", 0))
-
-                # 중복 체크
-                existing = db.query(StockPriceMinute).filter(
-                    StockPriceMinute.stock_code == stock_code,
-                    StockPriceMinute.datetime == dt
-                ).first()
-
-                if existing:
-                    # 이미 존재하면 스킵
-                    continue
-
-                # 새 레코드 생성
-                minute_price = StockPriceMinute(
-                    stock_code=stock_code,
-                    datetime=dt,
-                    open=open_price,
-                    high=high_price,
-                    low=low_price,
-                    close=close_price,
-                    volume=volume,
-                    source="kis"
-                )
-
-                db.add(minute_price)
-                saved_count += 1
+                records.append({
+                    "stock_code": stock_code,
+                    "datetime": datetime.strptime(f"{date_str}{time_str}", "%Y%m%d%H%M%S"),
+                    "open": float(bar.get("stck_oprc", 0)),
+                    "high": float(bar.get("stck_hgpr", 0)),
+                    "low": float(bar.get("stck_lwpr", 0)),
+                    "close": float(bar.get("stck_prpr", 0)),
+                    "volume": int(bar.get("cntg_vol", 0)),
+                    "source": "kis",
+                })
+
+            # 배치 전체 1회 저장 (이미 존재하는 분봉은 스킵, 신규 분봉만 반환)
+            saved_bars = insert_new_rows(
+                db, StockPriceMinute, records, returning=("datetime", "close", "volume")
+            )
+
+            # 기술적 지표 증분 갱신 (당일 잠정 일봉, SAVEPOINT - 실패해도 분봉 저장은 유지)
+            if saved_bars:
+                get_indicator_store().apply_intraday_bars(db, stock_code, saved_bars)
 
             # 커밋
             db.commit()
-            return saved_count
-
-        except IntegrityError as e:
-            db.rollback()
-            logger.warning(f"⚠️  {stock_code}: 중복 데이터 스킵 - {e}")
-            return 0
+            return len(saved_bars)
 
         except Exception as e:
             db.rollback()
+            get_indicator_store().invalidate(stock_code)
             logger.error(f"❌ {stock_code}: DB 저장 실패 - {e}")
             raise
 
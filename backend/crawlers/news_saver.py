@@ -19,6 +19,7 @@ from backend.utils.encoding_normalizer import get_encoding_normalizer
 from backend.llm.predictor import StockPredictor
 from backend.llm.vector_search import get_vector_search
 from backend.services.stock_analysis_service import update_stock_analysis_summary
+from backend.services.response_cache import invalidate_stock_responses
 import asyncio
 
 
@@ -172,6 +173,12 @@ class NewsSaver:
             self.db.commit()
             self.db.refresh(news_article)
 
+            # 제목 중복 인덱스에 반영 (다음 기사 검사부터 후보에 포함)
+            self.deduplicator.register(news_article.id, news_article.title, news_article.created_at)
+
+            # 대시보드/종목 API 응답 캐시 무효화
+            invalidate_stock_responses(stock_code)
+
             logger.info(
                 f"뉴스 저장 완료: ID={news_article.id}, "
                 f"제목='{news_article.title[:50]}', "
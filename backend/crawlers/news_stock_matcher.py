@@ -1,23 +1,39 @@
 """
 뉴스-주가 매칭기
 
-뉴스 발표 후 1일/3일/5일 주가 변동률을 계산하여 저장합니다.
+뉴스 발표 후 1일/2일/3일/5일/10일/20일 주가 변동률을 계산하여 저장합니다.
+
+- 단건: match_news_with_stock (뉴스당 주가 7회 조회)
+- 일괄: run_daily_matching → calculate_price_changes_bulk
+  종목별 주가를 한 번에 읽어 거래일 달력 기준으로 변동률을 벡터 연산하고,
+  news_stock_matches에 한 문장(INSERT ... ON CONFLICT)으로 저장
 """
 import logging
-from typing import Optional, Dict, Tuple
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 
+import numpy as np
 from sqlalchemy.orm import Session
 
+from backend.db.bulk_upsert import upsert_rows
 from backend.db.models.news import NewsArticle
 from backend.db.models.stock import StockPrice
 from backend.db.models.match import NewsStockMatch
 from backend.utils.business_days import add_business_days
+from backend.utils.trading_calendar import get_trading_calendar
 
 
 logger = logging.getLogger(__name__)
 
 
+# 변동률 계산 기간 (영업일)
+PRICE_CHANGE_HORIZONS: Tuple[int, ...] = (1, 2, 3, 5, 10, 20)
+
+# 주가 일괄 조회 시 IN 절 종목 수
+PRICE_QUERY_CHUNK_SIZE = 500
+
+
 def calculate_price_change(t0_price: float, tn_price: float) -> float:
     """
     주가 변동률을 계산합니다.
@@ -246,6 +262,153 @@ def match_news_with_stock(news_id: int, db: Session) -> bool:
         return False
 
 
+def _load_close_prices(
+    db: Session, stock_codes: Sequence[str], start: datetime, end: datetime
+) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    종목별 일봉 종가를 기간 단위로 일괄 조회합니다.
+
+    같은 일자에 소스가 여러 개면 kis를 우선합니다.
+
+    Returns:
+        {종목 코드: (일자 배열 datetime64[D] 오름차순, 종가 배열 float64)}
+    """
+    rows_by_code: Dict[str, List[Tuple[datetime, float]]] = defaultdict(list)
+    codes = sorted(set(stock_codes))
+
+    for offset in range(0, len(codes), PRICE_QUERY_CHUNK_SIZE):
+        rows = (
+            db.query(StockPrice.stock_code, StockPrice.date, StockPrice.close)
+            .filter(
+                StockPrice.stock_code.in_(codes[offset:offset + PRICE_QUERY_CHUNK_SIZE]),
+                StockPrice.date >= start,
+                StockPrice.date <= end,
+            )
+            .order_by(StockPrice.stock_code, StockPrice.date, StockPrice.source.desc())
+            .all()
+        )
+        for stock_code, date, close in rows:
+            rows_by_code[stock_code].append((date, close))
+
+    prices: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    for stock_code, rows in rows_by_code.items():
+        dates = np.array([date for date, _ in rows], dtype="datetime64[D]")
+        closes = np.array([close for _, close in rows], dtype=np.float64)
+        # 정렬된 배열에서 일자별 첫 행(kis 우선)만 유지
+        dates, first_index = np.unique(dates, return_index=True)
+        prices[stock_code] = (dates, closes[first_index])
+
+    return prices
+
+
+def _lookup_prices(dates: np.ndarray, closes: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """targets 일자의 종가 (없는 일자는 NaN, targets와 같은 shape)"""
+    if len(dates) == 0:
+        return np.full(targets.shape, np.nan)
+
+    index = np.searchsorted(dates, targets)
+    clipped = np.minimum(index, len(dates) - 1)
+    found = (index < len(dates)) & (dates[clipped] == targets)
+    return np.where(found, closes[clipped], np.nan)
+
+
+def calculate_price_changes_bulk(
+    news_list: Sequence[NewsArticle], db: Session
+) -> Dict[int, Dict[str, Optional[float]]]:
+    """
+    여러 뉴스의 1일/2일/3일/5일/10일/20일 주가 변동률을 일괄 계산합니다.
+
+    get_price_changes_for_news와 같은 기준(T0 = 발표일 종가, T+N = N 영업일 후 종가,
+    해당 일자 주가가 없으면 None)을 따르되, 필요한 기간의 주가를 종목별로 한 번만 조회하고
+    거래일 달력으로 뉴스별 T+N 일자를 한 번에 구해 모든 기간을 배열 연산으로 계산합니다.
+
+    Args:
+        news_list: 뉴스 기사 목록 (종목 코드가 없는 뉴스는 제외)
+        db: 데이터베이스 세션
+
+    Returns:
+        {뉴스 ID: {'1d': ..., '2d': ..., '3d': ..., '5d': ..., '10d': ..., '20d': ...}}
+    """
+    targets = [news for news in news_list if news.stock_code and news.published_at]
+    if not targets:
+        return {}
+
+    t0_list = [
+        news.published_at.replace(hour=0, minute=0, second=0, microsecond=0) for news in targets
+    ]
+    t0_dates = np.array(t0_list, dtype="datetime64[D]")
+
+    # 뉴스별 T+N 거래일 (뉴스 수 x 기간 수)
+    horizon_dates = get_trading_calendar().add_sessions_array(
+        t0_dates[:, None], np.array(PRICE_CHANGE_HORIZONS)[None, :]
+    )
+
+    prices = _load_close_prices(
+        db,
+        [news.stock_code for news in targets],
+        min(t0_list),
+        horizon_dates.max().astype("datetime64[s]").astype(datetime),
+    )
+
+    rows_by_code: Dict[str, List[int]] = defaultdict(list)
+    for row, news in enumerate(targets):
+        rows_by_code[news.stock_code].append(row)
+
+    changes = np.full((len(targets), len(PRICE_CHANGE_HORIZONS)), np.nan)
+    for stock_code, rows in rows_by_code.items():
+        if stock_code not in prices:
+            continue
+        dates, closes = prices[stock_code]
+        rows = np.array(rows)
+
+        t0_prices = _lookup_prices(dates, closes, t0_dates[rows])
+        tn_prices = _lookup_prices(dates, closes, horizon_dates[rows])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stock_changes = (tn_prices - t0_prices[:, None]) / t0_prices[:, None] * 100
+        # calculate_price_change와 동일하게 T0 주가가 0이면 0.0
+        stock_changes = np.where(
+            (t0_prices[:, None] == 0) & ~np.isnan(tn_prices), 0.0, stock_changes
+        )
+        changes[rows] = np.round(stock_changes, 2)
+
+    keys = [f"{days}d" for days in PRICE_CHANGE_HORIZONS]
+    logger.debug(f"변동률 일괄 계산: 뉴스 {len(targets)}건, 종목 {len(rows_by_code)}개")
+    return {
+        news.id: {
+            key: (None if np.isnan(value) else float(value))
+            for key, value in zip(keys, changes[row])
+        }
+        for row, news in enumerate(targets)
+    }
+
+
+def save_news_stock_matches(
+    db: Session, price_changes: Dict[int, Tuple[str, Dict[str, Optional[float]]]]
+) -> int:
+    """
+    매칭 결과를 news_stock_matches에 한 번에 upsert 합니다 (커밋은 호출자).
+
+    Args:
+        db: 데이터베이스 세션
+        price_changes: {뉴스 ID: (종목 코드, 변동률 딕셔너리)}
+
+    Returns:
+        저장된 행 수
+    """
+    calculated_at = datetime.utcnow()
+    rows: List[Dict[str, Any]] = [
+        {
+            "news_id": news_id,
+            "stock_code": stock_code,
+            **{f"price_change_{days}d": changes.get(f"{days}d") for days in PRICE_CHANGE_HORIZONS},
+            "calculated_at": calculated_at,
+        }
+        for news_id, (stock_code, changes) in price_changes.items()
+    ]
+    return upsert_rows(db, NewsStockMatch, rows)
+
+
 def run_daily_matching(db: Session, lookback_days: int = 7) -> Tuple[int, int]:
     """
     일일 뉴스-주가 매칭 작업을 실행합니다.
@@ -280,15 +443,25 @@ def run_daily_matching(db: Session, lookback_days: int = 7) -> Tuple[int, int]:
 
         logger.info(f"매칭 대상 뉴스: {len(news_list)}건")
 
-        success_count = 0
-        fail_count = 0
-
-        for news in news_list:
-            success = match_news_with_stock(news.id, db)
-            if success:
-                success_count += 1
-            else:
-                fail_count += 1
+        price_changes = calculate_price_changes_bulk(news_list, db)
+
+        # 모든 변동률이 None이면 저장 안 함 (T0 주가 없음 등)
+        matched = {
+            news.id: (news.stock_code, price_changes[news.id])
+            for news in news_list
+            if news.id in price_changes
+            and any(v is not None for v in price_changes[news.id].values())
+        }
+
+        try:
+            success_count = save_news_stock_matches(db, matched)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"매칭 레코드 일괄 저장 실패: {e}", exc_info=True)
+            return 0, len(news_list)
+
+        fail_count = len(news_list) - success_count
 
         logger.info("=" * 60)
         logger.info(f"✅ 일일 뉴스-주가 매칭 완료: 성공 {success_count}건, 실패 {fail_count}건")
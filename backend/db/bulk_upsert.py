@@ -0,0 +1,248 @@
+"""
+대량 저장(Bulk upsert) 유틸리티
+
+KIS 수집 데이터(일봉/분봉/호가/현재가/투자자매매동향/시간외)를
+행마다 SELECT → INSERT/UPDATE 하는 대신, 배치 전체를
+다중 VALUES `INSERT ... ON CONFLICT` 문으로 한 번에 저장합니다.
+
+- PostgreSQL: ON CONFLICT (유니크 키) DO UPDATE / DO NOTHING
+- SQLite(테스트): 동일한 ON CONFLICT 구문 사용
+
+Usage:
+    upsert_rows(db, StockPrice, {"stock_code": [...], "date": [...], ...})
+    inserted = insert_new_rows(db, StockPriceMinute, rows, returning=("datetime", "volume"))
+    increment_rows(db, PredictionSignalRollup, deltas, increment_columns=("total_count", ...))
+"""
+import logging
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from backend.db.models.stock import StockPrice, StockPriceMinute
+from backend.db.models.indicator import StockIndicatorState
+from backend.db.models.match import NewsStockMatch
+from backend.db.models.signal_rollup import PredictionSignalRollup
+from backend.db.models.stock_prediction_stats import StockPredictionStats
+from backend.db.models.market_data import (
+    StockOrderbook,
+    StockCurrentPrice,
+    InvestorTrading,
+    StockOvertimePrice,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# 테이블별 충돌 판정 유니크 키 (migrations/add_bulk_upsert_unique_keys.py)
+UPSERT_KEYS: Dict[type, Tuple[str, ...]] = {
+    StockPrice: ("stock_code", "date", "source"),
+    StockPriceMinute: ("stock_code", "datetime"),
+    StockOrderbook: ("stock_code", "datetime"),
+    StockCurrentPrice: ("stock_code", "datetime"),
+    InvestorTrading: ("stock_code", "date"),
+    StockOvertimePrice: ("stock_code", "date"),
+    NewsStockMatch: ("news_id", "stock_code"),
+    PredictionSignalRollup: ("stock_code", "date"),
+    StockPredictionStats: ("stock_code",),
+    StockIndicatorState: ("stock_code",),
+}
+
+# PostgreSQL 바인드 파라미터 한도(65535) 이내로 청크 분할
+MAX_BIND_PARAMS = 60000
+
+# 배치 입력: 행 딕셔너리 리스트, 컬럼 → 값 리스트 딕셔너리, 또는 DataFrame
+Batch = Union[Sequence[Mapping[str, Any]], Mapping[str, Sequence[Any]], Any]
+
+
+def to_records(batch: Batch) -> List[Dict[str, Any]]:
+    """
+    배치를 행 딕셔너리 리스트로 변환
+
+    Args:
+        batch: 행 딕셔너리 리스트, 컬럼형 딕셔너리({컬럼: [값...]}), 또는 DataFrame
+
+    Returns:
+        행 딕셔너리 리스트
+    """
+    if hasattr(batch, "to_dict") and hasattr(batch, "columns"):
+        return batch.to_dict("records")
+
+    if isinstance(batch, Mapping):
+        columns = list(batch.keys())
+        if not columns:
+            return []
+        return [dict(zip(columns, values)) for values in zip(*(batch[c] for c in columns))]
+
+    return [dict(row) for row in batch]
+
+
+def _insert_for(db: Session, model: type):
+    """세션 dialect에 맞는 INSERT 구문 생성기 반환"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model)
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    raise ValueError(f"bulk upsert 미지원 DB: {dialect}")
+
+
+def _chunks(records: List[Dict[str, Any]], column_count: int) -> Iterable[List[Dict[str, Any]]]:
+    """바인드 파라미터 한도 이내로 행을 분할"""
+    size = max(1, MAX_BIND_PARAMS // max(column_count, 1))
+    for start in range(0, len(records), size):
+        yield records[start:start + size]
+
+
+def _dedupe(records: List[Dict[str, Any]], keys: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """같은 배치 내 중복 키 제거 (마지막 값 우선, ON CONFLICT 이중 갱신 오류 방지)"""
+    unique: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    for record in records:
+        unique[tuple(record.get(key) for key in keys)] = record
+    return list(unique.values())
+
+
+def upsert_rows(
+    db: Session,
+    model: type,
+    batch: Batch,
+    update_columns: Optional[Sequence[str]] = None,
+) -> int:
+    """
+    배치 전체를 INSERT ... ON CONFLICT DO UPDATE로 저장 (커밋은 호출자)
+
+    Args:
+        db: Database session
+        model: 대상 모델 (UPSERT_KEYS에 등록된 모델)
+        batch: 저장할 배치
+        update_columns: 충돌 시 갱신할 컬럼 (None이면 키를 제외한 배치의 모든 컬럼)
+
+    Returns:
+        저장(삽입 또는 갱신)된 행 수
+    """
+    keys = UPSERT_KEYS[model]
+    records = _dedupe(to_records(batch), keys)
+    if not records:
+        return 0
+
+    columns = list(records[0].keys())
+    if update_columns is None:
+        update_columns = [column for column in columns if column not in keys]
+
+    saved_count = 0
+    for chunk in _chunks(records, len(columns)):
+        stmt = _insert_for(db, model).values(chunk)
+        if update_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(keys),
+                set_={column: stmt.excluded[column] for column in update_columns},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(keys))
+        db.execute(stmt)
+        saved_count += len(chunk)
+
+    logger.debug(f"bulk upsert: {model.__tablename__} {saved_count}건")
+    return saved_count
+
+
+def increment_rows(
+    db: Session,
+    model: type,
+    batch: Batch,
+    increment_columns: Sequence[str],
+) -> int:
+    """
+    배치 전체를 INSERT ... ON CONFLICT DO UPDATE SET 컬럼 = 컬럼 + 증분으로 저장 (커밋은 호출자)
+
+    집계 테이블의 카운터를 조회 없이 한 문장으로 더할 때 사용합니다.
+    같은 배치 내 중복 키는 증분을 합산하며, 증분 외 컬럼은 마지막 값으로 갱신합니다.
+
+    Args:
+        db: Database session
+        model: 대상 모델 (UPSERT_KEYS에 등록된 모델)
+        batch: 저장할 배치 (키 + 증분 컬럼 + 기타 컬럼)
+        increment_columns: 기존 값에 더할 컬럼
+
+    Returns:
+        저장(삽입 또는 갱신)된 행 수
+    """
+    keys = UPSERT_KEYS[model]
+    merged: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    for record in to_records(batch):
+        key = tuple(record.get(k) for k in keys)
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = dict(record)
+        else:
+            for column, value in record.items():
+                if column in increment_columns:
+                    existing[column] = (existing.get(column) or 0) + (value or 0)
+                else:
+                    existing[column] = value
+    records = list(merged.values())
+    if not records:
+        return 0
+
+    columns = list(records[0].keys())
+    table = model.__table__
+
+    saved_count = 0
+    for chunk in _chunks(records, len(columns)):
+        stmt = _insert_for(db, model).values(chunk)
+        set_ = {
+            column: (
+                table.c[column] + stmt.excluded[column]
+                if column in increment_columns
+                else stmt.excluded[column]
+            )
+            for column in columns
+            if column not in keys
+        }
+        db.execute(stmt.on_conflict_do_update(index_elements=list(keys), set_=set_))
+        saved_count += len(chunk)
+
+    logger.debug(f"bulk increment: {model.__tablename__} {saved_count}건")
+    return saved_count
+
+
+def insert_new_rows(
+    db: Session,
+    model: type,
+    batch: Batch,
+    returning: Sequence[str] = (),
+) -> List[Tuple[Any, ...]]:
+    """
+    배치 전체를 INSERT ... ON CONFLICT DO NOTHING으로 저장 (커밋은 호출자)
+
+    이미 존재하는 행은 건너뛰며, 새로 삽입된 행만 반환합니다.
+
+    Args:
+        db: Database session
+        model: 대상 모델 (UPSERT_KEYS에 등록된 모델)
+        batch: 저장할 배치
+        returning: 반환할 컬럼 (비어 있으면 유니크 키)
+
+    Returns:
+        새로 삽입된 행의 returning 컬럼 튜플 리스트
+    """
+    keys = UPSERT_KEYS[model]
+    records = _dedupe(to_records(batch), keys)
+    if not records:
+        return []
+
+    returning_columns = [getattr(model, column) for column in (returning or keys)]
+
+    inserted: List[Tuple[Any, ...]] = []
+    for chunk in _chunks(records, len(records[0])):
+        stmt = (
+            _insert_for(db, model)
+            .values(chunk)
+            .on_conflict_do_nothing(index_elements=list(keys))
+            .returning(*returning_columns)
+        )
+        inserted.extend(tuple(row) for row in db.execute(stmt).all())
+
+    logger.debug(f"bulk insert: {model.__tablename__} {len(inserted)}/{len(records)}건 신규")
+    return inserted
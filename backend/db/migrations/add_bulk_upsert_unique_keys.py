@@ -0,0 +1,96 @@
+"""
+Bulk upsert(INSERT ... ON CONFLICT)용 유니크 인덱스 추가 Migration
+
+기존 중복 행을 정리(가장 최근 id만 유지)한 뒤 충돌 판정 키에 유니크 인덱스를 생성합니다.
+(stock_prices_minute, stock_overtime_price는 테이블 생성 시 이미 유니크 제약 존재)
+
+Usage:
+    uv run python backend/db/migrations/add_bulk_upsert_unique_keys.py
+"""
+import logging
+from sqlalchemy import text
+
+from backend.db.session import SessionLocal
+
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+# (테이블, 유니크 인덱스명, 키 컬럼)
+UNIQUE_KEYS = [
+    ("stock_prices", "uk_stock_prices_code_date_source", ("stock_code", "date", "source")),
+    ("stock_orderbook", "uk_orderbook_stock_datetime", ("stock_code", "datetime")),
+    ("stock_current_price", "uk_current_price_stock_datetime", ("stock_code", "datetime")),
+    ("investor_trading", "uk_investor_trading_stock_date", ("stock_code", "date")),
+]
+
+
+def upgrade():
+    """Migration 실행"""
+    logger.info("=" * 80)
+    logger.info("🚀 Migration: bulk upsert 유니크 인덱스 생성")
+    logger.info("=" * 80)
+
+    db = SessionLocal()
+
+    try:
+        for i, (table, index_name, keys) in enumerate(UNIQUE_KEYS, start=1):
+            logger.info(f"\n{i}. {table} 처리 중...")
+
+            # 중복 행 정리 (키별 최대 id만 유지)
+            join_condition = " AND ".join(f"a.{key} = b.{key}" for key in keys)
+            result = db.execute(text(f"""
+                DELETE FROM {table} a
+                USING {table} b
+                WHERE {join_condition}
+                  AND a.id < b.id;
+            """))
+            logger.info(f"   🧹 중복 {result.rowcount}건 삭제")
+
+            db.execute(text(f"""
+                CREATE UNIQUE INDEX IF NOT EXISTS {index_name}
+                ON {table}({", ".join(keys)});
+            """))
+            logger.info(f"   ✅ {index_name} 인덱스 생성")
+
+        db.commit()
+
+        logger.info("\n" + "=" * 80)
+        logger.info("✅ Migration 완료!")
+        logger.info("=" * 80)
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"\n❌ Migration 실패: {e}", exc_info=True)
+        raise
+
+    finally:
+        db.close()
+
+
+def downgrade():
+    """Migration 롤백"""
+    logger.info("=" * 80)
+    logger.info("🔙 Rollback: bulk upsert 유니크 인덱스 삭제")
+    logger.info("=" * 80)
+
+    db = SessionLocal()
+
+    try:
+        for _, index_name, _ in UNIQUE_KEYS:
+            db.execute(text(f"DROP INDEX IF EXISTS {index_name};"))
+        db.commit()
+        logger.info("\n✅ Rollback 완료!")
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"\n❌ Rollback 실패: {e}", exc_info=True)
+        raise
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    upgrade()
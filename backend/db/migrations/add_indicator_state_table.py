@@ -0,0 +1,95 @@
+"""
+기술적 지표 증분 상태 테이블 추가 Migration
+
+Usage:
+    uv run python backend/db/migrations/add_indicator_state_table.py
+"""
+import logging
+from sqlalchemy import text
+
+from backend.db.session import SessionLocal
+
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+def upgrade():
+    """Migration 실행"""
+    logger.info("=" * 80)
+    logger.info("🚀 Migration: stock_indicator_state 테이블 생성")
+    logger.info("=" * 80)
+
+    db = SessionLocal()
+
+    try:
+        # 테이블 생성
+        logger.info("\n1. 테이블 생성 중...")
+        db.execute(text("""
+            CREATE TABLE IF NOT EXISTS stock_indicator_state (
+                id SERIAL PRIMARY KEY,
+                stock_code VARCHAR(10) NOT NULL,
+
+                -- 마지막 반영 봉 일자
+                bar_date TIMESTAMP,
+
+                -- 증분 상태 / 지표 스냅샷
+                state JSON NOT NULL,
+                indicators JSON,
+
+                -- 메타데이터
+                updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+
+                CONSTRAINT uk_indicator_state_stock_code UNIQUE (stock_code)
+            );
+        """))
+        logger.info("   ✅ stock_indicator_state 테이블 생성 완료")
+
+        # 인덱스 생성
+        logger.info("\n2. 인덱스 생성 중...")
+        db.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_stock_indicator_state_stock_code
+            ON stock_indicator_state(stock_code);
+        """))
+        logger.info("   ✅ ix_stock_indicator_state_stock_code 인덱스 생성")
+
+        db.commit()
+
+        logger.info("\n" + "=" * 80)
+        logger.info("✅ Migration 완료!")
+        logger.info("=" * 80)
+        logger.info("ℹ️  상태는 첫 조회 시 최근 일봉으로 자동 생성됩니다.")
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"\n❌ Migration 실패: {e}", exc_info=True)
+        raise
+
+    finally:
+        db.close()
+
+
+def downgrade():
+    """Migration 롤백"""
+    logger.info("=" * 80)
+    logger.info("🔙 Rollback: stock_indicator_state 테이블 삭제")
+    logger.info("=" * 80)
+
+    db = SessionLocal()
+
+    try:
+        db.execute(text("DROP TABLE IF EXISTS stock_indicator_state CASCADE;"))
+        db.commit()
+        logger.info("\n✅ Rollback 완료!")
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"\n❌ Rollback 실패: {e}", exc_info=True)
+        raise
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    upgrade()
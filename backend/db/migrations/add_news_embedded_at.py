@@ -0,0 +1,103 @@
+"""
+뉴스 임베딩 상태 컬럼(embedded_at) 추가 Migration
+
+- news_articles.embedded_at: Milvus 임베딩 저장 완료 시간 (NULL이면 미임베딩)
+- idx_news_articles_unembedded: 미임베딩 뉴스 조회용 부분 인덱스
+- 이미 Milvus에 저장된 뉴스는 embedded_at을 채움 (Milvus 연결 실패 시 건너뜀)
+
+Usage:
+    uv run python backend/db/migrations/add_news_embedded_at.py
+"""
+import logging
+from sqlalchemy import text
+
+from backend.db.session import SessionLocal
+
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+def upgrade():
+    """Migration 실행"""
+    logger.info("=" * 80)
+    logger.info("🚀 Migration: news_articles.embedded_at 컬럼 추가")
+    logger.info("=" * 80)
+
+    db = SessionLocal()
+
+    try:
+        # 컬럼 추가
+        logger.info("\n1. 컬럼 추가 중...")
+        db.execute(text("""
+            ALTER TABLE news_articles
+            ADD COLUMN IF NOT EXISTS embedded_at TIMESTAMP;
+        """))
+        logger.info("   ✅ embedded_at 컬럼 추가 완료")
+
+        # 부분 인덱스 생성
+        logger.info("\n2. 인덱스 생성 중...")
+        db.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_news_articles_unembedded
+            ON news_articles(id)
+            WHERE embedded_at IS NULL;
+        """))
+        logger.info("   ✅ idx_news_articles_unembedded 인덱스 생성")
+
+        db.commit()
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"\n❌ Migration 실패: {e}", exc_info=True)
+        raise
+
+    finally:
+        db.close()
+
+    # 기존 임베딩 상태 동기화 (청크 단위 커밋, 재실행 가능)
+    logger.info("\n3. Milvus 임베딩 상태 동기화 중...")
+    db = SessionLocal()
+    try:
+        from backend.llm.embedder import get_news_embedder
+
+        marked = get_news_embedder().sync_embedded_state(db)
+        logger.info(f"   ✅ {marked}건 embedded_at 기록")
+    except Exception as e:
+        db.rollback()
+        logger.warning(
+            f"   ⚠️  Milvus 상태 동기화 실패: {e}\n"
+            "   ℹ️  Milvus 연결 후 scripts/backfill_news_embeddings.py --sync-only 를 실행하세요."
+        )
+    finally:
+        db.close()
+
+    logger.info("\n" + "=" * 80)
+    logger.info("✅ Migration 완료!")
+    logger.info("=" * 80)
+
+
+def downgrade():
+    """Migration 롤백"""
+    logger.info("=" * 80)
+    logger.info("🔙 Rollback: news_articles.embedded_at 컬럼 삭제")
+    logger.info("=" * 80)
+
+    db = SessionLocal()
+
+    try:
+        db.execute(text("DROP INDEX IF EXISTS idx_news_articles_unembedded;"))
+        db.execute(text("ALTER TABLE news_articles DROP COLUMN IF EXISTS embedded_at;"))
+        db.commit()
+        logger.info("\n✅ Rollback 완료!")
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"\n❌ Rollback 실패: {e}", exc_info=True)
+        raise
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    upgrade()
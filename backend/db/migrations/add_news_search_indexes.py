@@ -0,0 +1,119 @@
+"""
+뉴스 검색/페이지네이션 인덱스 추가 Migration
+
+- pg_trgm 확장 + 제목/본문 trigram GIN 인덱스 (ILIKE '%검색어%' 부분 일치 검색용)
+- (created_at, id), (published_at, id) 인덱스 (뉴스 목록 키셋 페이지네이션용)
+
+인덱스는 CREATE INDEX CONCURRENTLY로 트랜잭션 밖에서 생성하므로 뉴스 저장(쓰기)을 막지 않습니다.
+(실패로 남은 INVALID 인덱스는 삭제 후 다시 생성)
+
+제약:
+- trigram은 3글자 이상 검색어에서만 인덱스를 사용합니다 (2글자 이하는 정렬 인덱스 순서로 스캔, 개수는 캐시)
+- 한글 trigram 추출은 DB의 LC_CTYPE에 따라 달라지므로 show_trgm('삼성전자')로 확인 후 경고합니다
+
+Usage:
+    uv run python backend/db/migrations/add_news_search_indexes.py
+"""
+import logging
+from sqlalchemy import text
+
+from backend.db.session import engine
+
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+INDEXES = [
+    ("idx_news_articles_title_trgm", "USING gin (title gin_trgm_ops)"),
+    ("idx_news_articles_content_trgm", "USING gin (content gin_trgm_ops)"),
+    ("idx_news_articles_created_at_id", "(created_at, id)"),
+    ("idx_news_articles_published_at_id", "(published_at, id)"),
+]
+
+# 한글 trigram 추출 확인용 문자열
+HANGUL_SAMPLE = "삼성전자"
+
+
+def _check_hangul_trigrams(conn) -> None:
+    """DB 로캘(LC_CTYPE)에서 한글 trigram이 추출되는지 확인 (추출되지 않으면 경고만)"""
+    ctype = conn.execute(
+        text("SELECT datctype FROM pg_database WHERE datname = current_database()")
+    ).scalar()
+    trigrams = conn.execute(text("SELECT show_trgm(:sample)"), {"sample": HANGUL_SAMPLE}).scalar()
+    # 한글이 단어 문자로 인식되지 않으면 공백 trigram만 남음
+    hangul_trigrams = [trigram for trigram in trigrams or [] if any("가" <= ch <= "힣" for ch in trigram)]
+
+    if hangul_trigrams:
+        logger.info(f"   ✅ 한글 trigram 추출 확인 (LC_CTYPE={ctype}, {len(hangul_trigrams)}개)")
+    else:
+        logger.warning(
+            f"   ⚠️  LC_CTYPE={ctype}에서 한글 trigram이 추출되지 않습니다. "
+            f"한글 검색은 trigram 인덱스를 사용하지 못합니다 (UTF-8 로캘, 예: ko_KR.UTF-8 / C.UTF-8 권장)"
+        )
+
+
+def upgrade():
+    """Migration 실행"""
+    logger.info("=" * 80)
+    logger.info("🚀 Migration: 뉴스 검색/페이지네이션 인덱스 추가")
+    logger.info("=" * 80)
+
+    try:
+        # CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 autocommit 연결 사용
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            # 확장 설치
+            logger.info("\n1. pg_trgm 확장 설치 중...")
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm;"))
+            logger.info("   ✅ pg_trgm 확장 설치 완료")
+            _check_hangul_trigrams(conn)
+
+            # 인덱스 생성 (쓰기 잠금 없이)
+            logger.info("\n2. 인덱스 생성 중 (CONCURRENTLY)...")
+            for name, definition in INDEXES:
+                invalid = conn.execute(text("""
+                    SELECT 1
+                    FROM pg_index i
+                    JOIN pg_class c ON c.oid = i.indexrelid
+                    WHERE c.relname = :name AND NOT i.indisvalid
+                """), {"name": name}).scalar()
+                if invalid:
+                    logger.warning(f"   ⚠️  이전 실패로 남은 INVALID 인덱스 삭제: {name}")
+                    conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name};"))
+
+                conn.execute(text(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON news_articles {definition};"
+                ))
+                logger.info(f"   ✅ {name} 인덱스 생성")
+
+            # 통계 갱신 (필터 없는 목록의 전체 개수 추정치에 사용)
+            conn.execute(text("ANALYZE news_articles;"))
+
+        logger.info("\n" + "=" * 80)
+        logger.info("✅ Migration 완료!")
+        logger.info("=" * 80)
+
+    except Exception as e:
+        logger.error(f"\n❌ Migration 실패: {e}", exc_info=True)
+        raise
+
+
+def downgrade():
+    """Migration 롤백"""
+    logger.info("=" * 80)
+    logger.info("🔙 Rollback: 뉴스 검색/페이지네이션 인덱스 삭제")
+    logger.info("=" * 80)
+
+    try:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            for name, _ in INDEXES:
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name};"))
+        logger.info("\n✅ Rollback 완료!")
+
+    except Exception as e:
+        logger.error(f"\n❌ Rollback 실패: {e}", exc_info=True)
+        raise
+
+
+if __name__ == "__main__":
+    upgrade()
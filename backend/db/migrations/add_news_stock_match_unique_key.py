@@ -0,0 +1,85 @@
+"""
+뉴스-주가 매칭 유니크 인덱스 추가 Migration
+
+일일 매칭 결과를 INSERT ... ON CONFLICT 한 문장으로 저장할 수 있도록
+news_stock_matches(news_id, stock_code)에 유니크 인덱스를 생성합니다.
+기존 중복 행은 가장 최근 id만 유지합니다.
+
+Usage:
+    uv run python backend/db/migrations/add_news_stock_match_unique_key.py
+"""
+import logging
+from sqlalchemy import text
+
+from backend.db.session import SessionLocal
+
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+def upgrade():
+    """Migration 실행"""
+    logger.info("=" * 80)
+    logger.info("🚀 Migration: news_stock_matches 유니크 인덱스 생성")
+    logger.info("=" * 80)
+
+    db = SessionLocal()
+
+    try:
+        logger.info("\n1. 중복 매칭 행 정리 중...")
+        result = db.execute(text("""
+            DELETE FROM news_stock_matches a
+            USING news_stock_matches b
+            WHERE a.news_id = b.news_id
+              AND a.stock_code = b.stock_code
+              AND a.id < b.id;
+        """))
+        logger.info(f"   🧹 중복 {result.rowcount}건 삭제")
+
+        logger.info("\n2. 유니크 인덱스 생성 중...")
+        db.execute(text("""
+            CREATE UNIQUE INDEX IF NOT EXISTS uk_news_stock_matches_news_stock
+            ON news_stock_matches(news_id, stock_code);
+        """))
+        logger.info("   ✅ uk_news_stock_matches_news_stock 인덱스 생성")
+
+        db.commit()
+
+        logger.info("\n" + "=" * 80)
+        logger.info("✅ Migration 완료!")
+        logger.info("=" * 80)
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"\n❌ Migration 실패: {e}", exc_info=True)
+        raise
+
+    finally:
+        db.close()
+
+
+def downgrade():
+    """Migration 롤백"""
+    logger.info("=" * 80)
+    logger.info("🔙 Rollback: news_stock_matches 유니크 인덱스 삭제")
+    logger.info("=" * 80)
+
+    db = SessionLocal()
+
+    try:
+        db.execute(text("DROP INDEX IF EXISTS uk_news_stock_matches_news_stock;"))
+        db.commit()
+        logger.info("\n✅ Rollback 완료!")
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"\n❌ Rollback 실패: {e}", exc_info=True)
+        raise
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    upgrade()
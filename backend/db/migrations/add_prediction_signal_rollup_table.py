@@ -0,0 +1,102 @@
+"""
+AI 시그널 집계 테이블(prediction_signal_rollup) 추가 Migration
+
+- 종목/일자별 예측 수, 긍정/부정 수, sentiment_score 합계/개수
+- 기존 predictions로 초기 집계를 채움 (이후는 예측 저장 시 증분 갱신)
+
+Usage:
+    uv run python backend/db/migrations/add_prediction_signal_rollup_table.py
+"""
+import logging
+from sqlalchemy import text
+
+from backend.db.session import SessionLocal
+from backend.services.signal_rollup import rebuild_signal_rollup
+
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+def upgrade():
+    """Migration 실행"""
+    logger.info("=" * 80)
+    logger.info("🚀 Migration: prediction_signal_rollup 테이블 생성")
+    logger.info("=" * 80)
+
+    db = SessionLocal()
+
+    try:
+        # 테이블 생성
+        logger.info("\n1. 테이블 생성 중...")
+        db.execute(text("""
+            CREATE TABLE IF NOT EXISTS prediction_signal_rollup (
+                id SERIAL PRIMARY KEY,
+                stock_code VARCHAR(10) NOT NULL,
+                date DATE NOT NULL,
+
+                -- 시그널 카운터
+                total_count INTEGER NOT NULL DEFAULT 0,
+                positive_count INTEGER NOT NULL DEFAULT 0,
+                negative_count INTEGER NOT NULL DEFAULT 0,
+                sentiment_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+                sentiment_count INTEGER NOT NULL DEFAULT 0,
+
+                -- 메타데이터
+                updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+            );
+        """))
+        logger.info("   ✅ prediction_signal_rollup 테이블 생성 완료")
+
+        # 인덱스 생성
+        logger.info("\n2. 인덱스 생성 중...")
+        db.execute(text("""
+            CREATE UNIQUE INDEX IF NOT EXISTS uk_signal_rollup_stock_date
+            ON prediction_signal_rollup(stock_code, date);
+        """))
+        logger.info("   ✅ uk_signal_rollup_stock_date 인덱스 생성")
+
+        # 초기 집계
+        logger.info("\n3. 기존 예측 집계 중...")
+        count = rebuild_signal_rollup(db)
+        logger.info(f"   ✅ {count}개 종목/일자 집계 완료")
+
+        db.commit()
+
+        logger.info("\n" + "=" * 80)
+        logger.info("✅ Migration 완료!")
+        logger.info("=" * 80)
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"\n❌ Migration 실패: {e}", exc_info=True)
+        raise
+
+    finally:
+        db.close()
+
+
+def downgrade():
+    """Migration 롤백"""
+    logger.info("=" * 80)
+    logger.info("🔙 Rollback: prediction_signal_rollup 테이블 삭제")
+    logger.info("=" * 80)
+
+    db = SessionLocal()
+
+    try:
+        db.execute(text("DROP TABLE IF EXISTS prediction_signal_rollup;"))
+        db.commit()
+        logger.info("\n✅ Rollback 완료!")
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"\n❌ Rollback 실패: {e}", exc_info=True)
+        raise
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    upgrade()
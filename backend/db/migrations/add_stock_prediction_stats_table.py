@@ -0,0 +1,127 @@
+"""
+종목별 예측 통계 테이블(stock_prediction_stats) 추가 Migration
+
+- 종목별 예측 수, 방향별 수, sentiment_score 합계/개수
+- confidence_breakdown / pattern_analysis 항목별 합계/개수
+- 기존 predictions로 초기 통계를 채움 (이후는 예측 저장 시 증분 갱신)
+
+Usage:
+    uv run python backend/db/migrations/add_stock_prediction_stats_table.py
+"""
+import logging
+from sqlalchemy import text
+
+from backend.db.session import SessionLocal
+from backend.services.stock_prediction_stats import rebuild_stock_prediction_stats
+
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+def upgrade():
+    """Migration 실행"""
+    logger.info("=" * 80)
+    logger.info("🚀 Migration: stock_prediction_stats 테이블 생성")
+    logger.info("=" * 80)
+
+    db = SessionLocal()
+
+    try:
+        # 테이블 생성
+        logger.info("\n1. 테이블 생성 중...")
+        db.execute(text("""
+            CREATE TABLE IF NOT EXISTS stock_prediction_stats (
+                id SERIAL PRIMARY KEY,
+                stock_code VARCHAR(10) NOT NULL,
+
+                -- 예측 수 / 방향 분포
+                prediction_count INTEGER NOT NULL DEFAULT 0,
+                positive_count INTEGER NOT NULL DEFAULT 0,
+                negative_count INTEGER NOT NULL DEFAULT 0,
+                neutral_count INTEGER NOT NULL DEFAULT 0,
+
+                -- sentiment_score
+                sentiment_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+                sentiment_count INTEGER NOT NULL DEFAULT 0,
+
+                -- confidence_breakdown
+                similar_news_quality_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+                similar_news_quality_count INTEGER NOT NULL DEFAULT 0,
+                pattern_consistency_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+                pattern_consistency_count INTEGER NOT NULL DEFAULT 0,
+                disclosure_impact_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+                disclosure_impact_count INTEGER NOT NULL DEFAULT 0,
+
+                -- pattern_analysis
+                pattern_avg_1d_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+                pattern_avg_1d_count INTEGER NOT NULL DEFAULT 0,
+                pattern_avg_2d_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+                pattern_avg_2d_count INTEGER NOT NULL DEFAULT 0,
+                pattern_avg_3d_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+                pattern_avg_3d_count INTEGER NOT NULL DEFAULT 0,
+                pattern_avg_5d_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+                pattern_avg_5d_count INTEGER NOT NULL DEFAULT 0,
+                pattern_avg_10d_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+                pattern_avg_10d_count INTEGER NOT NULL DEFAULT 0,
+                pattern_avg_20d_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+                pattern_avg_20d_count INTEGER NOT NULL DEFAULT 0,
+
+                -- 메타데이터
+                updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+            );
+        """))
+        logger.info("   ✅ stock_prediction_stats 테이블 생성 완료")
+
+        # 인덱스 생성
+        logger.info("\n2. 인덱스 생성 중...")
+        db.execute(text("""
+            CREATE UNIQUE INDEX IF NOT EXISTS uk_stock_prediction_stats_stock
+            ON stock_prediction_stats(stock_code);
+        """))
+        logger.info("   ✅ uk_stock_prediction_stats_stock 인덱스 생성")
+
+        # 초기 집계
+        logger.info("\n3. 기존 예측 통계 계산 중...")
+        count = rebuild_stock_prediction_stats(db)
+        logger.info(f"   ✅ {count}개 종목 통계 계산 완료")
+
+        db.commit()
+
+        logger.info("\n" + "=" * 80)
+        logger.info("✅ Migration 완료!")
+        logger.info("=" * 80)
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"\n❌ Migration 실패: {e}", exc_info=True)
+        raise
+
+    finally:
+        db.close()
+
+
+def downgrade():
+    """Migration 롤백"""
+    logger.info("=" * 80)
+    logger.info("🔙 Rollback: stock_prediction_stats 테이블 삭제")
+    logger.info("=" * 80)
+
+    db = SessionLocal()
+
+    try:
+        db.execute(text("DROP TABLE IF EXISTS stock_prediction_stats;"))
+        db.commit()
+        logger.info("\n✅ Rollback 완료!")
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"\n❌ Rollback 실패: {e}", exc_info=True)
+        raise
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    upgrade()
@@ -1,11 +1,35 @@
 """
 Milvus vector database connection and utility functions.
+
+MilvusConnectionManager (get_milvus_manager):
+    프로세스 전체가 공유하는 Milvus 연결 풀과 컬렉션 핸들.
+    호출마다 connect → load → disconnect 하지 않고, 미리 연결된 alias와
+    한 번 로드된 컬렉션으로 검색/조회/삽입만 수행합니다.
 """
-from typing import Optional
+import itertools
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Set, Tuple, TypeVar
+import grpc
 from pymilvus import connections, Collection, utility
+from pymilvus.exceptions import ConnectError, ConnectionNotExistException, MilvusUnavailableException
 from backend.config import settings
 
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 재연결 대상 예외 (연결/RPC 장애). 표현식·스키마 오류 등은 재연결 없이 그대로 전파
+RECONNECT_ERRORS = (
+    ConnectionError,
+    ConnectError,
+    ConnectionNotExistException,
+    MilvusUnavailableException,
+    grpc.RpcError,
+)
+
+
 def connect_milvus(alias: str = "default") -> None:
     """
     Connect to Milvus server.
@@ -108,3 +132,224 @@ def drop_collection(collection_name: str, alias: str = "default") -> bool:
     except Exception as e:
         print(f"❌ 컬렉션 삭제 실패: {e}")
         return False
+
+
+class MilvusConnectionManager:
+    """
+    프로세스 공유 Milvus 연결 풀 + 컬렉션 핸들 관리자
+
+    - pool_size개의 alias(gRPC 채널)를 라운드로빈으로 사용 (채널은 스레드 안전)
+    - 컬렉션 핸들은 (alias, 컬렉션)별로 캐싱, load()는 컬렉션당 한 번
+    - 연결은 alias별 락, load()는 컬렉션별 락에서 수행 (전역 락은 상태 갱신에만 사용하므로
+      한 컬렉션 로드 중에도 다른 작업은 진행)
+    - 연결/RPC 장애(RECONNECT_ERRORS)일 때만 해당 alias를 재연결하고 컬렉션을 다시 로드한 뒤 한 번 재시도
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        pool_size: int = 4,
+        alias_prefix: str = "craveny_pool",
+    ):
+        """
+        Args:
+            host: Milvus 호스트
+            port: Milvus 포트
+            pool_size: 연결(alias) 수
+            alias_prefix: alias 접두사
+        """
+        self.host = host
+        self.port = port
+        self.aliases = [f"{alias_prefix}_{i}" for i in range(max(1, pool_size))]
+
+        self._lock = threading.Lock()
+        self._round_robin = itertools.cycle(self.aliases)
+        self._connected: Set[str] = set()
+        self._collections: Dict[Tuple[str, str], Collection] = {}
+        self._loaded: Set[str] = set()
+        self._reconnects = 0
+        # alias별 연결 락, 컬렉션별 로드 락
+        self._alias_locks: Dict[str, threading.Lock] = {}
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+    def _next_alias(self) -> str:
+        with self._lock:
+            return next(self._round_robin)
+
+    def _named_lock(self, locks: Dict[str, threading.Lock], name: str) -> threading.Lock:
+        with self._lock:
+            lock = locks.get(name)
+            if lock is None:
+                lock = locks[name] = threading.Lock()
+            return lock
+
+    def _connect(self, alias: str) -> None:
+        """alias 연결 (이미 연결되어 있으면 무시)"""
+        if alias in self._connected:
+            return
+        with self._named_lock(self._alias_locks, alias):
+            if alias in self._connected:
+                return
+            connections.connect(alias=alias, host=self.host, port=self.port)
+            with self._lock:
+                self._connected.add(alias)
+            logger.info(f"🔌 Milvus 연결: {alias} ({self.host}:{self.port})")
+
+    def _reconnect(self, alias: str) -> None:
+        """alias 재연결 (캐싱된 컬렉션 핸들/로드 상태 초기화)"""
+        with self._named_lock(self._alias_locks, alias):
+            try:
+                connections.disconnect(alias)
+            except Exception:
+                pass
+            with self._lock:
+                self._connected.discard(alias)
+                self._collections = {
+                    key: collection for key, collection in self._collections.items() if key[0] != alias
+                }
+                # 서버 재시작으로 컬렉션이 release 되었을 수 있으므로 다시 로드
+                self._loaded.clear()
+                self._reconnects += 1
+        self._connect(alias)
+
+    def get_collection(self, collection_name: str, load: bool = True, alias: Optional[str] = None) -> Collection:
+        """
+        컬렉션 핸들 조회 (연결/로드는 최초 1회)
+
+        Args:
+            collection_name: 컬렉션 이름
+            load: 검색/조회용으로 메모리에 로드할지 여부
+            alias: 사용할 alias (None이면 라운드로빈)
+
+        Returns:
+            Collection
+        """
+        alias = alias or self._next_alias()
+        self._connect(alias)
+
+        key = (alias, collection_name)
+        collection = self._collections.get(key)
+        if collection is None:
+            collection = Collection(collection_name, using=alias)
+            with self._lock:
+                self._collections[key] = collection
+
+        if load and collection_name not in self._loaded:
+            with self._named_lock(self._load_locks, collection_name):
+                if collection_name not in self._loaded:
+                    collection.load()
+                    with self._lock:
+                        self._loaded.add(collection_name)
+                    logger.info(f"📂 Milvus 컬렉션 로드: {collection_name}")
+
+        return collection
+
+    def execute(
+        self,
+        collection_name: str,
+        operation: Callable[[Collection], T],
+        load: bool = True,
+        retry: bool = True,
+    ) -> T:
+        """
+        컬렉션 작업 실행 (연결/RPC 장애 시 재연결 후 1회 재시도, 그 외 예외는 그대로 전파)
+
+        Args:
+            collection_name: 컬렉션 이름
+            operation: Collection을 받아 작업을 수행하는 함수 (search/query/insert 등)
+            load: 작업 전 컬렉션 로드 필요 여부 (search/query는 True)
+            retry: 재연결 후 재시도 여부 (insert처럼 멱등이 아닌 작업은 False, 재연결만 수행)
+
+        Returns:
+            operation 반환값
+        """
+        alias = self._next_alias()
+        try:
+            return operation(self.get_collection(collection_name, load=load, alias=alias))
+        except RECONNECT_ERRORS as e:
+            logger.warning(
+                f"⚠️  Milvus 작업 실패, 재연결{' 후 재시도' if retry else ''} ({alias}): {e}"
+            )
+            self._reconnect(alias)
+            if not retry:
+                raise
+            return operation(self.get_collection(collection_name, load=load, alias=alias))
+
+    def health_check(self, collection_name: str = "news_embeddings") -> Dict[str, Any]:
+        """
+        연결 상태 확인 (실패한 alias는 재연결 시도)
+
+        Returns:
+            {status, server_version, embeddings_count, connected, reconnects}
+        """
+        alias = self.aliases[0]
+        try:
+            try:
+                self._connect(alias)
+                version = utility.get_server_version(using=alias)
+            except Exception:
+                self._reconnect(alias)
+                version = utility.get_server_version(using=alias)
+
+            count = self.execute(collection_name, lambda collection: collection.num_entities, load=False)
+            return {
+                "status": "healthy",
+                "error": None,
+                "server_version": version,
+                "embeddings_count": count,
+                "connected": len(self._connected),
+                "reconnects": self._reconnects,
+            }
+        except Exception as e:
+            return {
+                "status": "unhealthy",
+                "error": str(e),
+                "connected": len(self._connected),
+                "reconnects": self._reconnects,
+            }
+
+    def close(self) -> None:
+        """모든 연결 해제"""
+        with self._lock:
+            for alias in list(self._connected):
+                try:
+                    connections.disconnect(alias)
+                except Exception as e:
+                    logger.warning(f"⚠️  Milvus 연결 해제 중 경고 ({alias}): {e}")
+            self._connected.clear()
+            self._collections.clear()
+            self._loaded.clear()
+        logger.info("✅ Milvus 연결 풀 종료")
+
+
+# 싱글톤 인스턴스
+_milvus_manager: Optional[MilvusConnectionManager] = None
+_milvus_manager_lock = threading.Lock()
+
+
+def get_milvus_manager() -> MilvusConnectionManager:
+    """
+    MilvusConnectionManager 싱글톤 인스턴스를 반환합니다.
+
+    Returns:
+        MilvusConnectionManager 인스턴스
+    """
+    global _milvus_manager
+    with _milvus_manager_lock:
+        if _milvus_manager is None:
+            _milvus_manager = MilvusConnectionManager(
+                host=settings.MILVUS_HOST,
+                port=settings.MILVUS_PORT,
+                pool_size=settings.MILVUS_POOL_SIZE,
+            )
+        return _milvus_manager
+
+
+def close_milvus_manager() -> None:
+    """Milvus 연결 풀 종료 (애플리케이션 종료 시)"""
+    global _milvus_manager
+    with _milvus_manager_lock:
+        if _milvus_manager is not None:
+            _milvus_manager.close()
+            _milvus_manager = None
@@ -16,6 +16,9 @@ from backend.db.models.market_data import (
     IndexDailyPrice,
     StockOvertimePrice,
 )
+from backend.db.models.indicator import StockIndicatorState
+from backend.db.models.signal_rollup import PredictionSignalRollup
+from backend.db.models.stock_prediction_stats import StockPredictionStats
 
 __all__ = [
     "Base",
@@ -34,4 +37,7 @@ __all__ = [
     "SectorIndex",
     "IndexDailyPrice",
     "StockOvertimePrice",
+    "StockIndicatorState",
+    "PredictionSignalRollup",
+    "StockPredictionStats",
 ]
@@ -0,0 +1,38 @@
+"""
+기술적 지표 상태 모델 (종목별 증분 계산 상태 + 최신 지표 스냅샷).
+"""
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from datetime import datetime
+from backend.db.base import Base
+
+
+class StockIndicatorState(Base):
+    """
+    종목별 기술적 지표 증분 상태 모델.
+
+    일봉/분봉 저장 시 마지막 봉만 반영하여 갱신되며,
+    예측/리포트 생성 시 재계산 없이 indicators 스냅샷을 그대로 읽습니다.
+
+    Attributes:
+        id: Primary key
+        stock_code: 종목 코드 (종목당 1행)
+        bar_date: 마지막으로 반영된 봉의 일자
+        state: 증분 계산 상태 (이동합계, EMA, Wilder RSI 평균 등)
+        indicators: 최신 지표 딕셔너리 (get_technical_indicators 결과와 동일 구조)
+        updated_at: 갱신일시
+    """
+
+    __tablename__ = "stock_indicator_state"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    stock_code = Column(String(10), nullable=False, unique=True, index=True)
+    bar_date = Column(DateTime, nullable=True)
+    state = Column(JSON, nullable=False)
+    indicators = Column(JSON, nullable=True)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<StockIndicatorState(stock_code='{self.stock_code}', "
+            f"bar_date={self.bar_date})>"
+        )
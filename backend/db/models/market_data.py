@@ -85,6 +85,7 @@ class StockOrderbook(Base):
 
     __table_args__ = (
         Index("idx_orderbook_stock_datetime", "stock_code", "datetime"),
+        Index("uk_orderbook_stock_datetime", "stock_code", "datetime", unique=True),
     )
 
     def __repr__(self) -> str:
@@ -143,6 +144,7 @@ class StockCurrentPrice(Base):
 
     __table_args__ = (
         Index("idx_current_price_stock_datetime", "stock_code", "datetime"),
+        Index("uk_current_price_stock_datetime", "stock_code", "datetime", unique=True),
     )
 
     def __repr__(self) -> str:
@@ -192,6 +194,7 @@ class InvestorTrading(Base):
 
     __table_args__ = (
         Index("idx_investor_trading_stock_date", "stock_code", "date"),
+        Index("uk_investor_trading_stock_date", "stock_code", "date", unique=True),
     )
 
     def __repr__(self) -> str:
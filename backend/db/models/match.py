@@ -2,7 +2,7 @@
 NewsStockMatch model for storing news-stock price correlations.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from backend.db.base import Base
 
@@ -38,6 +38,11 @@ class NewsStockMatch(Base):
     price_change_20d = Column(Float, nullable=True)
     calculated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # bulk upsert 충돌 판정 키 (migrations/add_news_stock_match_unique_key.py)
+    __table_args__ = (
+        Index("uk_news_stock_matches_news_stock", "news_id", "stock_code", unique=True),
+    )
+
     # Relationship
     news_article = relationship("NewsArticle", lazy="select")
 
@@ -3,7 +3,7 @@ NewsArticle model for storing news articles and other content sources.
 """
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, Integer, String, Text, DateTime, Index, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, Enum as SQLEnum, text
 from sqlalchemy.dialects.postgresql import JSONB
 from backend.db.base import Base
 
@@ -29,6 +29,7 @@ class NewsArticle(Base):
         stock_code: 관련 종목 코드 (예: '005930')
         created_at: 데이터 생성 시간
         notified_at: 텔레그램 알림 전송 시간 (None이면 미전송)
+        embedded_at: Milvus 임베딩 저장 완료 시간 (None이면 미임베딩)
 
         # 멀티 플랫폼 지원 필드
         content_type: 콘텐츠 타입 (news, reddit, twitter 등)
@@ -55,6 +56,7 @@ class NewsArticle(Base):
     stock_code = Column(String(10), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     notified_at = Column(DateTime, nullable=True)
+    embedded_at = Column(DateTime, nullable=True)
 
     # 멀티 플랫폼 지원 필드
     content_type = Column(
@@ -80,6 +82,29 @@ class NewsArticle(Base):
         Index("idx_news_articles_content_type", "content_type"),
         Index("idx_news_articles_subreddit", "subreddit"),
         Index("idx_news_articles_source_type", "source", "content_type"),
+        # 미임베딩 뉴스 조회용 부분 인덱스 (임베딩 완료 행은 인덱스에서 빠짐)
+        Index(
+            "idx_news_articles_unembedded",
+            "id",
+            postgresql_where=text("embedded_at IS NULL"),
+            sqlite_where=text("embedded_at IS NULL"),
+        ),
+        # 뉴스 목록 키셋 페이지네이션용 (정렬 컬럼, id)
+        Index("idx_news_articles_created_at_id", "created_at", "id"),
+        Index("idx_news_articles_published_at_id", "published_at", "id"),
+        # 제목/본문 부분 일치 검색용 trigram GIN 인덱스 (PostgreSQL pg_trgm 확장 필요)
+        Index(
+            "idx_news_articles_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_news_articles_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
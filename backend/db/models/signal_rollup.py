@@ -0,0 +1,48 @@
+"""
+Per-stock daily prediction signal rollup.
+"""
+from sqlalchemy import Column, Integer, String, Float, DateTime, Date, Index
+from datetime import datetime
+from backend.db.base import Base
+
+
+class PredictionSignalRollup(Base):
+    """
+    종목/일자별 AI 시그널 집계 테이블.
+
+    예측 저장/수정/삭제 시 같은 트랜잭션에서 증분 갱신되며
+    (services/signal_rollup.py), 대시보드는 predictions 전체를 집계하는 대신 이 테이블을 읽습니다.
+
+    Attributes:
+        stock_code: 종목 코드
+        date: 예측 생성일 (predictions.created_at 기준)
+        total_count: 예측 수
+        positive_count: sentiment_direction = 'positive' 예측 수
+        negative_count: sentiment_direction = 'negative' 예측 수
+        sentiment_sum: sentiment_score 합계 (NULL 제외)
+        sentiment_count: sentiment_score가 있는 예측 수
+    """
+    __tablename__ = "prediction_signal_rollup"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    stock_code = Column(String(10), nullable=False)
+    date = Column(Date, nullable=False)
+
+    total_count = Column(Integer, default=0, nullable=False)
+    positive_count = Column(Integer, default=0, nullable=False)
+    negative_count = Column(Integer, default=0, nullable=False)
+    sentiment_sum = Column(Float, default=0.0, nullable=False)
+    sentiment_count = Column(Integer, default=0, nullable=False)
+
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
+
+    __table_args__ = (
+        Index("uk_signal_rollup_stock_date", "stock_code", "date", unique=True),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<PredictionSignalRollup(stock_code='{self.stock_code}', date={self.date}, "
+            f"total={self.total_count}, positive={self.positive_count}, "
+            f"negative={self.negative_count})>"
+        )
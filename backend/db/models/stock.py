@@ -68,6 +68,7 @@ class StockPrice(Base):
     __table_args__ = (
         Index("idx_stock_prices_stock_code_date", "stock_code", "date"),
         Index("idx_stock_prices_date_source", "date", "source"),
+        Index("uk_stock_prices_code_date_source", "stock_code", "date", "source", unique=True),
     )
 
     def __repr__(self) -> str:
@@ -110,6 +111,7 @@ class StockPriceMinute(Base):
     # 복합 인덱스: stock_code와 datetime로 빠른 조회
     __table_args__ = (
         Index("idx_minute_stock_datetime", "stock_code", "datetime"),
+        Index("uk_stock_datetime", "stock_code", "datetime", unique=True),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,72 @@
+"""
+Per-stock running prediction statistics.
+"""
+from sqlalchemy import Column, Integer, String, Float, DateTime, Index
+from datetime import datetime
+from backend.db.base import Base
+
+
+class StockPredictionStats(Base):
+    """
+    종목별 예측 종합 통계 테이블.
+
+    예측 저장/수정/삭제 시 같은 트랜잭션에서 합계/개수를 증분 갱신하며
+    (services/stock_prediction_stats.py), 종목 상세 API는 predictions 전체를 읽는 대신 이 행 하나를 읽습니다.
+
+    Attributes:
+        stock_code: 종목 코드
+        prediction_count: 예측 수
+        positive_count / negative_count / neutral_count: sentiment_direction별 예측 수
+        sentiment_sum / sentiment_count: sentiment_score 합계 / 개수 (NULL 제외)
+        <key>_sum / <key>_count: confidence_breakdown 항목별 합계 / 개수 (숫자가 아닌 값 제외)
+        pattern_<key>_sum / pattern_<key>_count: pattern_analysis 항목별 합계 / 개수 (0.0 제외)
+    """
+    __tablename__ = "stock_prediction_stats"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    stock_code = Column(String(10), nullable=False)
+
+    # 예측 수 / 방향 분포
+    prediction_count = Column(Integer, default=0, nullable=False)
+    positive_count = Column(Integer, default=0, nullable=False)
+    negative_count = Column(Integer, default=0, nullable=False)
+    neutral_count = Column(Integer, default=0, nullable=False)
+
+    # sentiment_score
+    sentiment_sum = Column(Float, default=0.0, nullable=False)
+    sentiment_count = Column(Integer, default=0, nullable=False)
+
+    # confidence_breakdown
+    similar_news_quality_sum = Column(Float, default=0.0, nullable=False)
+    similar_news_quality_count = Column(Integer, default=0, nullable=False)
+    pattern_consistency_sum = Column(Float, default=0.0, nullable=False)
+    pattern_consistency_count = Column(Integer, default=0, nullable=False)
+    disclosure_impact_sum = Column(Float, default=0.0, nullable=False)
+    disclosure_impact_count = Column(Integer, default=0, nullable=False)
+
+    # pattern_analysis
+    pattern_avg_1d_sum = Column(Float, default=0.0, nullable=False)
+    pattern_avg_1d_count = Column(Integer, default=0, nullable=False)
+    pattern_avg_2d_sum = Column(Float, default=0.0, nullable=False)
+    pattern_avg_2d_count = Column(Integer, default=0, nullable=False)
+    pattern_avg_3d_sum = Column(Float, default=0.0, nullable=False)
+    pattern_avg_3d_count = Column(Integer, default=0, nullable=False)
+    pattern_avg_5d_sum = Column(Float, default=0.0, nullable=False)
+    pattern_avg_5d_count = Column(Integer, default=0, nullable=False)
+    pattern_avg_10d_sum = Column(Float, default=0.0, nullable=False)
+    pattern_avg_10d_count = Column(Integer, default=0, nullable=False)
+    pattern_avg_20d_sum = Column(Float, default=0.0, nullable=False)
+    pattern_avg_20d_count = Column(Integer, default=0, nullable=False)
+
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
+
+    __table_args__ = (
+        Index("uk_stock_prediction_stats_stock", "stock_code", unique=True),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<StockPredictionStats(stock_code='{self.stock_code}', "
+            f"predictions={self.prediction_count}, positive={self.positive_count}, "
+            f"negative={self.negative_count}, neutral={self.neutral_count})>"
+        )
@@ -2,17 +2,34 @@
 뉴스 임베딩 모듈
 
 OpenAI Embedding API를 사용하여 뉴스를 벡터화합니다.
+
+모든 임베딩은 EmbeddingCache(모델/차원/정규화 텍스트 해시)를 거치므로
+중복 검사/유사 뉴스 검색/일일 임베딩 작업에서 같은 기사가 한 번만 임베딩됩니다.
+
+embed_batch는 여러 텍스트를 다중 입력(input=[...]) 요청으로 묶어 보냅니다.
+- 요청당 입력 수/토큰 수 한도에 맞춰 분할 (tiktoken 없으면 UTF-8 바이트 기준 추정)
+- 429/일시 오류는 지수 백오프로 재시도 (Retry-After 헤더 우선)
+- 잘못된 입력(400)은 배치를 반으로 나눠 실패 항목만 None 처리
+
+임베딩 진행 상태는 news_articles.embedded_at으로 관리합니다.
+- 미임베딩 조회는 embedded_at IS NULL 부분 인덱스 스캔 (Milvus 전체 ID 조회 없음)
+- 벡터 저장소 upsert 성공 후에만 embedded_at 기록 → 커밋
+- backfill_embeddings: ID 커서 청크 단위 백필 (중단 후 재개 가능)
 """
 import logging
+import random
 from typing import List, Optional, Dict, Tuple
 from datetime import datetime
 import time
 
+import openai
 from openai import OpenAI
-from pymilvus import Collection, connections
 from sqlalchemy.orm import Session
 
 from backend.config import settings
+from backend.db.milvus_client import get_milvus_manager
+from backend.llm.embedding_cache import EmbeddingCache, get_embedding_cache
+from backend.llm.vector_store import get_hot_vector_store, get_vector_store
 from backend.db.models.news import NewsArticle
 from backend.db.session import SessionLocal
 
@@ -20,6 +37,49 @@ from backend.db.session import SessionLocal
 logger = logging.getLogger(__name__)
 
 
+try:
+    import tiktoken
+
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:  # tiktoken 미설치 (선택 의존성)
+    _ENCODING = None
+
+
+# 재시도 대상 오류 (429, 연결/타임아웃, 5xx)
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+# 재시도 최대 대기 (초)
+_MAX_RETRY_WAIT = 60.0
+
+
+def count_tokens(text: str) -> int:
+    """
+    임베딩 입력 토큰 수
+
+    tiktoken이 없으면 UTF-8 바이트 수 / 2로 추정합니다.
+    (한글 1자 = 3바이트 ≈ 1~2토큰, 영문은 실제보다 크게 잡혀 한도 초과 없음)
+    """
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    return (len(text.encode("utf-8")) + 1) // 2
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """입력당 토큰 한도를 넘는 텍스트 절단"""
+    if _ENCODING is not None:
+        tokens = _ENCODING.encode(text)
+        return text if len(tokens) <= max_tokens else _ENCODING.decode(tokens[:max_tokens])
+
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_tokens * 2:
+        return text
+    return encoded[:max_tokens * 2].decode("utf-8", errors="ignore")
+
+
 class NewsEmbedder:
     """뉴스 임베딩 클래스"""
 
@@ -28,6 +88,10 @@ class NewsEmbedder:
         self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
         self.embedding_model = settings.OPENAI_EMBEDDING_MODEL
         self.embedding_dim = 768  # text-embedding-3-small의 차원
+        self.cache = get_embedding_cache()
+
+    def _cache_key(self, text: str) -> str:
+        return EmbeddingCache.make_key(self.embedding_model, self.embedding_dim, text)
 
     def embed_text(self, text: str) -> Optional[List[float]]:
         """
@@ -39,6 +103,12 @@ class NewsEmbedder:
         Returns:
             768차원 임베딩 벡터 또는 None (실패 시)
         """
+        text = truncate_tokens(text, settings.EMBEDDING_MAX_INPUT_TOKENS)
+        cache_key = self._cache_key(text)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             response = self.openai_client.embeddings.create(
                 model=self.embedding_model,
@@ -49,6 +119,7 @@ class NewsEmbedder:
             embedding = response.data[0].embedding
             logger.debug(f"임베딩 생성 완료: {len(embedding)}차원")
 
+            self.cache.set(cache_key, embedding)
             return embedding
 
         except Exception as e:
@@ -57,87 +128,207 @@ class NewsEmbedder:
 
     def embed_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
         """
-        여러 텍스트를 배치로 임베딩합니다.
+        여러 텍스트를 다중 입력 요청으로 묶어 임베딩합니다.
+        캐시에 있는 텍스트와 배치 내 중복 텍스트는 요청하지 않습니다.
 
         Args:
             texts: 임베딩할 텍스트 리스트
 
         Returns:
-            임베딩 벡터 리스트 (실패한 항목은 None)
+            임베딩 벡터 리스트 (입력 순서 유지, 실패한 항목은 None)
         """
-        embeddings = []
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+
+        # 빈 텍스트는 API가 거부하므로 제외 (None 유지)
+        indexes_by_key: Dict[str, List[int]] = {}
+        text_by_key: Dict[str, str] = {}
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            text = truncate_tokens(text, settings.EMBEDDING_MAX_INPUT_TOKENS)
+            cache_key = self._cache_key(text)
+            indexes_by_key.setdefault(cache_key, []).append(index)
+            text_by_key.setdefault(cache_key, text)
+
+        # 캐시 히트 반영, 미스만 요청 (같은 텍스트는 한 번만)
+        cached = self.cache.get_many(list(indexes_by_key))
+        keys = [key for key in indexes_by_key if key not in cached]
+        items = [(position, text_by_key[key]) for position, key in enumerate(keys)]
+
+        started = time.perf_counter()
+        chunks = self._chunk_inputs(items)
+        fetched: Dict[str, List[float]] = {}
+        for chunk in chunks:
+            for position, embedding in self._embed_chunk(chunk).items():
+                if embedding is not None:
+                    fetched[keys[position]] = embedding
+        self.cache.set_many(fetched)
+
+        for cache_key, embedding in {**cached, **fetched}.items():
+            for index in indexes_by_key[cache_key]:
+                embeddings[index] = embedding
+
+        success_count = sum(1 for embedding in embeddings if embedding is not None)
+        logger.info(
+            f"배치 임베딩 완료: {success_count}/{len(texts)}건 "
+            f"(캐시 {len(cached)}건, {len(chunks)}회 요청, {time.perf_counter() - started:.2f}초)"
+        )
+        return embeddings
 
-        for text in texts:
-            embedding = self.embed_text(text)
-            embeddings.append(embedding)
+    def _chunk_inputs(self, items: List[Tuple[int, str]]) -> List[List[Tuple[int, str]]]:
+        """요청당 입력 수/토큰 수 한도에 맞춰 분할"""
+        chunks: List[List[Tuple[int, str]]] = []
+        current: List[Tuple[int, str]] = []
+        current_tokens = 0
+
+        for index, text in items:
+            tokens = count_tokens(text)
+            if current and (
+                len(current) >= settings.EMBEDDING_BATCH_MAX_INPUTS
+                or current_tokens + tokens > settings.EMBEDDING_BATCH_MAX_TOKENS
+            ):
+                chunks.append(current)
+                current, current_tokens = [], 0
+
+            current.append((index, text))
+            current_tokens += tokens
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _embed_chunk(self, chunk: List[Tuple[int, str]]) -> Dict[int, Optional[List[float]]]:
+        """
+        한 요청 분량 임베딩 (실패 항목 격리)
 
-            # API rate limit 방지 (1초 대기)
-            time.sleep(0.1)
+        잘못된 입력(400 등)으로 요청이 거부되면 반으로 나눠 다시 요청하여
+        문제 항목만 None으로 처리합니다. 재시도 소진/기타 오류는 요청 전체가 None입니다.
+        """
+        try:
+            vectors = self._request_embeddings([text for _, text in chunk])
+            return {index: vector for (index, _), vector in zip(chunk, vectors)}
 
-        return embeddings
+        except openai.BadRequestError as e:
+            if len(chunk) == 1:
+                logger.warning(f"임베딩 입력 거부 (index={chunk[0][0]}): {e}")
+                return {chunk[0][0]: None}
+
+            middle = len(chunk) // 2
+            results = self._embed_chunk(chunk[:middle])
+            results.update(self._embed_chunk(chunk[middle:]))
+            return results
+
+        except Exception as e:
+            logger.error(f"배치 임베딩 실패 ({len(chunk)}건): {e}")
+            return {index: None for index, _ in chunk}
 
-    def get_unembedded_news(self, db: Session, limit: int = 100) -> List[NewsArticle]:
+    def _request_embeddings(self, inputs: List[str]) -> List[List[float]]:
+        """
+        다중 입력 임베딩 요청 (429/일시 오류 시 지수 백오프 재시도)
+
+        Returns:
+            입력 순서대로 정렬된 임베딩 벡터 리스트
+        """
+        # 재시도는 여기서 직접 처리 (SDK 기본 재시도와 중복 방지)
+        client = self.openai_client.with_options(max_retries=0)
+
+        attempt = 0
+        while True:
+            try:
+                response = client.embeddings.create(
+                    model=self.embedding_model,
+                    input=inputs,
+                    dimensions=self.embedding_dim,
+                )
+                data = sorted(response.data, key=lambda item: item.index)
+                if len(data) != len(inputs):
+                    raise ValueError(f"임베딩 응답 개수 불일치: {len(data)}/{len(inputs)}")
+                return [item.embedding for item in data]
+
+            except _RETRYABLE_ERRORS as e:
+                if attempt >= settings.EMBEDDING_MAX_RETRIES:
+                    raise
+
+                wait_seconds = self._retry_wait(e, attempt)
+                attempt += 1
+                logger.warning(
+                    f"⚠️  임베딩 요청 재시도 {attempt}/{settings.EMBEDDING_MAX_RETRIES} "
+                    f"({type(e).__name__}, {wait_seconds:.1f}초 대기)"
+                )
+                time.sleep(wait_seconds)
+
+    def _retry_wait(self, error: Exception, attempt: int) -> float:
+        """재시도 대기 시간 (Retry-After 헤더 우선, 없으면 지수 백오프 + jitter)"""
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), _MAX_RETRY_WAIT)
+            except ValueError:
+                pass
+
+        base = settings.EMBEDDING_RETRY_BASE_SECONDS
+        return min(base * (2 ** attempt) + random.uniform(0, base), _MAX_RETRY_WAIT)
+
+    def get_unembedded_news(
+        self, db: Session, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[NewsArticle]:
         """
         아직 임베딩되지 않은 뉴스를 조회합니다.
 
+        embedded_at IS NULL 부분 인덱스(idx_news_articles_unembedded)만 스캔하므로
+        누적 뉴스/임베딩 수와 무관하게 미임베딩 행 수에 비례합니다.
+
         Args:
             db: 데이터베이스 세션
             limit: 조회할 최대 개수
+            after_id: 지정 시 이 ID 이후 뉴스를 ID 오름차순으로 조회 (백필 커서),
+                None이면 최신 뉴스부터 조회
 
         Returns:
             임베딩되지 않은 뉴스 리스트
         """
-        try:
-            # Milvus 연결
-            connections.connect(
-                alias="default",
-                host=settings.MILVUS_HOST,
-                port=settings.MILVUS_PORT,
-            )
+        query = db.query(NewsArticle).filter(NewsArticle.embedded_at.is_(None))
 
-            # Milvus 컬렉션 로드
-            collection = Collection("news_embeddings")
-            collection.load()
-
-            # Milvus에 이미 저장된 news_article_id 조회
-            results = collection.query(
-                expr="",  # 모든 레코드
-                output_fields=["news_article_id"],
-                limit=16384,  # 최대 조회 개수
-            )
-
-            embedded_news_ids = set(r["news_article_id"] for r in results)
-            logger.info(f"Milvus에 이미 저장된 뉴스: {len(embedded_news_ids)}건")
-
-        except Exception as e:
-            logger.warning(f"Milvus 조회 실패 (모든 뉴스를 대상으로 처리): {e}")
-            embedded_news_ids = set()
-
-        # PostgreSQL에서 미임베딩 뉴스 조회
-        if embedded_news_ids:
-            unembedded_news = (
-                db.query(NewsArticle)
-                .filter(NewsArticle.id.notin_(embedded_news_ids))
-                .order_by(NewsArticle.published_at.desc())
-                .limit(limit)
-                .all()
-            )
+        if after_id is not None:
+            query = query.filter(NewsArticle.id > after_id).order_by(NewsArticle.id.asc())
         else:
-            unembedded_news = (
-                db.query(NewsArticle)
-                .order_by(NewsArticle.published_at.desc())
-                .limit(limit)
-                .all()
-            )
+            query = query.order_by(NewsArticle.id.desc())
+
+        unembedded_news = query.limit(limit).all()
 
         logger.info(f"미임베딩 뉴스: {len(unembedded_news)}건")
         return unembedded_news
 
+    def mark_embedded(self, db: Session, news_ids: List[int]) -> int:
+        """
+        임베딩 완료 시간을 기록합니다 (커밋은 호출자가 수행).
+
+        Args:
+            db: 데이터베이스 세션
+            news_ids: 벡터 저장이 끝난 뉴스 ID 리스트
+
+        Returns:
+            갱신된 행 수
+        """
+        if not news_ids:
+            return 0
+
+        return (
+            db.query(NewsArticle)
+            .filter(NewsArticle.id.in_(news_ids))
+            .update({NewsArticle.embedded_at: datetime.utcnow()}, synchronize_session=False)
+        )
+
     def save_to_milvus(
         self, news_list: List[NewsArticle], embeddings: List[List[float]]
     ) -> int:
         """
-        뉴스 임베딩을 Milvus에 저장합니다.
+        뉴스 임베딩을 벡터 저장소(Milvus 또는 로컬 인덱스)에 저장합니다.
+
+        news_article_id 기준 upsert이므로 같은 뉴스를 다시 저장해도
+        중복 벡터가 생기지 않습니다 (재시도/재처리 안전).
+        핫 캐시가 켜져 있으면 같은 임베딩을 핫 캐시에도 반영합니다.
 
         Args:
             news_list: 뉴스 리스트
@@ -150,47 +341,88 @@ class NewsEmbedder:
             logger.error("뉴스와 임베딩 개수가 일치하지 않습니다")
             return 0
 
+        # 데이터 준비
+        news_ids = [news.id for news in news_list]
+        stock_codes = [news.stock_code or "" for news in news_list]
+        published_timestamps = [
+            int(news.published_at.timestamp()) for news in news_list
+        ]
+
         try:
-            # Milvus 연결
-            connections.connect(
-                alias="default",
-                host=settings.MILVUS_HOST,
-                port=settings.MILVUS_PORT,
+            saved_count = get_vector_store().upsert(
+                news_ids, embeddings, stock_codes, published_timestamps
             )
+            logger.info(f"벡터 저장소에 {saved_count}건 저장 완료")
+        except Exception as e:
+            logger.error(f"벡터 저장소 저장 실패: {e}")
+            return 0
 
-            # Milvus 컬렉션 로드
-            collection = Collection("news_embeddings")
+        hot_store = get_hot_vector_store()
+        if hot_store is not None:
+            try:
+                hot_store.upsert(news_ids, embeddings, stock_codes, published_timestamps)
+            except Exception as e:
+                logger.warning(f"⚠️  벡터 핫 캐시 저장 실패: {e}")
 
-            # 데이터 준비
-            news_ids = [news.id for news in news_list]
-            stock_codes = [news.stock_code or "" for news in news_list]
-            published_timestamps = [
-                int(news.published_at.timestamp()) for news in news_list
-            ]
+        return saved_count
 
-            # Milvus에 삽입
-            data = [
-                news_ids,
-                embeddings,
-                stock_codes,
-                published_timestamps,
-            ]
+    def _embed_news_batch(
+        self, db: Session, news_list: List[NewsArticle]
+    ) -> Tuple[int, int]:
+        """
+        뉴스 목록을 임베딩 → 벡터 저장소 저장 → embedded_at 기록 순으로 처리합니다.
 
-            collection.insert(data)
-            collection.flush()
+        벡터 저장이 성공한 뉴스만 같은 트랜잭션에서 완료 표시 후 커밋합니다.
+        커밋 실패 시 해당 뉴스는 다음 실행에서 다시 처리됩니다 (upsert로 중복 없음).
 
-            logger.info(f"Milvus에 {len(news_ids)}건 저장 완료")
-            return len(news_ids)
+        Returns:
+            (성공 건수, 실패 건수) 튜플
+        """
+        # 텍스트 준비 (제목 + 본문)
+        texts = [f"{news.title}\n{news.content}" for news in news_list]
+
+        # 임베딩 생성 (다중 입력 배치 요청)
+        logger.info("OpenAI Embedding API 배치 호출 중...")
+        embeddings = self.embed_batch(texts)
+
+        # 성공/실패 분류
+        success_news = []
+        success_embeddings = []
+        fail_count = 0
+
+        for news, embedding in zip(news_list, embeddings):
+            if embedding is not None:
+                success_news.append(news)
+                success_embeddings.append(embedding)
+            else:
+                fail_count += 1
+                logger.warning(f"뉴스 ID {news.id} 임베딩 실패")
 
+        if not success_embeddings:
+            logger.warning("저장할 임베딩이 없습니다")
+            return 0, fail_count
+
+        # 벡터 저장소에 저장
+        saved_count = self.save_to_milvus(success_news, success_embeddings)
+        if not saved_count:
+            return 0, fail_count + len(success_news)
+
+        # 완료 기록 (벡터 저장 이후에만)
+        try:
+            self.mark_embedded(db, [news.id for news in success_news])
+            db.commit()
         except Exception as e:
-            logger.error(f"Milvus 저장 실패: {e}")
-            return 0
+            db.rollback()
+            logger.error(f"임베딩 완료 기록 실패 (다음 실행에서 재처리): {e}")
+            return 0, fail_count + len(success_news)
+
+        return saved_count, fail_count
 
     def embed_and_save_news(
         self, db: Session, batch_size: int = 100
     ) -> Tuple[int, int]:
         """
-        미임베딩 뉴스를 임베딩하여 Milvus에 저장합니다.
+        미임베딩 뉴스를 임베딩하여 벡터 저장소에 저장합니다.
 
         Args:
             db: 데이터베이스 세션
@@ -204,7 +436,7 @@ class NewsEmbedder:
         logger.info("=" * 60)
 
         try:
-            # 미임베딩 뉴스 조회
+            # 미임베딩 뉴스 조회 (최신순)
             unembedded_news = self.get_unembedded_news(db, limit=batch_size)
 
             if not unembedded_news:
@@ -213,41 +445,105 @@ class NewsEmbedder:
 
             logger.info(f"임베딩 대상 뉴스: {len(unembedded_news)}건")
 
-            # 텍스트 준비 (제목 + 본문)
-            texts = [f"{news.title}\n{news.content}" for news in unembedded_news]
-
-            # 임베딩 생성
-            logger.info("OpenAI Embedding API 호출 중...")
-            embeddings = self.embed_batch(texts)
-
-            # 성공/실패 분류
-            success_news = []
-            success_embeddings = []
-            fail_count = 0
-
-            for news, embedding in zip(unembedded_news, embeddings):
-                if embedding is not None:
-                    success_news.append(news)
-                    success_embeddings.append(embedding)
-                else:
-                    fail_count += 1
-                    logger.warning(f"뉴스 ID {news.id} 임베딩 실패")
-
-            # Milvus에 저장
-            if success_embeddings:
-                saved_count = self.save_to_milvus(success_news, success_embeddings)
-                logger.info(
-                    f"✅ 임베딩 완료: 성공 {saved_count}건, 실패 {fail_count}건"
-                )
-                return saved_count, fail_count
-            else:
-                logger.warning("저장할 임베딩이 없습니다")
-                return 0, fail_count
+            saved_count, fail_count = self._embed_news_batch(db, unembedded_news)
+            logger.info(f"✅ 임베딩 완료: 성공 {saved_count}건, 실패 {fail_count}건")
+            return saved_count, fail_count
 
         except Exception as e:
+            db.rollback()
             logger.error(f"뉴스 임베딩 작업 중 에러: {e}", exc_info=True)
             return 0, 0
 
+    def backfill_embeddings(
+        self,
+        db: Session,
+        chunk_size: int = 500,
+        max_chunks: Optional[int] = None,
+        start_after_id: int = 0,
+    ) -> Dict[str, int]:
+        """
+        미임베딩 뉴스를 ID 오름차순 청크로 임베딩합니다 (재개 가능).
+
+        청크마다 커밋하므로 중단 후 다시 실행하면 완료된 청크는 건너뜁니다.
+        실행 중에는 ID 커서로 진행하므로 실패 항목이 같은 청크를 반복시키지 않습니다.
+
+        Args:
+            db: 데이터베이스 세션
+            chunk_size: 청크 크기 (임베딩 배치 크기)
+            max_chunks: 최대 청크 수 (None이면 끝까지)
+            start_after_id: 시작 커서 (이 ID 이후부터 처리)
+
+        Returns:
+            {"success", "failed", "chunks", "last_id"}
+        """
+        result = {"success": 0, "failed": 0, "chunks": 0, "last_id": start_after_id}
+
+        while max_chunks is None or result["chunks"] < max_chunks:
+            news_list = self.get_unembedded_news(
+                db, limit=chunk_size, after_id=result["last_id"]
+            )
+            if not news_list:
+                break
+
+            success_count, fail_count = self._embed_news_batch(db, news_list)
+            result["success"] += success_count
+            result["failed"] += fail_count
+            result["chunks"] += 1
+            result["last_id"] = news_list[-1].id
+
+            logger.info(
+                f"📦 백필 청크 #{result['chunks']}: 성공 {success_count}건, 실패 {fail_count}건 "
+                f"(커서 ID {result['last_id']})"
+            )
+
+        return result
+
+    def sync_embedded_state(self, db: Session, chunk_size: int = 1000) -> int:
+        """
+        Milvus에 이미 저장된 뉴스의 embedded_at을 채웁니다 (상태 컬럼 도입 시 1회).
+
+        미임베딩 뉴스 ID를 청크 단위로 Milvus PK 조회(news_article_id in [...])하여
+        존재하는 뉴스만 완료 표시합니다. 청크마다 커밋하므로 중단 후 재실행 가능합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            chunk_size: 청크 크기
+
+        Returns:
+            완료 표시된 뉴스 수
+        """
+        manager = get_milvus_manager()
+        marked = 0
+        last_id = 0
+
+        while True:
+            news_ids = [
+                row.id
+                for row in db.query(NewsArticle.id)
+                .filter(NewsArticle.embedded_at.is_(None), NewsArticle.id > last_id)
+                .order_by(NewsArticle.id.asc())
+                .limit(chunk_size)
+                .all()
+            ]
+            if not news_ids:
+                break
+
+            results = manager.execute(
+                "news_embeddings",
+                lambda collection: collection.query(
+                    expr=f"news_article_id in {news_ids}",
+                    output_fields=["news_article_id"],
+                ),
+            )
+            embedded_ids = sorted({r["news_article_id"] for r in results})
+
+            marked += self.mark_embedded(db, embedded_ids)
+            db.commit()
+            last_id = news_ids[-1]
+
+        logger.info(f"✅ Milvus 임베딩 상태 동기화: {marked}건 완료 표시")
+        return marked
+
 
 # 싱글톤 인스턴스
 _news_embedder: Optional[NewsEmbedder] = None
@@ -283,3 +579,33 @@ def run_daily_embedding(batch_size: int = 100) -> Tuple[int, int]:
         return embedder.embed_and_save_news(db, batch_size=batch_size)
     finally:
         db.close()
+
+
+def run_embedding_backfill(
+    chunk_size: int = 500,
+    max_chunks: Optional[int] = None,
+    start_after_id: int = 0,
+) -> Dict[str, int]:
+    """
+    미임베딩 뉴스 백필을 실행합니다.
+
+    Args:
+        chunk_size: 청크 크기 (기본값: 500)
+        max_chunks: 최대 청크 수 (None이면 끝까지)
+        start_after_id: 시작 커서 (이 ID 이후부터 처리)
+
+    Returns:
+        {"success", "failed", "chunks", "last_id"}
+    """
+    db = SessionLocal()
+    embedder = get_news_embedder()
+
+    try:
+        return embedder.backfill_embeddings(
+            db,
+            chunk_size=chunk_size,
+            max_chunks=max_chunks,
+            start_after_id=start_after_id,
+        )
+    finally:
+        db.close()
@@ -0,0 +1,220 @@
+"""
+임베딩 캐시 모듈
+
+같은 뉴스 텍스트(제목 + 본문)가 중복 검사, 유사 뉴스 검색, 일일 임베딩 작업에서
+반복 임베딩되지 않도록 임베딩 벡터를 캐싱합니다.
+
+- 키: sha256(모델 + 차원 + 정규화 텍스트) (NFC 정규화, 공백 압축)
+- 1차: 프로세스 내 LRU (EMBEDDING_CACHE_LRU_SIZE)
+- 2차: Redis (float32 바이트, EMBEDDING_CACHE_TTL_SECONDS) - 프로세스 간 공유
+- Redis 오류 시 REDIS_RETRY_SECONDS 동안 LRU만 사용
+"""
+import hashlib
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import redis
+
+from backend.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (NFC, 연속 공백 압축, 앞뒤 공백 제거)"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+class EmbeddingCache:
+    """프로세스 LRU + Redis 2단계 임베딩 캐시"""
+
+    REDIS_RETRY_SECONDS = 30.0
+
+    def __init__(
+        self,
+        max_size: int = 4096,
+        redis_client: Optional[redis.Redis] = None,
+        ttl_seconds: int = 604800,
+        key_prefix: str = "embedding:",
+    ):
+        """
+        Args:
+            max_size: LRU 최대 항목 수
+            redis_client: 공유 캐시 Redis 클라이언트 (None이면 LRU만 사용)
+            ttl_seconds: Redis TTL (초)
+            key_prefix: Redis 키 접두사
+        """
+        self.max_size = max(1, max_size)
+        self.redis_client = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+
+        self._lru: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis_disabled_until = 0.0
+        self._metrics = {
+            "lru_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "redis_errors": 0,
+        }
+
+    @staticmethod
+    def make_key(model: str, dimensions: int, text: str) -> str:
+        """모델/차원/정규화 텍스트 해시 키"""
+        payload = f"{model}\x00{dimensions}\x00{normalize_text(text)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._metrics[name] += value
+
+    def _redis_available(self) -> bool:
+        return self.redis_client is not None and time.monotonic() >= self._redis_disabled_until
+
+    def _redis_failed(self, error: Exception) -> None:
+        self._redis_disabled_until = time.monotonic() + self.REDIS_RETRY_SECONDS
+        self._count("redis_errors")
+        logger.warning(
+            f"⚠️  임베딩 캐시 Redis 오류, {self.REDIS_RETRY_SECONDS:.0f}초간 LRU만 사용: {error}"
+        )
+
+    def _remember(self, key: str, embedding: List[float]) -> None:
+        with self._lock:
+            self._lru[key] = embedding
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_size:
+                self._lru.popitem(last=False)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        """
+        여러 키 일괄 조회 (LRU → Redis MGET)
+
+        Returns:
+            {키: 임베딩} (캐시에 있는 키만)
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        found: Dict[str, List[float]] = {}
+        missing: List[str] = []
+
+        with self._lock:
+            for key in unique_keys:
+                embedding = self._lru.get(key)
+                if embedding is None:
+                    missing.append(key)
+                else:
+                    self._lru.move_to_end(key)
+                    found[key] = embedding
+            self._metrics["lru_hits"] += len(found)
+
+        if missing and self._redis_available():
+            try:
+                values = self.redis_client.mget([self.key_prefix + key for key in missing])
+            except redis.RedisError as e:
+                self._redis_failed(e)
+                values = [None] * len(missing)
+
+            redis_hits = 0
+            for key, value in zip(missing, values):
+                if value:
+                    embedding = np.frombuffer(value, dtype="<f4").tolist()
+                    self._remember(key, embedding)
+                    found[key] = embedding
+                    redis_hits += 1
+            self._count("redis_hits", redis_hits)
+
+        self._count("misses", len(unique_keys) - len(found))
+        return found
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """단일 키 조회"""
+        return self.get_many([key]).get(key)
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        """여러 임베딩 저장 (LRU + Redis 파이프라인)"""
+        if not items:
+            return
+
+        for key, embedding in items.items():
+            self._remember(key, embedding)
+        self._count("sets", len(items))
+
+        if not self._redis_available():
+            return
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, embedding in items.items():
+                pipe.setex(
+                    self.key_prefix + key,
+                    self.ttl_seconds,
+                    np.asarray(embedding, dtype="<f4").tobytes(),
+                )
+            pipe.execute()
+        except redis.RedisError as e:
+            self._redis_failed(e)
+
+    def set(self, key: str, embedding: List[float]) -> None:
+        """단일 임베딩 저장"""
+        self.set_many({key: embedding})
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        캐시 지표
+
+        Returns:
+            {lru_hits, redis_hits, misses, sets, redis_errors, hit_rate, lru_size, redis_enabled}
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["lru_size"] = len(self._lru)
+
+        lookups = metrics["lru_hits"] + metrics["redis_hits"] + metrics["misses"]
+        metrics["hit_rate"] = (
+            round((metrics["lru_hits"] + metrics["redis_hits"]) / lookups, 4) if lookups else 0.0
+        )
+        metrics["redis_enabled"] = self._redis_available()
+        return metrics
+
+
+# 싱글톤 인스턴스
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """
+    EmbeddingCache 싱글톤 인스턴스를 반환합니다.
+
+    Returns:
+        EmbeddingCache 인스턴스
+    """
+    global _embedding_cache
+    with _embedding_cache_lock:
+        if _embedding_cache is None:
+            redis_client = None
+            if settings.EMBEDDING_CACHE_REDIS:
+                redis_client = redis.Redis(
+                    host=settings.REDIS_HOST,
+                    port=settings.REDIS_PORT,
+                    db=settings.REDIS_DB,
+                    socket_connect_timeout=1.0,
+                    socket_timeout=1.0,
+                )
+            _embedding_cache = EmbeddingCache(
+                max_size=settings.EMBEDDING_CACHE_LRU_SIZE,
+                redis_client=redis_client,
+                ttl_seconds=settings.EMBEDDING_CACHE_TTL_SECONDS,
+            )
+        return _embedding_cache
@@ -15,6 +15,7 @@ from backend.db.models.prediction import Prediction
 from backend.db.models.stock import StockPrice
 from backend.utils.stock_mapping import get_stock_mapper
 from backend.db.session import SessionLocal
+from backend.services.indicator_store import get_indicator_store
 from backend.db.models.market_data import (
     StockOrderbook,
     StockCurrentPrice,
@@ -94,6 +95,7 @@ class InvestmentReportGenerator:
         stock_code: str,
         predictions: List[Prediction],
         current_price: Optional[Dict[str, Any]] = None,
+        technical_indicators: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         종합 투자 리포트 생성
@@ -102,6 +104,7 @@ class InvestmentReportGenerator:
             stock_code: 종목 코드
             predictions: 최근 예측 리스트 (최대 20건)
             current_price: 현재 주가 정보
+            technical_indicators: 미리 계산된 기술적 지표 (없으면 조회)
 
         Returns:
             {
@@ -120,7 +123,7 @@ class InvestmentReportGenerator:
         try:
             # 1. 데이터 준비
             report_data = self._prepare_report_data(
-                stock_code, predictions, current_price
+                stock_code, predictions, current_price, technical_indicators
             )
 
             # 2. LLM 프롬프트 생성
@@ -251,6 +254,7 @@ class InvestmentReportGenerator:
         stock_code: str,
         predictions: List[Prediction],
         current_price: Optional[Dict[str, Any]],
+        technical_indicators: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """리포트 생성을 위한 데이터 준비"""
         stock_name = self.stock_mapper.get_company_name(stock_code) or stock_code
@@ -323,10 +327,9 @@ class InvestmentReportGenerator:
                 "impact_analysis": pred.impact_analysis if pred.impact_analysis else {},
             })
 
-        # 현재 기술적 지표 계산
-        from backend.llm.predictor import StockPredictor
-        predictor = StockPredictor()
-        technical_indicators = predictor._get_technical_indicators(stock_code)
+        # 현재 기술적 지표 (일괄 조회 결과가 없을 때만 지표 저장소에서 조회)
+        if technical_indicators is None:
+            technical_indicators = get_indicator_store().get(stock_code)
 
         # KIS API 시장 데이터 조회
         kis_market_data = self._get_kis_market_data(stock_code)
@@ -598,19 +601,19 @@ class InvestmentReportGenerator:
 
         # 볼린저 밴드 분석
         bb = technical.get("bollinger_bands")
-        if bb:
-            bb_signal = bb.get("signal", "중립")
+        if bb and bb.get("upper") is not None:
+            bb_signal = bb.get("position", "중립")
             sections.append(f"""### 볼린저 밴드 ({bb_signal})
-- 상단: {bb.get('upper', 0):,.0f}원
-- 중간 (MA20): {bb.get('middle', 0):,.0f}원
-- 하단: {bb.get('lower', 0):,.0f}원
-- %B: {bb.get('percent_b', 0):.2f} (0=하단, 0.5=중간, 1=상단)""")
+- 상단: {bb['upper']:,.0f}원
+- 중간 (MA20): {bb.get('middle') or 0:,.0f}원
+- 하단: {bb.get('lower') or 0:,.0f}원
+- %B: {bb.get('percent_b') or 0:.2f} (0=하단, 0.5=중간, 1=상단)""")
 
         # MACD 분석
         macd = technical.get("macd")
-        if macd:
-            macd_signal = macd.get("signal_type") or "중립"
-            macd_emoji = "📈" if macd_signal == "상승" else "📉" if macd_signal == "하락" else "➡️"
+        if macd and macd.get("macd_line") is not None:
+            macd_signal = macd.get("trend") or "중립"
+            macd_emoji = "📈" if macd_signal == "매수신호" else "📉" if macd_signal == "매도신호" else "➡️"
             macd_line = macd.get('macd_line') or 0
             signal_line = macd.get('signal_line') or 0
             histogram = macd.get('histogram') or 0
@@ -644,6 +647,7 @@ class InvestmentReportGenerator:
         stock_code: str,
         predictions: List[Prediction],
         current_price: Optional[Dict[str, Any]] = None,
+        technical_indicators: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         A/B 테스트: 두 모델로 종합 투자 리포트 생성
@@ -652,6 +656,7 @@ class InvestmentReportGenerator:
             stock_code: 종목 코드
             predictions: 최근 예측 리스트
             current_price: 현재 주가 정보
+            technical_indicators: 미리 계산된 기술적 지표 (없으면 조회)
 
         Returns:
             {
@@ -678,7 +683,9 @@ class InvestmentReportGenerator:
 
         try:
             # 공통 데이터 준비
-            report_data = self._prepare_report_data(stock_code, predictions, current_price)
+            report_data = self._prepare_report_data(
+                stock_code, predictions, current_price, technical_indicators
+            )
             prompt = self._build_prompt(report_data)
 
             logger.info(f"A/B 종합 리포트 생성: {stock_code} ({len(predictions)}건 분석) - 병렬 호출")
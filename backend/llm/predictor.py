@@ -5,25 +5,43 @@
 """
 import logging
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from openai import OpenAI
 from sqlalchemy.orm import Session
 
 from backend.config import settings
 from backend.llm.prediction_cache import get_prediction_cache
-from backend.db.models.stock import StockPrice, Stock
-from backend.db.models.news import NewsArticle
 from backend.db.models.model import Model
 from backend.db.models.ab_test_config import ABTestConfig
 from backend.db.session import SessionLocal
+from backend.llm.prompt_context import PromptContext, get_prompt_context_loader
 from sqlalchemy import text
 
 
 logger = logging.getLogger(__name__)
 
 
+# 프로바이더별 동시 호출 상한 (프로세스 전체 공유)
+_provider_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_provider_semaphores_lock = threading.Lock()
+
+
+def _get_provider_semaphore(provider: str) -> threading.BoundedSemaphore:
+    """프로바이더별 동시 호출 세마포어 반환 (LLM_PROVIDER_CONCURRENCY, 미등록 시 1)"""
+    with _provider_semaphores_lock:
+        semaphore = _provider_semaphores.get(provider)
+        if semaphore is None:
+            limit = max(1, settings.LLM_PROVIDER_CONCURRENCY.get(provider, 1))
+            semaphore = threading.BoundedSemaphore(limit)
+            _provider_semaphores[provider] = semaphore
+        return semaphore
+
+
 class StockPredictor:
     """LLM 기반 주가 예측 클래스"""
 
@@ -48,6 +66,12 @@ class StockPredictor:
 
         self.cache = get_prediction_cache()
 
+        # 멀티모델 동시 예측용 스레드 풀 (전체 동시 호출 상한)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.LLM_MAX_CONCURRENCY),
+            thread_name_prefix="llm-predict",
+        )
+
         # 멀티모델: DB에서 활성 모델 로드
         self.active_models = self._load_active_models()
         logger.info(f"✅ 활성 모델 {len(self.active_models)}개 로드 완료")
@@ -152,90 +176,116 @@ class StockPredictor:
             stock_code: 종목 코드
             prediction_data: 예측 결과
         """
+        self._save_model_predictions(news_id, stock_code, {model_id: prediction_data})
+
+    def _save_model_predictions(
+        self,
+        news_id: int,
+        stock_code: str,
+        predictions: Dict[int, Dict[str, Any]],
+    ) -> int:
+        """
+        여러 모델의 예측 결과를 하나의 트랜잭션으로 저장합니다.
+
+        기존 예측은 한 번의 IN 조회로 불러와 갱신하고, 없는 모델만 추가합니다.
+        종목/일자별 AI 시그널 집계(prediction_signal_rollup)와 종목별 예측 통계
+        (stock_prediction_stats)도 같은 트랜잭션에서 증분 갱신합니다.
+
+        Args:
+            news_id: 뉴스 ID
+            stock_code: 종목 코드
+            predictions: {model_id: 예측 결과}
+
+        Returns:
+            저장된 예측 수 (실패 시 0)
+        """
+        if not predictions:
+            return 0
+
         db = SessionLocal()
         try:
             from backend.db.models.prediction import Prediction
+            from backend.services.signal_rollup import SignalRollupDelta
+            from backend.services.stock_prediction_stats import StockPredictionStatsDelta
+
+            rollup = SignalRollupDelta()
+            stats = StockPredictionStatsDelta()
+
+            # 기존 예측 일괄 조회
+            existing_by_model = {
+                prediction.model_id: prediction
+                for prediction in db.query(Prediction).filter(
+                    Prediction.news_id == news_id,
+                    Prediction.model_id.in_(list(predictions.keys()))
+                ).all()
+            }
 
-            # 기존 예측이 있는지 확인
-            existing = db.query(Prediction).filter(
-                Prediction.news_id == news_id,
-                Prediction.model_id == model_id
-            ).first()
-
-            # prediction_data에서 새 필드 추출
-            sentiment_direction = prediction_data.get("sentiment_direction", "neutral")
-            sentiment_score = prediction_data.get("sentiment_score", 0.0)
-            impact_level = prediction_data.get("impact_level", "low")
-            relevance_score = prediction_data.get("relevance_score", 0.0)
-            urgency_level = prediction_data.get("urgency_level", "routine")
-            impact_analysis = prediction_data.get("impact_analysis", {})
-            reasoning = prediction_data.get("reasoning", "")
-            current_price = prediction_data.get("current_price")
-            pattern_analysis = prediction_data.get("pattern_analysis", {})
-
-            # Deprecated 필드는 None으로 설정
-            direction = None
-            confidence = None
-            short_term = None
-            medium_term = None
-            long_term = None
-            confidence_breakdown = None
-
-            if existing:
-                # UPDATE
-                existing.sentiment_direction = sentiment_direction
-                existing.sentiment_score = sentiment_score
-                existing.impact_level = impact_level
-                existing.relevance_score = relevance_score
-                existing.urgency_level = urgency_level
-                existing.impact_analysis = impact_analysis
-                existing.reasoning = reasoning
-                existing.current_price = current_price
-                existing.pattern_analysis = pattern_analysis
-                # Deprecated 필드는 None으로
-                existing.direction = None
-                existing.confidence = None
-                existing.short_term = None
-                existing.medium_term = None
-                existing.long_term = None
-                existing.confidence_breakdown = None
-                existing.created_at = datetime.now()
-            else:
-                # INSERT
-                new_prediction = Prediction(
-                    news_id=news_id,
-                    model_id=model_id,
-                    stock_code=stock_code,
-                    # 새 필드
-                    sentiment_direction=sentiment_direction,
-                    sentiment_score=sentiment_score,
-                    impact_level=impact_level,
-                    relevance_score=relevance_score,
-                    urgency_level=urgency_level,
-                    impact_analysis=impact_analysis,
-                    reasoning=reasoning,
-                    current_price=current_price,
-                    pattern_analysis=pattern_analysis,
+            for model_id, prediction_data in predictions.items():
+                # prediction_data에서 새 필드 추출
+                fields = {
+                    "sentiment_direction": prediction_data.get("sentiment_direction", "neutral"),
+                    "sentiment_score": prediction_data.get("sentiment_score", 0.0),
+                    "impact_level": prediction_data.get("impact_level", "low"),
+                    "relevance_score": prediction_data.get("relevance_score", 0.0),
+                    "urgency_level": prediction_data.get("urgency_level", "routine"),
+                    "impact_analysis": prediction_data.get("impact_analysis", {}),
+                    "reasoning": prediction_data.get("reasoning", ""),
+                    "current_price": prediction_data.get("current_price"),
+                    "pattern_analysis": prediction_data.get("pattern_analysis", {}),
                     # Deprecated 필드는 None
-                    direction=None,
-                    confidence=None,
-                    short_term=None,
-                    medium_term=None,
-                    long_term=None,
-                    confidence_breakdown=None,
+                    "direction": None,
+                    "confidence": None,
+                    "short_term": None,
+                    "medium_term": None,
+                    "long_term": None,
+                    "confidence_breakdown": None,
+                }
+
+                existing = existing_by_model.get(model_id)
+                if existing:
+                    # UPDATE (집계에서 수정 전 값을 빼고 새 값을 더함)
+                    rollup.remove(existing)
+                    stats.remove(existing)
+                    for column, value in fields.items():
+                        setattr(existing, column, value)
+                    existing.created_at = datetime.now()
+                    rollup.add(existing)
+                    stats.add(existing)
+                else:
+                    # INSERT
+                    prediction = Prediction(
+                        news_id=news_id,
+                        model_id=model_id,
+                        stock_code=stock_code,
+                        created_at=datetime.now(),
+                        **fields,
+                    )
+                    db.add(prediction)
+                    rollup.add(prediction)
+                    stats.add(prediction)
+
+                logger.debug(
+                    f"모델 {model_id} 영향도 분석 저장: news_id={news_id}, "
+                    f"sentiment={fields['sentiment_direction']} ({fields['sentiment_score']:.2f}), "
+                    f"impact={fields['impact_level']}, relevance={fields['relevance_score']:.2f}"
                 )
-                db.add(new_prediction)
 
+            rollup.apply(db)
+            stats.apply(db)
             db.commit()
-            logger.debug(
-                f"모델 {model_id} 영향도 분석 저장 완료: news_id={news_id}, "
-                f"sentiment={sentiment_direction} ({sentiment_score:.2f}), "
-                f"impact={impact_level}, relevance={relevance_score:.2f}"
-            )
+
+            # 대시보드/종목 API 응답 캐시 무효화
+            from backend.services.response_cache import invalidate_stock_responses
+            invalidate_stock_responses(stock_code)
+            return len(predictions)
 
         except Exception as e:
-            logger.error(f"모델 예측 저장 실패 (news_id={news_id}, model_id={model_id}): {e}", exc_info=True)
+            logger.error(
+                f"모델 예측 저장 실패 (news_id={news_id}, model_ids={list(predictions.keys())}): {e}",
+                exc_info=True,
+            )
             db.rollback()
+            return 0
         finally:
             db.close()
 
@@ -298,512 +348,6 @@ class StockPredictor:
         finally:
             db.close()
 
-    def _get_stock_info(self, stock_code: str) -> Optional[Dict[str, Any]]:
-        """
-        종목 기본 정보를 조회합니다.
-
-        Args:
-            stock_code: 종목 코드
-
-        Returns:
-            종목 정보 딕셔너리 또는 None
-        """
-        db = SessionLocal()
-        try:
-            stock = db.query(Stock).filter(Stock.code == stock_code).first()
-            if not stock:
-                return None
-
-            return {
-                "code": stock.code,
-                "name": stock.name,
-                "priority": stock.priority,
-            }
-        except Exception as e:
-            logger.error(f"종목 정보 조회 실패 (종목코드: {stock_code}): {e}")
-            return None
-        finally:
-            db.close()
-
-    def _get_current_stock_info(self, stock_code: str) -> Optional[Dict[str, Any]]:
-        """
-        현재 주가 정보를 조회합니다.
-
-        Args:
-            stock_code: 종목 코드
-
-        Returns:
-            주가 정보 딕셔너리 또는 None
-            {
-                "close": 종가,
-                "open": 시가,
-                "high": 고가,
-                "low": 저가,
-                "volume": 거래량,
-                "change_rate": 전일 대비 변동률 (%),
-                "date": 날짜
-            }
-        """
-        db = SessionLocal()
-        try:
-            # 최근 2일 데이터 조회 (변동률 계산용)
-            recent_prices = (
-                db.query(StockPrice)
-                .filter(StockPrice.stock_code == stock_code)
-                .order_by(StockPrice.date.desc())
-                .limit(2)
-                .all()
-            )
-
-            if not recent_prices:
-                return None
-
-            current = recent_prices[0]
-
-            # 변동률 계산
-            change_rate = 0.0
-            if len(recent_prices) >= 2:
-                previous = recent_prices[1]
-                if previous.close > 0:
-                    change_rate = ((current.close - previous.close) / previous.close) * 100
-
-            return {
-                "close": current.close,
-                "open": current.open,
-                "high": current.high,
-                "low": current.low,
-                "volume": current.volume,
-                "change_rate": round(change_rate, 2),
-                "date": current.date.strftime("%Y-%m-%d %H:%M") if current.date else "N/A",
-            }
-
-        except Exception as e:
-            logger.error(f"현재 주가 조회 실패 (종목코드: {stock_code}): {e}")
-            return None
-        finally:
-            db.close()
-
-    def _get_recent_disclosures(self, stock_code: str, days: int = 7) -> List[Dict[str, Any]]:
-        """
-        최근 DART 공시 정보를 조회합니다.
-
-        Args:
-            stock_code: 종목 코드
-            days: 조회할 기간 (일)
-
-        Returns:
-            공시 정보 리스트
-        """
-        db = SessionLocal()
-        try:
-            since_date = datetime.now() - timedelta(days=days)
-
-            disclosures = (
-                db.query(NewsArticle)
-                .filter(
-                    NewsArticle.stock_code == stock_code,
-                    NewsArticle.source == "dart",
-                    NewsArticle.published_at >= since_date
-                )
-                .order_by(NewsArticle.published_at.desc())
-                .limit(5)
-                .all()
-            )
-
-            return [
-                {
-                    "title": disc.title,
-                    "published_at": disc.published_at.strftime("%Y-%m-%d"),
-                    "content": disc.content[:100] + "..." if len(disc.content) > 100 else disc.content,
-                }
-                for disc in disclosures
-            ]
-
-        except Exception as e:
-            logger.error(f"DART 공시 조회 실패 (종목코드: {stock_code}): {e}")
-            return []
-        finally:
-            db.close()
-
-    def _get_market_context(self) -> Dict[str, Any]:
-        """
-        시장 지수 맥락 정보를 조회합니다.
-
-        KIS API 기반 index_daily_price 테이블 사용
-
-        Returns:
-            시장 지수 정보 딕셔너리
-        """
-        db = SessionLocal()
-        try:
-            from sqlalchemy import text
-
-            # KOSPI 최신 데이터 (index_code: 0001)
-            kospi_result = db.execute(
-                text("""
-                    SELECT close, change_rate, date
-                    FROM index_daily_price
-                    WHERE index_code = '0001'
-                    ORDER BY date DESC
-                    LIMIT 1
-                """)
-            )
-            kospi_row = kospi_result.fetchone()
-
-            # KOSDAQ 최신 데이터 (index_code: 1001)
-            kosdaq_result = db.execute(
-                text("""
-                    SELECT close, change_rate, date
-                    FROM index_daily_price
-                    WHERE index_code = '1001'
-                    ORDER BY date DESC
-                    LIMIT 1
-                """)
-            )
-            kosdaq_row = kosdaq_result.fetchone()
-
-            return {
-                "kospi": {
-                    "close": round(kospi_row[0], 2) if kospi_row else None,
-                    "change_pct": round(kospi_row[1], 2) if kospi_row else None,
-                    "date": kospi_row[2].strftime("%Y-%m-%d") if kospi_row else None,
-                } if kospi_row else None,
-                "kosdaq": {
-                    "close": round(kosdaq_row[0], 2) if kosdaq_row else None,
-                    "change_pct": round(kosdaq_row[1], 2) if kosdaq_row else None,
-                    "date": kosdaq_row[2].strftime("%Y-%m-%d") if kosdaq_row else None,
-                } if kosdaq_row else None,
-            }
-
-        except Exception as e:
-            logger.error(f"시장 지수 조회 실패: {e}")
-            return {"kospi": None, "kosdaq": None}
-        finally:
-            db.close()
-
-    def _get_sector_indices(self, top_n: int = 5) -> Dict[str, Any]:
-        """
-        섹터별 지수 정보 조회 (변동률 상위/하위)
-
-        KIS API 기반 index_daily_price 테이블 사용
-        업종 지수만 조회 (KOSPI, KOSDAQ 제외)
-
-        Args:
-            top_n: 상위/하위 각각 조회할 섹터 수
-
-        Returns:
-            섹터 지수 정보 딕셔너리
-        """
-        db = SessionLocal()
-        try:
-            from sqlalchemy import text
-
-            # 최신 날짜의 업종 지수 조회 (변동률 기준 정렬)
-            # index_code가 4자리(1010~1026)인 것만 조회 (업종 지수)
-            result = db.execute(
-                text("""
-                    WITH latest_date AS (
-                        SELECT MAX(date) as max_date FROM index_daily_price
-                    )
-                    SELECT
-                        index_name,
-                        close,
-                        change_rate
-                    FROM index_daily_price
-                    WHERE date = (SELECT max_date FROM latest_date)
-                    AND index_code LIKE '10__'  -- 업종 코드만 (1010~1026)
-                    AND change_rate IS NOT NULL
-                    ORDER BY change_rate DESC
-                """)
-            )
-            all_sectors = result.fetchall()
-
-            if not all_sectors or len(all_sectors) == 0:
-                logger.warning("섹터 지수 데이터 없음 (index_daily_price)")
-                return {"top_sectors": [], "bottom_sectors": []}
-
-            # 상위 N개
-            top_sectors = [
-                {
-                    "name": row[0],
-                    "close": round(row[1], 2),
-                    "change_pct": round(row[2], 2)
-                }
-                for row in all_sectors[:top_n]
-            ]
-
-            # 하위 N개
-            bottom_sectors = [
-                {
-                    "name": row[0],
-                    "close": round(row[1], 2),
-                    "change_pct": round(row[2], 2)
-                }
-                for row in all_sectors[-top_n:]
-            ]
-
-            return {
-                "top_sectors": top_sectors,
-                "bottom_sectors": bottom_sectors
-            }
-
-        except Exception as e:
-            logger.error(f"섹터 지수 조회 실패: {e}")
-            return {"top_sectors": [], "bottom_sectors": []}
-        finally:
-            db.close()
-
-    def _get_technical_indicators(self, stock_code: str) -> Optional[Dict[str, Any]]:
-        """
-        기술적 지표를 계산합니다.
-
-        Args:
-            stock_code: 종목 코드
-
-        Returns:
-            기술적 지표 딕셔너리 또는 None
-            {
-                "moving_averages": {
-                    "ma5": float,
-                    "ma20": float,
-                    "ma60": float,
-                    "current_vs_ma5": float,  # 현재가 대비 %
-                    "current_vs_ma20": float,
-                    "current_vs_ma60": float,
-                    "trend": str  # "강세", "중립", "약세"
-                },
-                "volume_analysis": {
-                    "current_volume": int,
-                    "avg_volume_20d": float,
-                    "volume_ratio": float,  # 평균 대비 %
-                    "trend": str  # "급증", "보통", "저조"
-                },
-                "price_momentum": {
-                    "change_1d": float,  # %
-                    "change_5d": float,
-                    "change_20d": float,
-                    "trend": str  # "상승세", "보합", "하락세"
-                }
-            }
-        """
-        db = SessionLocal()
-        try:
-            # 최근 60일치 데이터 조회 (MA60 계산용)
-            recent_prices = (
-                db.query(StockPrice)
-                .filter(StockPrice.stock_code == stock_code)
-                .order_by(StockPrice.date.desc())
-                .limit(60)
-                .all()
-            )
-
-            if len(recent_prices) < 5:
-                logger.warning(f"기술적 지표 계산 불가: {stock_code} - 데이터 부족 ({len(recent_prices)}일)")
-                return None
-
-            # 최신 데이터가 먼저 오므로 역순 정렬
-            recent_prices.reverse()
-
-            current_price = recent_prices[-1].close
-            current_volume = recent_prices[-1].volume or 0
-
-            # 1. 이동평균선 계산
-            ma5 = sum(p.close for p in recent_prices[-5:]) / 5 if len(recent_prices) >= 5 else None
-            ma20 = sum(p.close for p in recent_prices[-20:]) / 20 if len(recent_prices) >= 20 else None
-            ma60 = sum(p.close for p in recent_prices[-60:]) / 60 if len(recent_prices) >= 60 else None
-
-            # 현재가 vs 이동평균 비율
-            ma5_diff = ((current_price - ma5) / ma5 * 100) if ma5 else None
-            ma20_diff = ((current_price - ma20) / ma20 * 100) if ma20 else None
-            ma60_diff = ((current_price - ma60) / ma60 * 100) if ma60 else None
-
-            # 추세 판단 (정배열: 강세, 역배열: 약세)
-            ma_trend = "중립"
-            if ma5 and ma20 and ma60:
-                if ma5 > ma20 > ma60 and current_price > ma5:
-                    ma_trend = "강세"
-                elif ma5 < ma20 < ma60 and current_price < ma5:
-                    ma_trend = "약세"
-
-            # 2. 거래량 분석
-            volumes = [p.volume for p in recent_prices[-20:] if p.volume]
-            avg_volume_20d = sum(volumes) / len(volumes) if volumes else 0
-            volume_ratio = ((current_volume - avg_volume_20d) / avg_volume_20d * 100) if avg_volume_20d > 0 else 0
-
-            volume_trend = "보통"
-            if volume_ratio > 50:
-                volume_trend = "급증"
-            elif volume_ratio < -30:
-                volume_trend = "저조"
-
-            # 3. 가격 모멘텀
-            change_1d = 0.0
-            change_5d = 0.0
-            change_20d = 0.0
-
-            if len(recent_prices) >= 2:
-                change_1d = ((current_price - recent_prices[-2].close) / recent_prices[-2].close * 100)
-
-            if len(recent_prices) >= 6:
-                change_5d = ((current_price - recent_prices[-6].close) / recent_prices[-6].close * 100)
-
-            if len(recent_prices) >= 21:
-                change_20d = ((current_price - recent_prices[-21].close) / recent_prices[-21].close * 100)
-
-            # 모멘텀 추세 판단
-            momentum_trend = "보합"
-            if change_1d > 0 and change_5d > 0 and change_20d > 0:
-                momentum_trend = "상승세"
-            elif change_1d < 0 and change_5d < 0 and change_20d < 0:
-                momentum_trend = "하락세"
-
-            # 4. RSI (14일 기준)
-            rsi = None
-            rsi_signal = "중립"
-            if len(recent_prices) >= 15:
-                # RSI 계산: 14일간의 상승/하락 평균
-                gains = []
-                losses = []
-                for i in range(-14, 0):
-                    change = recent_prices[i].close - recent_prices[i-1].close
-                    if change > 0:
-                        gains.append(change)
-                        losses.append(0)
-                    else:
-                        gains.append(0)
-                        losses.append(abs(change))
-
-                avg_gain = sum(gains) / 14
-                avg_loss = sum(losses) / 14
-
-                if avg_loss == 0:
-                    rsi = 100
-                else:
-                    rs = avg_gain / avg_loss
-                    rsi = 100 - (100 / (1 + rs))
-
-                # RSI 신호 판단
-                if rsi >= 70:
-                    rsi_signal = "과매수"
-                elif rsi <= 30:
-                    rsi_signal = "과매도"
-
-            # 5. 볼린저 밴드 (20일 기준, 2 표준편차)
-            bb_upper = None
-            bb_middle = None
-            bb_lower = None
-            bb_position = "중립"
-            if len(recent_prices) >= 20 and ma20:
-                # 표준편차 계산
-                prices_20d = [p.close for p in recent_prices[-20:]]
-                variance = sum((p - ma20) ** 2 for p in prices_20d) / 20
-                std_dev = variance ** 0.5
-
-                bb_upper = ma20 + (2 * std_dev)
-                bb_middle = ma20
-                bb_lower = ma20 - (2 * std_dev)
-
-                # 현재가 위치 판단
-                if current_price >= bb_upper:
-                    bb_position = "상단돌파"
-                elif current_price <= bb_lower:
-                    bb_position = "하단돌파"
-                elif current_price > bb_middle:
-                    bb_position = "상단근접"
-                else:
-                    bb_position = "하단근접"
-
-            # 6. MACD (12일, 26일, 9일 신호선)
-            macd_line = None
-            macd_signal = None
-            macd_histogram = None
-            macd_trend = "중립"
-            if len(recent_prices) >= 26:
-                # EMA 계산 헬퍼 함수
-                def calculate_ema(prices, period):
-                    multiplier = 2 / (period + 1)
-                    ema = prices[0]
-                    for price in prices[1:]:
-                        ema = (price - ema) * multiplier + ema
-                    return ema
-
-                prices = [p.close for p in recent_prices]
-
-                # 12일 EMA
-                ema12 = calculate_ema(prices[-26:], 12)
-
-                # 26일 EMA
-                ema26 = calculate_ema(prices[-26:], 26)
-
-                # MACD Line
-                macd_line = ema12 - ema26
-
-                # Signal Line (MACD의 9일 EMA)
-                if len(recent_prices) >= 35:
-                    macd_values = []
-                    for i in range(-35, 0):
-                        prices_segment = [p.close for p in recent_prices[max(0, i-25):i+1]]
-                        if len(prices_segment) >= 26:
-                            e12 = calculate_ema(prices_segment[-26:], 12)
-                            e26 = calculate_ema(prices_segment[-26:], 26)
-                            macd_values.append(e12 - e26)
-
-                    if len(macd_values) >= 9:
-                        macd_signal = calculate_ema(macd_values[-9:], 9)
-                        macd_histogram = macd_line - macd_signal
-
-                        # MACD 신호 판단
-                        if macd_histogram > 0:
-                            macd_trend = "매수신호"
-                        elif macd_histogram < 0:
-                            macd_trend = "매도신호"
-
-            return {
-                "moving_averages": {
-                    "ma5": round(ma5, 2) if ma5 else None,
-                    "ma20": round(ma20, 2) if ma20 else None,
-                    "ma60": round(ma60, 2) if ma60 else None,
-                    "current_vs_ma5": round(ma5_diff, 2) if ma5_diff else None,
-                    "current_vs_ma20": round(ma20_diff, 2) if ma20_diff else None,
-                    "current_vs_ma60": round(ma60_diff, 2) if ma60_diff else None,
-                    "trend": ma_trend,
-                },
-                "volume_analysis": {
-                    "current_volume": current_volume,
-                    "avg_volume_20d": round(avg_volume_20d, 0) if avg_volume_20d else 0,
-                    "volume_ratio": round(volume_ratio, 2),
-                    "trend": volume_trend,
-                },
-                "price_momentum": {
-                    "change_1d": round(change_1d, 2),
-                    "change_5d": round(change_5d, 2),
-                    "change_20d": round(change_20d, 2),
-                    "trend": momentum_trend,
-                },
-                "rsi": {
-                    "value": round(rsi, 2) if rsi else None,
-                    "signal": rsi_signal,
-                },
-                "bollinger_bands": {
-                    "upper": round(bb_upper, 2) if bb_upper else None,
-                    "middle": round(bb_middle, 2) if bb_middle else None,
-                    "lower": round(bb_lower, 2) if bb_lower else None,
-                    "position": bb_position,
-                },
-                "macd": {
-                    "macd_line": round(macd_line, 2) if macd_line else None,
-                    "signal_line": round(macd_signal, 2) if macd_signal else None,
-                    "histogram": round(macd_histogram, 2) if macd_histogram else None,
-                    "trend": macd_trend,
-                }
-            }
-
-        except Exception as e:
-            logger.error(f"기술적 지표 계산 실패 (종목코드: {stock_code}): {e}")
-            return None
-        finally:
-            db.close()
-
     def _calculate_similar_news_stats(self, similar_news: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         유사 뉴스 패턴 통계를 계산합니다.
@@ -858,6 +402,7 @@ class StockPredictor:
         self,
         current_news: Dict[str, Any],
         similar_news: List[Dict[str, Any]],
+        prompt_context: Optional[PromptContext] = None,
     ) -> str:
         """
         예측 프롬프트 생성 (개선 버전)
@@ -865,14 +410,20 @@ class StockPredictor:
         Args:
             current_news: 현재 뉴스 정보 {title, content, stock_code}
             similar_news: 유사 뉴스 리스트 [{title, content, similarity, price_changes}]
+            prompt_context: 미리 일괄 조회된 컨텍스트 (없거나 종목이 빠져 있으면 해당 종목만 조회)
 
         Returns:
             프롬프트 문자열
         """
         stock_code = current_news.get('stock_code')
 
-        # 1. 종목 기본 정보 조회
-        stock_basic = self._get_stock_info(stock_code) if stock_code else None
+        # 0. 종목/시장 컨텍스트 (한 세션 일괄 조회 결과)
+        if prompt_context is None or not prompt_context.has_stock(stock_code):
+            prompt_context = get_prompt_context_loader().load([stock_code])
+        stock_context = prompt_context.for_stock(stock_code)
+
+        # 1. 종목 기본 정보
+        stock_basic = stock_context.stock_info
         stock_name = stock_basic['name'] if stock_basic else "알 수 없음"
 
         # 2. 유사 뉴스 통계 계산
@@ -911,11 +462,9 @@ class StockPredictor:
                 stats_section += f"""**T+{period.replace('d', '')}일**: 데이터 없음
 """
 
-        # 5. 현재 주가 정보 조회
-        stock_price = self._get_current_stock_info(stock_code) if stock_code else None
-
-        # 5-1. 기술적 지표 조회
-        technical = self._get_technical_indicators(stock_code) if stock_code else None
+        # 5. 현재 주가 정보 / 기술적 지표
+        stock_price = stock_context.stock_price
+        technical = stock_context.technical
 
         # 6. 현재 주가 정보 섹션
         if stock_price:
@@ -1121,8 +670,8 @@ class StockPredictor:
         else:
             technical_section = "\n## 📈 기술적 지표 분석\n기술적 지표 데이터 없음\n"
 
-        # 7. 최근 DART 공시 정보 조회
-        disclosures = self._get_recent_disclosures(stock_code, days=7) if stock_code else []
+        # 7. 최근 DART 공시 정보
+        disclosures = stock_context.disclosures
 
         if disclosures:
             disclosure_section = f"""
@@ -1136,9 +685,9 @@ class StockPredictor:
         else:
             disclosure_section = "\n## 📢 최근 공시 정보\n최근 7일 내 공시 없음\n"
 
-        # 8. 시장 지수 맥락 정보 조회
-        market_context = self._get_market_context()
-        sector_context = self._get_sector_indices(top_n=3)
+        # 8. 시장 지수 맥락 정보 (실행 단위로 공유)
+        market_context = prompt_context.market_context
+        sector_context = prompt_context.sector_indices
 
         market_section = "\n## 📈 시장 지수 현황\n"
         if market_context.get("kospi"):
@@ -1507,6 +1056,9 @@ class StockPredictor:
             예측 결과
         """
         try:
+            # 요청 타임아웃은 호출 시점(프로바이더 슬롯 획득 후)부터 적용, 재시도 횟수 제한
+            client = client.with_options(max_retries=settings.LLM_REQUEST_MAX_RETRIES)
+
             # LLM 호출
             if provider == "openrouter":
                 response = client.chat.completions.create(
@@ -1520,6 +1072,7 @@ class StockPredictor:
                     ],
                     temperature=0.3,
                     max_tokens=1000,
+                    timeout=settings.LLM_REQUEST_TIMEOUT,
                 )
             else:  # openai
                 response = client.chat.completions.create(
@@ -1534,6 +1087,7 @@ class StockPredictor:
                     temperature=0.3,
                     max_tokens=1000,
                     response_format={"type": "json_object"},
+                    timeout=settings.LLM_REQUEST_TIMEOUT,
                 )
 
             # 응답 파싱
@@ -1573,19 +1127,50 @@ class StockPredictor:
 
         except Exception as e:
             logger.error(f"모델 {model_name} 예측 실패: {e}")
-            return {
-                "prediction": "유지",
-                "confidence": 0,
-                "reasoning": f"예측 실패: {str(e)}",
-                "short_term": "예측 불가",
-                "medium_term": "예측 불가",
-                "long_term": "예측 불가",
-                "similar_count": similar_count,
-                "model": model_name,
-                "provider": provider,
-                "timestamp": datetime.now().isoformat(),
-                "error": str(e),
-            }
+            return self._get_model_fallback(model_name, provider, similar_count, str(e))
+
+    def _get_model_fallback(
+        self,
+        model_name: str,
+        provider: str,
+        similar_count: int,
+        error_msg: str,
+    ) -> Dict[str, Any]:
+        """모델 예측 실패/타임아웃 시 기본 결과 (error 키 포함)"""
+        return {
+            "prediction": "유지",
+            "confidence": 0,
+            "reasoning": f"예측 실패: {error_msg}",
+            "short_term": "예측 불가",
+            "medium_term": "예측 불가",
+            "long_term": "예측 불가",
+            "similar_count": similar_count,
+            "model": model_name,
+            "provider": provider,
+            "timestamp": datetime.now().isoformat(),
+            "error": error_msg,
+        }
+
+    def _predict_with_provider_limit(
+        self,
+        model_info: Dict[str, Any],
+        prompt: str,
+        similar_count: int,
+    ) -> Dict[str, Any]:
+        """
+        프로바이더 동시 호출 상한 내에서 _predict_with_model 실행 (스레드 풀 작업)
+
+        슬롯/스레드 풀 대기 시간은 타임아웃에 포함하지 않고, 슬롯을 얻은 뒤의 LLM 호출에만
+        LLM_REQUEST_TIMEOUT을 적용합니다 (실행 중인 호출은 취소할 수 없으므로 클라이언트에서 종료).
+        """
+        with _get_provider_semaphore(model_info["provider"]):
+            return self._predict_with_model(
+                model_info["client"],
+                model_info["model_identifier"],
+                model_info["provider"],
+                prompt,
+                similar_count
+            )
 
     def dual_predict(
         self,
@@ -1669,49 +1254,74 @@ class StockPredictor:
         current_news: Dict[str, Any],
         similar_news: List[Dict[str, Any]],
         news_id: int,
+        prompt_context: Optional[PromptContext] = None,
     ) -> Dict[int, Dict[str, Any]]:
         """
-        모든 활성 모델로 예측을 생성하고 DB에 저장합니다.
+        모든 활성 모델로 예측을 동시에 생성하고 DB에 저장합니다.
+
+        - 모델별 호출은 스레드 풀에서 동시에 실행 (프로바이더별 동시 호출 상한 적용)
+        - 모델별 요청 타임아웃(LLM_REQUEST_TIMEOUT)은 클라이언트가 적용하며, 실패/타임아웃 모델은
+          error 결과로 대체 (상한/스레드 풀 대기 시간은 타임아웃에 포함되지 않음)
+        - 성공한 예측만 하나의 트랜잭션으로 저장 (실패/타임아웃은 기존 예측 유지)
 
         Args:
             current_news: 현재 뉴스 정보
             similar_news: 유사 뉴스 리스트
             news_id: 뉴스 ID
+            prompt_context: 미리 일괄 조회된 프롬프트 컨텍스트 (선택사항, 여러 뉴스 처리 시 공유)
 
         Returns:
-            {model_id: prediction_result, ...}
+            {model_id: prediction_result, ...} (실패/타임아웃 모델은 error 키 포함)
         """
         stock_code = current_news.get("stock_code")
         similar_count = len(similar_news)
         results = {}
 
+        if not self.active_models:
+            return results
+
         # 프롬프트 생성 (공통)
-        prompt = self._build_prompt(current_news, similar_news)
+        prompt = self._build_prompt(current_news, similar_news, prompt_context)
 
         logger.info(f"🔬 모든 활성 모델로 예측 시작: news_id={news_id}, models={len(self.active_models)}")
+        started = time.perf_counter()
 
-        for model_id, model_info in self.active_models.items():
-            logger.info(f"  📊 {model_info['name']} 예측 중...")
-
-            # 예측 실행
-            prediction = self._predict_with_model(
-                model_info["client"],
-                model_info["model_identifier"],
-                model_info["provider"],
-                prompt,
-                similar_count
+        futures = {
+            model_id: self._executor.submit(
+                self._predict_with_provider_limit, model_info, prompt, similar_count
             )
+            for model_id, model_info in self.active_models.items()
+        }
+        wait(futures.values())
+
+        for model_id, future in futures.items():
+            model_info = self.active_models[model_id]
+
+            try:
+                prediction = future.result()
+            except Exception as e:
+                logger.error(f"  ❌ {model_info['name']} 예측 실패: {e}")
+                prediction = self._get_model_fallback(
+                    model_info["model_identifier"], model_info["provider"], similar_count, str(e)
+                )
 
             # 결과에 model_id 추가
             prediction["model_id"] = model_id
             prediction["model"] = model_info["name"]
-
-            # DB 저장
-            self._save_model_prediction(news_id, model_id, stock_code, prediction)
-
             results[model_id] = prediction
 
-        logger.info(f"✅ 모든 모델 예측 완료: {len(results)}개")
+        # 성공한 예측만 일괄 저장
+        succeeded = {
+            model_id: prediction
+            for model_id, prediction in results.items()
+            if "error" not in prediction
+        }
+        saved_count = self._save_model_predictions(news_id, stock_code, succeeded)
+
+        logger.info(
+            f"✅ 모든 모델 예측 완료: 성공 {len(succeeded)}/{len(results)}개, "
+            f"저장 {saved_count}개 ({time.perf_counter() - started:.1f}초)"
+        )
         return results
 
     def get_ab_predictions(self, news_id: int) -> Dict[str, Any]:
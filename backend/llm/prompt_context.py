@@ -0,0 +1,324 @@
+"""
+예측 프롬프트 컨텍스트 로더
+
+StockPredictor._build_prompt에 필요한 종목 정보, 현재 주가, 최근 공시, 기술적 지표,
+시장 지수(KOSPI/KOSDAQ), 업종 지수를 한 세션에서 종목 목록 단위로 일괄 조회합니다.
+
+- 종목별 데이터: 종목 목록 전체에 대해 테이블당 쿼리 1회 (IN + 윈도우 함수)
+- 시장/업종 지수: 종목과 무관하므로 MARKET_CONTEXT_TTL_SECONDS 동안 재사용
+  (한 실행(사이클)의 모든 뉴스가 같은 값을 공유)
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend.db.models.market_data import IndexDailyPrice
+from backend.db.models.news import NewsArticle
+from backend.db.models.stock import Stock, StockPrice
+from backend.db.session import SessionLocal
+from backend.services.indicator_store import get_indicator_store
+
+
+logger = logging.getLogger(__name__)
+
+
+MARKET_INDEX_CODES = {"kospi": "0001", "kosdaq": "1001"}
+SECTOR_INDEX_PATTERN = "10__"  # 업종 지수 코드 (1010~1026)
+
+DISCLOSURE_DAYS = 7
+DISCLOSURE_LIMIT = 5
+SECTOR_TOP_N = 3
+MARKET_CONTEXT_TTL_SECONDS = 300
+
+
+@dataclass
+class StockPromptContext:
+    """종목별 프롬프트 컨텍스트"""
+    stock_info: Optional[Dict[str, Any]] = None
+    stock_price: Optional[Dict[str, Any]] = None
+    disclosures: List[Dict[str, Any]] = field(default_factory=list)
+    technical: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class PromptContext:
+    """한 실행(사이클)의 프롬프트 컨텍스트 (종목별 + 시장 공통)"""
+    stocks: Dict[str, StockPromptContext] = field(default_factory=dict)
+    market_context: Dict[str, Any] = field(
+        default_factory=lambda: {"kospi": None, "kosdaq": None}
+    )
+    sector_indices: Dict[str, Any] = field(
+        default_factory=lambda: {"top_sectors": [], "bottom_sectors": []}
+    )
+
+    def for_stock(self, stock_code: Optional[str]) -> StockPromptContext:
+        """종목 컨텍스트 (없으면 빈 컨텍스트)"""
+        if not stock_code:
+            return StockPromptContext()
+        return self.stocks.get(stock_code) or StockPromptContext()
+
+    def has_stock(self, stock_code: Optional[str]) -> bool:
+        return not stock_code or stock_code in self.stocks
+
+
+class PromptContextLoader:
+    """프롬프트 컨텍스트 일괄 로더"""
+
+    def __init__(self, market_ttl_seconds: int = MARKET_CONTEXT_TTL_SECONDS):
+        """
+        Args:
+            market_ttl_seconds: 시장/업종 지수 재사용 시간 (초)
+        """
+        self.market_ttl_seconds = market_ttl_seconds
+        self._market_cache: Optional[Dict[str, Any]] = None
+        self._market_expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def load(self, stock_codes: Iterable[Optional[str]], db: Optional[Session] = None) -> PromptContext:
+        """
+        종목 목록의 프롬프트 컨텍스트를 한 세션에서 일괄 조회합니다.
+
+        조회 실패한 항목은 빈 값으로 두고 나머지는 그대로 반환합니다 (프롬프트는 "정보 없음"으로 표시).
+
+        Args:
+            stock_codes: 종목 코드 목록 (None/중복 허용)
+            db: Database session (None이면 내부에서 생성)
+
+        Returns:
+            PromptContext
+        """
+        codes = sorted({code for code in stock_codes if code})
+
+        owns_session = db is None
+        if owns_session:
+            db = SessionLocal()
+        try:
+            context = PromptContext(stocks={code: StockPromptContext() for code in codes})
+
+            if codes:
+                for name, loader in (
+                    ("종목 정보", self._load_stock_info),
+                    ("현재 주가", self._load_stock_prices),
+                    ("DART 공시", self._load_disclosures),
+                ):
+                    try:
+                        loader(db, codes, context.stocks)
+                    except Exception as e:
+                        db.rollback()
+                        logger.error(f"{name} 일괄 조회 실패 ({len(codes)}개 종목): {e}")
+
+                technical = get_indicator_store().get_many(codes, db)
+                for code in codes:
+                    context.stocks[code].technical = technical.get(code)
+
+            market = self._get_market(db)
+            context.market_context = market["market_context"]
+            context.sector_indices = market["sector_indices"]
+            return context
+        finally:
+            if owns_session:
+                db.close()
+
+    def invalidate_market(self) -> None:
+        """시장/업종 지수 캐시 초기화 (지수 수집 후 호출)"""
+        with self._lock:
+            self._market_cache = None
+            self._market_expires_at = 0.0
+
+    @staticmethod
+    def _load_stock_info(db: Session, codes: List[str], stocks: Dict[str, StockPromptContext]) -> None:
+        for stock in db.query(Stock).filter(Stock.code.in_(codes)).all():
+            stocks[stock.code].stock_info = {
+                "code": stock.code,
+                "name": stock.name,
+                "priority": stock.priority,
+            }
+
+    @staticmethod
+    def _load_stock_prices(db: Session, codes: List[str], stocks: Dict[str, StockPromptContext]) -> None:
+        """종목별 최근 2일 주가 (변동률 계산용) - 윈도우 쿼리 1회"""
+        ranked = db.query(
+            StockPrice.stock_code,
+            StockPrice.date,
+            StockPrice.open,
+            StockPrice.high,
+            StockPrice.low,
+            StockPrice.close,
+            StockPrice.volume,
+            func.row_number().over(
+                partition_by=StockPrice.stock_code,
+                order_by=StockPrice.date.desc(),
+            ).label("rank"),
+        ).filter(StockPrice.stock_code.in_(codes)).subquery()
+
+        rows = db.query(ranked).filter(ranked.c.rank <= 2).order_by(
+            ranked.c.stock_code, ranked.c.rank
+        ).all()
+
+        recent_prices: Dict[str, list] = {}
+        for row in rows:
+            recent_prices.setdefault(row.stock_code, []).append(row)
+
+        for code, prices in recent_prices.items():
+            current = prices[0]
+
+            # 변동률 계산
+            change_rate = 0.0
+            if len(prices) >= 2:
+                previous = prices[1]
+                if previous.close > 0:
+                    change_rate = ((current.close - previous.close) / previous.close) * 100
+
+            stocks[code].stock_price = {
+                "close": current.close,
+                "open": current.open,
+                "high": current.high,
+                "low": current.low,
+                "volume": current.volume,
+                "change_rate": round(change_rate, 2),
+                "date": current.date.strftime("%Y-%m-%d %H:%M") if current.date else "N/A",
+            }
+
+    @staticmethod
+    def _load_disclosures(db: Session, codes: List[str], stocks: Dict[str, StockPromptContext]) -> None:
+        """종목별 최근 DART 공시 (최대 DISCLOSURE_LIMIT건) - 윈도우 쿼리 1회"""
+        since_date = datetime.now() - timedelta(days=DISCLOSURE_DAYS)
+
+        ranked = db.query(
+            NewsArticle.stock_code,
+            NewsArticle.title,
+            NewsArticle.content,
+            NewsArticle.published_at,
+            func.row_number().over(
+                partition_by=NewsArticle.stock_code,
+                order_by=NewsArticle.published_at.desc(),
+            ).label("rank"),
+        ).filter(
+            NewsArticle.stock_code.in_(codes),
+            NewsArticle.source == "dart",
+            NewsArticle.published_at >= since_date,
+        ).subquery()
+
+        rows = db.query(ranked).filter(ranked.c.rank <= DISCLOSURE_LIMIT).order_by(
+            ranked.c.stock_code, ranked.c.rank
+        ).all()
+
+        for row in rows:
+            stocks[row.stock_code].disclosures.append({
+                "title": row.title,
+                "published_at": row.published_at.strftime("%Y-%m-%d"),
+                "content": row.content[:100] + "..." if len(row.content) > 100 else row.content,
+            })
+
+    def _get_market(self, db: Session) -> Dict[str, Any]:
+        """시장/업종 지수 (MARKET_CONTEXT_TTL_SECONDS 동안 재사용)"""
+        with self._lock:
+            if self._market_cache is not None and self._market_expires_at > time.monotonic():
+                return self._market_cache
+
+        market = {
+            "market_context": self._load_market_context(db),
+            "sector_indices": self._load_sector_indices(db),
+        }
+        with self._lock:
+            self._market_cache = market
+            self._market_expires_at = time.monotonic() + self.market_ttl_seconds
+        return market
+
+    @staticmethod
+    def _load_market_context(db: Session) -> Dict[str, Any]:
+        """KOSPI/KOSDAQ 최신 지수 - 윈도우 쿼리 1회"""
+        try:
+            ranked = db.query(
+                IndexDailyPrice.index_code,
+                IndexDailyPrice.close,
+                IndexDailyPrice.change_rate,
+                IndexDailyPrice.date,
+                func.row_number().over(
+                    partition_by=IndexDailyPrice.index_code,
+                    order_by=IndexDailyPrice.date.desc(),
+                ).label("rank"),
+            ).filter(IndexDailyPrice.index_code.in_(list(MARKET_INDEX_CODES.values()))).subquery()
+
+            latest = {
+                row.index_code: row
+                for row in db.query(ranked).filter(ranked.c.rank == 1).all()
+            }
+
+            market_context = {}
+            for name, index_code in MARKET_INDEX_CODES.items():
+                row = latest.get(index_code)
+                market_context[name] = {
+                    "close": round(row.close, 2),
+                    "change_pct": round(row.change_rate, 2) if row.change_rate is not None else None,
+                    "date": row.date.strftime("%Y-%m-%d"),
+                } if row else None
+            return market_context
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"시장 지수 조회 실패: {e}")
+            return {"kospi": None, "kosdaq": None}
+
+    @staticmethod
+    def _load_sector_indices(db: Session, top_n: int = SECTOR_TOP_N) -> Dict[str, Any]:
+        """최신 날짜의 업종 지수 변동률 상위/하위 N개 (KOSPI, KOSDAQ 제외)"""
+        try:
+            latest_date = db.query(func.max(IndexDailyPrice.date)).scalar_subquery()
+            all_sectors = db.query(
+                IndexDailyPrice.index_name,
+                IndexDailyPrice.close,
+                IndexDailyPrice.change_rate,
+            ).filter(
+                IndexDailyPrice.date == latest_date,
+                IndexDailyPrice.index_code.like(SECTOR_INDEX_PATTERN),
+                # KOSDAQ(1001)도 10__ 패턴에 걸리므로 제외
+                IndexDailyPrice.index_code.notin_(list(MARKET_INDEX_CODES.values())),
+                IndexDailyPrice.change_rate.isnot(None),
+            ).order_by(IndexDailyPrice.change_rate.desc()).all()
+
+            if not all_sectors:
+                logger.warning("섹터 지수 데이터 없음 (index_daily_price)")
+                return {"top_sectors": [], "bottom_sectors": []}
+
+            def _sector(row) -> Dict[str, Any]:
+                return {
+                    "name": row.index_name,
+                    "close": round(row.close, 2),
+                    "change_pct": round(row.change_rate, 2),
+                }
+
+            return {
+                "top_sectors": [_sector(row) for row in all_sectors[:top_n]],
+                "bottom_sectors": [_sector(row) for row in all_sectors[-top_n:]],
+            }
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"섹터 지수 조회 실패: {e}")
+            return {"top_sectors": [], "bottom_sectors": []}
+
+
+# 싱글톤 인스턴스
+_prompt_context_loader: Optional[PromptContextLoader] = None
+_prompt_context_loader_lock = threading.Lock()
+
+
+def get_prompt_context_loader() -> PromptContextLoader:
+    """
+    PromptContextLoader 싱글톤 인스턴스를 반환합니다.
+
+    Returns:
+        PromptContextLoader 인스턴스
+    """
+    global _prompt_context_loader
+    with _prompt_context_loader_lock:
+        if _prompt_context_loader is None:
+            _prompt_context_loader = PromptContextLoader()
+        return _prompt_context_loader
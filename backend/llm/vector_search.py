@@ -1,18 +1,25 @@
 """
 뉴스 벡터 검색 모듈
 
-Milvus에서 유사한 과거 뉴스를 검색하고, 해당 뉴스의 주가 변동률을 조회합니다.
+벡터 저장소(Milvus 또는 로컬 인덱스)에서 유사한 과거 뉴스를 검색하고,
+해당 뉴스의 주가 변동률을 조회합니다.
+
+최근 N시간 이내 뉴스만 찾는 검색(max_age_hours, 중복 검사)은 핫 캐시가 있으면
+네트워크 호출 없이 프로세스 내 인덱스에서 처리합니다.
 """
 import logging
 import threading
-from typing import List, Dict, Any, Optional
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
 
-from pymilvus import Collection, connections
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from backend.config import settings
 from backend.llm.embedder import NewsEmbedder
+from backend.llm.vector_store import VectorHit, VectorStore, get_hot_vector_store, get_vector_store
 from backend.db.models.news import NewsArticle
 from backend.db.models.match import NewsStockMatch
 
@@ -20,13 +27,46 @@ from backend.db.models.match import NewsStockMatch
 logger = logging.getLogger(__name__)
 
 
+# 검색 요청당 최대 쿼리 벡터 수 (Milvus nq 한도 16384 이내)
+MAX_QUERY_VECTORS = 256
+
+# 유사 뉴스 본문 요약 길이 (DB에서 잘라서 조회)
+SUMMARY_LENGTH = 200
+
+# 유사 뉴스 상세(제목/요약/주가 변동률) TTL 캐시
+DETAIL_CACHE_TTL_SECONDS = 300
+DETAIL_CACHE_MAX_SIZE = 2048
+
+EMPTY_PRICE_CHANGES = {"1d": None, "2d": None, "3d": None, "5d": None, "10d": None, "20d": None}
+
+
 class NewsVectorSearch:
     """뉴스 벡터 검색 클래스"""
 
-    def __init__(self):
-        """벡터 검색 초기화"""
+    def __init__(
+        self,
+        detail_cache_ttl: int = DETAIL_CACHE_TTL_SECONDS,
+        store: Optional[VectorStore] = None,
+        hot_store: Optional[VectorStore] = None,
+        hot_store_hours: Optional[int] = None,
+    ):
+        """
+        벡터 검색 초기화
+
+        Args:
+            detail_cache_ttl: 유사 뉴스 상세 캐시 유효 시간 (초, 0이면 캐시 사용 안 함)
+            store: 벡터 저장소 (기본: get_vector_store())
+            hot_store: 최근 뉴스 핫 캐시 (기본: get_hot_vector_store(), 비활성 시 None)
+            hot_store_hours: 핫 캐시가 보관하는 기간 (기본: VECTOR_HOT_CACHE_HOURS)
+        """
         self.embedder = NewsEmbedder()
-        self.collection_name = "news_embeddings"
+        self.store = store or get_vector_store()
+        self.hot_store = hot_store if hot_store is not None else get_hot_vector_store()
+        self.hot_store_hours = hot_store_hours or settings.VECTOR_HOT_CACHE_HOURS
+
+        self.detail_cache_ttl = detail_cache_ttl
+        self._detail_cache: "OrderedDict[int, Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+        self._detail_lock = threading.Lock()
 
     def search_similar_news(
         self,
@@ -34,6 +74,7 @@ class NewsVectorSearch:
         stock_code: Optional[str] = None,
         top_k: int = 5,
         similarity_threshold: float = 0.7,
+        max_age_hours: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         유사한 과거 뉴스를 검색합니다.
@@ -43,6 +84,7 @@ class NewsVectorSearch:
             stock_code: 종목 코드 (필터링용, 선택사항)
             top_k: 반환할 최대 개수
             similarity_threshold: 유사도 임계값 (0.0 ~ 1.0)
+            max_age_hours: 최근 N시간 이내 발행 뉴스만 검색 (핫 캐시 기간 이내면 핫 캐시 사용)
 
         Returns:
             유사 뉴스 리스트 [
@@ -55,10 +97,6 @@ class NewsVectorSearch:
                 ...
             ]
         """
-        # 스레드별 고유 alias 생성 (멀티스레드 환경에서 충돌 방지)
-        thread_id = threading.get_ident()
-        alias = f"search_{thread_id}"
-
         try:
             # 1. 뉴스 텍스트 임베딩
             embedding = self.embedder.embed_text(news_text)
@@ -66,62 +104,10 @@ class NewsVectorSearch:
                 logger.error("뉴스 임베딩 생성 실패")
                 return []
 
-            # 2. Milvus 연결 (이미 연결되어 있으면 재사용)
-            try:
-                connections.connect(
-                    alias=alias,
-                    host=settings.MILVUS_HOST,
-                    port=settings.MILVUS_PORT,
-                )
-            except Exception as e:
-                # 이미 연결되어 있으면 무시
-                if "already exist" not in str(e).lower():
-                    raise
-
-            # 3. 컬렉션 로드
-            collection = Collection(self.collection_name, using=alias)
-            collection.load()
-
-            # 4. 검색 파라미터 설정
-            search_params = {
-                "metric_type": "L2",  # 유클리디안 거리
-                "params": {"nprobe": 10},
-            }
-
-            # 5. 필터 표현식 (종목 코드가 있는 경우)
-            expr = f'stock_code == "{stock_code}"' if stock_code else ""
-
-            # 6. 벡터 검색
-            results = collection.search(
-                data=[embedding],
-                anns_field="embedding",
-                param=search_params,
-                limit=top_k * 2,  # 임계값 필터링을 위해 여유있게 가져옴
-                expr=expr,
-                output_fields=["news_article_id", "stock_code", "published_timestamp"],
-            )
-
-            # 7. 결과 파싱
-            similar_news = []
-            if results and len(results) > 0:
-                for hit in results[0]:
-                    # L2 거리를 코사인 유사도로 변환
-                    # L2 거리가 작을수록 유사함
-                    # 유사도 = 1 / (1 + L2_distance)
-                    distance = hit.distance
-                    similarity = 1 / (1 + distance)
-
-                    if similarity >= similarity_threshold:
-                        similar_news.append({
-                            "news_id": hit.entity.get("news_article_id"),
-                            "similarity": round(similarity, 4),
-                            "stock_code": hit.entity.get("stock_code"),
-                            "published_at": hit.entity.get("published_timestamp"),
-                        })
-
-                    # top_k개만 반환
-                    if len(similar_news) >= top_k:
-                        break
+            # 2. 벡터 검색
+            similar_news = self._search_vectors(
+                [embedding], stock_code, top_k, similarity_threshold, max_age_hours
+            )[0]
 
             logger.info(f"유사 뉴스 검색 완료: {len(similar_news)}건 (임계값: {similarity_threshold})")
             return similar_news
@@ -130,11 +116,115 @@ class NewsVectorSearch:
             logger.error(f"벡터 검색 실패: {e}", exc_info=True)
             return []
 
-        finally:
-            try:
-                connections.disconnect(alias)
-            except Exception:
-                pass
+    def search_similar_news_batch(
+        self,
+        news_texts: List[str],
+        stock_codes: Optional[List[Optional[str]]] = None,
+        top_k: int = 5,
+        similarity_threshold: float = 0.7,
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        여러 뉴스의 유사 과거 뉴스를 한 번에 검색합니다.
+
+        모든 텍스트를 배치 임베딩(캐시 미스만 1회 요청)한 뒤, 종목 코드 필터별로
+        다중 벡터 검색 1회씩 수행합니다.
+
+        Args:
+            news_texts: 검색할 뉴스 텍스트 리스트
+            stock_codes: 뉴스별 종목 코드 (필터링용, None이면 필터 없음)
+            top_k: 뉴스당 반환할 최대 개수
+            similarity_threshold: 유사도 임계값 (0.0 ~ 1.0)
+
+        Returns:
+            입력 순서대로 뉴스별 유사 뉴스 리스트 (search_similar_news와 같은 형식).
+            임베딩/검색에 실패한 뉴스는 None (빈 리스트 = 유사 뉴스 없음과 구분, 호출자가 뉴스별로 재검색)
+        """
+        results: List[Optional[List[Dict[str, Any]]]] = [None for _ in news_texts]
+        if not news_texts:
+            return results
+
+        stock_codes = stock_codes or [None] * len(news_texts)
+        embeddings = self.embedder.embed_batch(news_texts)
+
+        # 종목 코드 필터별 그룹 (필터는 검색 요청 단위로 적용)
+        groups: Dict[Optional[str], List[int]] = {}
+        for index, embedding in enumerate(embeddings):
+            if embedding:
+                groups.setdefault(stock_codes[index], []).append(index)
+
+        for stock_code, indexes in groups.items():
+            for start in range(0, len(indexes), MAX_QUERY_VECTORS):
+                chunk = indexes[start:start + MAX_QUERY_VECTORS]
+                try:
+                    hits = self._search_vectors(
+                        [embeddings[index] for index in chunk], stock_code, top_k, similarity_threshold
+                    )
+                except Exception as e:
+                    logger.error(f"배치 벡터 검색 실패 (종목={stock_code}, {len(chunk)}건): {e}", exc_info=True)
+                    continue
+
+                for index, similar_news in zip(chunk, hits):
+                    results[index] = similar_news
+
+        logger.info(
+            f"배치 유사 뉴스 검색 완료: {len(news_texts)}건, 검색 {len(groups)}그룹 "
+            f"(임계값: {similarity_threshold})"
+        )
+        return results
+
+    def _search_vectors(
+        self,
+        embeddings: List[List[float]],
+        stock_code: Optional[str],
+        top_k: int,
+        similarity_threshold: float,
+        max_age_hours: Optional[int] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        다중 벡터 검색 1회 (같은 종목 코드 필터)
+
+        Returns:
+            벡터별 유사 뉴스 리스트 (입력 순서)
+        """
+        store = self.store
+        min_published_at = None
+        if max_age_hours:
+            min_published_at = int(time.time() - max_age_hours * 3600)
+            if self.hot_store is not None and max_age_hours <= self.hot_store_hours:
+                store = self.hot_store
+
+        results = store.search(
+            embeddings,
+            top_k * 2,  # 임계값 필터링을 위해 여유있게 가져옴
+            stock_code=stock_code,
+            min_published_at=min_published_at,
+        )
+
+        return [self._parse_hits(hits, top_k, similarity_threshold) for hits in results]
+
+    @staticmethod
+    def _parse_hits(hits: List[VectorHit], top_k: int, similarity_threshold: float) -> List[Dict[str, Any]]:
+        """검색 결과(한 벡터분)를 유사 뉴스 리스트로 변환"""
+        similar_news = []
+        for hit in hits:
+            # L2 거리를 코사인 유사도로 변환
+            # L2 거리가 작을수록 유사함
+            # 유사도 = 1 / (1 + L2_distance)
+            similarity = 1 / (1 + hit.distance)
+
+            if similarity >= similarity_threshold:
+                similar_news.append({
+                    "news_id": hit.news_id,
+                    "similarity": round(similarity, 4),
+                    "stock_code": hit.stock_code,
+                    "published_at": hit.published_at,
+                })
+
+            # top_k개만 반환
+            if len(similar_news) >= top_k:
+                break
+
+        return similar_news
 
     def get_news_with_price_changes(
         self,
@@ -187,48 +277,137 @@ class NewsVectorSearch:
             return []
 
         # 2. 뉴스 상세 정보 및 주가 변동률 조회
-        enriched_news = []
+        return self.enrich_with_price_changes(similar_news, db)
 
-        for news in similar_news:
-            news_id = news["news_id"]
+    def enrich_with_price_changes(
+        self,
+        similar_news: List[Dict[str, Any]],
+        db: Session,
+    ) -> List[Dict[str, Any]]:
+        """
+        검색된 유사 뉴스에 뉴스 상세 정보와 주가 변동률을 붙입니다.
 
-            # 뉴스 정보 조회
-            news_article = db.query(NewsArticle).filter(NewsArticle.id == news_id).first()
-            if not news_article:
-                continue
+        Args:
+            similar_news: search_similar_news(_batch) 결과
+            db: 데이터베이스 세션
 
-            # 주가 변동률 조회
-            match = (
-                db.query(NewsStockMatch)
-                .filter(
-                    NewsStockMatch.news_id == news_id,
-                    NewsStockMatch.stock_code == news["stock_code"]
-                )
-                .first()
-            )
+        Returns:
+            get_news_with_price_changes와 같은 형식의 리스트
+        """
+        if not similar_news:
+            return []
 
-            price_changes = {
-                "1d": match.price_change_1d if match else None,
-                "2d": match.price_change_2d if match else None,
-                "3d": match.price_change_3d if match else None,
-                "5d": match.price_change_5d if match else None,
-                "10d": match.price_change_10d if match else None,
-                "20d": match.price_change_20d if match else None,
-            }
+        details = self._get_news_details({news["news_id"] for news in similar_news}, db)
+
+        enriched_news = []
+        for news in similar_news:
+            detail = details.get(news["news_id"])
+            if not detail:
+                continue
+
+            # 주가 변동률 (매칭 없으면 모두 None)
+            price_changes = detail["price_changes"].get(news["stock_code"], EMPTY_PRICE_CHANGES)
 
             enriched_news.append({
-                "news_id": news_id,
+                "news_id": news["news_id"],
                 "similarity": news["similarity"],
-                "news_title": news_article.title,
-                "news_content": news_article.content[:200] + "...",  # 요약
+                "news_title": detail["title"],
+                "news_content": detail["summary"] + "...",  # 요약
                 "stock_code": news["stock_code"],
-                "published_at": news_article.published_at,
-                "price_changes": price_changes,
+                "published_at": detail["published_at"],
+                "price_changes": dict(price_changes),
             })
 
         logger.info(f"유사 뉴스 + 주가 변동률 조회 완료: {len(enriched_news)}건")
         return enriched_news
 
+    def _get_news_details(self, news_ids: Set[int], db: Session) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        뉴스 상세(제목/요약/발행일)와 종목별 주가 변동률 일괄 조회
+
+        TTL 캐시에 없는 뉴스만 IN 쿼리 2회(뉴스, 매칭)로 조회합니다.
+        본문은 DB에서 앞 200자만 잘라서 가져옵니다.
+        DB에 없는 뉴스(Milvus에만 남은 경우)도 None으로 캐싱하여 반복 조회하지 않습니다.
+
+        Returns:
+            {news_id: {"title", "summary", "published_at", "price_changes": {종목코드: {...}}} 또는 None}
+        """
+        details: Dict[int, Optional[Dict[str, Any]]] = {}
+        now = time.monotonic()
+
+        if self.detail_cache_ttl > 0:
+            with self._detail_lock:
+                for news_id in news_ids:
+                    entry = self._detail_cache.get(news_id)
+                    if entry and now - entry[0] <= self.detail_cache_ttl:
+                        details[news_id] = entry[1]
+
+        missing = [news_id for news_id in news_ids if news_id not in details]
+        if not missing:
+            return details
+
+        # 1. 뉴스 정보 (필요한 컬럼만, 본문은 요약 길이만큼)
+        articles = (
+            db.query(
+                NewsArticle.id,
+                NewsArticle.title,
+                func.substr(NewsArticle.content, 1, SUMMARY_LENGTH).label("summary"),
+                NewsArticle.published_at,
+            )
+            .filter(NewsArticle.id.in_(missing))
+            .all()
+        )
+        fetched: Dict[int, Optional[Dict[str, Any]]] = {
+            row.id: {
+                "title": row.title,
+                "summary": row.summary or "",
+                "published_at": row.published_at,
+                "price_changes": {},
+            }
+            for row in articles
+        }
+
+        # 2. 주가 변동률 (뉴스별 모든 종목, 같은 종목 중복 시 최신 계산값)
+        if fetched:
+            matches = (
+                db.query(
+                    NewsStockMatch.news_id,
+                    NewsStockMatch.stock_code,
+                    NewsStockMatch.price_change_1d,
+                    NewsStockMatch.price_change_2d,
+                    NewsStockMatch.price_change_3d,
+                    NewsStockMatch.price_change_5d,
+                    NewsStockMatch.price_change_10d,
+                    NewsStockMatch.price_change_20d,
+                )
+                .filter(NewsStockMatch.news_id.in_(list(fetched.keys())))
+                .order_by(NewsStockMatch.calculated_at.desc())
+                .all()
+            )
+            for match in matches:
+                fetched[match.news_id]["price_changes"].setdefault(match.stock_code, {
+                    "1d": match.price_change_1d,
+                    "2d": match.price_change_2d,
+                    "3d": match.price_change_3d,
+                    "5d": match.price_change_5d,
+                    "10d": match.price_change_10d,
+                    "20d": match.price_change_20d,
+                })
+
+        for news_id in missing:
+            fetched.setdefault(news_id, None)
+
+        if self.detail_cache_ttl > 0:
+            with self._detail_lock:
+                for news_id, detail in fetched.items():
+                    self._detail_cache[news_id] = (now, detail)
+                    self._detail_cache.move_to_end(news_id)
+                while len(self._detail_cache) > DETAIL_CACHE_MAX_SIZE:
+                    self._detail_cache.popitem(last=False)
+
+        details.update(fetched)
+        return details
+
 
 # 싱글톤 인스턴스
 _vector_search: Optional[NewsVectorSearch] = None
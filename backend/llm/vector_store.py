@@ -0,0 +1,659 @@
+"""
+뉴스 임베딩 벡터 저장소
+
+NewsVectorSearch/NewsEmbedder가 사용하는 벡터 저장소 인터페이스와 구현체입니다.
+
+- MilvusVectorStore: 기존 Milvus 컬렉션 (news_embeddings)
+- LocalVectorStore: 프로세스 내 NumPy 인덱스
+  - 디스크의 .npy 파일을 memmap으로 열어 사용 (재시작 후에도 유지)
+  - 최근 window_days 일치 임베딩만 보관 (flush 시 오래된 항목 제거)
+  - 종목 코드 필터는 종목별 행 목록으로 바로 좁힌 뒤 정확 검색
+  - 항목이 ivf_min_size 이상이면 IVF(k-means 분할) 근사 검색 (nprobe개 분할만 비교)
+
+Milvus 없이 개발/테스트 환경에서 VECTOR_STORE_BACKEND="local"로 사용하거나,
+Milvus 사용 시 VECTOR_HOT_CACHE_ENABLED로 최근 24시간 중복 검사용 핫 캐시로 사용합니다.
+
+거리는 Milvus L2 metric과 같은 L2 제곱 거리입니다.
+"""
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.config import settings
+from backend.db.milvus_client import get_milvus_manager
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VectorHit:
+    """벡터 검색 결과 1건"""
+
+    news_id: int
+    distance: float  # L2 제곱 거리 (작을수록 유사)
+    stock_code: str
+    published_at: int  # Unix timestamp
+
+
+class VectorStore(ABC):
+    """뉴스 임베딩 벡터 저장소 인터페이스"""
+
+    @abstractmethod
+    def search(
+        self,
+        embeddings: Sequence[Sequence[float]],
+        top_k: int,
+        stock_code: Optional[str] = None,
+        min_published_at: Optional[int] = None,
+    ) -> List[List[VectorHit]]:
+        """
+        다중 벡터 검색
+
+        Args:
+            embeddings: 쿼리 벡터 리스트
+            top_k: 벡터당 최대 결과 수
+            stock_code: 종목 코드 필터
+            min_published_at: 발행 시각 하한 (Unix timestamp)
+
+        Returns:
+            쿼리 벡터별 검색 결과 (거리 오름차순, 입력 순서)
+        """
+
+    @abstractmethod
+    def upsert(
+        self,
+        news_ids: Sequence[int],
+        embeddings: Sequence[Sequence[float]],
+        stock_codes: Sequence[str],
+        published_timestamps: Sequence[int],
+    ) -> int:
+        """
+        뉴스 ID 기준 임베딩 저장 (같은 ID는 교체)
+
+        Returns:
+            저장된 항목 수
+        """
+
+    def flush(self) -> None:
+        """버퍼에 쌓인 변경 사항을 반영합니다."""
+
+    def close(self) -> None:
+        """저장소를 닫습니다."""
+        self.flush()
+
+
+class MilvusVectorStore(VectorStore):
+    """Milvus 컬렉션 벡터 저장소 (공유 연결 풀 사용)"""
+
+    OUTPUT_FIELDS = ["news_article_id", "stock_code", "published_timestamp"]
+
+    def __init__(self, collection_name: str = "news_embeddings", nprobe: int = 10):
+        """
+        Args:
+            collection_name: 컬렉션 이름
+            nprobe: IVF 검색 시 비교할 클러스터 수
+        """
+        self.collection_name = collection_name
+        self.nprobe = nprobe
+
+    def search(
+        self,
+        embeddings: Sequence[Sequence[float]],
+        top_k: int,
+        stock_code: Optional[str] = None,
+        min_published_at: Optional[int] = None,
+    ) -> List[List[VectorHit]]:
+        # 필터 표현식 (종목 코드 / 발행 시각)
+        filters = []
+        if stock_code:
+            filters.append(f'stock_code == "{stock_code}"')
+        if min_published_at is not None:
+            filters.append(f"published_timestamp >= {int(min_published_at)}")
+
+        results = get_milvus_manager().execute(
+            self.collection_name,
+            lambda collection: collection.search(
+                data=list(embeddings),
+                anns_field="embedding",
+                param={"metric_type": "L2", "params": {"nprobe": self.nprobe}},
+                limit=top_k,
+                expr=" and ".join(filters),
+                output_fields=self.OUTPUT_FIELDS,
+            ),
+        )
+
+        return [
+            [
+                VectorHit(
+                    news_id=hit.entity.get("news_article_id"),
+                    distance=hit.distance,
+                    stock_code=hit.entity.get("stock_code"),
+                    published_at=hit.entity.get("published_timestamp"),
+                )
+                for hit in (results[i] if results and i < len(results) else [])
+            ]
+            for i in range(len(embeddings))
+        ]
+
+    def upsert(
+        self,
+        news_ids: Sequence[int],
+        embeddings: Sequence[Sequence[float]],
+        stock_codes: Sequence[str],
+        published_timestamps: Sequence[int],
+    ) -> int:
+        data = [list(news_ids), list(embeddings), list(stock_codes), list(published_timestamps)]
+
+        # news_article_id(PK) 기준 upsert (멱등이므로 재연결 후 재시도), 로드 불필요
+        def upsert(collection):
+            collection.upsert(data)
+            collection.flush()
+
+        get_milvus_manager().execute(self.collection_name, upsert, load=False)
+        return len(news_ids)
+
+    def fetch_recent(self, min_published_at: int, batch_size: int = 1000):
+        """
+        발행 시각 하한 이후 임베딩을 배치 단위로 조회합니다 (핫 캐시 채우기용).
+
+        Yields:
+            (news_ids, embeddings, stock_codes, published_timestamps) 배치
+        """
+        iterator = get_milvus_manager().execute(
+            self.collection_name,
+            lambda collection: collection.query_iterator(
+                batch_size=batch_size,
+                expr=f"published_timestamp >= {int(min_published_at)}",
+                output_fields=self.OUTPUT_FIELDS + ["embedding"],
+            ),
+        )
+        try:
+            while True:
+                rows = iterator.next()
+                if not rows:
+                    break
+                yield (
+                    [row["news_article_id"] for row in rows],
+                    [row["embedding"] for row in rows],
+                    [row["stock_code"] for row in rows],
+                    [row["published_timestamp"] for row in rows],
+                )
+        finally:
+            iterator.close()
+
+
+class _Segment:
+    """LocalVectorStore의 불변 기본 구간 (memmap 벡터 + 메타데이터 + IVF 분할)"""
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        news_ids: np.ndarray,
+        stock_codes: np.ndarray,
+        published: np.ndarray,
+        ivf_centroids: Optional[np.ndarray] = None,
+        ivf_order: Optional[np.ndarray] = None,
+        ivf_offsets: Optional[np.ndarray] = None,
+    ):
+        self.vectors = vectors
+        self.news_ids = news_ids
+        self.stock_codes = stock_codes
+        self.published = published
+        self.norms = np.einsum("ij,ij->i", vectors, vectors) if len(vectors) else np.zeros(0, dtype=np.float32)
+        self.alive = np.ones(len(news_ids), dtype=bool)
+        self.row_by_id: Dict[int, int] = {int(news_id): row for row, news_id in enumerate(news_ids)}
+
+        # 종목별 행 목록
+        self.stock_rows: Dict[str, np.ndarray] = {}
+        if len(stock_codes):
+            order = np.argsort(stock_codes, kind="stable")
+            codes, starts = np.unique(stock_codes[order], return_index=True)
+            for code, rows in zip(codes, np.split(order, starts[1:])):
+                self.stock_rows[str(code)] = rows
+
+        # IVF 분할별 행 목록
+        self.ivf_centroids = ivf_centroids
+        self.ivf_lists: List[np.ndarray] = []
+        if ivf_centroids is not None:
+            self.ivf_lists = np.split(ivf_order, ivf_offsets[1:-1])
+
+    def __len__(self) -> int:
+        return len(self.news_ids)
+
+    @classmethod
+    def empty(cls, dim: int) -> "_Segment":
+        return cls(
+            np.zeros((0, dim), dtype=np.float32),
+            np.zeros(0, dtype=np.int64),
+            np.zeros(0, dtype="<U10"),
+            np.zeros(0, dtype=np.int64),
+        )
+
+
+class LocalVectorStore(VectorStore):
+    """
+    프로세스 내 NumPy 벡터 인덱스
+
+    기본 구간(디스크 memmap, 불변)과 최근 추가분 버퍼(메모리)로 구성되며,
+    flush 시 두 구간을 합치고 보관 기간이 지난 항목을 제거한 뒤 파일을 교체합니다.
+    """
+
+    VECTORS_FILE = "embeddings.npy"
+    META_FILE = "meta.npz"
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        dim: int = 768,
+        window_days: Optional[float] = 7,
+        ivf_min_size: int = 20000,
+        nprobe: int = 8,
+        auto_flush_rows: int = 1024,
+    ):
+        """
+        Args:
+            path: 인덱스 디렉터리 (None이면 메모리 전용)
+            dim: 벡터 차원
+            window_days: 보관 기간 (일, None이면 무제한)
+            ivf_min_size: IVF 근사 검색을 사용할 최소 항목 수
+            nprobe: IVF 검색 시 비교할 분할 수
+            auto_flush_rows: 버퍼가 이 크기를 넘으면 자동 flush
+        """
+        self.path = path
+        self.dim = dim
+        self.window_days = window_days
+        self.ivf_min_size = ivf_min_size
+        self.nprobe = nprobe
+        self.auto_flush_rows = auto_flush_rows
+
+        self._lock = threading.RLock()
+        self._delta: "OrderedDict[int, Tuple[np.ndarray, str, int]]" = OrderedDict()
+        self._segment = self._load()
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+
+    def _load(self) -> _Segment:
+        if not self.path:
+            return _Segment.empty(self.dim)
+
+        vectors_path = os.path.join(self.path, self.VECTORS_FILE)
+        meta_path = os.path.join(self.path, self.META_FILE)
+        if not (os.path.exists(vectors_path) and os.path.exists(meta_path)):
+            return _Segment.empty(self.dim)
+
+        try:
+            vectors = np.load(vectors_path, mmap_mode="r")
+            with np.load(meta_path) as meta:
+                arrays = {name: meta[name] for name in meta.files}
+
+            if vectors.shape[0] != len(arrays["news_ids"]) or vectors.shape[1] != self.dim:
+                raise ValueError(f"인덱스 파일 크기 불일치: {vectors.shape}, {len(arrays['news_ids'])}건")
+
+            segment = _Segment(
+                vectors,
+                arrays["news_ids"],
+                arrays["stock_codes"],
+                arrays["published"],
+                arrays.get("ivf_centroids"),
+                arrays.get("ivf_order"),
+                arrays.get("ivf_offsets"),
+            )
+            logger.info(f"📂 로컬 벡터 인덱스 로드: {len(segment)}건 ({self.path})")
+            return segment
+
+        except Exception as e:
+            logger.warning(f"⚠️  로컬 벡터 인덱스 로드 실패, 빈 인덱스로 시작: {e}")
+            return _Segment.empty(self.dim)
+
+    def _save(self, segment: _Segment) -> _Segment:
+        """구간을 파일로 저장하고 memmap으로 다시 엽니다 (임시 파일 → 교체)"""
+        os.makedirs(self.path, exist_ok=True)
+        vectors_path = os.path.join(self.path, self.VECTORS_FILE)
+        meta_path = os.path.join(self.path, self.META_FILE)
+
+        meta = {
+            "news_ids": segment.news_ids,
+            "stock_codes": segment.stock_codes,
+            "published": segment.published,
+        }
+        if segment.ivf_centroids is not None:
+            meta["ivf_centroids"] = segment.ivf_centroids
+            meta["ivf_order"] = np.concatenate(segment.ivf_lists)
+            meta["ivf_offsets"] = np.cumsum([0] + [len(rows) for rows in segment.ivf_lists])
+
+        with open(vectors_path + ".tmp", "wb") as f:
+            np.save(f, np.ascontiguousarray(segment.vectors, dtype=np.float32))
+        with open(meta_path + ".tmp", "wb") as f:
+            np.savez(f, **meta)
+        os.replace(vectors_path + ".tmp", vectors_path)
+        os.replace(meta_path + ".tmp", meta_path)
+
+        return self._load()
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+
+    def _cutoff(self, min_published_at: Optional[int] = None) -> Optional[int]:
+        """보관 기간과 요청 하한 중 늦은 시각"""
+        cutoffs = [value for value in (min_published_at,) if value is not None]
+        if self.window_days is not None:
+            cutoffs.append(int(time.time() - self.window_days * 86400))
+        return max(cutoffs) if cutoffs else None
+
+    def upsert(
+        self,
+        news_ids: Sequence[int],
+        embeddings: Sequence[Sequence[float]],
+        stock_codes: Sequence[str],
+        published_timestamps: Sequence[int],
+    ) -> int:
+        vectors = np.asarray(embeddings, dtype=np.float32).reshape(len(news_ids), self.dim)
+
+        with self._lock:
+            segment = self._segment
+            for news_id, vector, stock_code, published in zip(
+                news_ids, vectors, stock_codes, published_timestamps
+            ):
+                news_id = int(news_id)
+                row = segment.row_by_id.get(news_id)
+                if row is not None:
+                    segment.alive[row] = False
+                self._delta[news_id] = (vector, stock_code or "", int(published))
+                self._delta.move_to_end(news_id)
+
+            should_flush = len(self._delta) >= self.auto_flush_rows
+
+        if should_flush:
+            self.flush()
+        return len(news_ids)
+
+    def flush(self) -> None:
+        """버퍼를 기본 구간에 합치고, 보관 기간이 지난 항목을 제거한 뒤 저장합니다."""
+        with self._lock:
+            segment = self._segment
+            cutoff = self._cutoff()
+
+            keep = segment.alive.copy()
+            if cutoff is not None:
+                keep &= segment.published >= cutoff
+            delta = [
+                (news_id, vector, stock_code, published)
+                for news_id, (vector, stock_code, published) in self._delta.items()
+                if cutoff is None or published >= cutoff
+            ]
+
+            if not delta and keep.all():
+                self._delta.clear()
+                return
+
+            started = time.perf_counter()
+            vectors = np.concatenate([
+                np.asarray(segment.vectors[keep], dtype=np.float32),
+                np.asarray([item[1] for item in delta], dtype=np.float32).reshape(len(delta), self.dim),
+            ])
+            news_ids = np.concatenate([segment.news_ids[keep], np.asarray([item[0] for item in delta], dtype=np.int64)])
+            stock_codes = np.concatenate([segment.stock_codes[keep], np.asarray([item[2] for item in delta], dtype="<U10")])
+            published = np.concatenate([segment.published[keep], np.asarray([item[3] for item in delta], dtype=np.int64)])
+
+            ivf = self._train_ivf(vectors) if len(vectors) >= self.ivf_min_size else (None, None, None)
+            new_segment = _Segment(vectors, news_ids, stock_codes, published, *ivf)
+            if self.path:
+                new_segment = self._save(new_segment)
+
+            self._segment = new_segment
+            self._delta.clear()
+
+        logger.info(
+            f"💾 로컬 벡터 인덱스 갱신: {len(new_segment)}건 "
+            f"(추가 {len(delta)}건, IVF {'사용' if ivf[0] is not None else '미사용'}, "
+            f"{time.perf_counter() - started:.2f}초)"
+        )
+
+    def _train_ivf(
+        self, vectors: np.ndarray, iterations: int = 10, seed: int = 0
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        k-means로 IVF 분할 학습 (분할 수 = √N)
+
+        Returns:
+            (centroids, 분할 순서로 정렬된 행 번호, 분할별 시작 오프셋)
+        """
+        rng = np.random.default_rng(seed)
+        nlist = max(1, int(np.sqrt(len(vectors))))
+        sample = vectors[rng.choice(len(vectors), min(len(vectors), nlist * 64), replace=False)]
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+
+        for _ in range(iterations):
+            assign = _nearest_centroids(sample, centroids)
+            order = np.argsort(assign, kind="stable")
+            clusters, starts, counts = np.unique(assign[order], return_index=True, return_counts=True)
+            centroids[clusters] = np.add.reduceat(sample[order], starts) / counts[:, None]
+
+        assign = _nearest_centroids(vectors, centroids)
+        order = np.argsort(assign, kind="stable")
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(assign, minlength=nlist))])
+        return centroids, order, offsets
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        embeddings: Sequence[Sequence[float]],
+        top_k: int,
+        stock_code: Optional[str] = None,
+        min_published_at: Optional[int] = None,
+    ) -> List[List[VectorHit]]:
+        queries = np.asarray(embeddings, dtype=np.float32).reshape(-1, self.dim)
+        cutoff = self._cutoff(min_published_at)
+
+        with self._lock:
+            segment = self._segment
+            alive = segment.alive.copy()
+            delta = [
+                (news_id, vector, code, published)
+                for news_id, (vector, code, published) in self._delta.items()
+                if (not stock_code or code == stock_code) and (cutoff is None or published >= cutoff)
+            ]
+
+        # 버퍼 구간 (항상 정확 검색)
+        delta_hits: List[List[VectorHit]] = [[] for _ in queries]
+        if delta:
+            delta_vectors = np.stack([item[1] for item in delta])
+            distances = _l2_squared(queries, delta_vectors, np.einsum("ij,ij->i", delta_vectors, delta_vectors))
+            for query_index, row_distances in enumerate(distances):
+                for position in _top_k(row_distances, top_k):
+                    news_id, _, code, published = delta[position]
+                    delta_hits[query_index].append(
+                        VectorHit(news_id, float(row_distances[position]), code, published)
+                    )
+
+        # 기본 구간: 종목 필터 → 해당 종목 행만 정확 검색, 전체 → IVF 또는 전체 정확 검색
+        if stock_code:
+            candidates = segment.stock_rows.get(stock_code, np.zeros(0, dtype=np.int64))
+            base_hits = self._search_rows(segment, alive, queries, candidates, top_k, cutoff)
+        elif segment.ivf_centroids is not None:
+            probes = np.argsort(_l2_squared(queries, segment.ivf_centroids), axis=1)[:, : self.nprobe]
+            base_hits = [
+                self._search_rows(
+                    segment, alive, query[None, :],
+                    np.concatenate([segment.ivf_lists[probe] for probe in query_probes]),
+                    top_k, cutoff,
+                )[0]
+                for query, query_probes in zip(queries, probes)
+            ]
+        else:
+            base_hits = self._search_rows(segment, alive, queries, None, top_k, cutoff)
+
+        return [
+            sorted(base + extra, key=lambda hit: hit.distance)[:top_k]
+            for base, extra in zip(base_hits, delta_hits)
+        ]
+
+    @staticmethod
+    def _search_rows(
+        segment: _Segment,
+        alive: np.ndarray,
+        queries: np.ndarray,
+        rows: Optional[np.ndarray],
+        top_k: int,
+        cutoff: Optional[int],
+    ) -> List[List[VectorHit]]:
+        """기본 구간의 후보 행(None이면 전체)에 대한 정확 검색"""
+        if len(segment) == 0:
+            return [[] for _ in queries]
+
+        mask = alive if rows is None else alive[rows]
+        if cutoff is not None:
+            mask = mask & ((segment.published if rows is None else segment.published[rows]) >= cutoff)
+
+        if rows is None:
+            rows = np.flatnonzero(mask) if not mask.all() else None
+        else:
+            rows = rows[mask]
+
+        if rows is None:
+            distances = _l2_squared(queries, segment.vectors, segment.norms)
+            rows = np.arange(len(segment))
+        elif len(rows) == 0:
+            return [[] for _ in queries]
+        else:
+            distances = _l2_squared(queries, segment.vectors[rows], segment.norms[rows])
+
+        results = []
+        for row_distances in distances:
+            hits = []
+            for position in _top_k(row_distances, top_k):
+                row = rows[position]
+                hits.append(VectorHit(
+                    news_id=int(segment.news_ids[row]),
+                    distance=float(row_distances[position]),
+                    stock_code=str(segment.stock_codes[row]),
+                    published_at=int(segment.published[row]),
+                ))
+            results.append(hits)
+        return results
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._segment.alive.sum()) + len(self._delta)
+
+
+def _l2_squared(queries: np.ndarray, vectors: np.ndarray, norms: Optional[np.ndarray] = None) -> np.ndarray:
+    """쿼리 × 벡터 L2 제곱 거리 행렬"""
+    if norms is None:
+        norms = np.einsum("ij,ij->i", vectors, vectors)
+    query_norms = np.einsum("ij,ij->i", queries, queries)
+    distances = query_norms[:, None] + norms[None, :] - 2.0 * (queries @ np.asarray(vectors).T)
+    return np.maximum(distances, 0.0)
+
+
+def _top_k(distances: np.ndarray, k: int) -> np.ndarray:
+    """거리 오름차순 상위 k개 위치"""
+    if len(distances) <= k:
+        return np.argsort(distances)
+    positions = np.argpartition(distances, k)[:k]
+    return positions[np.argsort(distances[positions])]
+
+
+def _nearest_centroids(vectors: np.ndarray, centroids: np.ndarray, chunk_size: int = 8192) -> np.ndarray:
+    """벡터별 가장 가까운 centroid 번호 (메모리 제한을 위해 청크 단위)"""
+    centroid_norms = np.einsum("ij,ij->i", centroids, centroids)
+    assign = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), chunk_size):
+        chunk = np.asarray(vectors[start:start + chunk_size], dtype=np.float32)
+        assign[start:start + chunk_size] = np.argmin(centroid_norms[None, :] - 2.0 * (chunk @ centroids.T), axis=1)
+    return assign
+
+
+# 싱글톤 인스턴스
+_vector_store: Optional[VectorStore] = None
+_hot_vector_store: Optional[LocalVectorStore] = None
+_vector_store_lock = threading.Lock()
+
+
+def get_vector_store() -> VectorStore:
+    """
+    설정(VECTOR_STORE_BACKEND)에 따른 벡터 저장소 싱글톤 인스턴스를 반환합니다.
+
+    Returns:
+        MilvusVectorStore 또는 LocalVectorStore 인스턴스
+    """
+    global _vector_store
+    with _vector_store_lock:
+        if _vector_store is None:
+            if settings.VECTOR_STORE_BACKEND == "local":
+                _vector_store = LocalVectorStore(
+                    path=settings.LOCAL_VECTOR_STORE_PATH,
+                    window_days=settings.LOCAL_VECTOR_STORE_WINDOW_DAYS,
+                )
+            else:
+                _vector_store = MilvusVectorStore()
+        return _vector_store
+
+
+def get_hot_vector_store() -> Optional[LocalVectorStore]:
+    """
+    최근 뉴스 핫 캐시(LocalVectorStore) 싱글톤 인스턴스를 반환합니다.
+
+    Milvus 사용 시 VECTOR_HOT_CACHE_ENABLED가 켜져 있을 때만 생성합니다.
+
+    Returns:
+        LocalVectorStore 인스턴스 또는 None
+    """
+    global _hot_vector_store
+    if not settings.VECTOR_HOT_CACHE_ENABLED or settings.VECTOR_STORE_BACKEND == "local":
+        return None
+
+    with _vector_store_lock:
+        if _hot_vector_store is None:
+            _hot_vector_store = LocalVectorStore(
+                path=settings.VECTOR_HOT_CACHE_PATH,
+                window_days=settings.VECTOR_HOT_CACHE_HOURS / 24,
+            )
+        return _hot_vector_store
+
+
+def warm_hot_vector_store() -> int:
+    """
+    핫 캐시를 Milvus의 최근 임베딩으로 채웁니다 (애플리케이션 시작 시).
+
+    Returns:
+        채운 항목 수
+    """
+    hot_store = get_hot_vector_store()
+    store = get_vector_store()
+    if hot_store is None or not isinstance(store, MilvusVectorStore):
+        return 0
+
+    started = time.perf_counter()
+    min_published_at = int(time.time() - settings.VECTOR_HOT_CACHE_HOURS * 3600)
+    count = 0
+    for batch in store.fetch_recent(min_published_at):
+        count += hot_store.upsert(*batch)
+    hot_store.flush()
+
+    logger.info(f"🔥 벡터 핫 캐시 준비: {count}건 ({time.perf_counter() - started:.2f}초)")
+    return count
+
+
+def close_vector_stores() -> None:
+    """벡터 저장소 버퍼를 디스크에 반영합니다 (애플리케이션 종료 시)."""
+    for store in (_vector_store, _hot_vector_store):
+        if store is not None:
+            try:
+                store.close()
+            except Exception as e:
+                logger.warning(f"⚠️  벡터 저장소 종료 실패: {e}")
@@ -2,11 +2,16 @@
 Craveny FastAPI 애플리케이션 진입점
 """
 import logging
+import threading
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.config import settings
 from backend.scheduler.crawler_scheduler import get_crawler_scheduler
+from backend.crawlers.kis_client import close_kis_client
+from backend.db.milvus_client import close_milvus_manager
+from backend.llm.vector_store import close_vector_stores, warm_hot_vector_store
 
 
 # 로깅 설정
@@ -58,6 +63,16 @@ async def startup_event():
     scheduler.start()
     logger.info("✅ 크롤러 스케줄러 시작 (뉴스 + 주가)")
 
+    # 벡터 핫 캐시 채우기 (활성 시, 시작을 막지 않도록 백그라운드)
+    if settings.VECTOR_HOT_CACHE_ENABLED:
+        def warm() -> None:
+            try:
+                warm_hot_vector_store()
+            except Exception as e:
+                logger.warning(f"⚠️  벡터 핫 캐시 준비 실패: {e}")
+
+        threading.Thread(target=warm, name="vector-hot-cache-warmup", daemon=True).start()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -69,6 +84,13 @@ async def shutdown_event():
     scheduler.shutdown()
     logger.info("✅ 크롤러 스케줄러 종료 (뉴스 + 주가)")
 
+    # KIS API 연결 풀 종료
+    await close_kis_client()
+
+    # 벡터 저장소 버퍼 반영 후 Milvus 연결 풀 종료
+    close_vector_stores()
+    close_milvus_manager()
+
 
 @app.get("/")
 async def root():
@@ -2,23 +2,62 @@
 자동 알림 모듈
 
 새로운 뉴스에 대해 자동으로 예측을 수행하고 텔레그램으로 알림을 전송합니다.
+
+뉴스 한 건씩 순서대로 처리하는 대신 단계별 파이프라인으로 처리합니다.
+    중복 검사 → 유사 뉴스 검색 → 멀티모델 예측 → A/B 조회 및 텔레그램 전송
+단계마다 워커 수(AUTO_NOTIFY_*_WORKERS)와 단계 간 큐 크기(AUTO_NOTIFY_QUEUE_SIZE)를
+설정할 수 있으며, 조회 기간 내 미알림 뉴스를 모두 처리합니다.
 """
 import logging
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List
+from typing import Any, Dict, List, Optional, Set
 from sqlalchemy.orm import Session
 
 from backend.db.models.news import NewsArticle
 from backend.llm.vector_search import get_vector_search
 from backend.llm.predictor import get_predictor
 from backend.notifications.telegram import get_telegram_notifier
+from backend.notifications.notify_pipeline import PipelineStage, StagePipeline
 from backend.utils.embedding_deduplicator import get_embedding_deduplicator
+from backend.llm.prompt_context import get_prompt_context_loader
+from backend.services.response_cache import invalidate_stock_responses
 from backend.config import settings
 
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class NotifyItem:
+    """파이프라인 처리 항목 (스레드 간 전달되므로 ORM 객체 대신 값만 보관)"""
+
+    news_id: int
+    title: str
+    content: str
+    stock_code: str
+    status: str = "pending"  # pending, success, failed, skipped
+    duplicate_candidates: List[int] = field(default_factory=list)
+    similar_hits: Optional[List[Dict[str, Any]]] = None  # 배치 벡터 검색 결과 (실패 시 None)
+    similar_news: List[Dict[str, Any]] = field(default_factory=list)
+    model_count: int = 0
+
+    @property
+    def news_text(self) -> str:
+        return f"{self.title}\n{self.content}"
+
+
+def _mark_notified(db: Session, news_id: int) -> None:
+    """notified_at 기록 후 커밋"""
+    db.query(NewsArticle).filter(NewsArticle.id == news_id).update(
+        {NewsArticle.notified_at: datetime.utcnow()}, synchronize_session=False
+    )
+    db.commit()
+    # 알림 건수가 바뀌므로 대시보드/종목 요약 응답 캐시 무효화
+    invalidate_stock_responses()
+
+
 def process_new_news_notifications(
     db: Session,
     lookback_minutes: int = 15,
@@ -27,14 +66,14 @@ def process_new_news_notifications(
     최근에 저장된 뉴스에 대해 자동으로 예측을 수행하고 알림을 전송합니다.
 
     Args:
-        db: 데이터베이스 세션
+        db: 데이터베이스 세션 (대상 뉴스 조회용, 파이프라인 워커는 전용 세션 사용)
         lookback_minutes: 조회할 과거 시간 (분 단위)
 
     Returns:
-        처리 통계 {processed, success, failed}
+        처리 통계 {processed, success, failed, skipped, stages}
     """
     try:
-        # 최근 N분 이내 저장된 뉴스 조회 (종목 코드가 있는 것만)
+        # 최근 N분 이내 저장된 뉴스 조회 (종목 코드가 있는 것만, 전체 적체분)
         cutoff_time = datetime.utcnow() - timedelta(minutes=lookback_minutes)
 
         recent_news = (
@@ -45,7 +84,6 @@ def process_new_news_notifications(
                 NewsArticle.notified_at.is_(None),  # 아직 알림을 보내지 않은 뉴스만
             )
             .order_by(NewsArticle.created_at.desc())
-            .limit(10)  # 최대 10건만 처리
             .all()
         )
 
@@ -57,98 +95,180 @@ def process_new_news_notifications(
             f"🔔 자동 알림 처리: 최근 {lookback_minutes}분 이내 {len(recent_news)}건 발견"
         )
 
+        items = [
+            NotifyItem(
+                news_id=news.id,
+                title=news.title,
+                content=news.content,
+                stock_code=news.stock_code,
+            )
+            for news in recent_news
+        ]
+
         vector_search = get_vector_search()
         predictor = get_predictor()
         notifier = get_telegram_notifier()
         embedding_deduplicator = get_embedding_deduplicator()
 
-        success_count = 0
-        failed_count = 0
-        skipped_count = 0
-
-        for news in recent_news:
-            try:
-                logger.info(f"처리 중: {news.title[:50]}... (종목: {news.stock_code})")
-
-                # 0. 임베딩 기반 알림 중복 검사
-                news_text = f"{news.title}\n{news.content}"
-                should_skip, similar_id, similarity = embedding_deduplicator.should_skip_notification(
-                    news_text=news_text,
-                    stock_code=news.stock_code,
-                    db=db,
-                    notification_lookback_hours=4,
+        # 프롬프트 컨텍스트 일괄 조회 (종목 정보/주가/공시/기술적 지표는 종목당 1회,
+        # 시장/업종 지수는 이번 실행의 모든 뉴스가 공유)
+        prompt_context = get_prompt_context_loader().load(
+            {item.stock_code for item in items}, db
+        )
+
+        # 유사 뉴스 일괄 검색 (배치 임베딩 1회 + 종목별 다중 벡터 검색)
+        # 중복 검사 후보(높은 유사도 상위 3건)와 유사 뉴스 컨텍스트(상위 5건)를 한 번에 얻음
+        try:
+            similar_hits = vector_search.search_similar_news_batch(
+                [item.news_text for item in items],
+                [item.stock_code for item in items],
+                top_k=5,
+                similarity_threshold=0.5,
+            )
+            for item, hits in zip(items, similar_hits):
+                item.similar_hits = hits
+        except Exception as e:
+            logger.warning(f"⚠️  유사 뉴스 일괄 검색 실패, 뉴스별 검색으로 진행: {e}")
+
+        # 이번 실행에서 알림 전송(또는 전송 중)인 뉴스 ID
+        # 동시에 처리되는 유사 뉴스끼리 중복 알림이 나가지 않도록 전송 단계에서 확인
+        notified_in_run: Set[int] = set()
+        notified_lock = threading.Lock()
+
+        def dedup_stage(item: NotifyItem, session: Session) -> Optional[NotifyItem]:
+            """0. 임베딩 기반 알림 중복 검사"""
+            logger.info(f"처리 중: {item.title[:50]}... (종목: {item.stock_code})")
+
+            if item.similar_hits is not None:
+                candidates = embedding_deduplicator.select_notification_candidates(item.similar_hits)
+            else:
+                candidates = embedding_deduplicator.find_notification_candidates(
+                    item.news_text, item.stock_code
+                )
+            should_skip, similar_id, similarity = embedding_deduplicator.check_recent_notification(
+                candidates, item.stock_code, session, notification_lookback_hours=4
+            )
+
+            if should_skip:
+                logger.info(
+                    f"🔕 유사 뉴스 알림 이력 존재 (유사도={similarity:.3f}) "
+                    f"→ 알림 skip (뉴스 ID={item.news_id}, 유사 뉴스 ID={similar_id})"
+                )
+                # notified_at 업데이트 (알림 skip했지만 처리는 완료)
+                _mark_notified(session, item.news_id)
+                item.status = "skipped"
+                return None
+
+            item.duplicate_candidates = [
+                similar["news_id"] for similar in candidates if similar["news_id"] != item.news_id
+            ]
+            return item
+
+        def retrieval_stage(item: NotifyItem, session: Session) -> NotifyItem:
+            """1. 유사 뉴스 검색 (일괄 검색 결과가 있으면 상세 정보/주가 변동률만 조회)"""
+            if item.similar_hits is not None:
+                item.similar_news = vector_search.enrich_with_price_changes(item.similar_hits, session)
+                return item
+
+            item.similar_news = vector_search.get_news_with_price_changes(
+                news_text=item.news_text,
+                stock_code=item.stock_code,
+                db=session,
+                top_k=5,
+                similarity_threshold=0.5,
+            )
+            return item
+
+        def prediction_stage(item: NotifyItem, session: Session) -> NotifyItem:
+            """2. 멀티모델 예측: 모든 활성 모델로 예측 생성"""
+            all_predictions = predictor.predict_all_models(
+                current_news={
+                    "title": item.title,
+                    "content": item.content,
+                    "stock_code": item.stock_code,
+                },
+                similar_news=item.similar_news,
+                news_id=item.news_id,
+                prompt_context=prompt_context,
+            )
+            item.model_count = len(all_predictions)
+            return item
+
+        def send_stage(item: NotifyItem, session: Session) -> Optional[NotifyItem]:
+            """3. A/B 예측 조회 및 텔레그램 알림 전송"""
+            with notified_lock:
+                duplicate_id = next(
+                    (news_id for news_id in item.duplicate_candidates if news_id in notified_in_run),
+                    None,
                 )
+                if duplicate_id is None:
+                    notified_in_run.add(item.news_id)
 
-                if should_skip:
-                    logger.info(
-                        f"🔕 유사 뉴스 알림 이력 존재 (유사도={similarity:.3f}) "
-                        f"→ 알림 skip (뉴스 ID={news.id}, 유사 뉴스 ID={similar_id})"
-                    )
-                    # notified_at 업데이트 (알림 skip했지만 처리는 완료)
-                    news.notified_at = datetime.utcnow()
-                    db.commit()
-                    skipped_count += 1
-                    continue
-
-                # 1. 유사 뉴스 검색
-                similar_news = vector_search.get_news_with_price_changes(
-                    news_text=news_text,
-                    stock_code=news.stock_code,
-                    db=db,
-                    top_k=5,
-                    similarity_threshold=0.5,
+            if duplicate_id is not None:
+                logger.info(
+                    f"🔕 이번 실행에서 유사 뉴스 알림 전송됨 "
+                    f"→ 알림 skip (뉴스 ID={item.news_id}, 유사 뉴스 ID={duplicate_id})"
                 )
+                _mark_notified(session, item.news_id)
+                item.status = "skipped"
+                return None
+
+            # A/B 설정에 따라 표시할 두 모델 예측 조회
+            prediction = predictor.get_ab_predictions(news_id=item.news_id)
+
+            if notifier.send_prediction(
+                news_title=item.title,
+                stock_code=item.stock_code,
+                prediction=prediction,
+            ):
+                # 알림 전송 성공 시 notified_at 업데이트
+                _mark_notified(session, item.news_id)
+                item.status = "success"
 
-                # 2. 예측 수행
-                current_news_data = {
-                    "title": news.title,
-                    "content": news.content,
-                    "stock_code": news.stock_code,
-                }
-
-                # 멀티모델 예측: 모든 활성 모델로 예측 생성
-                all_predictions = predictor.predict_all_models(
-                    current_news=current_news_data,
-                    similar_news=similar_news,
-                    news_id=news.id,
+                comp = prediction.get("comparison", {})
+                logger.info(
+                    f"✅ A/B 알림 전송 성공: {item.title[:30]}... "
+                    f"(모델 {item.model_count}개 예측 완료, A/B 일치: {comp.get('agreement')}, 차이: {comp.get('confidence_diff')}%)"
                 )
+                return item
+
+            with notified_lock:
+                notified_in_run.discard(item.news_id)
+            item.status = "failed"
+            logger.warning(f"⚠️  알림 전송 실패: {item.title[:30]}...")
+            return None
+
+        def on_error(item: NotifyItem, stage_name: str, error: Exception) -> None:
+            item.status = "failed"
+            logger.error(f"❌ 뉴스 처리 실패 (ID={item.news_id}, 단계={stage_name}): {error}")
+
+        pipeline = StagePipeline(
+            [
+                PipelineStage("dedup", dedup_stage, settings.AUTO_NOTIFY_DEDUP_WORKERS),
+                PipelineStage("retrieval", retrieval_stage, settings.AUTO_NOTIFY_RETRIEVAL_WORKERS),
+                PipelineStage("prediction", prediction_stage, settings.AUTO_NOTIFY_PREDICTION_WORKERS),
+                PipelineStage("notify", send_stage, settings.AUTO_NOTIFY_SEND_WORKERS),
+            ],
+            queue_size=settings.AUTO_NOTIFY_QUEUE_SIZE,
+            on_error=on_error,
+        )
+        pipeline.run(items)
 
-                # A/B 설정에 따라 표시할 두 모델 예측 조회
-                prediction = predictor.get_ab_predictions(news_id=news.id)
-
-                # 3. 텔레그램 알림 전송
-                if notifier.send_prediction(
-                    news_title=news.title,
-                    stock_code=news.stock_code,
-                    prediction=prediction,
-                ):
-                    # 알림 전송 성공 시 notified_at 업데이트
-                    news.notified_at = datetime.utcnow()
-                    db.commit()
-
-                    success_count += 1
-                    comp = prediction.get("comparison", {})
-                    logger.info(
-                        f"✅ A/B 알림 전송 성공: {news.title[:30]}... "
-                        f"(모델 {len(all_predictions)}개 예측 완료, A/B 일치: {comp.get('agreement')}, 차이: {comp.get('confidence_diff')}%)"
-                    )
-                else:
-                    failed_count += 1
-                    logger.warning(f"⚠️  알림 전송 실패: {news.title[:30]}...")
-
-            except Exception as e:
-                failed_count += 1
-                logger.error(f"❌ 뉴스 처리 실패 (ID={news.id}): {e}", exc_info=True)
+        success_count = sum(1 for item in items if item.status == "success")
+        failed_count = sum(1 for item in items if item.status in ("failed", "pending"))
+        skipped_count = sum(1 for item in items if item.status == "skipped")
 
         logger.info(
             f"📊 자동 알림 완료: 성공 {success_count}건, 실패 {failed_count}건, skip {skipped_count}건"
         )
+        pipeline.log_stats()
 
         return {
-            "processed": len(recent_news),
+            "processed": len(items),
             "success": success_count,
             "failed": failed_count,
             "skipped": skipped_count,
+            "stages": pipeline.stats,
         }
 
     except Exception as e:
@@ -0,0 +1,230 @@
+"""
+단계별 처리 파이프라인
+
+항목을 여러 단계(예: 중복 검사 → 유사 뉴스 검색 → 예측 → 알림 전송)로
+흘려보내며, 단계마다 워커 스레드를 두고 단계 사이를 크기 제한 큐로 연결합니다.
+
+- 느린 단계(LLM 예측)가 처리하는 동안 앞 단계가 다음 항목을 미리 준비
+- 큐 크기 제한으로 앞 단계가 너무 앞서 나가지 않음 (backpressure)
+- 워커마다 전용 DB 세션 사용 (세션은 스레드 간 공유 불가, 첫 항목 처리 시 생성)
+- 세션 생성/처리 실패는 항목 단위로 집계하고 워커는 계속 실행 (큐 항목은 항상 task_done)
+- 단계별 처리량/처리 시간/최대 큐 적체 통계 제공
+
+Usage:
+    pipeline = StagePipeline([
+        PipelineStage("dedup", dedup_handler, workers=2),
+        PipelineStage("notify", notify_handler, workers=1),
+    ])
+    completed = pipeline.run(items)
+    pipeline.stats  # {"dedup": {...}, "notify": {...}}
+"""
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from backend.db.session import SessionLocal
+
+
+logger = logging.getLogger(__name__)
+
+
+# 워커 종료 신호
+_STOP = object()
+
+
+@dataclass
+class PipelineStage:
+    """
+    파이프라인 단계
+
+    handler(item, db)가 반환한 값은 다음 단계로 전달되며,
+    None을 반환하면 항목은 해당 단계에서 종료(drop)됩니다.
+    """
+
+    name: str
+    handler: Callable[[Any, Session], Optional[Any]]
+    workers: int = 1
+
+
+class StagePipeline:
+    """크기 제한 큐로 연결된 단계별 워커 파이프라인"""
+
+    def __init__(
+        self,
+        stages: List[PipelineStage],
+        queue_size: int = 16,
+        session_factory: Optional[Callable[[], Session]] = None,
+        on_error: Optional[Callable[[Any, str, Exception], None]] = None,
+    ):
+        """
+        Args:
+            stages: 처리 단계 (순서대로 실행)
+            queue_size: 단계 사이 큐 최대 크기
+            session_factory: 워커별 DB 세션 생성 함수 (기본: SessionLocal)
+            on_error: 단계 처리 중 예외 발생 시 호출 (item, stage_name, exception)
+        """
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self.session_factory = session_factory or SessionLocal
+        self.on_error = on_error
+
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+    def _record(self, stage_name: str, key: str, value: float = 1) -> None:
+        with self._lock:
+            self.stats[stage_name][key] += value
+
+    def _record_depth(self, stage_name: str, depth: int) -> None:
+        with self._lock:
+            stage_stats = self.stats[stage_name]
+            stage_stats["max_queue_depth"] = max(stage_stats["max_queue_depth"], depth)
+
+    def _worker(
+        self,
+        stage: PipelineStage,
+        in_queue: queue.Queue,
+        out_queue: Optional[queue.Queue],
+        next_stage_name: Optional[str],
+        completed: List[Any],
+    ) -> None:
+        # 세션은 첫 항목 처리 시 생성 (생성 실패도 항목 단위 실패로 처리하여 워커가 죽지 않도록)
+        db: Optional[Session] = None
+        try:
+            while True:
+                item = in_queue.get()
+                try:
+                    if item is _STOP:
+                        break
+
+                    started = time.perf_counter()
+                    try:
+                        if db is None:
+                            db = self.session_factory()
+                        result = stage.handler(item, db)
+                    except Exception as e:
+                        if db is not None:
+                            db.rollback()
+                        self._record(stage.name, "failed")
+                        logger.error(f"❌ 파이프라인 단계 실패 ({stage.name}): {e}", exc_info=True)
+                        self._notify_error(item, stage.name, e)
+                        continue
+                    finally:
+                        self._record(stage.name, "busy_seconds", time.perf_counter() - started)
+
+                    if result is None:
+                        self._record(stage.name, "dropped")
+                        continue
+
+                    self._record(stage.name, "processed")
+                    if out_queue is None:
+                        with self._lock:
+                            completed.append(result)
+                    else:
+                        out_queue.put(result)
+                        self._record_depth(next_stage_name, out_queue.qsize())
+                finally:
+                    in_queue.task_done()
+        finally:
+            if db is not None:
+                db.close()
+
+    def _notify_error(self, item: Any, stage_name: str, error: Exception) -> None:
+        """on_error 콜백 호출 (콜백 예외로 워커가 종료되지 않도록 로그만 남김)"""
+        if self.on_error is None:
+            return
+        try:
+            self.on_error(item, stage_name, error)
+        except Exception as e:
+            logger.error(f"❌ 파이프라인 오류 콜백 실패 ({stage_name}): {e}", exc_info=True)
+
+    def run(self, items: Iterable[Any]) -> List[Any]:
+        """
+        모든 항목을 파이프라인으로 처리 (모든 단계가 끝날 때까지 블로킹)
+
+        Args:
+            items: 처리할 항목
+
+        Returns:
+            마지막 단계까지 완료된 항목 리스트
+        """
+        self.stats = {
+            stage.name: {
+                "workers": max(1, stage.workers),
+                "processed": 0,
+                "dropped": 0,
+                "failed": 0,
+                "busy_seconds": 0.0,
+                "max_queue_depth": 0,
+            }
+            for stage in self.stages
+        }
+        if not self.stages:
+            return []
+
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        completed: List[Any] = []
+        threads: List[List[threading.Thread]] = []
+
+        started = time.perf_counter()
+        for index, stage in enumerate(self.stages):
+            is_last = index == len(self.stages) - 1
+            stage_threads = [
+                threading.Thread(
+                    target=self._worker,
+                    args=(
+                        stage,
+                        queues[index],
+                        None if is_last else queues[index + 1],
+                        None if is_last else self.stages[index + 1].name,
+                        completed,
+                    ),
+                    name=f"pipeline-{stage.name}-{worker}",
+                    daemon=True,
+                )
+                for worker in range(max(1, stage.workers))
+            ]
+            for thread in stage_threads:
+                thread.start()
+            threads.append(stage_threads)
+
+        # 첫 단계 투입 (큐가 가득 차면 대기)
+        first_stage = self.stages[0].name
+        for item in items:
+            queues[0].put(item)
+            self._record_depth(first_stage, queues[0].qsize())
+
+        # 앞 단계부터 순서대로 종료 (앞 단계 워커가 모두 끝나야 다음 단계에 종료 신호)
+        for index, stage_threads in enumerate(threads):
+            for _ in stage_threads:
+                queues[index].put(_STOP)
+            for thread in stage_threads:
+                thread.join()
+
+        elapsed = time.perf_counter() - started
+        for stage_stats in self.stats.values():
+            handled = stage_stats["processed"] + stage_stats["dropped"] + stage_stats["failed"]
+            stage_stats["busy_seconds"] = round(stage_stats["busy_seconds"], 3)
+            stage_stats["throughput_per_sec"] = round(handled / elapsed, 3) if elapsed > 0 else 0.0
+            stage_stats["avg_seconds"] = (
+                round(stage_stats["busy_seconds"] / handled, 3) if handled else 0.0
+            )
+
+        return completed
+
+    def log_stats(self) -> None:
+        """단계별 통계 로그 출력"""
+        for name, stage_stats in self.stats.items():
+            logger.info(
+                f"  📈 {name}: 워커 {stage_stats['workers']}개, "
+                f"처리 {stage_stats['processed']}건 / 종료 {stage_stats['dropped']}건 / "
+                f"실패 {stage_stats['failed']}건, "
+                f"{stage_stats.get('throughput_per_sec', 0):.2f}건/초 "
+                f"(평균 {stage_stats.get('avg_seconds', 0):.2f}초), "
+                f"최대 큐 {stage_stats['max_queue_depth']}"
+            )
@@ -0,0 +1,127 @@
+"""
+스케줄러 비동기 작업용 영속 이벤트 루프
+
+APScheduler(BackgroundScheduler) 스레드에서 실행되는 KIS 수집 코루틴을
+작업마다 asyncio.run()으로 새 루프를 만들지 않고, 전용 스레드의
+단일 이벤트 루프에서 실행합니다.
+
+- KIS 연결 풀/Rate Limiter/Token 락이 실행 간 재사용됨
+- 루프가 하나이므로 asyncio 락이 다른 루프에 묶이는 오류가 없음
+- FastAPI 루프와 분리하여, 수집 코루틴 내부의 동기 DB 작업이 API 응답을 막지 않음
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLoopThread:
+    """전용 스레드에서 실행되는 영속 asyncio 이벤트 루프"""
+
+    def __init__(self, name: str = "scheduler-async-loop"):
+        """
+        Args:
+            name: 루프 스레드 이름
+        """
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    def start(self) -> None:
+        """루프 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self.is_running:
+                return
+
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def run_loop() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+
+            self._thread = threading.Thread(target=run_loop, name=self.name, daemon=True)
+            self._thread.start()
+            started.wait()
+            self._loop = loop
+
+        logger.info(f"🔁 비동기 작업 루프 시작 ({self.name})")
+
+    def run(
+        self,
+        coro_func: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        코루틴을 영속 루프에서 실행하고 완료까지 대기 (호출 스레드 블로킹)
+
+        Args:
+            coro_func: 코루틴 함수 (인자 없이 호출)
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            코루틴 반환값
+
+        Raises:
+            TimeoutError: timeout 초과 (코루틴은 취소됨)
+        """
+        if not self.is_running:
+            self.start()
+
+        started = time.perf_counter()
+        future = asyncio.run_coroutine_threadsafe(coro_func(), self._loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            # 루프에서 계속 실행되지 않도록 코루틴 취소
+            future.cancel()
+            raise
+        finally:
+            logger.debug(
+                f"비동기 작업 완료: {getattr(coro_func, '__name__', coro_func)} "
+                f"({time.perf_counter() - started:.2f}초)"
+            )
+
+    def stop(
+        self,
+        cleanup: Optional[Callable[[], Awaitable[Any]]] = None,
+        timeout: float = 10.0,
+    ) -> None:
+        """
+        루프 종료
+
+        Args:
+            cleanup: 종료 전 루프에서 실행할 정리 코루틴 함수 (예: 연결 풀 종료)
+            timeout: 정리/스레드 종료 대기 시간 (초)
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None:
+                return
+
+            if cleanup is not None and loop.is_running():
+                try:
+                    asyncio.run_coroutine_threadsafe(cleanup(), loop).result(timeout)
+                except Exception as e:
+                    logger.warning(f"⚠️  비동기 루프 정리 실패: {e}")
+
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout)
+            if not loop.is_running():
+                loop.close()
+
+            self._loop = None
+            self._thread = None
+
+        logger.info(f"🔁 비동기 작업 루프 종료 ({self.name})")
@@ -5,7 +5,7 @@ APScheduler를 사용하여 주기적으로 뉴스 및 주가 데이터를 크
 """
 import logging
 import asyncio
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -17,6 +17,7 @@ from backend.crawlers.maeil_crawler import MaeilNewsCrawler
 from backend.crawlers.naver_search_crawler import NaverNewsSearchCrawler
 from backend.crawlers.dart_crawler import DartCrawler
 from backend.crawlers.news_saver import NewsSaver
+from backend.crawlers.kis_client import close_kis_client
 from backend.crawlers.kis_daily_crawler import get_kis_daily_crawler
 from backend.crawlers.kis_minute_collector import run_minute_collector
 from backend.crawlers.kis_market_data_collector import (
@@ -32,11 +33,18 @@ from backend.utils.market_time import is_market_open
 from backend.db.session import SessionLocal
 from backend.db.models.stock import Stock
 from backend.notifications.auto_notify import process_new_news_notifications
+from backend.scheduler.async_loop import AsyncLoopThread
 
 
 logger = logging.getLogger(__name__)
 
 
+# KIS 비동기 작업 최대 실행 시간 (초) - 초과 시 취소하여 APScheduler 작업 스레드 반환
+KIS_MINUTE_JOB_TIMEOUT_SECONDS = 120
+KIS_MARKET_DATA_JOB_TIMEOUT_SECONDS = 600
+KIS_DAILY_JOB_TIMEOUT_SECONDS = 3600
+
+
 class CrawlerScheduler:
     """크롤러 스케줄러 클래스"""
 
@@ -53,6 +61,9 @@ class CrawlerScheduler:
         self.scheduler: Optional[BackgroundScheduler] = None
         self.is_running = False
 
+        # KIS 비동기 작업용 영속 이벤트 루프 (연결 풀/Rate Limiter 재사용)
+        self.async_loop = AsyncLoopThread(name="kis-async-loop")
+
         # 뉴스 크롤링 통계
         self.news_total_crawls = 0
         self.news_total_saved = 0
@@ -701,6 +712,7 @@ class CrawlerScheduler:
 
         try:
             from backend.services.stock_analysis_service import update_stock_analysis_summary
+            from backend.services.indicator_store import get_indicator_store
 
             # Priority 1-2 종목만 조회
             priority_stocks = db.query(Stock).filter(
@@ -710,6 +722,11 @@ class CrawlerScheduler:
 
             logger.info(f"📊 리포트 생성 대상: {len(priority_stocks)}개 종목 (Priority 1-2)")
 
+            # 기술적 지표 일괄 조회 (증분 갱신된 지표 저장소, 1회 쿼리)
+            technical_by_code = get_indicator_store().get_many(
+                [stock.code for stock in priority_stocks], db
+            )
+
             success_count = 0
             failed_count = 0
 
@@ -719,7 +736,8 @@ class CrawlerScheduler:
                     report = await update_stock_analysis_summary(
                         stock_code=stock.code,
                         db=db,
-                        force_update=True
+                        force_update=True,
+                        technical_indicators=technical_by_code.get(stock.code),
                     )
 
                     if report:
@@ -763,6 +781,7 @@ class CrawlerScheduler:
             from backend.services.evaluation_service import EvaluationService
             from backend.db.models.ab_test_config import ABTestConfig
             from backend.db.models.model import Model
+            from backend.db.models.stock_analysis import StockAnalysisSummary
             from datetime import datetime
 
             # 오늘 생성된 리포트 조회
@@ -796,69 +815,47 @@ class CrawlerScheduler:
             # EvaluationService 초기화
             service = EvaluationService(db)
 
-            success_count = 0
-            failed_count = 0
-
             # A/B 테스트 설정 조회
             ab_config = db.query(ABTestConfig).filter(ABTestConfig.is_active == True).first()
 
+            # 평가 항목 생성 (A/B 테스트 리포트는 두 모델 모두 평가)
+            targets = []
+            failed_count = 0
             for report in reports:
-                try:
-                    # A/B 테스트 리포트인 경우 두 모델 모두 평가
-                    if report.custom_data and report.custom_data.get('ab_test_enabled') and ab_config:
-                        model_a = db.query(Model).filter(Model.id == ab_config.model_a_id).first()
-                        model_b = db.query(Model).filter(Model.id == ab_config.model_b_id).first()
-
-                        # Model A 평가
-                        try:
-                            eval_a = service.evaluate_report(report, model_id=ab_config.model_a_id)
-                            if eval_a:
-                                success_count += 1
-                                logger.info(
-                                    f"  ✅ {report.stock_code} - Model A ({model_a.name}): "
-                                    f"score={eval_a.final_score:.1f}"
-                                )
-                            else:
-                                failed_count += 1
-                                logger.warning(f"  ⚠️  {report.stock_code} - Model A 평가 실패")
-                        except Exception as e:
-                            failed_count += 1
-                            logger.error(f"  ❌ {report.stock_code} - Model A 평가 에러: {e}")
-
-                        # Model B 평가
-                        try:
-                            eval_b = service.evaluate_report(report, model_id=ab_config.model_b_id)
-                            if eval_b:
-                                success_count += 1
-                                logger.info(
-                                    f"  ✅ {report.stock_code} - Model B ({model_b.name}): "
-                                    f"score={eval_b.final_score:.1f}"
-                                )
-                            else:
-                                failed_count += 1
-                                logger.warning(f"  ⚠️  {report.stock_code} - Model B 평가 실패")
-                        except Exception as e:
-                            failed_count += 1
-                            logger.error(f"  ❌ {report.stock_code} - Model B 평가 에러: {e}")
+                if report.custom_data and report.custom_data.get('ab_test_enabled') and ab_config:
+                    model_ids = [ab_config.model_a_id, ab_config.model_b_id]
+                else:
+                    model_ids = [1]
+
+                for model_id in model_ids:
+                    try:
+                        target = service.report_target(report, model_id, ab_config)
+                    except Exception as e:
+                        logger.error(f"  ❌ {report.stock_code} 평가 항목 생성 에러: {e}", exc_info=True)
+                        target = None
+
+                    if target is None:
+                        failed_count += 1
                     else:
-                        # 일반 리포트 (단일 모델)
-                        try:
-                            evaluation = service.evaluate_report(report, model_id=1)
-                            if evaluation:
-                                success_count += 1
-                                logger.info(
-                                    f"  ✅ {report.stock_code}: score={evaluation.final_score:.1f}"
-                                )
-                            else:
-                                failed_count += 1
-                                logger.warning(f"  ⚠️  {report.stock_code} 평가 실패")
-                        except Exception as e:
-                            failed_count += 1
-                            logger.error(f"  ❌ {report.stock_code} 평가 에러: {e}")
+                        targets.append(target)
 
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(f"  ❌ {report.stock_code} 평가 중 에러: {e}")
+            # 일괄 평가 (주가 조회/저장 각 1회)
+            try:
+                evaluations = service.evaluate_batch(targets)
+            except Exception as e:
+                logger.error(f"  ❌ 일괄 평가 에러: {e}", exc_info=True)
+                evaluations = []
+
+            model_names = dict(db.query(Model.id, Model.name).all())
+            for evaluation in evaluations:
+                logger.info(
+                    f"  ✅ {evaluation['stock_code']} - "
+                    f"{model_names.get(evaluation['model_id'], evaluation['model_id'])}: "
+                    f"score={evaluation['final_score']:.1f}"
+                )
+
+            success_count = len(evaluations)
+            failed_count += len(targets) - success_count
 
             # 통계 업데이트
             self.evaluation_total_runs += 1
@@ -891,6 +888,46 @@ class CrawlerScheduler:
         finally:
             db.close()
 
+    def _run_async(
+        self,
+        coro_func: Callable[[], Awaitable[None]],
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        비동기 작업을 영속 이벤트 루프에서 실행합니다.
+
+        APScheduler 작업 스레드는 코루틴이 끝날 때까지 대기하므로
+        같은 작업의 중복 실행 방지(max_instances)는 그대로 유지됩니다.
+        timeout을 넘기면 코루틴을 취소하고 작업 스레드를 반환합니다 (KIS 호출 무응답 대비).
+
+        Args:
+            coro_func: 실행할 코루틴 함수 (예: self._collect_kis_minute_prices)
+            timeout: 최대 실행 시간 (초, None이면 무제한)
+        """
+        try:
+            self.async_loop.run(coro_func, timeout=timeout)
+        except TimeoutError:
+            logger.error(
+                f"❌ 비동기 작업 시간 초과로 취소: "
+                f"{getattr(coro_func, '__name__', coro_func)} ({timeout}초)"
+            )
+
+    def _run_stock_reports(self) -> None:
+        """
+        리포트 생성은 KIS 루프가 아닌 작업 스레드의 별도 루프에서 실행합니다.
+
+        종목별 LLM 호출/DB 작업이 동기로 수 분간 실행되므로, 영속 루프에서 돌리면
+        1분봉/시장 데이터 수집이 그동안 멈춥니다.
+        실행이 끝나면 루프가 닫히므로, 이 루프에서 만든 KIS 연결 풀도 함께 종료합니다.
+        """
+        async def run() -> None:
+            try:
+                await self._generate_stock_reports()
+            finally:
+                await close_kis_client()
+
+        asyncio.run(run())
+
     def start(self) -> None:
         """스케줄러를 시작합니다."""
         if self.is_running:
@@ -903,6 +940,7 @@ class CrawlerScheduler:
         )
 
         self.scheduler = BackgroundScheduler()
+        self.async_loop.start()
 
         # 뉴스 크롤링 작업 등록 (10분 간격)
         news_trigger = IntervalTrigger(minutes=self.news_interval_minutes)
@@ -969,7 +1007,8 @@ class CrawlerScheduler:
         # KIS 업종/지수 일자별 수집 작업 등록 (매일 18:00 - 시간외 거래 마감 후)
         index_daily_trigger = CronTrigger(hour=18, minute=0)
         self.scheduler.add_job(
-            func=lambda: asyncio.run(self._collect_index_daily()),
+            func=self._run_async,
+            args=[self._collect_index_daily, KIS_DAILY_JOB_TIMEOUT_SECONDS],
             trigger=index_daily_trigger,
             id="kis_index_daily_job",
             name="KIS 업종/지수 일자별 수집기",
@@ -979,7 +1018,8 @@ class CrawlerScheduler:
         # KIS 일봉 수집 작업 등록 (매일 15:40 - 장 마감 후)
         kis_daily_trigger = CronTrigger(hour=15, minute=40)
         self.scheduler.add_job(
-            func=lambda: asyncio.run(self._collect_kis_daily_prices()),
+            func=self._run_async,
+            args=[self._collect_kis_daily_prices, KIS_DAILY_JOB_TIMEOUT_SECONDS],
             trigger=kis_daily_trigger,
             id="kis_daily_collector_job",
             name="KIS 일봉 수집기",
@@ -989,7 +1029,8 @@ class CrawlerScheduler:
         # KIS 1분봉 수집 작업 등록 (매 1분 - 장 시간만)
         kis_minute_trigger = IntervalTrigger(minutes=1)
         self.scheduler.add_job(
-            func=lambda: asyncio.run(self._collect_kis_minute_prices()),
+            func=self._run_async,
+            args=[self._collect_kis_minute_prices, KIS_MINUTE_JOB_TIMEOUT_SECONDS],
             trigger=kis_minute_trigger,
             id="kis_minute_collector_job",
             name="KIS 1분봉 수집기",
@@ -999,7 +1040,8 @@ class CrawlerScheduler:
         # KIS 시장 데이터 수집 작업 등록 (매 5분 - 장 시간만)
         market_data_trigger = IntervalTrigger(minutes=5)
         self.scheduler.add_job(
-            func=lambda: asyncio.run(self._collect_market_data()),
+            func=self._run_async,
+            args=[self._collect_market_data, KIS_MARKET_DATA_JOB_TIMEOUT_SECONDS],
             trigger=market_data_trigger,
             id="kis_market_data_job",
             name="KIS 시장 데이터 수집",
@@ -1009,7 +1051,8 @@ class CrawlerScheduler:
         # 투자자별 매매동향 수집 (매일 16:00 - 장 마감 후)
         investor_trading_trigger = CronTrigger(hour=16, minute=0)
         self.scheduler.add_job(
-            func=lambda: asyncio.run(self._collect_investor_trading()),
+            func=self._run_async,
+            args=[self._collect_investor_trading, KIS_DAILY_JOB_TIMEOUT_SECONDS],
             trigger=investor_trading_trigger,
             id="investor_trading_job",
             name="투자자별 매매동향 수집",
@@ -1019,7 +1062,8 @@ class CrawlerScheduler:
         # 종목 기본정보 수집 (매일 16:10 - 장 마감 후)
         stock_info_trigger = CronTrigger(hour=16, minute=10)
         self.scheduler.add_job(
-            func=lambda: asyncio.run(self._collect_stock_info()),
+            func=self._run_async,
+            args=[self._collect_stock_info, KIS_DAILY_JOB_TIMEOUT_SECONDS],
             trigger=stock_info_trigger,
             id="stock_info_job",
             name="종목 기본정보 수집",
@@ -1029,7 +1073,8 @@ class CrawlerScheduler:
         # 시간외 거래 가격 수집 (매일 18:00 - 시간외 거래 종료 후)
         overtime_trigger = CronTrigger(hour=18, minute=0)
         self.scheduler.add_job(
-            func=lambda: asyncio.run(self._collect_overtime_prices()),
+            func=self._run_async,
+            args=[self._collect_overtime_prices, KIS_DAILY_JOB_TIMEOUT_SECONDS],
             trigger=overtime_trigger,
             id="overtime_price_job",
             name="시간외 거래 가격 수집",
@@ -1040,7 +1085,7 @@ class CrawlerScheduler:
         # 장 시작 후 (09:15)
         report_morning_trigger = CronTrigger(hour=9, minute=15)
         self.scheduler.add_job(
-            func=lambda: asyncio.run(self._generate_stock_reports()),
+            func=self._run_stock_reports,
             trigger=report_morning_trigger,
             id="stock_report_morning_job",
             name="투자 리포트 생성 (장초)",
@@ -1050,7 +1095,7 @@ class CrawlerScheduler:
         # 점심 시간 후 (13:00)
         report_lunch_trigger = CronTrigger(hour=13, minute=0)
         self.scheduler.add_job(
-            func=lambda: asyncio.run(self._generate_stock_reports()),
+            func=self._run_stock_reports,
             trigger=report_lunch_trigger,
             id="stock_report_lunch_job",
             name="투자 리포트 생성 (장중)",
@@ -1060,7 +1105,7 @@ class CrawlerScheduler:
         # 장 마감 후 (15:45 - KIS 일봉 수집 후 5분)
         report_close_trigger = CronTrigger(hour=15, minute=45)
         self.scheduler.add_job(
-            func=lambda: asyncio.run(self._generate_stock_reports()),
+            func=self._run_stock_reports,
             trigger=report_close_trigger,
             id="stock_report_close_job",
             name="투자 리포트 생성 (장마감)",
@@ -1117,6 +1162,9 @@ class CrawlerScheduler:
         if self.scheduler:
             self.scheduler.shutdown(wait=False)
 
+        # 영속 루프 종료 (KIS 연결 풀은 루프 안에서 정리)
+        self.async_loop.stop(cleanup=close_kis_client)
+
         self.is_running = False
         logger.info("✅ 스케줄러 종료 완료")
 
@@ -79,22 +79,12 @@ class EvaluationScheduler:
                 logger.info("📊 평가 대상 없음")
                 return
 
-            success_count = 0
-            error_count = 0
+            # 일괄 평가 (주가 조회/저장 각 1회)
+            targets = service.prediction_targets(predictions)
+            evaluations = service.evaluate_batch(targets)
 
-            for prediction in predictions:
-                try:
-                    # 평가 실행
-                    evaluation = service.evaluate_prediction(prediction)
-
-                    if evaluation:
-                        success_count += 1
-                    else:
-                        error_count += 1
-
-                except Exception as e:
-                    error_count += 1
-                    logger.error(f"❌ 평가 실패: {prediction.id}, {e}", exc_info=True)
+            success_count = len(evaluations)
+            error_count = len(predictions) - success_count
 
             logger.info("=" * 80)
             logger.info(f"✅ 일일 평가 완료: 성공 {success_count}건, 실패 {error_count}건")
@@ -128,21 +118,11 @@ class EvaluationScheduler:
                 logger.info("📊 평가 대상 없음")
                 return
 
-            success_count = 0
-            error_count = 0
-
-            for prediction in predictions:
-                try:
-                    evaluation = service.evaluate_prediction(prediction)
-
-                    if evaluation:
-                        success_count += 1
-                    else:
-                        error_count += 1
+            targets = service.prediction_targets(predictions)
+            evaluations = service.evaluate_batch(targets)
 
-                except Exception as e:
-                    error_count += 1
-                    logger.error(f"❌ 평가 실패: {prediction.id}, {e}", exc_info=True)
+            success_count = len(evaluations)
+            error_count = len(predictions) - success_count
 
             logger.info(f"✅ 수동 평가 완료: 성공 {success_count}건, 실패 {error_count}건")
 
@@ -3,10 +3,18 @@ Model evaluation service for automated scoring.
 
 이 서비스는 Investment Report의 예측 정확도를 자동으로 평가합니다.
 매일 배치 작업으로 D-1일 예측을 평가하고 점수를 계산합니다.
+
+- 단건: evaluate_prediction / evaluate_report (항목마다 주가 조회 + 저장)
+- 배치: evaluate_batch (전체 항목의 T+1~T+N 주가를 한 번에 조회,
+  달성 여부/점수를 배열 연산으로 계산하고 한 문장으로 저장)
 """
 import logging
-from typing import List, Optional, Dict
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from typing import Any, List, Optional, Dict, Sequence
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from backend.db.models.prediction import Prediction
@@ -14,11 +22,39 @@ from backend.db.models.stock_analysis import StockAnalysisSummary
 from backend.db.models.stock import StockPrice
 from backend.db.models.model_evaluation import ModelEvaluation
 from backend.db.models.evaluation_history import EvaluationHistory
+from backend.utils.trading_calendar import get_trading_calendar
 
 
 logger = logging.getLogger(__name__)
 
 
+# 배치 조회 시 IN 절 종목 수
+PRICE_QUERY_CHUNK_SIZE = 500
+
+
+@dataclass
+class EvaluationTarget:
+    """평가 항목 (Prediction/StockAnalysisSummary 공통 가격 스냅샷)"""
+
+    prediction_id: int
+    model_id: int
+    stock_code: str
+    predicted_at: datetime
+    target_price: float
+    support_price: float
+    base_price: float
+    confidence: Optional[float] = None
+    prediction_period: str = "1일~5일"
+
+
+# 일괄 INSERT 실패 시 재시도 청크 크기
+INSERT_FALLBACK_CHUNK_SIZE = 100
+
+
+def _nan_to_none(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
 class EvaluationService:
     """
     모델 평가 서비스.
@@ -112,7 +148,7 @@ class EvaluationService:
         days: int = 5
     ) -> Dict[int, Dict[str, any]]:
         """
-        주가 데이터 조회 (T+1 ~ T+N일).
+        주가 데이터 조회 (T+1 ~ T+N 거래일).
 
         Args:
             stock_code: 종목 코드
@@ -125,38 +161,39 @@ class EvaluationService:
                 2: {"high": 51000, "low": 49000, "close": 50500, "date": "2025-11-07"},
                 ...
             }
+            (키는 N번째 거래일, 주가가 없는 거래일은 제외)
         """
-        result = {}
-        current_day = 1
-
-        for offset in range(1, days * 2):  # 주말 고려하여 최대 2배
-            target_date = base_date + timedelta(days=offset)
+        # T+1 ~ T+N 거래일 (주말/KRX 휴장일 제외)
+        calendar = get_trading_calendar()
+        sessions = calendar.sessions_in_range(
+            calendar.next_session(base_date), calendar.add_sessions(base_date, days)
+        )
+        if not sessions:
+            return {}
 
-            # 주말 스킵 (토, 일)
-            if target_date.weekday() >= 5:
-                continue
+        # 기간 전체 주가를 한 번에 조회 (일자별 첫 행 사용)
+        rows = self.db.query(StockPrice).filter(
+            StockPrice.stock_code == stock_code,
+            StockPrice.date >= sessions[0],
+            StockPrice.date <= sessions[-1].replace(hour=23, minute=59, second=59)
+        ).order_by(StockPrice.date).all()
 
-            # 주가 데이터 조회
-            stock_data = self.db.query(StockPrice).filter(
-                StockPrice.stock_code == stock_code,
-                StockPrice.date >= target_date.replace(hour=0, minute=0, second=0),
-                StockPrice.date <= target_date.replace(hour=23, minute=59, second=59)
-            ).first()
+        prices_by_date = {}
+        for stock_data in rows:
+            prices_by_date.setdefault(stock_data.date.date(), stock_data)
 
+        result = {}
+        for day, session in enumerate(sessions, start=1):
+            stock_data = prices_by_date.get(session.date())
             if stock_data:
-                result[current_day] = {
+                result[day] = {
                     "high": stock_data.high,
                     "low": stock_data.low,
                     "close": stock_data.close,
                     "date": stock_data.date.strftime("%Y-%m-%d")
                 }
-                current_day += 1
-
-                # 목표 일수 달성
-                if current_day > days:
-                    break
             else:
-                logger.warning(f"⚠️ 주가 데이터 없음: {stock_code} on {target_date.date()}")
+                logger.warning(f"⚠️ 주가 데이터 없음: {stock_code} on {session.date()}")
 
         return result
 
@@ -456,40 +493,20 @@ class EvaluationService:
             생성된 ModelEvaluation 객체 또는 None (실패 시)
         """
         try:
-            # A/B 테스트 리포트인 경우 모델별 데이터 사용
+            ab_config = None
             if report.custom_data and report.custom_data.get('ab_test_enabled'):
-                # A/B 테스트 설정에서 모델 ID 확인
                 from backend.db.models.ab_test_config import ABTestConfig
                 ab_config = self.db.query(ABTestConfig).filter(
                     ABTestConfig.is_active == True
                 ).first()
 
-                # model_id가 Model A인지 Model B인지 판단
-                if ab_config:
-                    model_key = 'model_a' if model_id == ab_config.model_a_id else 'model_b'
-                else:
-                    # fallback: ID가 작은 쪽을 Model A로 간주
-                    model_key = 'model_a' if model_id <= 2 else 'model_b'
-
-                model_data = report.custom_data.get(model_key, {})
-                price_targets = model_data.get('price_targets', {})
-
-                target_price = price_targets.get('short_term_target')
-                support_price = price_targets.get('short_term_support')
-                base_price = price_targets.get('base_price')
-
-                if not target_price or not support_price or not base_price:
-                    logger.warning(f"⚠️ {model_key} 가격 정보 없음: {report.stock_code}")
-                    return None
-            else:
-                # 일반 리포트는 테이블 레벨 데이터 사용
-                target_price = report.short_term_target_price
-                support_price = report.short_term_support_price
-                base_price = report.base_price
+            target = self.report_target(report, model_id, ab_config)
+            if target is None:
+                return None
 
-                if not target_price or not support_price or not base_price:
-                    logger.warning(f"⚠️ 필수 가격 정보 없음: {report.stock_code}")
-                    return None
+            target_price = target.target_price
+            support_price = target.support_price
+            base_price = target.base_price
 
             # 주가 데이터 조회
             stock_prices = self.get_stock_prices(
@@ -571,6 +588,354 @@ class EvaluationService:
             self.db.rollback()
             return None
 
+    def prediction_target(
+        self,
+        prediction: Prediction,
+        target_price: Optional[float] = None,
+        support_price: Optional[float] = None
+    ) -> EvaluationTarget:
+        """
+        Prediction 평가 항목 생성 (evaluate_prediction과 같은 기본값).
+
+        Args:
+            prediction: 평가 대상 예측
+            target_price: 목표가 (None이면 current_price * 1.1 사용)
+            support_price: 손절가 (None이면 current_price * 0.9 사용)
+
+        Returns:
+            EvaluationTarget
+        """
+        return EvaluationTarget(
+            prediction_id=prediction.id,
+            model_id=prediction.model_id,
+            stock_code=prediction.stock_code,
+            predicted_at=prediction.created_at,
+            target_price=target_price if target_price is not None else prediction.current_price * 1.1,
+            support_price=support_price if support_price is not None else prediction.current_price * 0.9,
+            base_price=prediction.current_price,
+            confidence=prediction.confidence,
+            prediction_period=prediction.target_period or "1일~5일",
+        )
+
+    def prediction_targets(self, predictions: Sequence[Prediction]) -> List[EvaluationTarget]:
+        """
+        Prediction 목록의 평가 항목 생성 (항목별 실패는 로그 후 제외).
+
+        Args:
+            predictions: 평가 대상 예측 목록
+
+        Returns:
+            EvaluationTarget 리스트
+        """
+        targets = []
+        for prediction in predictions:
+            try:
+                targets.append(self.prediction_target(prediction))
+            except Exception as e:
+                logger.error(f"❌ 평가 항목 생성 실패: {prediction.id}, {e}", exc_info=True)
+        return targets
+
+    def report_target(
+        self,
+        report: StockAnalysisSummary,
+        model_id: int,
+        ab_config: Optional[Any] = None
+    ) -> Optional[EvaluationTarget]:
+        """
+        Investment Report 평가 항목 생성.
+
+        A/B 테스트 리포트는 모델별(custom_data) 가격을, 일반 리포트는 테이블 컬럼 가격을 사용합니다.
+
+        Args:
+            report: 평가 대상 Investment Report
+            model_id: 모델 ID
+            ab_config: 활성 ABTestConfig (A/B 리포트의 Model A/B 판단용)
+
+        Returns:
+            EvaluationTarget 또는 None (가격 정보 없음)
+        """
+        if report.custom_data and report.custom_data.get('ab_test_enabled'):
+            # model_id가 Model A인지 Model B인지 판단
+            if ab_config:
+                model_key = 'model_a' if model_id == ab_config.model_a_id else 'model_b'
+            else:
+                # fallback: ID가 작은 쪽을 Model A로 간주
+                model_key = 'model_a' if model_id <= 2 else 'model_b'
+
+            model_data = report.custom_data.get(model_key, {})
+            price_targets = model_data.get('price_targets', {})
+
+            target_price = price_targets.get('short_term_target')
+            support_price = price_targets.get('short_term_support')
+            base_price = price_targets.get('base_price')
+
+            if not target_price or not support_price or not base_price:
+                logger.warning(f"⚠️ {model_key} 가격 정보 없음: {report.stock_code}")
+                return None
+        else:
+            # 일반 리포트는 테이블 레벨 데이터 사용
+            target_price = report.short_term_target_price
+            support_price = report.short_term_support_price
+            base_price = report.base_price
+
+            if not target_price or not support_price or not base_price:
+                logger.warning(f"⚠️ 필수 가격 정보 없음: {report.stock_code}")
+                return None
+
+        return EvaluationTarget(
+            prediction_id=report.id,  # StockAnalysisSummary의 ID를 prediction_id로 사용
+            model_id=model_id,
+            stock_code=report.stock_code,
+            predicted_at=report.last_updated,
+            target_price=target_price,
+            support_price=support_price,
+            base_price=base_price,
+            confidence=report.avg_confidence,
+        )
+
+    def load_forward_windows(
+        self,
+        targets: Sequence[EvaluationTarget],
+        days: int = 5
+    ) -> Dict[str, np.ndarray]:
+        """
+        전체 평가 항목의 T+1 ~ T+N 거래일 고가/저가/종가를 한 번에 조회.
+
+        Args:
+            targets: 평가 항목 목록
+            days: 조회할 거래일 수
+
+        Returns:
+            {"high": ..., "low": ..., "close": ...} 각각 (항목 수, days) 배열 (주가 없으면 NaN)
+        """
+        shape = (len(targets), days)
+        windows = {column: np.full(shape, np.nan) for column in ("high", "low", "close")}
+        if not targets:
+            return windows
+
+        base_dates = np.array([target.predicted_at for target in targets], dtype="datetime64[D]")
+        session_dates = get_trading_calendar().add_sessions_array(
+            base_dates[:, None], np.arange(1, days + 1)[None, :]
+        )
+        start = session_dates.min().astype("datetime64[s]").astype(datetime)
+        end = session_dates.max().astype("datetime64[s]").astype(datetime)
+
+        rows_by_code: Dict[str, List[Any]] = {}
+        codes = sorted({target.stock_code for target in targets})
+        for offset in range(0, len(codes), PRICE_QUERY_CHUNK_SIZE):
+            rows = self.db.query(
+                StockPrice.stock_code, StockPrice.date,
+                StockPrice.high, StockPrice.low, StockPrice.close
+            ).filter(
+                StockPrice.stock_code.in_(codes[offset:offset + PRICE_QUERY_CHUNK_SIZE]),
+                StockPrice.date >= start,
+                StockPrice.date <= end.replace(hour=23, minute=59, second=59)
+            ).order_by(StockPrice.stock_code, StockPrice.date).all()
+            for row in rows:
+                rows_by_code.setdefault(row.stock_code, []).append(row)
+
+        target_rows: Dict[str, List[int]] = {}
+        for index, target in enumerate(targets):
+            target_rows.setdefault(target.stock_code, []).append(index)
+
+        for stock_code, indexes in target_rows.items():
+            rows = rows_by_code.get(stock_code)
+            if not rows:
+                continue
+
+            # 일자별 첫 행만 사용 (get_stock_prices와 동일)
+            dates, first = np.unique(
+                np.array([row.date for row in rows], dtype="datetime64[D]"), return_index=True
+            )
+            wanted = session_dates[indexes]
+            position = np.searchsorted(dates, wanted)
+            clipped = np.minimum(position, len(dates) - 1)
+            found = (position < len(dates)) & (dates[clipped] == wanted)
+            row_index = first[clipped]
+
+            for column in ("high", "low", "close"):
+                values = np.array([getattr(row, column) for row in rows], dtype=np.float64)
+                windows[column][indexes] = np.where(found, values[row_index], np.nan)
+
+        return windows
+
+    def compute_evaluations(
+        self,
+        targets: Sequence[EvaluationTarget],
+        windows: Dict[str, np.ndarray]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        달성 여부와 자동 점수를 배열 연산으로 계산.
+
+        check_target_achievement + calculate_auto_score와 같은 규칙을 전체 항목에 한 번에 적용합니다.
+
+        Args:
+            targets: 평가 항목 목록
+            windows: load_forward_windows() 결과
+
+        Returns:
+            항목별 ModelEvaluation 행 딕셔너리 (주가 데이터가 없으면 None)
+        """
+        if not targets:
+            return []
+
+        high, low, close = windows["high"], windows["low"], windows["close"]
+        days = high.shape[1]
+        target = np.array([t.target_price for t in targets], dtype=np.float64)
+        support = np.array([t.support_price for t in targets], dtype=np.float64)
+        base = np.array([t.base_price for t in targets], dtype=np.float64)
+
+        has_data = ~np.isnan(close).all(axis=1)
+
+        # 달성 여부 (NaN 비교는 False)
+        target_hits = high >= target[:, None]
+        target_achieved = target_hits.any(axis=1)
+        target_achieved_days = np.where(target_achieved, target_hits.argmax(axis=1) + 1, 0)
+        support_breached = (low <= support[:, None]).any(axis=1)
+
+        high_1d, low_1d, close_1d = high[:, 0], low[:, 0], close[:, 0]
+        if days >= 5:
+            high_5d, low_5d, close_5d = high[:, 4], low[:, 4], close[:, 4]
+        else:
+            high_5d = low_5d = close_5d = np.full(len(targets), np.nan)
+
+        # 1. 목표가 정확도 점수 (미달성 시 실제 도달 비율)
+        actual_high = np.where(~np.isnan(high_5d), high_5d, np.where(~np.isnan(high_1d), high_1d, base))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = (actual_high - base) / (target - base) * 100
+        partial_accuracy = np.where(
+            (actual_high > base) & (target > base), np.clip(ratio, 0.0, 100.0), 0.0
+        )
+        accuracy_score = np.where(target_achieved, 100.0, partial_accuracy)
+
+        # 2. 타이밍 점수 (1일: 100, 2일: 90, ..., 최소 60)
+        timing_score = np.where(
+            target_achieved, np.maximum(60.0, 110.0 - target_achieved_days * 10), 0.0
+        )
+
+        # 3. 리스크 관리 점수 (손절가 대비 이탈 비율)
+        actual_low = np.where(~np.isnan(low_5d), low_5d, np.where(~np.isnan(low_1d), low_1d, base))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            breach_ratio = np.abs((actual_low - support) / support) * 100
+        breach_score = np.where(support > 0, np.maximum(0.0, 100 - breach_ratio), 0.0)
+        risk_score = np.where(support_breached, breach_score, 100.0)
+
+        final_score = accuracy_score * 0.4 + timing_score * 0.3 + risk_score * 0.3
+
+        evaluated_at = datetime.now()
+        results: List[Optional[Dict[str, Any]]] = []
+        for i, t in enumerate(targets):
+            if not has_data[i]:
+                results.append(None)
+                continue
+
+            results.append({
+                "prediction_id": t.prediction_id,
+                "model_id": t.model_id,
+                "stock_code": t.stock_code,
+                "predicted_at": t.predicted_at,
+                "prediction_period": t.prediction_period,
+                "predicted_target_price": t.target_price,
+                "predicted_support_price": t.support_price,
+                "predicted_base_price": t.base_price,
+                "predicted_confidence": t.confidence,
+                "actual_high_1d": _nan_to_none(high_1d[i]),
+                "actual_low_1d": _nan_to_none(low_1d[i]),
+                "actual_close_1d": _nan_to_none(close_1d[i]),
+                "actual_high_5d": _nan_to_none(high_5d[i]),
+                "actual_low_5d": _nan_to_none(low_5d[i]),
+                "actual_close_5d": _nan_to_none(close_5d[i]),
+                "target_achieved": bool(target_achieved[i]),
+                "target_achieved_days": int(target_achieved_days[i]) if target_achieved[i] else None,
+                "support_breached": bool(support_breached[i]),
+                "target_accuracy_score": float(accuracy_score[i]),
+                "timing_score": float(timing_score[i]),
+                "risk_management_score": float(risk_score[i]),
+                "final_score": float(final_score[i]),
+                "evaluated_at": evaluated_at,
+            })
+
+        return results
+
+    def evaluate_batch(
+        self,
+        targets: Sequence[EvaluationTarget],
+        days: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 항목을 한 번에 평가하고 ModelEvaluation을 일괄 저장.
+
+        주가 조회 1회(종목 500개 단위) + 배열 연산 + INSERT 1회로 처리합니다.
+        일괄 INSERT가 실패하면 청크(INSERT_FALLBACK_CHUNK_SIZE) → 건별 순으로 다시 저장하여
+        실패한 항목만 제외합니다.
+
+        Args:
+            targets: 평가 항목 목록
+            days: 평가 거래일 수 (기본 5일)
+
+        Returns:
+            저장된 평가 행 딕셔너리 리스트 (주가 데이터가 없거나 저장에 실패한 항목 제외)
+        """
+        if not targets:
+            return []
+
+        windows = self.load_forward_windows(targets, days=days)
+        rows = [row for row in self.compute_evaluations(targets, windows) if row is not None]
+
+        missing = len(targets) - len(rows)
+        if missing:
+            logger.warning(f"⚠️ 주가 데이터 없음: {missing}건 평가 제외")
+
+        saved = self._insert_evaluations(rows) if rows else []
+
+        logger.info(f"✅ 배치 평가 저장 완료: {len(saved)}/{len(targets)}건")
+        return saved
+
+    def _insert_rows(self, rows: List[Dict[str, Any]]) -> bool:
+        """평가 행 INSERT + 커밋 (실패 시 롤백 후 False)"""
+        try:
+            self.db.execute(insert(ModelEvaluation), rows)
+            self.db.commit()
+            return True
+        except Exception as e:
+            self.db.rollback()
+            if len(rows) == 1:
+                logger.error(f"❌ 평가 저장 실패: prediction_id={rows[0]['prediction_id']}, {e}")
+            else:
+                logger.warning(f"⚠️ 평가 {len(rows)}건 일괄 저장 실패: {e}")
+            return False
+
+    def _insert_evaluations(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        평가 행 저장 (일괄 → 청크 → 건별 순으로 재시도, 한 건의 오류가 전체를 되돌리지 않음)
+
+        Returns:
+            저장된 행 리스트
+        """
+        if self._insert_rows(rows):
+            return rows
+
+        chunk_size = INSERT_FALLBACK_CHUNK_SIZE if len(rows) > INSERT_FALLBACK_CHUNK_SIZE else 1
+        saved: List[Dict[str, Any]] = []
+        failed_ids: List[int] = []
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            if self._insert_rows(chunk):
+                saved.extend(chunk)
+                continue
+            if len(chunk) == 1:
+                failed_ids.append(chunk[0]["prediction_id"])
+                continue
+            for row in chunk:
+                if self._insert_rows([row]):
+                    saved.append(row)
+                else:
+                    failed_ids.append(row["prediction_id"])
+
+        if failed_ids:
+            logger.error(f"❌ 평가 저장 실패 {len(failed_ids)}건: prediction_id={failed_ids}")
+        return saved
+
     def update_human_rating(
         self,
         evaluation_id: int,
@@ -0,0 +1,646 @@
+"""
+기술적 지표 증분 저장소
+
+종목별로 이동합계/EMA/Wilder RSI 평균 등의 증분 상태를 유지하여,
+일봉/분봉이 들어올 때 마지막 봉만 반영해 지표를 갱신합니다.
+
+- 갱신: KISDailyCrawler.save_to_db, MinutePriceCollector._save_to_db (봉 1개당 O(1))
+- 조회: StockPredictor, InvestmentReportGenerator (프로세스 내 TTL 캐시 → DB 스냅샷 1행)
+- 상태가 없는 종목은 최근 일봉을 재생(replay)하여 생성 후 저장 (워밍업)
+- 일봉/분봉 저장이 동시에 실행되므로 상태 행은 SELECT ... FOR UPDATE로 잠근 뒤 갱신
+  (최초 행은 INSERT ... ON CONFLICT DO NOTHING으로 생성 후 잠금)
+- 지표 갱신은 SAVEPOINT 안에서 실행하며, 실패해도 가격 저장 트랜잭션은 유지
+
+같은 일자의 봉이 다시 들어오면(장중 분봉 → 장 마감 일봉) 마지막 봉을 되돌린 뒤
+다시 반영하므로, 장중 잠정 일봉이 확정 일봉으로 교체됩니다.
+"""
+import logging
+import math
+import threading
+import time
+from collections import deque
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend.db.bulk_upsert import upsert_rows
+from backend.db.models.indicator import StockIndicatorState
+from backend.db.models.stock import StockPriceMinute
+from backend.db.session import SessionLocal
+from backend.services.technical_indicator_service import (
+    BB_PERIOD,
+    BB_STD_MULTIPLIER,
+    LOOKBACK_DAYS,
+    MACD_FAST,
+    MACD_SIGNAL,
+    MACD_SLOW,
+    MIN_DAYS,
+    RSI_PERIOD,
+    fetch_recent_prices,
+    format_indicators,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# 워밍업 시 재생할 일봉 수 (EMA/RSI 평활 수렴용)
+WARMUP_DAYS = 120
+
+# 프로세스 내 캐시 유효 시간 (초)
+CACHE_TTL_SECONDS = 60
+
+# 이동평균 윈도우
+MA_WINDOWS = (5, 20, 60)
+
+# 최근 봉 보관 개수 (MA60 + 마지막 봉 되돌리기용 1개)
+HISTORY_SIZE = LOOKBACK_DAYS + 1
+
+
+def _to_date(value: Any) -> date:
+    """datetime/date/ISO 문자열을 date로 변환"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+class RollingIndicatorState:
+    """
+    단일 종목의 기술적 지표 증분 상태
+
+    - 이동평균/볼린저: 윈도우별 이동합계(및 20일 제곱합)
+    - MACD: EMA(12/26) 및 시그널 EMA(9) 누산기
+    - RSI: Wilder 평균 상승/하락폭 (첫 14개는 단순 평균)
+    """
+
+    def __init__(self):
+        self.bar_date: Optional[date] = None
+        self.closes: Deque[float] = deque(maxlen=HISTORY_SIZE)
+        self.volumes: Deque[int] = deque(maxlen=HISTORY_SIZE)
+        self.close_sums: Dict[int, float] = {window: 0.0 for window in MA_WINDOWS}
+        self.close_sumsq = 0.0
+        self.volume_sum = 0.0
+        self.volume_days = 0
+        self.accumulators = self._initial_accumulators()
+        # 마지막 봉 반영 직전의 누산기 (같은 일자 봉 재반영용)
+        self.previous_accumulators: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def _initial_accumulators() -> Dict[str, Any]:
+        return {
+            "bar_count": 0,
+            "ema_fast": None,
+            "ema_slow": None,
+            "macd_signal": None,
+            "macd_count": 0,
+            "avg_gain": 0.0,
+            "avg_loss": 0.0,
+            "rsi_count": 0,
+        }
+
+    def apply_bar(self, bar_date: Any, close: float, volume: Optional[int]) -> bool:
+        """
+        봉 1개 반영
+
+        Args:
+            bar_date: 봉 일자
+            close: 종가 (장중이면 현재가)
+            volume: 거래량 (없으면 None/0)
+
+        Returns:
+            반영 여부 (마지막 봉보다 과거 일자면 False)
+
+        Raises:
+            ValueError: 같은 일자 봉을 되돌릴 누산기가 없는 경우
+        """
+        bar_date = _to_date(bar_date)
+
+        if self.bar_date is not None:
+            if bar_date < self.bar_date:
+                return False
+            if bar_date == self.bar_date:
+                self._pop()
+
+        self._push(float(close), int(volume) if volume else 0)
+        self.bar_date = bar_date
+        return True
+
+    def _push(self, close: float, volume: int) -> None:
+        """마지막에 봉 추가 (이동합계/누산기 갱신)"""
+        length = len(self.closes)
+
+        for window in MA_WINDOWS:
+            self.close_sums[window] += close
+            if length >= window:
+                self.close_sums[window] -= self.closes[-window]
+
+        self.close_sumsq += close * close
+        self.volume_sum += volume
+        self.volume_days += 1 if volume else 0
+        if length >= BB_PERIOD:
+            self.close_sumsq -= self.closes[-BB_PERIOD] ** 2
+            dropped_volume = self.volumes[-BB_PERIOD]
+            self.volume_sum -= dropped_volume
+            self.volume_days -= 1 if dropped_volume else 0
+
+        previous_close = self.closes[-1] if length else None
+        self.previous_accumulators = dict(self.accumulators)
+        acc = self.accumulators
+        acc["bar_count"] += 1
+
+        # EMA / MACD
+        for key, period in (("ema_fast", MACD_FAST), ("ema_slow", MACD_SLOW)):
+            ema = acc[key]
+            acc[key] = close if ema is None else ema + (close - ema) * 2 / (period + 1)
+
+        if acc["bar_count"] >= MACD_SLOW:
+            macd = acc["ema_fast"] - acc["ema_slow"]
+            signal = acc["macd_signal"]
+            acc["macd_signal"] = macd if signal is None else signal + (macd - signal) * 2 / (MACD_SIGNAL + 1)
+            acc["macd_count"] += 1
+
+        # Wilder RSI
+        if previous_close is not None:
+            delta = close - previous_close
+            acc["rsi_count"] += 1
+            divisor = min(acc["rsi_count"], RSI_PERIOD)
+            acc["avg_gain"] += (max(delta, 0.0) - acc["avg_gain"]) / divisor
+            acc["avg_loss"] += (max(-delta, 0.0) - acc["avg_loss"]) / divisor
+
+        self.closes.append(close)
+        self.volumes.append(volume)
+
+    def _pop(self) -> None:
+        """마지막 봉 되돌리기"""
+        if self.previous_accumulators is None:
+            raise ValueError("마지막 봉을 되돌릴 상태가 없습니다")
+
+        close = self.closes.pop()
+        volume = self.volumes.pop()
+        length = len(self.closes)
+
+        for window in MA_WINDOWS:
+            self.close_sums[window] -= close
+            if length >= window:
+                self.close_sums[window] += self.closes[-window]
+
+        self.close_sumsq -= close * close
+        self.volume_sum -= volume
+        self.volume_days -= 1 if volume else 0
+        if length >= BB_PERIOD:
+            self.close_sumsq += self.closes[-BB_PERIOD] ** 2
+            restored_volume = self.volumes[-BB_PERIOD]
+            self.volume_sum += restored_volume
+            self.volume_days += 1 if restored_volume else 0
+
+        self.accumulators = self.previous_accumulators
+        self.previous_accumulators = None
+
+    def values(self) -> Dict[str, Optional[float]]:
+        """
+        현재 상태의 지표 값 (calculate_indicator_matrix 키와 동일)
+
+        Returns:
+            지표명 → 값 딕셔너리 (계산 불가 시 None)
+        """
+        length = len(self.closes)
+        acc = self.accumulators
+        current_price = self.closes[-1]
+
+        def moving_average(window: int) -> Optional[float]:
+            return self.close_sums[window] / window if length >= window else None
+
+        def change(days: int) -> float:
+            if length <= days or not self.closes[-1 - days]:
+                return 0.0
+            previous = self.closes[-1 - days]
+            return (current_price - previous) / previous * 100
+
+        ma20 = moving_average(BB_PERIOD)
+        bb_upper = bb_middle = bb_lower = None
+        if ma20 is not None:
+            std = math.sqrt(max(self.close_sumsq / BB_PERIOD - ma20 * ma20, 0.0))
+            bb_upper = ma20 + BB_STD_MULTIPLIER * std
+            bb_middle = ma20
+            bb_lower = ma20 - BB_STD_MULTIPLIER * std
+
+        rsi = None
+        if acc["rsi_count"] >= RSI_PERIOD:
+            if acc["avg_loss"] == 0:
+                rsi = 100.0
+            else:
+                rsi = 100 - (100 / (1 + acc["avg_gain"] / acc["avg_loss"]))
+
+        macd_line = acc["ema_fast"] - acc["ema_slow"] if acc["bar_count"] >= MACD_SLOW else None
+        macd_signal = acc["macd_signal"] if acc["macd_count"] >= MACD_SIGNAL else None
+        macd_histogram = macd_line - macd_signal if macd_line is not None and macd_signal is not None else None
+
+        return {
+            "count": float(min(length, LOOKBACK_DAYS)),
+            "current_price": current_price,
+            "ma5": moving_average(5),
+            "ma20": ma20,
+            "ma60": moving_average(60),
+            "avg_volume_20d": self.volume_sum / self.volume_days if self.volume_days else 0.0,
+            "change_1d": change(1),
+            "change_5d": change(5),
+            "change_20d": change(20),
+            "rsi": rsi,
+            "bb_upper": bb_upper,
+            "bb_middle": bb_middle,
+            "bb_lower": bb_lower,
+            "macd_line": macd_line,
+            "macd_signal": macd_signal,
+            "macd_histogram": macd_histogram,
+        }
+
+    def indicators(self) -> Optional[Dict[str, Any]]:
+        """기술적 지표 딕셔너리 (데이터 부족 시 None)"""
+        if len(self.closes) < MIN_DAYS:
+            return None
+        return format_indicators(self.values(), self.volumes[-1])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 저장용 직렬화"""
+        return {
+            "bar_date": self.bar_date.isoformat() if self.bar_date else None,
+            "closes": list(self.closes),
+            "volumes": list(self.volumes),
+            "accumulators": dict(self.accumulators),
+            "previous_accumulators": self.previous_accumulators,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RollingIndicatorState":
+        """저장된 상태 복원 (이동합계는 보관된 최근 봉으로 재계산)"""
+        state = cls()
+        state.bar_date = _to_date(data["bar_date"]) if data.get("bar_date") else None
+        state.closes.extend(data.get("closes", []))
+        state.volumes.extend(data.get("volumes", []))
+        state.accumulators.update(data.get("accumulators", {}))
+        state.previous_accumulators = data.get("previous_accumulators")
+
+        closes = list(state.closes)
+        volumes = list(state.volumes)
+        for window in MA_WINDOWS:
+            state.close_sums[window] = sum(closes[-window:]) if len(closes) >= window else sum(closes)
+        state.close_sumsq = sum(c * c for c in closes[-BB_PERIOD:])
+        state.volume_sum = float(sum(volumes[-BB_PERIOD:]))
+        state.volume_days = sum(1 for v in volumes[-BB_PERIOD:] if v)
+        return state
+
+
+class IndicatorStore:
+    """종목별 기술적 지표 증분 저장소 (DB 영속 + 프로세스 내 TTL 캐시)"""
+
+    def __init__(self, ttl_seconds: int = CACHE_TTL_SECONDS):
+        """
+        Args:
+            ttl_seconds: 캐시 유효 시간 (초)
+        """
+        self.ttl_seconds = ttl_seconds
+        self._cache: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 캐시
+    # ------------------------------------------------------------------
+
+    def _cache_get(self, stock_code: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        with self._lock:
+            entry = self._cache.get(stock_code)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            return False, None
+        return True, entry[1]
+
+    def _cache_put(self, stock_code: str, indicators: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._cache[stock_code] = (time.monotonic(), indicators)
+
+    def invalidate(self, stock_code: Optional[str] = None) -> None:
+        """
+        캐시 무효화
+
+        Args:
+            stock_code: 종목 코드 (None이면 전체)
+        """
+        with self._lock:
+            if stock_code is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(stock_code, None)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def get(self, stock_code: str, db: Optional[Session] = None) -> Optional[Dict[str, Any]]:
+        """
+        단일 종목 기술적 지표 조회
+
+        Args:
+            stock_code: 종목 코드
+            db: Database session (None이면 내부에서 생성)
+
+        Returns:
+            기술적 지표 딕셔너리 또는 None
+        """
+        return self.get_many([stock_code], db).get(stock_code)
+
+    def get_many(
+        self,
+        stock_codes: Iterable[str],
+        db: Optional[Session] = None,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        여러 종목 기술적 지표 조회
+
+        캐시 → 스냅샷 테이블(IN 쿼리 1회) → 워밍업(윈도우 쿼리 1회) 순으로 조회하며,
+        워밍업 결과는 전달된 세션으로 저장 후 커밋합니다.
+
+        Args:
+            stock_codes: 종목 코드 목록
+            db: Database session (None이면 내부에서 생성)
+
+        Returns:
+            {종목코드: 지표 딕셔너리 또는 None}
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        misses: List[str] = []
+
+        for stock_code in sorted({code for code in stock_codes if code}):
+            hit, indicators = self._cache_get(stock_code)
+            if hit:
+                results[stock_code] = indicators
+            else:
+                misses.append(stock_code)
+
+        if not misses:
+            return results
+
+        own_session = db is None
+        if own_session:
+            db = SessionLocal()
+
+        try:
+            rows = (
+                db.query(StockIndicatorState.stock_code, StockIndicatorState.indicators)
+                .filter(StockIndicatorState.stock_code.in_(misses))
+                .all()
+            )
+            for stock_code, indicators in rows:
+                results[stock_code] = indicators
+                self._cache_put(stock_code, indicators)
+
+            missing = [code for code in misses if code not in results]
+            if missing:
+                states = self.rebuild(db, missing)
+                db.commit()
+                for stock_code in missing:
+                    state = states.get(stock_code)
+                    results[stock_code] = state.indicators() if state else None
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"❌ 기술적 지표 조회 실패 ({len(misses)}개 종목): {e}")
+            for stock_code in misses:
+                results.setdefault(stock_code, None)
+
+        finally:
+            if own_session:
+                db.close()
+
+        return results
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def rebuild(self, db: Session, stock_codes: List[str]) -> Dict[str, RollingIndicatorState]:
+        """
+        최근 일봉을 재생하여 상태를 새로 생성하고 세션에 저장합니다 (커밋은 호출자).
+
+        Args:
+            db: Database session
+            stock_codes: 종목 코드 목록
+
+        Returns:
+            {종목코드: 상태} (일봉이 없는 종목은 제외)
+        """
+        states: Dict[str, RollingIndicatorState] = {}
+        for stock_code, bar_date, close, volume in fetch_recent_prices(db, stock_codes, WARMUP_DAYS):
+            state = states.get(stock_code)
+            if state is None:
+                state = states[stock_code] = RollingIndicatorState()
+            state.apply_bar(bar_date, close, volume)
+
+        for stock_code, state in states.items():
+            self._save(db, stock_code, state)
+
+        logger.info(f"🧮 기술적 지표 상태 워밍업: {len(states)}/{len(stock_codes)}개 종목")
+        return states
+
+    @staticmethod
+    def _lock_row(db: Session, stock_code: str) -> Optional[StockIndicatorState]:
+        """
+        상태 행을 행 잠금(SELECT ... FOR UPDATE)으로 조회
+
+        일봉/분봉 저장이 동시에 같은 종목 상태를 읽고-수정-저장하므로,
+        커밋(호출자)까지 잠금을 유지해 한쪽 갱신이 덮어써지지 않도록 합니다.
+        """
+        return (
+            db.query(StockIndicatorState)
+            .filter(StockIndicatorState.stock_code == stock_code)
+            .with_for_update()
+            .populate_existing()
+            .first()
+        )
+
+    def _load_state(self, db: Session, stock_code: str) -> Optional[RollingIndicatorState]:
+        """저장된 상태 조회 (없으면 None, 행 잠금)"""
+        row = self._lock_row(db, stock_code)
+        return RollingIndicatorState.from_dict(row.state) if row else None
+
+    def _save(self, db: Session, stock_code: str, state: RollingIndicatorState) -> None:
+        """상태/스냅샷을 세션에 반영하고 캐시 갱신"""
+        indicators = state.indicators()
+        row = self._lock_row(db, stock_code)
+        if row is None:
+            # 행이 없으면 FOR UPDATE가 잠그지 못하므로, 동시 생성에도 충돌하지 않게 먼저 생성 후 잠금
+            upsert_rows(
+                db,
+                StockIndicatorState,
+                [{"stock_code": stock_code, "state": {}, "updated_at": datetime.now()}],
+                update_columns=(),
+            )
+            row = self._lock_row(db, stock_code)
+
+        row.bar_date = datetime.combine(state.bar_date, datetime.min.time()) if state.bar_date else None
+        row.state = state.to_dict()
+        row.indicators = indicators
+        row.updated_at = datetime.now()
+        self._cache_put(stock_code, indicators)
+
+    def _apply_in_savepoint(
+        self,
+        db: Session,
+        stock_code: str,
+        apply: Callable[[], Optional[Dict[str, Any]]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        지표 갱신을 SAVEPOINT 안에서 실행
+
+        지표는 가격에서 파생된 데이터이므로, 갱신 실패 시 SAVEPOINT만 롤백하고
+        캐시를 무효화하여 같은 트랜잭션의 가격 저장은 그대로 커밋되도록 합니다.
+        """
+        try:
+            with db.begin_nested():
+                return apply()
+        except Exception as e:
+            self.invalidate(stock_code)
+            logger.warning(f"⚠️  {stock_code}: 기술적 지표 갱신 실패 (가격 저장은 유지) - {e}")
+            return None
+
+    def apply_daily_bars(
+        self,
+        db: Session,
+        stock_code: str,
+        bars: Iterable[Tuple[Any, float, Optional[int]]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        일봉 반영 (커밋은 호출자, 실패 시 None)
+
+        Args:
+            db: Database session (일봉을 저장한 세션)
+            stock_code: 종목 코드
+            bars: (일자, 종가, 거래량) 목록
+
+        Returns:
+            갱신된 기술적 지표 딕셔너리 또는 None
+        """
+        bars = list(bars)
+        return self._apply_in_savepoint(db, stock_code, lambda: self._apply_daily_bars(db, stock_code, bars))
+
+    def _apply_daily_bars(
+        self,
+        db: Session,
+        stock_code: str,
+        bars: List[Tuple[Any, float, Optional[int]]],
+    ) -> Optional[Dict[str, Any]]:
+        """일봉 반영 본체 (SAVEPOINT 안에서 실행)"""
+        state = self._load_state(db, stock_code)
+        if state is None:
+            db.flush()
+            state = self.rebuild(db, [stock_code]).get(stock_code)
+            return state.indicators() if state else None
+
+        try:
+            for bar_date, close, volume in sorted(bars, key=lambda bar: _to_date(bar[0])):
+                state.apply_bar(bar_date, close, volume)
+        except ValueError:
+            # 되돌릴 상태가 없으면 저장된 일봉으로 재생성
+            db.flush()
+            state = self.rebuild(db, [stock_code]).get(stock_code)
+            return state.indicators() if state else None
+
+        self._save(db, stock_code, state)
+        return state.indicators()
+
+    def apply_intraday_bars(
+        self,
+        db: Session,
+        stock_code: str,
+        bars: Iterable[Tuple[datetime, float, Optional[int]]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        분봉 반영 - 당일 잠정 일봉(종가=최신 분봉 종가, 거래량=분봉 거래량 합)으로 갱신
+        (커밋은 호출자, 실패 시 None)
+
+        Args:
+            db: Database session (분봉을 저장한 세션)
+            stock_code: 종목 코드
+            bars: 새로 저장된 (시각, 종가, 거래량) 목록
+
+        Returns:
+            갱신된 기술적 지표 딕셔너리 또는 None
+        """
+        bars = list(bars)
+        return self._apply_in_savepoint(db, stock_code, lambda: self._apply_intraday_bars(db, stock_code, bars))
+
+    def _apply_intraday_bars(
+        self,
+        db: Session,
+        stock_code: str,
+        bars: List[Tuple[datetime, float, Optional[int]]],
+    ) -> Optional[Dict[str, Any]]:
+        """분봉 반영 본체 (SAVEPOINT 안에서 실행)"""
+        by_date: Dict[date, Tuple[datetime, float, int]] = {}
+        for bar_time, close, volume in bars:
+            bar_date = bar_time.date()
+            last_time, last_close, volume_sum = by_date.get(bar_date, (bar_time, close, 0))
+            if bar_time >= last_time:
+                last_time, last_close = bar_time, close
+            by_date[bar_date] = (last_time, last_close, volume_sum + (volume or 0))
+
+        if not by_date:
+            return None
+
+        state = self._load_state(db, stock_code)
+        if state is None:
+            state = self.rebuild(db, [stock_code]).get(stock_code)
+            if state is None:
+                return None
+
+        try:
+            for bar_date in sorted(by_date):
+                _, close, new_volume = by_date[bar_date]
+                if state.bar_date == bar_date:
+                    # 같은 날: 새 분봉 거래량만 누적
+                    volume = state.volumes[-1] + new_volume
+                else:
+                    # 새 날: 당일 분봉 거래량 합계로 시작
+                    db.flush()
+                    volume = self._minute_volume_sum(db, stock_code, bar_date)
+                state.apply_bar(bar_date, close, volume)
+        except ValueError as e:
+            logger.warning(f"⚠️  {stock_code}: 분봉 지표 반영 skip - {e}")
+            return None
+
+        self._save(db, stock_code, state)
+        return state.indicators()
+
+    @staticmethod
+    def _minute_volume_sum(db: Session, stock_code: str, bar_date: date) -> int:
+        """당일 저장된 분봉 거래량 합계"""
+        day_start = datetime.combine(bar_date, datetime.min.time())
+        total = (
+            db.query(func.sum(StockPriceMinute.volume))
+            .filter(
+                StockPriceMinute.stock_code == stock_code,
+                StockPriceMinute.datetime >= day_start,
+                StockPriceMinute.datetime < day_start + timedelta(days=1),
+            )
+            .scalar()
+        )
+        return int(total or 0)
+
+
+# 싱글톤 인스턴스
+_indicator_store: Optional[IndicatorStore] = None
+
+
+def get_indicator_store() -> IndicatorStore:
+    """
+    IndicatorStore 싱글톤 인스턴스 반환
+
+    Returns:
+        IndicatorStore 인스턴스
+    """
+    global _indicator_store
+    if _indicator_store is None:
+        _indicator_store = IndicatorStore()
+    return _indicator_store
@@ -0,0 +1,304 @@
+"""
+뉴스 검색 서비스
+
+뉴스 목록 API의 검색/필터/정렬/페이지네이션을 담당합니다.
+
+- 검색: 제목/본문 부분 일치 (PostgreSQL에서는 pg_trgm GIN 인덱스를 사용하므로
+  형태소 분석기 없이도 한국어 부분 문자열 검색이 인덱스를 탑니다)
+  trigram은 3글자 이상에서만 추출되므로 2글자 이하 검색어(예: "삼성")는 기간 제한 없이
+  (정렬 컬럼, id) 인덱스 순서로 스캔하며 LIMIT만큼 찾으면 멈추고, 전체 개수는 캐시로 재사용합니다
+- 페이지네이션: (정렬 컬럼, id) 키셋 커서 (OFFSET 없이 다음 페이지 조회)
+- 전체 개수: 필터 조합별 TTL 캐시 (필터가 없으면 PostgreSQL 통계 추정치 사용)
+- 예측 정보: 뉴스별 최신 예측을 LATERAL 조인 한 번으로 함께 조회
+"""
+import base64
+import binascii
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import func, or_, select, text, true, tuple_
+from sqlalchemy.orm import Query, Session, aliased
+
+from backend.db.models.news import NewsArticle
+from backend.db.models.prediction import Prediction
+
+
+logger = logging.getLogger(__name__)
+
+
+# 키셋 페이지네이션이 가능한 정렬 컬럼 (NOT NULL + (컬럼, id) 인덱스)
+SORT_COLUMNS = {
+    "created_at": NewsArticle.created_at,
+    "published_at": NewsArticle.published_at,
+    "id": NewsArticle.id,
+}
+DEFAULT_SORT = "created_at"
+
+# 전체 개수 캐시
+COUNT_CACHE_TTL_SECONDS = 60
+COUNT_CACHE_MAX_ENTRIES = 256
+
+# sentiment_direction → 화면 표시 방향 (up/down/hold)
+SENTIMENT_TO_DIRECTION = {
+    "positive": "up",
+    "negative": "down",
+    "neutral": "hold",
+}
+
+_count_cache: Dict[Tuple[Any, ...], Tuple[float, int]] = {}
+_count_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class NewsSearchFilters:
+    """뉴스 목록 검색 조건"""
+    search: Optional[str] = None
+    stock_code: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    has_stock: Optional[bool] = None
+    notified: Optional[bool] = None
+    source: Optional[str] = None
+
+    def is_empty(self) -> bool:
+        return all(value is None or value == "" for value in asdict(self).values())
+
+
+def encode_cursor(sort_by: str, sort_order: str, sort_value: Any, news_id: int) -> str:
+    """마지막 행의 (정렬 값, id)를 커서 문자열로 인코딩"""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps(
+        {"sort": sort_by, "order": sort_order, "value": sort_value, "id": news_id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_order: str) -> Tuple[Any, int]:
+    """
+    커서 문자열을 (정렬 값, id)로 디코딩
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 정렬 조건이 다른 커서
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload["sort"] != sort_by or payload["order"] != sort_order:
+            raise ValueError("정렬 조건이 다른 커서입니다")
+        value = payload["value"]
+        if sort_by != "id":
+            value = datetime.fromisoformat(value)
+        return value, int(payload["id"])
+    except (binascii.Error, json.JSONDecodeError, KeyError, TypeError, UnicodeDecodeError) as e:
+        raise ValueError(f"잘못된 커서입니다: {e}") from e
+
+
+def _apply_filters(query: Query, filters: NewsSearchFilters) -> Query:
+    """검색 조건을 쿼리에 적용"""
+    if filters.search:
+        query = query.filter(or_(
+            NewsArticle.title.ilike(f"%{filters.search}%"),
+            NewsArticle.content.ilike(f"%{filters.search}%"),
+        ))
+
+    if filters.stock_code:
+        query = query.filter(NewsArticle.stock_code == filters.stock_code)
+
+    if filters.has_stock is not None:
+        if filters.has_stock:
+            query = query.filter(NewsArticle.stock_code.isnot(None))
+        else:
+            query = query.filter(NewsArticle.stock_code.is_(None))
+
+    if filters.notified is not None:
+        if filters.notified:
+            query = query.filter(NewsArticle.notified_at.isnot(None))
+        else:
+            query = query.filter(NewsArticle.notified_at.is_(None))
+
+    if filters.source:
+        query = query.filter(NewsArticle.source.ilike(f"%{filters.source}%"))
+
+    if filters.start_date:
+        query = query.filter(NewsArticle.published_at >= filters.start_date)
+
+    if filters.end_date:
+        query = query.filter(NewsArticle.published_at <= filters.end_date)
+
+    return query
+
+
+def count_news(db: Session, filters: NewsSearchFilters) -> int:
+    """
+    검색 조건에 맞는 뉴스 수 (TTL 캐시)
+
+    필터가 없으면 PostgreSQL의 pg_class.reltuples 추정치를 사용하고,
+    필터가 있으면 정확한 COUNT 결과를 COUNT_CACHE_TTL_SECONDS 동안 재사용합니다.
+    """
+    key = tuple(asdict(filters).items())
+    now = time.monotonic()
+    with _count_cache_lock:
+        cached = _count_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+    total = None
+    if filters.is_empty() and db.bind.dialect.name == "postgresql":
+        estimate = db.execute(
+            text("SELECT reltuples::BIGINT FROM pg_class WHERE oid = 'news_articles'::regclass")
+        ).scalar()
+        # 한 번도 ANALYZE되지 않은 테이블은 -1 (또는 0)
+        if estimate and estimate > 0:
+            total = int(estimate)
+
+    if total is None:
+        total = _apply_filters(db.query(func.count(NewsArticle.id)), filters).scalar() or 0
+
+    with _count_cache_lock:
+        if len(_count_cache) >= COUNT_CACHE_MAX_ENTRIES:
+            _count_cache.clear()
+        _count_cache[key] = (now + COUNT_CACHE_TTL_SECONDS, total)
+    return total
+
+
+def clear_count_cache() -> None:
+    """전체 개수 캐시 초기화"""
+    with _count_cache_lock:
+        _count_cache.clear()
+
+
+def _latest_prediction_columns(db: Session):
+    """
+    뉴스별 최신 예측 (sentiment_direction, direction, confidence, sentiment_score) 조인 대상
+
+    PostgreSQL에서는 LATERAL 서브쿼리, LATERAL을 지원하지 않는 DB(SQLite)에서는
+    최신 예측 id를 상관 서브쿼리로 구해 조인합니다.
+
+    Returns:
+        (조인 대상, ON 조건, 컬럼 목록)
+    """
+    order = (Prediction.created_at.desc(), Prediction.id.desc())
+
+    if db.bind.dialect.name == "postgresql":
+        latest = select(
+            Prediction.sentiment_direction,
+            Prediction.direction,
+            Prediction.confidence,
+            Prediction.sentiment_score,
+        ).where(
+            Prediction.news_id == NewsArticle.id
+        ).order_by(*order).limit(1).lateral("latest_prediction")
+        return latest, true(), [
+            latest.c.sentiment_direction,
+            latest.c.direction,
+            latest.c.confidence,
+            latest.c.sentiment_score,
+        ]
+
+    latest = aliased(Prediction, name="latest_prediction")
+    latest_id = select(Prediction.id).where(
+        Prediction.news_id == NewsArticle.id
+    ).order_by(*order).limit(1).correlate(NewsArticle).scalar_subquery()
+    return latest, latest.id == latest_id, [
+        latest.sentiment_direction,
+        latest.direction,
+        latest.confidence,
+        latest.sentiment_score,
+    ]
+
+
+def _prediction_fields(
+    sentiment_direction: Optional[str],
+    direction: Optional[str],
+    confidence: Optional[float],
+    sentiment_score: Optional[float],
+) -> Tuple[Optional[str], Optional[float]]:
+    """최신 예측을 (방향, 신뢰도)로 변환 (신 스키마 우선, 구 스키마 fallback)"""
+    prediction_direction = SENTIMENT_TO_DIRECTION.get(sentiment_direction, direction)
+    if confidence is None and sentiment_score is not None:
+        # 신 스키마는 신뢰도 대신 감성 강도(|sentiment_score|, 0~1)를 사용
+        confidence = abs(sentiment_score)
+    return prediction_direction, confidence
+
+
+def search_news(
+    db: Session,
+    filters: NewsSearchFilters,
+    limit: int = 20,
+    sort_by: str = DEFAULT_SORT,
+    sort_order: str = "desc",
+    cursor: Optional[str] = None,
+    page: int = 1,
+) -> Dict[str, Any]:
+    """
+    뉴스 목록 검색
+
+    cursor가 있으면 키셋 페이지네이션으로 다음 페이지를 조회하고,
+    없으면 page 번호로 조회합니다 (첫 페이지 이후에는 cursor 사용 권장).
+
+    Args:
+        db: 데이터베이스 세션
+        filters: 검색 조건
+        limit: 페이지당 항목 수
+        sort_by: 정렬 컬럼 (SORT_COLUMNS 외에는 created_at)
+        sort_order: 정렬 순서 (asc/desc)
+        cursor: 이전 응답의 next_cursor
+        page: 페이지 번호 (cursor가 없을 때만 사용)
+
+    Returns:
+        {"rows": [(NewsArticle, 예측 방향, 예측 신뢰도)], "total", "next_cursor"}
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    if sort_by not in SORT_COLUMNS:
+        sort_by = DEFAULT_SORT
+    sort_order = "asc" if sort_order == "asc" else "desc"
+    sort_column = SORT_COLUMNS[sort_by]
+
+    latest, on_clause, prediction_columns = _latest_prediction_columns(db)
+    query = _apply_filters(
+        db.query(NewsArticle, *prediction_columns).outerjoin(latest, on_clause),
+        filters,
+    )
+
+    # (정렬 컬럼, id) 순서로 정렬하여 동일 값에서도 순서가 고정되도록 함
+    if sort_order == "desc":
+        query = query.order_by(sort_column.desc(), NewsArticle.id.desc())
+    else:
+        query = query.order_by(sort_column.asc(), NewsArticle.id.asc())
+
+    if cursor:
+        last_value, last_id = decode_cursor(cursor, sort_by, sort_order)
+        position = tuple_(sort_column, NewsArticle.id)
+        boundary = tuple_(last_value, last_id)
+        query = query.filter(position < boundary if sort_order == "desc" else position > boundary)
+    elif page > 1:
+        query = query.offset((page - 1) * limit)
+
+    # 다음 페이지 존재 여부 확인용으로 1건 더 조회
+    fetched = query.limit(limit + 1).all()
+    has_next = len(fetched) > limit
+    fetched = fetched[:limit]
+
+    rows = [
+        (news, *_prediction_fields(*prediction))
+        for news, *prediction in fetched
+    ]
+
+    next_cursor = None
+    if has_next and rows:
+        last = rows[-1][0]
+        next_cursor = encode_cursor(sort_by, sort_order, getattr(last, sort_by), last.id)
+
+    return {
+        "rows": rows,
+        "total": count_news(db, filters),
+        "next_cursor": next_cursor,
+    }
@@ -0,0 +1,292 @@
+"""
+API 응답 캐시 모듈
+
+프론트엔드가 주기적으로 호출하는 대시보드/종목 API의 응답을 프로세스 내에 캐싱합니다.
+
+- TTL: 시장 단계별 (utils/market_time.get_response_ttl_seconds, 장중 짧게 / 장 마감 후 길게)
+- 단일 계산(single-flight): 같은 키의 동시 요청은 한 번만 계산하고 결과를 공유
+- ETag / If-None-Match: 변경이 없으면 304 응답
+- 무효화: 태그 단위 (뉴스 저장/예측 저장 시 invalidate_stock_responses 호출)
+- 지표: 히트율, 절약한 계산 시간 (get_metrics)
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from backend.config import settings
+from backend.utils.market_time import get_market_phase, get_response_ttl_seconds
+
+
+logger = logging.getLogger(__name__)
+
+
+# 캐시 태그
+TAG_DASHBOARD = "dashboard"
+TAG_STOCKS = "stocks"
+
+
+def stock_tag(stock_code: str) -> str:
+    """종목 상세 응답 태그"""
+    return f"stock:{stock_code}"
+
+
+@dataclass
+class CachedResponse:
+    """캐시된 응답 본문과 메타데이터"""
+    body: bytes
+    etag: str
+    expires_at: float
+    compute_seconds: float
+    tags: Tuple[str, ...]
+
+
+class ResponseCache:
+    """시장 단계별 TTL + 단일 계산 + ETag 응답 캐시"""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_resolver: Optional[Callable[[], int]] = None,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            max_entries: 최대 캐시 항목 수
+            ttl_resolver: TTL(초) 계산 함수 (None이면 현재 시장 단계 기준)
+            enabled: False면 캐시 없이 매번 계산 (ETag는 유지)
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_resolver = ttl_resolver or (lambda: get_response_ttl_seconds(get_market_phase()))
+        self.enabled = enabled
+
+        self._entries: Dict[str, CachedResponse] = {}
+        # 전체/태그별 무효화 세대 (계산 중 무효화된 결과는 저장하지 않음)
+        self._epoch = 0
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        # 이벤트 루프 스레드에서만 접근
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._metrics = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "not_modified": 0,
+            "invalidations": 0,
+            "compute_seconds": 0.0,
+            "saved_compute_seconds": 0.0,
+        }
+
+    def _count(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._metrics[name] += value
+
+    def _get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry
+
+    def _generation(self, tags: Tuple[str, ...]) -> Tuple[int, ...]:
+        return (self._epoch, *(self._generations.get(tag, 0) for tag in tags))
+
+    def _snapshot(self, tags: Tuple[str, ...]) -> Tuple[int, ...]:
+        with self._lock:
+            return self._generation(tags)
+
+    def _put(self, key: str, entry: CachedResponse, generations: Tuple[int, ...]) -> None:
+        with self._lock:
+            # 계산 도중 무효화되었으면 저장하지 않음
+            if generations != self._generation(entry.tags):
+                return
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                now = time.monotonic()
+                for expired in [k for k, e in self._entries.items() if e.expires_at <= now]:
+                    del self._entries[expired]
+                if len(self._entries) >= self.max_entries:
+                    # 가장 먼저 저장된 항목 제거
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = entry
+
+    async def _compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        tags: Tuple[str, ...],
+    ) -> CachedResponse:
+        """같은 키의 동시 요청은 진행 중인 계산 결과를 기다림"""
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            entry = await asyncio.shield(inflight)
+            self._count("coalesced")
+            self._count("saved_compute_seconds", entry.compute_seconds)
+            return entry
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generations = self._snapshot(tags)
+        started = time.perf_counter()
+        try:
+            payload = await compute()
+            body = json.dumps(
+                jsonable_encoder(payload), ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+            elapsed = time.perf_counter() - started
+            entry = CachedResponse(
+                body=body,
+                etag=f'"{hashlib.sha1(body).hexdigest()}"',
+                expires_at=time.monotonic() + self.ttl_resolver(),
+                compute_seconds=elapsed,
+                tags=tags,
+            )
+            self._count("misses")
+            self._count("compute_seconds", elapsed)
+            if self.enabled:
+                self._put(key, entry, generations)
+            future.set_result(entry)
+            return entry
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def respond(
+        self,
+        request: Request,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        tags: Iterable[str] = (),
+    ) -> Response:
+        """
+        캐시된 응답을 반환하거나 계산 후 캐싱합니다.
+
+        Args:
+            request: 요청 (If-None-Match 확인용)
+            key: 캐시 키
+            compute: 응답 데이터를 만드는 코루틴 함수 (JSON 직렬화 가능한 값 반환)
+            tags: 무효화 태그
+
+        Returns:
+            JSON 응답 (If-None-Match가 일치하면 304)
+        """
+        entry = self._get(key) if self.enabled else None
+        if entry is not None:
+            self._count("hits")
+            self._count("saved_compute_seconds", entry.compute_seconds)
+            cache_status = "HIT"
+        else:
+            entry = await self._compute(key, compute, tuple(tags))
+            cache_status = "MISS"
+
+        max_age = max(0, int(entry.expires_at - time.monotonic()))
+        headers = {
+            "ETag": entry.etag,
+            "Cache-Control": f"private, max-age={max_age}",
+            "X-Cache": cache_status,
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and entry.etag in [tag.strip() for tag in if_none_match.split(",")]:
+            self._count("not_modified")
+            return Response(status_code=304, headers=headers)
+
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+    def invalidate(self, *tags: str) -> int:
+        """
+        태그가 붙은 캐시 항목 삭제 (태그가 없으면 전체 삭제)
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            if tags:
+                for tag in tags:
+                    self._generations[tag] = self._generations.get(tag, 0) + 1
+                removed = [
+                    key for key, entry in self._entries.items()
+                    if any(tag in entry.tags for tag in tags)
+                ]
+            else:
+                self._epoch += 1
+                removed = list(self._entries)
+            for key in removed:
+                del self._entries[key]
+            self._metrics["invalidations"] += len(removed)
+        return len(removed)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        캐시 지표
+
+        Returns:
+            {hits, misses, coalesced, not_modified, invalidations, compute_seconds,
+             saved_compute_seconds, hit_rate, entries, enabled}
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["entries"] = len(self._entries)
+
+        served = metrics["hits"] + metrics["coalesced"]
+        requests = served + metrics["misses"]
+        metrics["hit_rate"] = round(served / requests, 4) if requests else 0.0
+        metrics["compute_seconds"] = round(metrics["compute_seconds"], 3)
+        metrics["saved_compute_seconds"] = round(metrics["saved_compute_seconds"], 3)
+        metrics["enabled"] = self.enabled
+        return metrics
+
+
+# 싱글톤 인스턴스
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    ResponseCache 싱글톤 인스턴스를 반환합니다.
+
+    Returns:
+        ResponseCache 인스턴스
+    """
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(
+                max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+                enabled=settings.RESPONSE_CACHE_ENABLED,
+            )
+        return _response_cache
+
+
+def invalidate_stock_responses(stock_code: Optional[str] = None) -> None:
+    """
+    뉴스/예측 저장 후 관련 응답 캐시 무효화 (대시보드, 종목 요약, 해당 종목 상세)
+
+    Args:
+        stock_code: 종목 코드 (None이면 대시보드/종목 요약만)
+    """
+    tags = [TAG_DASHBOARD, TAG_STOCKS]
+    if stock_code:
+        tags.append(stock_tag(stock_code))
+    try:
+        get_response_cache().invalidate(*tags)
+    except Exception as e:
+        # 캐시 무효화 실패가 저장 경로를 막지 않도록 함 (TTL 만료로 복구)
+        logger.warning(f"⚠️  응답 캐시 무효화 실패: {e}")
@@ -0,0 +1,225 @@
+"""
+AI 시그널 집계(prediction_signal_rollup) 서비스
+
+predictions 전체를 종목별로 집계하는 대신, 예측이 저장/수정/삭제될 때
+종목/일자별 카운터를 증분 갱신하고 대시보드는 집계 테이블만 읽습니다.
+
+- 갱신: 예측 저장과 같은 트랜잭션에서 add/remove 증분을 모아 한 문장으로 반영
+  (StockPredictor._save_model_predictions, 모델 삭제 API)
+- 조회: 종목 목록의 시그널 수를 IN 조회 1회로 반환 (get_signal_counts)
+- 복구: rebuild_signal_rollup (predictions에서 전체 재계산)
+"""
+import logging
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from backend.db.bulk_upsert import increment_rows
+from backend.db.models.prediction import Prediction
+from backend.db.models.signal_rollup import PredictionSignalRollup
+
+
+logger = logging.getLogger(__name__)
+
+
+COUNTER_COLUMNS = (
+    "total_count",
+    "positive_count",
+    "negative_count",
+    "sentiment_sum",
+    "sentiment_count",
+)
+
+
+class SignalRollupDelta:
+    """한 트랜잭션의 시그널 증분 누적기 (종목/일자별)"""
+
+    def __init__(self):
+        self._counters: Dict[Tuple[str, date], Dict[str, float]] = defaultdict(
+            lambda: dict.fromkeys(COUNTER_COLUMNS, 0)
+        )
+
+    def _apply(
+        self,
+        stock_code: str,
+        created_at: datetime,
+        sentiment_direction: Optional[str],
+        sentiment_score: Optional[float],
+        sign: int,
+    ) -> None:
+        counters = self._counters[(stock_code, created_at.date())]
+        counters["total_count"] += sign
+        if sentiment_direction == "positive":
+            counters["positive_count"] += sign
+        elif sentiment_direction == "negative":
+            counters["negative_count"] += sign
+        if sentiment_score is not None:
+            counters["sentiment_sum"] += sign * sentiment_score
+            counters["sentiment_count"] += sign
+
+    def add(self, prediction: Prediction) -> None:
+        """예측 추가분 반영"""
+        self._apply(
+            prediction.stock_code,
+            prediction.created_at,
+            prediction.sentiment_direction,
+            prediction.sentiment_score,
+            1,
+        )
+
+    def remove(self, prediction: Prediction) -> None:
+        """예측 삭제분(또는 수정 전 값) 반영"""
+        self._apply(
+            prediction.stock_code,
+            prediction.created_at,
+            prediction.sentiment_direction,
+            prediction.sentiment_score,
+            -1,
+        )
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """변화가 있는 종목/일자의 증분 행"""
+        now = datetime.now()
+        return [
+            {"stock_code": stock_code, "date": day, **counters, "updated_at": now}
+            for (stock_code, day), counters in self._counters.items()
+            if any(counters.values())
+        ]
+
+    def apply(self, db: Session) -> int:
+        """
+        누적 증분을 prediction_signal_rollup에 반영 (커밋은 호출자)
+
+        Returns:
+            갱신된 종목/일자 수
+        """
+        rows = self.rows()
+        if not rows:
+            return 0
+        return increment_rows(db, PredictionSignalRollup, rows, increment_columns=COUNTER_COLUMNS)
+
+
+def get_signal_counts(
+    db: Session,
+    stock_codes: Iterable[str],
+    since: Optional[date] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    종목 목록의 AI 시그널 수를 한 번에 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        stock_codes: 종목 코드 목록
+        since: 이 날짜 이후 집계만 사용 (None이면 전체 기간)
+
+    Returns:
+        {종목 코드: {"total", "positive", "negative", "avg_sentiment"}} (시그널이 없는 종목은 제외)
+    """
+    codes = list(dict.fromkeys(stock_codes))
+    if not codes:
+        return {}
+
+    query = db.query(
+        PredictionSignalRollup.stock_code,
+        func.sum(PredictionSignalRollup.total_count).label("total"),
+        func.sum(PredictionSignalRollup.positive_count).label("positive"),
+        func.sum(PredictionSignalRollup.negative_count).label("negative"),
+        func.sum(PredictionSignalRollup.sentiment_sum).label("sentiment_sum"),
+        func.sum(PredictionSignalRollup.sentiment_count).label("sentiment_count"),
+    ).filter(PredictionSignalRollup.stock_code.in_(codes))
+
+    if since is not None:
+        query = query.filter(PredictionSignalRollup.date >= since)
+
+    return {
+        row.stock_code: {
+            "total": int(row.total or 0),
+            "positive": int(row.positive or 0),
+            "negative": int(row.negative or 0),
+            "avg_sentiment": (
+                row.sentiment_sum / row.sentiment_count if row.sentiment_count else None
+            ),
+        }
+        for row in query.group_by(PredictionSignalRollup.stock_code).all()
+    }
+
+
+def get_top_signal_stocks(db: Session, limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    AI 시그널이 많은 종목 TOP N (전체 기간)
+
+    Returns:
+        [{"stock_code", "total", "positive", "negative"}] (시그널 수 내림차순)
+    """
+    total = func.sum(PredictionSignalRollup.total_count)
+    rows = db.query(
+        PredictionSignalRollup.stock_code,
+        total.label("total"),
+        func.sum(PredictionSignalRollup.positive_count).label("positive"),
+        func.sum(PredictionSignalRollup.negative_count).label("negative"),
+    ).group_by(
+        PredictionSignalRollup.stock_code
+    ).having(total > 0).order_by(total.desc()).limit(limit).all()
+
+    return [
+        {
+            "stock_code": row.stock_code,
+            "total": int(row.total),
+            "positive": int(row.positive or 0),
+            "negative": int(row.negative or 0),
+        }
+        for row in rows
+    ]
+
+
+def rebuild_signal_rollup(db: Session, stock_codes: Optional[Sequence[str]] = None) -> int:
+    """
+    predictions에서 집계를 다시 계산합니다 (커밋은 호출자).
+
+    Args:
+        db: 데이터베이스 세션
+        stock_codes: 재계산할 종목 (None이면 전체)
+
+    Returns:
+        저장된 종목/일자 수
+    """
+    day = func.date(Prediction.created_at)
+    query = db.query(
+        Prediction.stock_code,
+        day.label("day"),
+        func.count(Prediction.id).label("total_count"),
+        func.sum(case((Prediction.sentiment_direction == "positive", 1), else_=0)).label("positive_count"),
+        func.sum(case((Prediction.sentiment_direction == "negative", 1), else_=0)).label("negative_count"),
+        func.coalesce(func.sum(Prediction.sentiment_score), 0.0).label("sentiment_sum"),
+        func.count(Prediction.sentiment_score).label("sentiment_count"),
+    )
+    delete_query = db.query(PredictionSignalRollup)
+    if stock_codes is not None:
+        query = query.filter(Prediction.stock_code.in_(list(stock_codes)))
+        delete_query = delete_query.filter(PredictionSignalRollup.stock_code.in_(list(stock_codes)))
+
+    rows = query.group_by(Prediction.stock_code, day).all()
+    delete_query.delete(synchronize_session=False)
+
+    now = datetime.now()
+    records = [
+        {
+            "stock_code": row.stock_code,
+            "date": row.day if isinstance(row.day, date) else date.fromisoformat(str(row.day)),
+            "total_count": row.total_count,
+            "positive_count": row.positive_count or 0,
+            "negative_count": row.negative_count or 0,
+            "sentiment_sum": float(row.sentiment_sum or 0.0),
+            "sentiment_count": row.sentiment_count,
+            "updated_at": now,
+        }
+        for row in rows
+    ]
+    if records:
+        increment_rows(db, PredictionSignalRollup, records, increment_columns=COUNTER_COLUMNS)
+
+    logger.info(f"📊 AI 시그널 집계 재계산: {len(records)}개 종목/일자")
+    return len(records)
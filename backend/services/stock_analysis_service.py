@@ -104,7 +104,8 @@ async def should_update_report(
 async def update_stock_analysis_summary(
     stock_code: str,
     db: Session,
-    force_update: bool = False
+    force_update: bool = False,
+    technical_indicators: Optional[Dict[str, Any]] = None,
 ) -> Optional[StockAnalysisSummary]:
     """
     종목 투자 분석 요약 업데이트 (LLM 기반)
@@ -113,6 +114,7 @@ async def update_stock_analysis_summary(
         stock_code: 종목 코드
         db: Database session
         force_update: 강제 업데이트 여부 (기본값: False)
+        technical_indicators: 미리 일괄 계산된 기술적 지표 (없으면 리포트 생성 시 조회)
 
     Returns:
         StockAnalysisSummary 인스턴스 또는 None (실패 시)
@@ -186,9 +188,13 @@ async def update_stock_analysis_summary(
         # A/B 테스트 활성화 시 dual_generate_report 사용
         from backend.config import settings
         if settings.AB_TEST_ENABLED:
-            report = generator.dual_generate_report(stock_code, predictions, current_price)
+            report = generator.dual_generate_report(
+                stock_code, predictions, current_price, technical_indicators
+            )
         else:
-            report = generator.generate_report(stock_code, predictions, current_price)
+            report = generator.generate_report(
+                stock_code, predictions, current_price, technical_indicators
+            )
 
         if not report or (not settings.AB_TEST_ENABLED and not report.get("overall_summary")):
             logger.error(f"종목 {stock_code}의 리포트 생성 실패")
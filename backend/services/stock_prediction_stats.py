@@ -0,0 +1,218 @@
+"""
+종목별 예측 종합 통계(stock_prediction_stats) 서비스
+
+종목 상세 API가 예측 전체를 ORM 객체로 불러와 JSON 필드를 평균내는 대신,
+예측이 저장/수정/삭제될 때 종목별 합계/개수를 증분 갱신하고 상세 API는 행 하나만 읽습니다.
+
+- 갱신: 예측 저장과 같은 트랜잭션에서 add/remove 증분을 모아 한 문장으로 반영
+  (StockPredictor._save_model_predictions, 모델 삭제 API)
+- 조회: get_stock_prediction_stats (예측 수와 무관하게 단건 조회)
+- 복구: rebuild_stock_prediction_stats (predictions에서 전체 재계산)
+"""
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from backend.db.bulk_upsert import increment_rows
+from backend.db.models.prediction import Prediction
+from backend.db.models.stock_prediction_stats import StockPredictionStats
+
+
+logger = logging.getLogger(__name__)
+
+
+CONFIDENCE_BREAKDOWN_KEYS = ("similar_news_quality", "pattern_consistency", "disclosure_impact")
+PATTERN_ANALYSIS_KEYS = ("avg_1d", "avg_2d", "avg_3d", "avg_5d", "avg_10d", "avg_20d")
+
+# sentiment_direction → 집계 컬럼
+DIRECTION_COLUMNS = {
+    "positive": "positive_count",
+    "negative": "negative_count",
+    "neutral": "neutral_count",
+}
+
+COUNTER_COLUMNS = (
+    "prediction_count",
+    "positive_count",
+    "negative_count",
+    "neutral_count",
+    "sentiment_sum",
+    "sentiment_count",
+    *(f"{key}_{suffix}" for key in CONFIDENCE_BREAKDOWN_KEYS for suffix in ("sum", "count")),
+    *(f"pattern_{key}_{suffix}" for key in PATTERN_ANALYSIS_KEYS for suffix in ("sum", "count")),
+)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """JSON 값을 float로 변환 (문자열로 저장된 경우 포함, 변환 실패 시 None)"""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+class StockPredictionStatsDelta:
+    """한 트랜잭션의 종목별 예측 통계 증분 누적기"""
+
+    def __init__(self):
+        self._counters: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: dict.fromkeys(COUNTER_COLUMNS, 0)
+        )
+
+    def _apply(self, prediction: Prediction, sign: int) -> None:
+        counters = self._counters[prediction.stock_code]
+        counters["prediction_count"] += sign
+
+        direction_column = DIRECTION_COLUMNS.get(prediction.sentiment_direction)
+        if direction_column:
+            counters[direction_column] += sign
+
+        if prediction.sentiment_score is not None:
+            counters["sentiment_sum"] += sign * prediction.sentiment_score
+            counters["sentiment_count"] += sign
+
+        breakdown = prediction.confidence_breakdown or {}
+        for key in CONFIDENCE_BREAKDOWN_KEYS:
+            value = _to_float(breakdown.get(key))
+            if value is not None:
+                counters[f"{key}_sum"] += sign * value
+                counters[f"{key}_count"] += sign
+
+        pattern = prediction.pattern_analysis or {}
+        for key in PATTERN_ANALYSIS_KEYS:
+            value = _to_float(pattern.get(key))
+            # 0.0은 제외 (의미 없는 데이터)
+            if value is not None and value != 0.0:
+                counters[f"pattern_{key}_sum"] += sign * value
+                counters[f"pattern_{key}_count"] += sign
+
+    def add(self, prediction: Prediction) -> None:
+        """예측 추가분 반영"""
+        self._apply(prediction, 1)
+
+    def remove(self, prediction: Prediction) -> None:
+        """예측 삭제분(또는 수정 전 값) 반영"""
+        self._apply(prediction, -1)
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """변화가 있는 종목의 증분 행"""
+        now = datetime.now()
+        return [
+            {"stock_code": stock_code, **counters, "updated_at": now}
+            for stock_code, counters in self._counters.items()
+            if any(counters.values())
+        ]
+
+    def apply(self, db: Session) -> int:
+        """
+        누적 증분을 stock_prediction_stats에 반영 (커밋은 호출자)
+
+        Returns:
+            갱신된 종목 수
+        """
+        rows = self.rows()
+        if not rows:
+            return 0
+        return increment_rows(db, StockPredictionStats, rows, increment_columns=COUNTER_COLUMNS)
+
+
+def get_stock_prediction_stats(db: Session, stock_code: str) -> Dict[str, Any]:
+    """
+    종목의 예측 종합 통계를 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        stock_code: 종목 코드
+
+    Returns:
+        {
+            "direction_distribution": {"up", "down", "hold"},
+            "total_predictions": 방향이 있는 예측 수,
+            "avg_confidence": sentiment_score 평균을 0~1로 정규화한 값,
+            "confidence_breakdown_avg": {항목: 평균 (소수 1자리)},
+            "pattern_analysis_avg": {항목: 평균 (소수 2자리)},
+        }
+    """
+    stats = db.query(StockPredictionStats).filter(
+        StockPredictionStats.stock_code == stock_code
+    ).first()
+
+    def _count(column: str) -> int:
+        return int(getattr(stats, column) or 0) if stats else 0
+
+    def _average(prefix: str, digits: int) -> Optional[float]:
+        count = _count(f"{prefix}_count")
+        if count <= 0:
+            return None
+        return round(getattr(stats, f"{prefix}_sum") / count, digits)
+
+    direction_distribution = {
+        "up": _count("positive_count"),
+        "down": _count("negative_count"),
+        "hold": _count("neutral_count"),
+    }
+
+    # sentiment_score는 -1.0~1.0이므로 평균을 0~1로 정규화
+    sentiment_count = _count("sentiment_count")
+    avg_confidence = (
+        (stats.sentiment_sum / sentiment_count + 1) / 2 if sentiment_count > 0 else None
+    )
+
+    return {
+        "direction_distribution": direction_distribution,
+        "total_predictions": sum(direction_distribution.values()),
+        "avg_confidence": avg_confidence,
+        "confidence_breakdown_avg": {
+            key: _average(key, 1) for key in CONFIDENCE_BREAKDOWN_KEYS
+        },
+        "pattern_analysis_avg": {
+            key: _average(f"pattern_{key}", 2) for key in PATTERN_ANALYSIS_KEYS
+        },
+    }
+
+
+def rebuild_stock_prediction_stats(
+    db: Session,
+    stock_codes: Optional[Sequence[str]] = None,
+    batch_size: int = 1000,
+) -> int:
+    """
+    predictions에서 종목별 통계를 다시 계산합니다 (커밋은 호출자).
+
+    JSON 필드의 숫자 변환 규칙을 증분 갱신과 동일하게 맞추기 위해
+    필요한 컬럼만 스트리밍 조회하여 같은 누적기로 집계합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        stock_codes: 재계산할 종목 (None이면 전체)
+        batch_size: 스트리밍 조회 배치 크기
+
+    Returns:
+        저장된 종목 수
+    """
+    query = db.query(
+        Prediction.stock_code,
+        Prediction.sentiment_direction,
+        Prediction.sentiment_score,
+        Prediction.confidence_breakdown,
+        Prediction.pattern_analysis,
+    )
+    delete_query = db.query(StockPredictionStats)
+    if stock_codes is not None:
+        query = query.filter(Prediction.stock_code.in_(list(stock_codes)))
+        delete_query = delete_query.filter(StockPredictionStats.stock_code.in_(list(stock_codes)))
+
+    delta = StockPredictionStatsDelta()
+    for row in query.yield_per(batch_size):
+        delta.add(row)
+
+    delete_query.delete(synchronize_session=False)
+    count = delta.apply(db)
+
+    logger.info(f"📊 종목별 예측 통계 재계산: {count}개 종목")
+    return count
@@ -0,0 +1,490 @@
+"""
+기술적 지표 계산 서비스
+
+여러 종목의 기술적 지표(MA/RSI/볼린저 밴드/MACD/거래량/모멘텀)를
+한 번의 일봉 조회와 NumPy 행렬 연산으로 일괄 계산합니다.
+
+- 종목 × 일자 행렬(최신 일자가 마지막 열, 데이터가 부족한 종목은 왼쪽을 NaN으로 채움)
+- 이동평균/표준편차: 마지막 N열 슬라이스에 대한 벡터 연산
+- EMA/MACD/RSI: 시간축 한 번 순회 (모든 종목 동시 계산, O(일수))
+"""
+import logging
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend.db.models.stock import Stock, StockPrice
+from backend.db.session import SessionLocal
+
+
+logger = logging.getLogger(__name__)
+
+
+# 조회 일수 (MA60 계산용)
+LOOKBACK_DAYS = 60
+
+# 지표 파라미터
+MIN_DAYS = 5
+RSI_PERIOD = 14
+BB_PERIOD = 20
+BB_STD_MULTIPLIER = 2
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+
+
+def _ema_matrix(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    행별 지수이동평균(EMA) 계산
+
+    각 행의 첫 유효값을 시드로 사용하며, NaN 구간은 그대로 유지합니다.
+
+    Args:
+        values: (종목 수, 일수) 행렬
+        period: EMA 기간
+
+    Returns:
+        같은 shape의 EMA 행렬
+    """
+    multiplier = 2 / (period + 1)
+    result = np.full(values.shape, np.nan)
+    ema = np.full(values.shape[0], np.nan)
+
+    for t in range(values.shape[1]):
+        column = values[:, t]
+        ema = np.where(np.isnan(ema), column, ema + (column - ema) * multiplier)
+        result[:, t] = ema
+
+    return result
+
+
+def _wilder_rsi_matrix(closes: np.ndarray, period: int = RSI_PERIOD) -> np.ndarray:
+    """
+    행별 Wilder RSI 계산
+
+    첫 period개 변화량은 단순 평균, 이후는 Wilder 평활
+    (avg = avg + (x - avg) / period)을 적용합니다.
+
+    Args:
+        closes: 종가 행렬 (종목 수, 일수)
+        period: RSI 기간
+
+    Returns:
+        (종목 수,) RSI 배열 (변화량이 period개 미만이면 NaN)
+    """
+    deltas = np.diff(closes, axis=1)
+    avg_gain = np.zeros(closes.shape[0])
+    avg_loss = np.zeros(closes.shape[0])
+    seen = np.zeros(closes.shape[0])
+
+    for t in range(deltas.shape[1]):
+        delta = deltas[:, t]
+        valid = ~np.isnan(delta)
+        seen = seen + valid
+        divisor = np.maximum(np.minimum(seen, period), 1)
+        gain = np.where(valid, np.clip(delta, 0, None), 0.0)
+        loss = np.where(valid, np.clip(-delta, 0, None), 0.0)
+        avg_gain = np.where(valid, avg_gain + (gain - avg_gain) / divisor, avg_gain)
+        avg_loss = np.where(valid, avg_loss + (loss - avg_loss) / divisor, avg_loss)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(avg_loss == 0, 100.0, 100 - (100 / (1 + avg_gain / avg_loss)))
+    return np.where(seen >= period, rsi, np.nan)
+
+
+def _tail_mean(values: np.ndarray, counts: np.ndarray, window: int) -> np.ndarray:
+    """마지막 window열 평균 (데이터가 window일 미만이면 NaN)"""
+    means = values[:, -window:].mean(axis=1)
+    return np.where(counts >= window, means, np.nan)
+
+
+def _change_pct(closes: np.ndarray, counts: np.ndarray, days: int) -> np.ndarray:
+    """N일 전 대비 수익률 (%) - 데이터가 부족하면 0.0"""
+    if closes.shape[1] <= days:
+        return np.zeros(closes.shape[0])
+
+    current = closes[:, -1]
+    previous = closes[:, -1 - days]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        changes = (current - previous) / previous * 100
+    return np.where((counts > days) & np.isfinite(changes), changes, 0.0)
+
+
+def calculate_indicator_matrix(
+    closes: np.ndarray,
+    volumes: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    종목 × 일자 행렬로부터 모든 기술적 지표를 일괄 계산합니다.
+
+    Args:
+        closes: 종가 행렬 (종목 수, 일수), 오래된 일자 → 최신 일자 순, 부족분은 왼쪽 NaN
+        volumes: 거래량 행렬 (같은 shape), 거래량 없음(None/0)은 NaN
+
+    Returns:
+        지표명 → (종목 수,) 배열 딕셔너리
+    """
+    counts = np.sum(~np.isnan(closes), axis=1)
+    current_price = closes[:, -1]
+
+    # 1. 이동평균선
+    ma5 = _tail_mean(closes, counts, 5)
+    ma20 = _tail_mean(closes, counts, 20)
+    ma60 = _tail_mean(closes, counts, 60)
+
+    # 2. 거래량 (20일 평균, 거래량 없는 날 제외)
+    volume_tail = volumes[:, -20:]
+    volume_days = np.sum(~np.isnan(volume_tail), axis=1)
+    avg_volume_20d = np.where(volume_days > 0, np.nansum(volume_tail, axis=1) / np.maximum(volume_days, 1), 0.0)
+
+    # 3. 가격 모멘텀
+    change_1d = _change_pct(closes, counts, 1)
+    change_5d = _change_pct(closes, counts, 5)
+    change_20d = _change_pct(closes, counts, 20)
+
+    # 4. RSI (14일, Wilder 평활)
+    rsi = _wilder_rsi_matrix(closes)
+
+    # 5. 볼린저 밴드 (20일, 2 표준편차)
+    std_20d = np.where(counts >= BB_PERIOD, closes[:, -BB_PERIOD:].std(axis=1), np.nan)
+    bb_upper = ma20 + BB_STD_MULTIPLIER * std_20d
+    bb_lower = ma20 - BB_STD_MULTIPLIER * std_20d
+
+    # 6. MACD (12, 26, 9)
+    ema_fast = _ema_matrix(closes, MACD_FAST)
+    ema_slow = _ema_matrix(closes, MACD_SLOW)
+    macd_series = ema_fast - ema_slow
+
+    # 26일 이상 누적된 구간만 MACD 값으로 인정
+    positions = np.arange(closes.shape[1])
+    first_valid = closes.shape[1] - counts
+    macd_series[positions[None, :] < (first_valid + MACD_SLOW - 1)[:, None]] = np.nan
+
+    signal_series = _ema_matrix(macd_series, MACD_SIGNAL)
+    macd_line = np.where(counts >= MACD_SLOW, macd_series[:, -1], np.nan)
+    macd_signal = np.where(counts >= MACD_SLOW + MACD_SIGNAL - 1, signal_series[:, -1], np.nan)
+
+    return {
+        "count": counts,
+        "current_price": current_price,
+        "ma5": ma5,
+        "ma20": ma20,
+        "ma60": ma60,
+        "avg_volume_20d": avg_volume_20d,
+        "change_1d": change_1d,
+        "change_5d": change_5d,
+        "change_20d": change_20d,
+        "rsi": rsi,
+        "bb_upper": bb_upper,
+        "bb_middle": np.where(np.isnan(std_20d), np.nan, ma20),
+        "bb_lower": bb_lower,
+        "macd_line": macd_line,
+        "macd_signal": macd_signal,
+        "macd_histogram": macd_line - macd_signal,
+    }
+
+
+def _value(array: np.ndarray, index: int) -> Optional[float]:
+    """NaN을 None으로 변환하여 float 반환"""
+    value = array[index]
+    return None if np.isnan(value) else float(value)
+
+
+def matrix_row(matrix: Dict[str, np.ndarray], index: int) -> Dict[str, Optional[float]]:
+    """행렬 계산 결과에서 한 종목의 지표 값을 추출합니다 (NaN → None)"""
+    return {key: _value(array, index) for key, array in matrix.items()}
+
+
+def _round(value: Optional[float], digits: int = 2) -> Optional[float]:
+    """None-safe 반올림"""
+    return round(value, digits) if value is not None else None
+
+
+def _diff_pct(current: float, base: Optional[float]) -> Optional[float]:
+    """현재가 대비 비율 (%)"""
+    if not base:
+        return None
+    return (current - base) / base * 100
+
+
+def format_indicators(
+    values: Dict[str, Optional[float]],
+    current_volume: int,
+) -> Dict[str, Any]:
+    """
+    지표 값으로부터 종목의 지표 딕셔너리를 구성합니다.
+
+    StockPredictor._build_prompt 및 InvestmentReportGenerator가 사용하는
+    기존 딕셔너리 구조를 그대로 유지합니다.
+
+    Args:
+        values: calculate_indicator_matrix()의 키와 같은 스칼라 값 딕셔너리
+        current_volume: 최신 거래량
+    """
+    current_price = values["current_price"]
+
+    # 1. 이동평균선
+    ma5 = values["ma5"]
+    ma20 = values["ma20"]
+    ma60 = values["ma60"]
+
+    ma_trend = "중립"
+    if ma5 and ma20 and ma60:
+        if ma5 > ma20 > ma60 and current_price > ma5:
+            ma_trend = "강세"
+        elif ma5 < ma20 < ma60 and current_price < ma5:
+            ma_trend = "약세"
+
+    # 2. 거래량
+    avg_volume_20d = values["avg_volume_20d"] or 0.0
+    volume_ratio = ((current_volume - avg_volume_20d) / avg_volume_20d * 100) if avg_volume_20d > 0 else 0
+
+    volume_trend = "보통"
+    if volume_ratio > 50:
+        volume_trend = "급증"
+    elif volume_ratio < -30:
+        volume_trend = "저조"
+
+    # 3. 가격 모멘텀
+    change_1d = values["change_1d"] or 0.0
+    change_5d = values["change_5d"] or 0.0
+    change_20d = values["change_20d"] or 0.0
+
+    momentum_trend = "보합"
+    if change_1d > 0 and change_5d > 0 and change_20d > 0:
+        momentum_trend = "상승세"
+    elif change_1d < 0 and change_5d < 0 and change_20d < 0:
+        momentum_trend = "하락세"
+
+    # 4. RSI
+    rsi = values["rsi"]
+    rsi_signal = "중립"
+    if rsi is not None:
+        if rsi >= 70:
+            rsi_signal = "과매수"
+        elif rsi <= 30:
+            rsi_signal = "과매도"
+
+    # 5. 볼린저 밴드
+    bb_upper = values["bb_upper"]
+    bb_middle = values["bb_middle"]
+    bb_lower = values["bb_lower"]
+    bb_position = "중립"
+    percent_b = None
+    if bb_upper is not None and bb_lower is not None:
+        if current_price >= bb_upper:
+            bb_position = "상단돌파"
+        elif current_price <= bb_lower:
+            bb_position = "하단돌파"
+        elif current_price > bb_middle:
+            bb_position = "상단근접"
+        else:
+            bb_position = "하단근접"
+
+        if bb_upper > bb_lower:
+            percent_b = (current_price - bb_lower) / (bb_upper - bb_lower)
+
+    # 6. MACD
+    macd_line = values["macd_line"]
+    macd_signal = values["macd_signal"]
+    macd_histogram = values["macd_histogram"]
+    macd_trend = "중립"
+    if macd_histogram is not None:
+        if macd_histogram > 0:
+            macd_trend = "매수신호"
+        elif macd_histogram < 0:
+            macd_trend = "매도신호"
+
+    return {
+        "moving_averages": {
+            "ma5": _round(ma5),
+            "ma20": _round(ma20),
+            "ma60": _round(ma60),
+            "current_vs_ma5": _round(_diff_pct(current_price, ma5)),
+            "current_vs_ma20": _round(_diff_pct(current_price, ma20)),
+            "current_vs_ma60": _round(_diff_pct(current_price, ma60)),
+            "trend": ma_trend,
+        },
+        "volume_analysis": {
+            "current_volume": current_volume,
+            "avg_volume_20d": round(avg_volume_20d, 0) if avg_volume_20d else 0,
+            "volume_ratio": round(volume_ratio, 2),
+            "trend": volume_trend,
+        },
+        "price_momentum": {
+            "change_1d": round(change_1d, 2),
+            "change_5d": round(change_5d, 2),
+            "change_20d": round(change_20d, 2),
+            "trend": momentum_trend,
+        },
+        "rsi": {
+            "value": _round(rsi),
+            "signal": rsi_signal,
+        },
+        "bollinger_bands": {
+            "upper": _round(bb_upper),
+            "middle": _round(bb_middle),
+            "lower": _round(bb_lower),
+            "percent_b": _round(percent_b),
+            "position": bb_position,
+        },
+        "macd": {
+            "macd_line": _round(macd_line),
+            "signal_line": _round(macd_signal),
+            "histogram": _round(macd_histogram),
+            "trend": macd_trend,
+        },
+    }
+
+
+def build_price_matrix(
+    rows: Iterable[Tuple[str, float, Optional[int]]],
+    lookback: int = LOOKBACK_DAYS,
+) -> Tuple[List[str], np.ndarray, np.ndarray, Dict[str, int]]:
+    """
+    (종목코드, 종가, 거래량) 행을 종목 × 일자 행렬로 변환합니다.
+
+    Args:
+        rows: 종목코드별로 묶이고 일자 오름차순으로 정렬된 행
+        lookback: 행렬 열 수 (최근 N일)
+
+    Returns:
+        (종목코드 리스트, 종가 행렬, 거래량 행렬, 종목별 최신 거래량)
+    """
+    series: Dict[str, Tuple[List[float], List[Optional[int]]]] = {}
+    for stock_code, close, volume in rows:
+        closes, volumes = series.setdefault(stock_code, ([], []))
+        closes.append(close)
+        volumes.append(volume)
+
+    codes = list(series.keys())
+    close_matrix = np.full((len(codes), lookback), np.nan)
+    volume_matrix = np.full((len(codes), lookback), np.nan)
+    current_volumes: Dict[str, int] = {}
+
+    for i, stock_code in enumerate(codes):
+        closes, volumes = series[stock_code]
+        closes = closes[-lookback:]
+        volumes = volumes[-lookback:]
+
+        close_matrix[i, lookback - len(closes):] = closes
+        volume_matrix[i, lookback - len(volumes):] = [v if v else np.nan for v in volumes]
+        current_volumes[stock_code] = volumes[-1] or 0
+
+    return codes, close_matrix, volume_matrix, current_volumes
+
+
+def fetch_recent_prices(
+    db: Session,
+    stock_codes: List[str],
+    lookback: int = LOOKBACK_DAYS,
+) -> List[Tuple[str, Any, float, Optional[int]]]:
+    """
+    종목별 최근 N일 일봉을 단일 쿼리로 조회합니다.
+
+    Args:
+        db: Database session
+        stock_codes: 종목 코드 리스트
+        lookback: 종목별 조회 일수
+
+    Returns:
+        (종목코드, 일자, 종가, 거래량) 리스트 (종목코드, 일자 오름차순)
+    """
+    # 종목별 최근 N일만 남기는 윈도우 함수 쿼리 (1회 왕복)
+    ranked = (
+        db.query(
+            StockPrice.stock_code.label("stock_code"),
+            StockPrice.date.label("date"),
+            StockPrice.close.label("close"),
+            StockPrice.volume.label("volume"),
+            func.row_number().over(
+                partition_by=StockPrice.stock_code,
+                order_by=StockPrice.date.desc(),
+            ).label("rn"),
+        )
+        .filter(StockPrice.stock_code.in_(stock_codes))
+        .subquery()
+    )
+
+    return (
+        db.query(ranked.c.stock_code, ranked.c.date, ranked.c.close, ranked.c.volume)
+        .filter(ranked.c.rn <= lookback)
+        .order_by(ranked.c.stock_code, ranked.c.date)
+        .all()
+    )
+
+
+def load_technical_indicators(
+    db: Session,
+    stock_codes: Optional[Iterable[str]] = None,
+    lookback: int = LOOKBACK_DAYS,
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    여러 종목의 기술적 지표를 단일 쿼리로 조회하여 일괄 계산합니다.
+
+    Args:
+        db: Database session
+        stock_codes: 대상 종목 코드 (None이면 활성 종목 전체)
+        lookback: 종목별 조회 일수
+
+    Returns:
+        {종목코드: 지표 딕셔너리 또는 None (데이터 부족)}
+    """
+    if stock_codes is None:
+        stock_codes = [code for (code,) in db.query(Stock.code).filter(Stock.is_active == True).all()]
+    stock_codes = sorted({code for code in stock_codes if code})
+
+    if not stock_codes:
+        return {}
+
+    rows = fetch_recent_prices(db, stock_codes, lookback)
+
+    results: Dict[str, Optional[Dict[str, Any]]] = {code: None for code in stock_codes}
+
+    codes, closes, volumes, current_volumes = build_price_matrix(
+        [(stock_code, close, volume) for stock_code, _, close, volume in rows], lookback
+    )
+    if not codes:
+        return results
+
+    matrix = calculate_indicator_matrix(closes, volumes)
+
+    for i, stock_code in enumerate(codes):
+        count = int(matrix["count"][i])
+        if count < MIN_DAYS:
+            logger.warning(f"기술적 지표 계산 불가: {stock_code} - 데이터 부족 ({count}일)")
+            continue
+        results[stock_code] = format_indicators(matrix_row(matrix, i), current_volumes[stock_code])
+
+    logger.debug(f"기술적 지표 일괄 계산 완료: {len(codes)}개 종목")
+    return results
+
+
+def get_technical_indicators(
+    stock_code: str,
+    db: Optional[Session] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    단일 종목의 기술적 지표를 계산합니다.
+
+    Args:
+        stock_code: 종목 코드
+        db: Database session (None이면 내부에서 생성)
+
+    Returns:
+        기술적 지표 딕셔너리 또는 None
+    """
+    own_session = db is None
+    if own_session:
+        db = SessionLocal()
+
+    try:
+        return load_technical_indicators(db, [stock_code]).get(stock_code)
+    except Exception as e:
+        logger.error(f"기술적 지표 계산 실패 (종목코드: {stock_code}): {e}")
+        return None
+    finally:
+        if own_session:
+            db.close()
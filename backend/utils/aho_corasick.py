@@ -0,0 +1,98 @@
+"""
+Aho–Corasick 다중 문자열 검색
+
+여러 패턴(예: 종목명 수천 개)을 하나의 오토마톤으로 컴파일하여
+텍스트를 한 번만 훑으면서 모든 패턴의 출현 위치를 찾습니다.
+검색 비용은 패턴 수와 무관하게 텍스트 길이 + 매칭 수에 비례합니다.
+"""
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class AhoCorasick:
+    """컴파일된 Aho–Corasick 오토마톤 (불변, 스레드 간 공유 가능)"""
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Args:
+            patterns: 검색할 패턴 (빈 문자열/중복은 무시)
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 상태별 이 위치에서 끝나는 패턴 (길이, 패턴) - 실패 링크 경유분 포함
+        self._outputs: List[Tuple[Tuple[int, str], ...]] = [()]
+        self.patterns: List[str] = []
+
+        outputs: List[List[Tuple[int, str]]] = [[]]
+        for pattern in dict.fromkeys(patterns):
+            if not pattern:
+                continue
+            self.patterns.append(pattern)
+
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                state = next_state
+            outputs[state].append((len(pattern), pattern))
+
+        # BFS로 실패 링크 계산 (부모의 실패 링크를 따라 같은 문자 전이를 찾음)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                outputs[next_state].extend(outputs[self._fail[next_state]])
+
+        self._outputs = [tuple(sorted(output, reverse=True)) for output in outputs]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """
+        모든 매칭 (겹침 포함)
+
+        Yields:
+            (시작 위치, 끝 위치(미포함), 패턴) - 끝 위치 오름차순, 같은 끝 위치는 긴 패턴 먼저
+        """
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, pattern in outputs[state]:
+                yield index - length + 1, index + 1, pattern
+
+    def find_longest(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        겹치지 않는 최장 매칭 (왼쪽 우선, 같은 시작 위치는 가장 긴 패턴)
+
+        예: 패턴 {"LG", "LG화학"}, 텍스트 "LG화학과 LG" → [(0, 4, "LG화학"), (6, 8, "LG")]
+
+        Returns:
+            (시작 위치, 끝 위치(미포함), 패턴) 리스트 (위치 순)
+        """
+        matches = sorted(self.iter_matches(text), key=lambda match: (match[0], -match[1]))
+
+        selected = []
+        last_end = 0
+        for start, end, pattern in matches:
+            if start >= last_end:
+                selected.append((start, end, pattern))
+                last_end = end
+        return selected
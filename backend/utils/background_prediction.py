@@ -12,6 +12,7 @@ from backend.db.session import SessionLocal
 from backend.db.models.news import NewsArticle
 from backend.db.models.prediction import Prediction
 from backend.llm.predictor import get_predictor
+from backend.llm.prompt_context import get_prompt_context_loader
 from backend.llm.vector_search import get_vector_search
 from backend.utils.prediction_status import get_tracker
 
@@ -77,6 +78,10 @@ def _generate_predictions_worker(news_id: int, model_ids: List[int], task_id: Op
             "stock_code": news.stock_code,
         }
 
+        # 프롬프트는 모델과 무관하므로 컨텍스트 조회(같은 세션)와 생성은 1회만 수행
+        prompt_context = get_prompt_context_loader().load([news.stock_code], db)
+        prompt = None
+
         # 각 모델별로 예측 생성
         for model_id in model_ids:
             # 이미 예측이 있는지 확인
@@ -96,12 +101,15 @@ def _generate_predictions_worker(news_id: int, model_ids: List[int], task_id: Op
                     logger.warning(f"모델을 찾을 수 없음: model_id={model_id}")
                     continue
 
+                if prompt is None:
+                    prompt = predictor._build_prompt(current_news_data, similar_news, prompt_context)
+
                 # _predict_with_model() 호출 시 올바른 파라미터 전달
                 prediction_data = predictor._predict_with_model(
                     client=model_info["client"],
                     model_name=model_info["model_identifier"],
                     provider=model_info["provider"],
-                    prompt=predictor._build_prompt(current_news_data, similar_news),
+                    prompt=prompt,
                     similar_count=len(similar_news),
                 )
 
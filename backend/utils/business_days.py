@@ -1,36 +1,21 @@
 """
 영업일 계산 유틸리티
 
-한국 주식 시장의 영업일(평일)을 계산합니다.
+한국 주식 시장의 영업일(거래일)을 계산합니다.
+계산은 모두 KRX 거래일 달력(trading_calendar.TradingCalendar)에 위임합니다.
 """
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional, List
 
+from backend.utils.trading_calendar import (
+    TradingCalendar,
+    get_trading_calendar,
+    get_weekday_calendar,
+)
 
-# 한국 주식시장 영업일 (월~금)
-BUSINESS_WEEKDAYS = [0, 1, 2, 3, 4]  # Monday=0, Friday=4
-
-# 한국 공휴일 (추후 확장)
-# 2025년 공휴일 리스트 (예시)
-HOLIDAYS_2025: List[str] = [
-    "2025-01-01",  # 신정
-    "2025-01-28",  # 설날 연휴
-    "2025-01-29",  # 설날
-    "2025-01-30",  # 설날 연휴
-    "2025-03-01",  # 삼일절
-    "2025-03-03",  # 대체공휴일 (삼일절)
-    "2025-05-05",  # 어린이날
-    "2025-05-06",  # 대체공휴일 (어린이날)
-    "2025-06-06",  # 현충일
-    "2025-08-15",  # 광복절
-    "2025-09-06",  # 추석 연휴
-    "2025-09-07",  # 추석 연휴
-    "2025-09-08",  # 추석
-    "2025-09-09",  # 추석 연휴
-    "2025-10-03",  # 개천절
-    "2025-10-09",  # 한글날
-    "2025-12-25",  # 크리스마스
-]
+
+def _calendar(include_holidays: bool) -> TradingCalendar:
+    return get_trading_calendar() if include_holidays else get_weekday_calendar()
 
 
 def get_holidays(year: Optional[int] = None) -> List[datetime]:
@@ -41,17 +26,16 @@ def get_holidays(year: Optional[int] = None) -> List[datetime]:
         year: 연도 (기본값: 현재 연도)
 
     Returns:
-        datetime 객체 리스트
+        datetime 객체 리스트 (KRX 휴장일 데이터가 없는 연도는 빈 리스트)
     """
     if year is None:
         year = datetime.now().year
 
-    # 현재는 2025년만 지원
-    if year == 2025:
-        return [datetime.strptime(date, "%Y-%m-%d") for date in HOLIDAYS_2025]
-    else:
-        # 다른 연도는 빈 리스트 반환 (추후 확장)
-        return []
+    return [
+        datetime(day.year, day.month, day.day)
+        for day in sorted(get_trading_calendar().holidays)
+        if day.year == year
+    ]
 
 
 def is_business_day(dt: Optional[datetime] = None, include_holidays: bool = True) -> bool:
@@ -81,20 +65,7 @@ def is_business_day(dt: Optional[datetime] = None, include_holidays: bool = True
     if dt is None:
         dt = datetime.now()
 
-    # 주말 체크
-    if dt.weekday() not in BUSINESS_WEEKDAYS:
-        return False
-
-    # 공휴일 체크
-    if include_holidays:
-        holidays = get_holidays(dt.year)
-        # 날짜 부분만 비교
-        dt_date = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-        for holiday in holidays:
-            if dt_date.date() == holiday.date():
-                return False
-
-    return True
+    return _calendar(include_holidays).is_session(dt)
 
 
 def get_next_business_day(
@@ -123,23 +94,7 @@ def get_next_business_day(
     if dt is None:
         dt = datetime.now()
 
-    # 시간 정보 제거 (날짜만)
-    current_date = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-    business_days_counted = 0
-
-    # 다음 날부터 시작
-    next_date = current_date + timedelta(days=1)
-
-    # N 영업일을 찾을 때까지 반복
-    while business_days_counted < skip_days:
-        if is_business_day(next_date, include_holidays=include_holidays):
-            business_days_counted += 1
-
-        # 아직 N 영업일에 도달하지 못했으면 다음 날로
-        if business_days_counted < skip_days:
-            next_date += timedelta(days=1)
-
-    return next_date
+    return _calendar(include_holidays).add_sessions(dt, skip_days)
 
 
 def add_business_days(
@@ -171,25 +126,7 @@ def add_business_days(
     if days == 0:
         return dt
 
-    # 양수: 미래로
-    if days > 0:
-        return get_next_business_day(dt, skip_days=days, include_holidays=include_holidays)
-
-    # 음수: 과거로
-    current_date = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-    business_days_counted = 0
-
-    prev_date = current_date - timedelta(days=1)
-
-    # N 영업일을 찾을 때까지 반복
-    while business_days_counted < abs(days):
-        if is_business_day(prev_date, include_holidays=include_holidays):
-            business_days_counted += 1
-
-        if business_days_counted < abs(days):
-            prev_date -= timedelta(days=1)
-
-    return prev_date
+    return _calendar(include_holidays).add_sessions(dt, days)
 
 
 def get_business_days_between(
@@ -214,18 +151,4 @@ def get_business_days_between(
         ... )
         1
     """
-    start = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-    end = end_date.replace(hour=0, minute=0, second=0, microsecond=0)
-
-    if start >= end:
-        return 0
-
-    business_days = 0
-    current = start + timedelta(days=1)
-
-    while current <= end:
-        if is_business_day(current, include_holidays=include_holidays):
-            business_days += 1
-        current += timedelta(days=1)
-
-    return business_days
+    return _calendar(include_holidays).sessions_between(start_date, end_date)
@@ -2,15 +2,22 @@
 뉴스 중복 검사 유틸리티
 
 제목 유사도 기반으로 중복 뉴스를 필터링합니다.
+
+최근 제목은 MinHash/LSH 인덱스(메모리)에 유지하며, 검사할 때마다
+DB 전체를 읽지 않고 새로 저장된 뉴스(ID 워터마크 이후)만 추가로 반영합니다.
+SequenceMatcher 유사도는 LSH 후보에 대해서만 계산합니다.
 """
 import logging
+import threading
 from typing import List
 from difflib import SequenceMatcher
 from datetime import datetime, timedelta
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from backend.db.models.news import NewsArticle
+from backend.utils.minhash_index import MinHashLSHIndex
 
 
 logger = logging.getLogger(__name__)
@@ -19,15 +26,27 @@ logger = logging.getLogger(__name__)
 class NewsDuplicator:
     """뉴스 중복 검사 클래스"""
 
-    def __init__(self, similarity_threshold: float = 0.8, lookback_hours: int = 24):
+    def __init__(
+        self,
+        similarity_threshold: float = 0.8,
+        lookback_hours: int = 24,
+        num_perm: int = 96,
+        bands: int = 32,
+    ):
         """
         Args:
             similarity_threshold: 중복 판정 유사도 임계값 (0.0 ~ 1.0)
             lookback_hours: 중복 검사 대상 시간 범위 (시간 단위)
+            num_perm: MinHash 순열 수
+            bands: LSH band 수 (후보 선정 민감도, 클수록 후보가 많아짐)
         """
         self.similarity_threshold = similarity_threshold
         self.lookback_hours = lookback_hours
 
+        self.index = MinHashLSHIndex(num_perm=num_perm, bands=bands)
+        self._last_id: int | None = None  # DB 동기화 워터마크 (None이면 미적재)
+        self._sync_lock = threading.Lock()
+
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """
         두 텍스트의 유사도를 계산합니다.
@@ -59,8 +78,13 @@ class NewsDuplicator:
         Returns:
             중복 여부 (True: 중복, False: 중복 아님)
         """
-        similarity = self.calculate_similarity(title1, title2)
-        return similarity >= self.similarity_threshold
+        matcher = SequenceMatcher(None, title1, title2)
+        # 상한값(real_quick_ratio ≥ quick_ratio ≥ ratio)으로 명백한 비중복을 먼저 걸러냄
+        if matcher.real_quick_ratio() < self.similarity_threshold:
+            return False
+        if matcher.quick_ratio() < self.similarity_threshold:
+            return False
+        return matcher.ratio() >= self.similarity_threshold
 
     def get_recent_news_titles(self, db: Session) -> List[tuple[int, str]]:
         """
@@ -82,10 +106,62 @@ class NewsDuplicator:
 
         return [(news.id, news.title) for news in recent_news]
 
+    def sync_index(self, db: Session) -> int:
+        """
+        제목 인덱스를 DB와 동기화합니다.
+
+        최초 호출 시 최근 lookback_hours 시간의 제목을 적재하고,
+        이후에는 마지막으로 반영한 ID 이후 뉴스만 추가합니다 (다른 프로세스 저장분 포함).
+        시간 범위를 벗어난 제목은 인덱스에서 제거합니다.
+
+        Args:
+            db: 데이터베이스 세션
+
+        Returns:
+            새로 추가된 제목 수
+        """
+        cutoff_time = datetime.now() - timedelta(hours=self.lookback_hours)
+
+        with self._sync_lock:
+            query = db.query(NewsArticle.id, NewsArticle.title, NewsArticle.created_at)
+            if self._last_id is None:
+                query = query.filter(NewsArticle.created_at >= cutoff_time)
+                last_id = db.query(func.max(NewsArticle.id)).scalar() or 0
+            else:
+                query = query.filter(NewsArticle.id > self._last_id)
+                last_id = self._last_id
+
+            added = 0
+            for news in query.order_by(NewsArticle.id).all():
+                last_id = max(last_id, news.id)
+                if news.created_at >= cutoff_time:
+                    self.index.add(news.id, news.title, news.created_at)
+                    added += 1
+
+            if self._last_id is None:
+                logger.info(f"제목 중복 인덱스 적재: 최근 {self.lookback_hours}시간 {added}건")
+            self._last_id = last_id
+            self.index.expire(cutoff_time)
+
+        return added
+
+    def register(self, news_id: int, title: str, created_at: datetime | None = None) -> None:
+        """
+        저장된 뉴스 제목을 인덱스에 추가합니다 (저장 직후 호출).
+
+        Args:
+            news_id: 뉴스 ID
+            title: 제목
+            created_at: 생성 시각 (기본: 현재)
+        """
+        self.index.add(news_id, title, created_at or datetime.now())
+
     def find_duplicate_in_db(self, title: str, db: Session) -> tuple[bool, int | None]:
         """
         데이터베이스에서 중복 뉴스를 찾습니다.
 
+        LSH 후보에 대해서만 유사도를 계산합니다.
+
         Args:
             title: 검사할 뉴스 제목
             db: 데이터베이스 세션
@@ -94,9 +170,9 @@ class NewsDuplicator:
             (중복 여부, 중복 뉴스 ID) 튜플
             중복이 아니면 (False, None) 반환
         """
-        recent_news = self.get_recent_news_titles(db)
+        self.sync_index(db)
 
-        for news_id, existing_title in recent_news:
+        for news_id, existing_title in self.index.candidates(title):
             if self.is_duplicate(title, existing_title):
                 logger.info(
                     f"중복 뉴스 발견 (유사도: {self.calculate_similarity(title, existing_title):.2f})"
@@ -4,7 +4,7 @@
 유사한 뉴스를 임베딩 유사도로 판별하여 중복 예측 및 알림을 방지합니다.
 """
 import logging
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 from sqlalchemy.orm import Session
@@ -59,12 +59,13 @@ class EmbeddingDeduplicator:
             - similarity: 유사도 점수
         """
         try:
-            # 1. 최근 뉴스 중 유사도가 높은 뉴스 검색
+            # 1. 최근 뉴스 중 유사도가 높은 뉴스 검색 (비교 기간 이내만, 핫 캐시 사용 가능)
             similar_news = self.vector_search.search_similar_news(
                 news_text=news_text,
                 stock_code=stock_code,
                 top_k=3,  # 상위 3개만 확인
                 similarity_threshold=self.medium_similarity_threshold,
+                max_age_hours=self.lookback_hours,
             )
 
             if not similar_news:
@@ -140,37 +141,87 @@ class EmbeddingDeduplicator:
             - similar_news_id: 유사 뉴스 ID
             - similarity: 유사도 점수
         """
+        candidates = self.find_notification_candidates(news_text, stock_code)
+        return self.check_recent_notification(candidates, stock_code, db, notification_lookback_hours)
+
+    def find_notification_candidates(
+        self,
+        news_text: str,
+        stock_code: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        알림 중복 후보(높은 유사도의 과거 뉴스)를 검색합니다.
+
+        Args:
+            news_text: 뉴스 텍스트 (제목 + 내용)
+            stock_code: 종목 코드
+
+        Returns:
+            유사 뉴스 리스트 [{"news_id", "similarity", ...}] (실패 시 빈 리스트)
+        """
         try:
-            # 1. 최근 알림 전송된 뉴스 중 유사도가 높은 뉴스 검색
-            similar_news = self.vector_search.search_similar_news(
+            return self.vector_search.search_similar_news(
                 news_text=news_text,
                 stock_code=stock_code,
                 top_k=3,
                 similarity_threshold=self.high_similarity_threshold,
             )
+        except Exception as e:
+            logger.error(f"알림 중복 후보 검색 실패: {e}", exc_info=True)
+            return []
 
-            if not similar_news:
-                return False, None, None
+    def select_notification_candidates(self, similar_news: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        이미 검색된 유사 뉴스(유사도 내림차순)에서 알림 중복 후보를 고릅니다.
 
-            # 2. 최근 알림 전송된 뉴스인지 확인
+        find_notification_candidates와 같은 기준(높은 유사도, 상위 3건)이므로
+        배치 검색 결과를 재사용할 때 별도 검색이 필요 없습니다.
+        """
+        return [
+            similar for similar in similar_news
+            if similar["similarity"] >= self.high_similarity_threshold
+        ][:3]
+
+    def check_recent_notification(
+        self,
+        candidates: List[Dict[str, Any]],
+        stock_code: str,
+        db: Session,
+        notification_lookback_hours: int = 4,
+    ) -> Tuple[bool, Optional[int], Optional[float]]:
+        """
+        중복 후보 중 최근 알림이 전송된 뉴스가 있는지 확인합니다.
+
+        Args:
+            candidates: find_notification_candidates 결과
+            stock_code: 종목 코드 (로그용)
+            db: 데이터베이스 세션
+            notification_lookback_hours: 최근 몇 시간 내 알림과 비교할지
+
+        Returns:
+            (should_skip, similar_news_id, similarity) 튜플
+        """
+        if not candidates:
+            return False, None, None
+
+        try:
             cutoff_time = datetime.utcnow() - timedelta(hours=notification_lookback_hours)
 
-            for similar in similar_news:
+            # 최근 알림 전송된 후보 일괄 조회
+            notified_ids = {
+                row.id
+                for row in db.query(NewsArticle.id).filter(
+                    NewsArticle.id.in_([similar["news_id"] for similar in candidates]),
+                    NewsArticle.notified_at.isnot(None),
+                    NewsArticle.notified_at >= cutoff_time,
+                ).all()
+            }
+
+            for similar in candidates:
                 news_id = similar["news_id"]
                 similarity = similar["similarity"]
 
-                # 최근 알림 전송된 뉴스 조회
-                notified_news = (
-                    db.query(NewsArticle)
-                    .filter(
-                        NewsArticle.id == news_id,
-                        NewsArticle.notified_at.isnot(None),
-                        NewsArticle.notified_at >= cutoff_time,
-                    )
-                    .first()
-                )
-
-                if notified_news and similarity >= self.high_similarity_threshold:
+                if news_id in notified_ids and similarity >= self.high_similarity_threshold:
                     logger.info(
                         f"🔕 유사 뉴스 알림 이력 존재 (유사도={similarity:.3f}) "
                         f"→ 알림 skip (뉴스 ID={news_id}, 종목={stock_code})"
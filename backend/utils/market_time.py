@@ -6,15 +6,21 @@
 from datetime import datetime, time
 from pytz import timezone
 
+from backend.utils.trading_calendar import get_trading_calendar
+
 
 def get_market_phase() -> str:
-    """현재 한국 증시 단계 반환
+    """현재 한국 증시 단계 반환 (주말/휴장일은 종일 after_hours)
     
     Returns:
         str: pre_market | market_open | trading | market_close | after_hours
     """
     kst = timezone('Asia/Seoul')
-    now = datetime.now(kst).time()
+    now_kst = datetime.now(kst)
+    if not get_trading_calendar().is_session(now_kst.date()):
+        return "after_hours"
+
+    now = now_kst.time()
 
     if time(0, 0) <= now < time(9, 0):
         return "pre_market"
@@ -47,6 +53,25 @@ def get_ttl_hours(market_phase: str) -> int:
     return ttl_map[market_phase]
 
 
+def get_response_ttl_seconds(market_phase: str) -> int:
+    """시장 단계별 API 응답 캐시 TTL 반환 (장중에는 짧게, 장 마감 후에는 길게)
+
+    Args:
+        market_phase: 시장 단계 (get_market_phase() 결과)
+
+    Returns:
+        int: TTL (초)
+    """
+    ttl_map = {
+        "pre_market": 60,
+        "market_open": 10,
+        "trading": 15,
+        "market_close": 10,
+        "after_hours": 600,
+    }
+    return ttl_map[market_phase]
+
+
 def get_price_threshold(market_phase: str) -> float:
     """시장 단계별 주가 변동 감지 임계값 (%)
     
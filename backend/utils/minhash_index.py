@@ -0,0 +1,166 @@
+"""
+MinHash/LSH 근사 중복 제목 인덱스
+
+제목을 문자 n-gram(shingle) 집합으로 보고 MinHash 서명을 만든 뒤,
+서명을 band 단위로 나눠 해시 버킷에 넣습니다 (Locality Sensitive Hashing).
+같은 버킷을 공유하는 제목만 후보가 되므로 조회 비용이 전체 제목 수에 비례하지 않습니다.
+
+- Jaccard 유사도 J인 두 제목이 후보가 될 확률: 1 - (1 - J^rows)^bands
+- 후보에 대한 최종 판정(정확 유사도)은 호출자가 수행
+- 삽입 순서(=시간순)로 보관하여 오래된 항목을 앞에서부터 제거
+"""
+import re
+import threading
+import unicodedata
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+# 2^31 - 1 (메르센 소수, uint64 곱셈 오버플로 방지)
+_PRIME = np.uint64((1 << 31) - 1)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_title(title: str) -> str:
+    """shingle용 제목 정규화 (NFC, 소문자, 공백 제거)"""
+    return _WHITESPACE.sub("", unicodedata.normalize("NFC", title).lower())
+
+
+class MinHashLSHIndex:
+    """시간순으로 유지되는 MinHash/LSH 제목 인덱스"""
+
+    def __init__(
+        self,
+        num_perm: int = 96,
+        bands: int = 32,
+        shingle_size: int = 2,
+        seed: int = 1,
+    ):
+        """
+        Args:
+            num_perm: MinHash 순열(해시 함수) 수
+            bands: LSH band 수 (num_perm의 약수, band당 행 수 = num_perm / bands)
+            shingle_size: 문자 n-gram 크기
+            seed: 해시 함수 난수 시드
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})의 배수여야 합니다")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_PRIME), num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_PRIME), num_perm, dtype=np.uint64)
+
+        self._lock = threading.Lock()
+        self._buckets: List[Dict[bytes, Set[int]]] = [{} for _ in range(bands)]
+        # news_id → (제목, 시각, band 키) (삽입 순서 = 시간순)
+        self._entries: "OrderedDict[int, Tuple[str, datetime, List[bytes]]]" = OrderedDict()
+
+    def shingles(self, title: str) -> Set[str]:
+        """제목의 문자 n-gram 집합 (n보다 짧으면 제목 전체)"""
+        text = normalize_title(title)
+        if len(text) <= self.shingle_size:
+            return {text} if text else set()
+        return {text[i:i + self.shingle_size] for i in range(len(text) - self.shingle_size + 1)}
+
+    def signature(self, title: str) -> Optional[np.ndarray]:
+        """MinHash 서명 (shingle이 없으면 None)"""
+        shingles = self.shingles(title)
+        if not shingles:
+            return None
+
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        ) % _PRIME
+        return ((hashes[:, None] * self._a[None, :] + self._b[None, :]) % _PRIME).min(axis=0)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def add(self, news_id: int, title: str, created_at: datetime) -> None:
+        """
+        제목 추가 (같은 ID는 교체)
+
+        Args:
+            news_id: 뉴스 ID
+            title: 제목
+            created_at: 생성 시각 (만료 기준)
+        """
+        signature = self.signature(title)
+        keys = self._band_keys(signature) if signature is not None else []
+
+        with self._lock:
+            self._remove_locked(news_id)
+            for band, key in enumerate(keys):
+                self._buckets[band].setdefault(key, set()).add(news_id)
+            self._entries[news_id] = (title, created_at, keys)
+
+    def _remove_locked(self, news_id: int) -> None:
+        entry = self._entries.pop(news_id, None)
+        if entry is None:
+            return
+        for band, key in enumerate(entry[2]):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(news_id)
+                if not bucket:
+                    del self._buckets[band][key]
+
+    def expire(self, cutoff: datetime) -> int:
+        """
+        cutoff 이전에 생성된 항목 제거 (삽입 순서 앞쪽부터)
+
+        Returns:
+            제거된 항목 수
+        """
+        removed = 0
+        with self._lock:
+            while self._entries:
+                news_id, (_, created_at, _) = next(iter(self._entries.items()))
+                if created_at >= cutoff:
+                    break
+                self._remove_locked(news_id)
+                removed += 1
+        return removed
+
+    def candidates(self, title: str) -> List[Tuple[int, str]]:
+        """
+        LSH 버킷을 공유하는 후보 제목 조회
+
+        Returns:
+            (뉴스 ID, 제목) 리스트 (ID 오름차순)
+        """
+        signature = self.signature(title)
+        if signature is None:
+            return []
+
+        with self._lock:
+            news_ids: Set[int] = set()
+            for band, key in enumerate(self._band_keys(signature)):
+                bucket = self._buckets[band].get(key)
+                if bucket:
+                    news_ids.update(bucket)
+            return [(news_id, self._entries[news_id][0]) for news_id in sorted(news_ids)]
+
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        with self._lock:
+            self._buckets = [{} for _ in range(self.bands)]
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -2,21 +2,46 @@
 종목코드 매핑 유틸리티
 
 기업명과 종목코드를 매핑하는 기능을 제공합니다.
+
+- 텍스트 내 기업명 검색: Aho–Corasick 오토마톤 (본문 1회 스캔, 최장 일치/위치순)
+- 종목코드 → 기업명: 역방향 dict (O(1))
+- stocks 테이블이 바뀌면 재구성 (종목 관리 API에서 reload, 다른 프로세스는 주기적 변경 확인)
 """
 import json
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, NamedTuple, Optional, Dict, List, Tuple
+
+from sqlalchemy import func
 
 from backend.db.session import SessionLocal
 from backend.db.models.stock import Stock
+from backend.utils.aho_corasick import AhoCorasick
 
 logger = logging.getLogger(__name__)
 
 
+class StockMention(NamedTuple):
+    """텍스트 내 종목 언급"""
+
+    stock_code: str
+    company_name: str
+    start: int
+    end: int
+
+
+def _is_ascii_word_char(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
 class StockMapper:
     """종목코드 매퍼 클래스"""
 
+    # 다른 프로세스의 stocks 변경 확인 주기 (초)
+    REFRESH_INTERVAL_SECONDS = 60.0
+
     def __init__(self, mapping_file: Optional[Path] = None, use_db: bool = True):
         """
         Args:
@@ -26,30 +51,59 @@ class StockMapper:
         self.use_db = use_db
         self.mapping_file = mapping_file
         self._mapping: Dict[str, str] = {}
+        self._code_to_name: Dict[str, str] = {}
+        self._matcher = AhoCorasick([])
+
+        self._lock = threading.Lock()
+        self._fingerprint: Optional[Tuple[Any, ...]] = None
+        self._checked_at = time.monotonic()
         self._load_mapping()
 
+    def _build_index(self, mapping: Dict[str, str]) -> None:
+        """역방향 dict와 기업명 오토마톤을 만든 뒤 한 번에 교체합니다."""
+        code_to_name: Dict[str, str] = {}
+        for company_name, code in mapping.items():
+            code_to_name.setdefault(code, company_name)
+
+        matcher = AhoCorasick(mapping.keys())
+        self._mapping, self._code_to_name, self._matcher = mapping, code_to_name, matcher
+
+    @staticmethod
+    def _query_fingerprint(db) -> Tuple[Any, ...]:
+        """stocks 테이블 변경 감지용 (행 수, 최근 수정 시각)"""
+        return tuple(db.query(func.count(Stock.id), func.max(Stock.updated_at)).one())
+
     def _load_mapping(self) -> None:
         """매핑 파일을 로드합니다 (DB 우선, 없으면 JSON 파일)."""
         if self.use_db:
             # DB에서 활성화된 종목 로드
             try:
-                db = SessionLocal()
-                try:
-                    stocks = db.query(Stock).filter(Stock.is_active == True).all()
-
-                    self._mapping = {
-                        stock.name: stock.code
-                        for stock in stocks
-                    }
-
-                    logger.info(f"종목 매핑 로드 완료 (DB): {len(self._mapping)}개")
-                    return
-                finally:
-                    db.close()
+                self._load_from_db()
+                return
             except Exception as e:
                 logger.warning(f"DB에서 종목 로드 실패, JSON 파일로 대체: {e}")
 
         # JSON 파일에서 로드 (fallback)
+        self._load_from_json()
+
+    def _load_from_db(self) -> None:
+        """stocks 테이블의 활성 종목으로 인덱스 구성 (실패 시 예외, 기존 인덱스 유지)"""
+        db = SessionLocal()
+        try:
+            stocks = db.query(Stock.name, Stock.code).filter(Stock.is_active == True).all()
+            fingerprint = self._query_fingerprint(db)
+        finally:
+            db.close()
+
+        self._build_index({
+            stock.name: stock.code
+            for stock in stocks
+        })
+        self._fingerprint = fingerprint
+        logger.info(f"종목 매핑 로드 완료 (DB): {len(self._mapping)}개")
+
+    def _load_from_json(self) -> None:
+        """JSON 매핑 파일로 인덱스 구성 (실패 시 예외, 기존 인덱스 유지)"""
         if self.mapping_file is None:
             project_root = Path(__file__).parent.parent.parent
             self.mapping_file = project_root / "data" / "stock_codes.json"
@@ -58,10 +112,52 @@ class StockMapper:
             raise FileNotFoundError(f"종목코드 매핑 파일을 찾을 수 없습니다: {self.mapping_file}")
 
         with open(self.mapping_file, "r", encoding="utf-8") as f:
-            self._mapping = json.load(f)
+            self._build_index(json.load(f))
 
         logger.info(f"종목 매핑 로드 완료 (JSON): {len(self._mapping)}개")
 
+    def reload(self) -> None:
+        """
+        종목 매핑을 다시 로드하고 인덱스를 재구성합니다 (stocks 변경 직후 호출).
+
+        이미 커밋된 변경 이후에 호출되므로 실패해도 예외를 올리지 않고 기존 인덱스를 유지합니다
+        (DB 모드에서는 JSON 파일로 대체하지 않음, 다음 주기적 변경 확인에서 다시 시도).
+        """
+        with self._lock:
+            try:
+                if self.use_db:
+                    self._load_from_db()
+                else:
+                    self._load_from_json()
+            except Exception as e:
+                logger.warning(f"⚠️  종목 매핑 재구성 실패, 기존 인덱스 유지: {e}")
+            finally:
+                self._checked_at = time.monotonic()
+
+    def _refresh_if_changed(self) -> None:
+        """REFRESH_INTERVAL_SECONDS마다 stocks 변경 여부를 확인하고 바뀌었으면 재구성합니다."""
+        if not self.use_db or time.monotonic() - self._checked_at < self.REFRESH_INTERVAL_SECONDS:
+            return
+        if not self._lock.acquire(blocking=False):
+            return  # 다른 스레드가 확인/재구성 중 (기존 인덱스로 응답)
+
+        try:
+            self._checked_at = time.monotonic()
+            db = SessionLocal()
+            try:
+                fingerprint = self._query_fingerprint(db)
+            finally:
+                db.close()
+
+            if fingerprint != self._fingerprint:
+                logger.info("🔄 종목 테이블 변경 감지, 종목 매핑 재구성")
+                self._load_from_db()
+        except Exception as e:
+            # 일시적인 DB 오류: 기존 인덱스 유지 (JSON 파일로 대체하지 않음)
+            logger.warning(f"⚠️  종목 테이블 변경 확인 실패, 기존 인덱스 유지: {e}")
+        finally:
+            self._lock.release()
+
     def get_stock_code(self, company_name: str) -> Optional[str]:
         """
         기업명으로 종목코드를 조회합니다.
@@ -79,6 +175,7 @@ class StockMapper:
             >>> mapper.get_stock_code("존재하지않는기업")
             None
         """
+        self._refresh_if_changed()
         return self._mapping.get(company_name)
 
     def get_company_name(self, stock_code: str) -> Optional[str]:
@@ -98,16 +195,58 @@ class StockMapper:
             >>> mapper.get_company_name("999999")
             None
         """
-        for company_name, code in self._mapping.items():
-            if code == stock_code:
-                return company_name
-        return None
+        self._refresh_if_changed()
+        return self._code_to_name.get(stock_code)
+
+    def find_stock_mentions(self, text: str) -> List[StockMention]:
+        """
+        텍스트에서 언급된 모든 기업명을 위치순으로 찾습니다.
+
+        - 겹치는 기업명은 가장 긴 이름 우선 (예: "LG화학"이 있으면 "LG"는 제외)
+        - 영문/숫자로 시작·끝나는 이름은 앞뒤가 영문/숫자가 아닐 때만 인정 (예: "SKT"의 "SK" 제외)
+
+        Args:
+            text: 검색할 텍스트 (뉴스 본문 등)
+
+        Returns:
+            StockMention 리스트 (출현 위치 순, 같은 종목 여러 번 포함)
+        """
+        if not text:
+            return []
+
+        self._refresh_if_changed()
+        mapping, matcher = self._mapping, self._matcher
+
+        mentions = []
+        for start, end, company_name in matcher.find_longest(text):
+            stock_code = mapping.get(company_name)
+            if stock_code is None:
+                continue  # 재구성과 겹친 경우
+            if (
+                (start > 0 and _is_ascii_word_char(company_name[0]) and _is_ascii_word_char(text[start - 1]))
+                or (end < len(text) and _is_ascii_word_char(company_name[-1]) and _is_ascii_word_char(text[end]))
+            ):
+                continue
+            mentions.append(StockMention(stock_code, company_name, start, end))
+        return mentions
+
+    def find_stock_codes_in_text(self, text: str) -> List[str]:
+        """
+        텍스트에서 언급된 종목코드를 처음 등장한 순서대로 반환합니다 (중복 제거).
+
+        Args:
+            text: 검색할 텍스트 (뉴스 본문 등)
+
+        Returns:
+            종목코드 리스트
+        """
+        return list(dict.fromkeys(mention.stock_code for mention in self.find_stock_mentions(text)))
 
     def find_stock_code_in_text(self, text: str) -> Optional[str]:
         """
         텍스트에서 기업명을 찾아 종목코드를 반환합니다.
 
-        여러 기업명이 발견되면 첫 번째 기업의 종목코드를 반환합니다.
+        여러 기업명이 발견되면 가장 앞에 등장한 기업의 종목코드를 반환합니다.
 
         Args:
             text: 검색할 텍스트 (뉴스 본문 등)
@@ -120,10 +259,8 @@ class StockMapper:
             >>> mapper.find_stock_code_in_text("삼성전자가 신규 공정을 개발했다")
             '005930'
         """
-        for company_name, stock_code in self._mapping.items():
-            if company_name in text:
-                return stock_code
-        return None
+        mentions = self.find_stock_mentions(text)
+        return mentions[0].stock_code if mentions else None
 
     def get_all_companies(self) -> list[str]:
         """
@@ -159,3 +296,13 @@ def get_stock_mapper() -> StockMapper:
     if _stock_mapper is None:
         _stock_mapper = StockMapper()
     return _stock_mapper
+
+
+def reload_stock_mapper() -> None:
+    """
+    stocks 변경 후 싱글톤 StockMapper의 매핑을 즉시 재구성합니다.
+
+    아직 생성되지 않았다면 첫 사용 시 최신 데이터로 로드되므로 아무것도 하지 않습니다.
+    """
+    if _stock_mapper is not None:
+        _stock_mapper.reload()
@@ -0,0 +1,251 @@
+"""
+KRX 거래일 달력
+
+평일에서 KRX 휴장일(krx_holidays.json)을 뺀 거래일(session)을 정렬 배열로 한 번 만들어 두고,
+거래일 판정/N 거래일 이동/구간 거래일 수를 이진 탐색으로 계산합니다.
+
+- 스칼라 API: bisect (datetime/date 입력, datetime 자정 반환)
+- 배열 API: np.searchsorted (datetime64[D] 배열 입력/반환)
+- 휴장일 데이터가 없는 연도는 주말만 제외 (연도별 KRX 휴장일 공시 기준으로 JSON 갱신)
+"""
+import json
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+HOLIDAYS_FILE = Path(__file__).parent / "krx_holidays.json"
+
+# 달력 범위 (연도)
+CALENDAR_START_YEAR = 2000
+CALENDAR_END_YEAR = 2099
+
+DateLike = Union[date, datetime, np.datetime64, str]
+
+
+def _to_date(value: DateLike) -> date:
+    """datetime/date/datetime64/문자열 → date (시간 제거)"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return np.datetime64(value, "D").astype(date)
+
+
+def _to_datetime(value: date) -> datetime:
+    return datetime(value.year, value.month, value.day)
+
+
+def _to_days(values) -> np.ndarray:
+    """날짜 배열 → datetime64[D] 배열"""
+    return np.asarray(values, dtype="datetime64[ns]").astype("datetime64[D]")
+
+
+def load_krx_holidays(path: Optional[Path] = None) -> Dict[date, str]:
+    """
+    KRX 휴장일 파일을 읽습니다.
+
+    Args:
+        path: JSON 파일 경로 ({연도: {"YYYY-MM-DD": 휴장 사유}}, 기본: krx_holidays.json)
+
+    Returns:
+        {휴장일: 사유}
+    """
+    with open(path or HOLIDAYS_FILE, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    return {
+        date.fromisoformat(day): name
+        for year_holidays in data.values()
+        for day, name in year_holidays.items()
+    }
+
+
+class TradingCalendar:
+    """정렬된 거래일 배열 기반 거래일 달력 (불변, 스레드 간 공유 가능)"""
+
+    def __init__(
+        self,
+        holidays: Optional[Dict[date, str]] = None,
+        start_year: int = CALENDAR_START_YEAR,
+        end_year: int = CALENDAR_END_YEAR,
+    ):
+        """
+        Args:
+            holidays: {휴장일: 사유} (None이면 주말만 제외)
+            start_year: 달력 시작 연도
+            end_year: 달력 종료 연도 (포함)
+        """
+        self.holidays: Dict[date, str] = dict(holidays or {})
+        self.holiday_years = sorted({day.year for day in self.holidays})
+
+        days = np.arange(
+            np.datetime64(f"{start_year}-01-01"),
+            np.datetime64(f"{end_year + 1}-01-01"),
+            dtype="datetime64[D]",
+        )
+        weekdays = np.is_busday(days)
+        holiday_days = np.array(sorted(self.holidays), dtype="datetime64[D]")
+        self.sessions: np.ndarray = days[weekdays & ~np.isin(days, holiday_days)]
+
+        # bisect용 서수(ordinal) 리스트 (스칼라 조회는 numpy 호출보다 빠름)
+        self._ordinals: List[int] = [day.toordinal() for day in self.sessions.astype(date)]
+        self.first_session = _to_datetime(date.fromordinal(self._ordinals[0]))
+        self.last_session = _to_datetime(date.fromordinal(self._ordinals[-1]))
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def has_holiday_data(self, value: DateLike) -> bool:
+        """해당 연도의 휴장일 데이터 보유 여부"""
+        return _to_date(value).year in self.holiday_years
+
+    def _session_at(self, index: int) -> datetime:
+        if not 0 <= index < len(self._ordinals):
+            raise ValueError(
+                f"거래일 달력 범위를 벗어났습니다 "
+                f"({self.first_session:%Y-%m-%d} ~ {self.last_session:%Y-%m-%d})"
+            )
+        return _to_datetime(date.fromordinal(self._ordinals[index]))
+
+    # ------------------------------------------------------------------
+    # 스칼라 API
+    # ------------------------------------------------------------------
+
+    def is_session(self, value: DateLike) -> bool:
+        """거래일 여부"""
+        ordinal = _to_date(value).toordinal()
+        index = bisect_left(self._ordinals, ordinal)
+        return index < len(self._ordinals) and self._ordinals[index] == ordinal
+
+    def add_sessions(self, value: DateLike, count: int) -> datetime:
+        """
+        N 거래일 후(음수면 전)의 거래일 (자정)
+
+        기준일이 거래일이 아니면 다음(이전) 첫 거래일을 1 거래일로 셉니다.
+        count가 0이면 기준일(자정)을 그대로 반환합니다.
+
+        Examples:
+            >>> calendar.add_sessions(datetime(2025, 10, 31), 1)  # 금 → 월
+            datetime(2025, 11, 3, 0, 0)
+        """
+        day = _to_date(value)
+        if count == 0:
+            return _to_datetime(day)
+
+        ordinal = day.toordinal()
+        if count > 0:
+            return self._session_at(bisect_right(self._ordinals, ordinal) - 1 + count)
+        return self._session_at(bisect_left(self._ordinals, ordinal) + count)
+
+    def next_session(self, value: DateLike) -> datetime:
+        """기준일 다음 거래일"""
+        return self.add_sessions(value, 1)
+
+    def previous_session(self, value: DateLike) -> datetime:
+        """기준일 이전 거래일"""
+        return self.add_sessions(value, -1)
+
+    def sessions_between(self, start: DateLike, end: DateLike) -> int:
+        """start 초과 ~ end 이하 거래일 수 (start >= end면 0)"""
+        start_ordinal = _to_date(start).toordinal()
+        end_ordinal = _to_date(end).toordinal()
+        if start_ordinal >= end_ordinal:
+            return 0
+        return bisect_right(self._ordinals, end_ordinal) - bisect_right(self._ordinals, start_ordinal)
+
+    def sessions_in_range(self, start: DateLike, end: DateLike) -> List[datetime]:
+        """start 이상 ~ end 이하 거래일 목록"""
+        lo = bisect_left(self._ordinals, _to_date(start).toordinal())
+        hi = bisect_right(self._ordinals, _to_date(end).toordinal())
+        return [_to_datetime(date.fromordinal(ordinal)) for ordinal in self._ordinals[lo:hi]]
+
+    # ------------------------------------------------------------------
+    # 배열 API (datetime64[D])
+    # ------------------------------------------------------------------
+
+    def is_session_array(self, values: Iterable[DateLike]) -> np.ndarray:
+        """날짜 배열의 거래일 여부 (bool 배열)"""
+        days = _to_days(values)
+        index = np.searchsorted(self.sessions, days)
+        clipped = np.minimum(index, len(self.sessions) - 1)
+        return (index < len(self.sessions)) & (self.sessions[clipped] == days)
+
+    def add_sessions_array(self, values: Iterable[DateLike], counts) -> np.ndarray:
+        """
+        날짜 배열에 N 거래일 이동 (add_sessions와 같은 규칙, counts는 브로드캐스트)
+
+        Returns:
+            datetime64[D] 배열 (달력 범위를 벗어나면 NaT)
+        """
+        days = _to_days(values)
+        counts = np.asarray(counts)
+        days, counts = np.broadcast_arrays(days, counts)
+
+        forward = np.searchsorted(self.sessions, days, side="right") - 1 + counts
+        backward = np.searchsorted(self.sessions, days, side="left") + counts
+        index = np.where(counts > 0, forward, backward)
+
+        valid = (index >= 0) & (index < len(self.sessions))
+        result = self.sessions[np.clip(index, 0, len(self.sessions) - 1)]
+        result = np.where(counts == 0, days, result)
+        return np.where(valid | (counts == 0), result, np.datetime64("NaT"))
+
+    def sessions_between_array(self, starts: Iterable[DateLike], ends: Iterable[DateLike]) -> np.ndarray:
+        """sessions_between의 배열 버전 (int 배열)"""
+        start_days = _to_days(starts)
+        end_days = _to_days(ends)
+        counts = (
+            np.searchsorted(self.sessions, end_days, side="right")
+            - np.searchsorted(self.sessions, start_days, side="right")
+        )
+        return np.where(start_days >= end_days, 0, counts)
+
+
+# 싱글톤 인스턴스
+_trading_calendar: Optional[TradingCalendar] = None
+_weekday_calendar: Optional[TradingCalendar] = None
+_calendar_lock = threading.Lock()
+
+
+def get_trading_calendar() -> TradingCalendar:
+    """
+    KRX 거래일 달력 싱글톤 인스턴스를 반환합니다.
+
+    Returns:
+        TradingCalendar 인스턴스
+    """
+    global _trading_calendar
+    with _calendar_lock:
+        if _trading_calendar is None:
+            holidays = load_krx_holidays()
+            _trading_calendar = TradingCalendar(holidays)
+            logger.info(
+                f"📅 KRX 거래일 달력 로드: 휴장일 {len(holidays)}일 "
+                f"({min(_trading_calendar.holiday_years)}~{max(_trading_calendar.holiday_years)}년)"
+            )
+        return _trading_calendar
+
+
+def get_weekday_calendar() -> TradingCalendar:
+    """
+    주말만 제외한 달력 싱글톤 인스턴스 (휴장일 미적용)를 반환합니다.
+
+    Returns:
+        TradingCalendar 인스턴스
+    """
+    global _weekday_calendar
+    with _calendar_lock:
+        if _weekday_calendar is None:
+            _weekday_calendar = TradingCalendar()
+        return _weekday_calendar
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""
+미임베딩 뉴스 일괄 임베딩 (재개 가능)
+
+embedded_at이 비어 있는 뉴스를 ID 오름차순 청크로 임베딩하여 Milvus에 저장합니다.
+청크마다 커밋하므로 중단 후 다시 실행하면 남은 뉴스부터 이어서 처리합니다.
+
+Usage:
+    uv run python scripts/backfill_news_embeddings.py
+    uv run python scripts/backfill_news_embeddings.py --chunk-size 500 --max-chunks 10
+    uv run python scripts/backfill_news_embeddings.py --start-after-id 120000
+    uv run python scripts/backfill_news_embeddings.py --sync-only  # Milvus 기준 embedded_at만 채움
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import argparse
+import logging
+
+from backend.db.session import SessionLocal
+from backend.llm.embedder import get_news_embedder, run_embedding_backfill
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="미임베딩 뉴스 일괄 임베딩")
+    parser.add_argument("--chunk-size", type=int, default=500, help="청크 크기")
+    parser.add_argument("--max-chunks", type=int, default=None, help="최대 청크 수 (기본: 끝까지)")
+    parser.add_argument("--start-after-id", type=int, default=0, help="이 뉴스 ID 이후부터 처리")
+    parser.add_argument("--sync-only", action="store_true", help="Milvus에 있는 뉴스의 embedded_at만 채움")
+    args = parser.parse_args()
+
+    logger.info("=" * 70)
+    logger.info("🚀 뉴스 임베딩 백필 시작")
+    logger.info("=" * 70)
+
+    if args.sync_only:
+        db = SessionLocal()
+        try:
+            get_news_embedder().sync_embedded_state(db, chunk_size=args.chunk_size)
+        finally:
+            db.close()
+        return
+
+    result = run_embedding_backfill(
+        chunk_size=args.chunk_size,
+        max_chunks=args.max_chunks,
+        start_after_id=args.start_after_id,
+    )
+
+    logger.info("=" * 70)
+    logger.info(
+        f"✅ 백필 완료: 청크 {result['chunks']}개, 성공 {result['success']}건, "
+        f"실패 {result['failed']}건 (마지막 ID {result['last_id']})"
+    )
+    logger.info("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
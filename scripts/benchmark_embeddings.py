@@ -0,0 +1,181 @@
+"""
+뉴스 임베딩 배치 벤치마크
+
+로컬 가짜 OpenAI Embeddings 서버를 띄우고 뉴스 N건을 임베딩하여
+건별 요청 + 0.1초 대기 방식(before)과 다중 입력 배치 요청(after)의
+처리량(건/s)과 요청 수를 비교합니다.
+
+가짜 서버:
+- POST /v1/embeddings (input: 문자열 또는 리스트) → 텍스트 해시 기반 결정적 벡터
+- --rate-limit-every N: N번째 요청마다 429 + Retry-After 응답 (백오프 확인용)
+- "__bad__"가 포함된 입력은 400 응답 (실패 항목 격리 확인용)
+
+Usage:
+    uv run python scripts/benchmark_embeddings.py
+    uv run python scripts/benchmark_embeddings.py --news 500 --latency-ms 50 --rate-limit-every 5
+    uv run python scripts/benchmark_embeddings.py --serve --port 8900  # 서버만 실행
+"""
+import argparse
+import hashlib
+import logging
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from openai import OpenAI
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.llm.embedder import NewsEmbedder
+
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+
+def create_fake_embeddings_app(latency_ms: float, rate_limit_every: int) -> FastAPI:
+    """OpenAI Embeddings API 호환 가짜 서버"""
+    app = FastAPI()
+    app.state.request_count = 0
+
+    def fake_vector(text: str, dimensions: int) -> List[float]:
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+        vector = np.random.default_rng(seed).standard_normal(dimensions)
+        return (vector / np.linalg.norm(vector)).round(6).tolist()
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        app.state.request_count += 1
+
+        if rate_limit_every and app.state.request_count % rate_limit_every == 0:
+            return JSONResponse(
+                status_code=429,
+                headers={"retry-after": "0.05"},
+                content={"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}},
+            )
+
+        inputs = body["input"]
+        if isinstance(inputs, str):
+            inputs = [inputs]
+
+        if any("__bad__" in text for text in inputs):
+            return JSONResponse(
+                status_code=400,
+                content={"error": {"message": "Invalid input", "type": "invalid_request_error", "code": None}},
+            )
+
+        if latency_ms:
+            # 입력 수에 비례하지 않는 요청당 고정 지연 (네트워크 왕복)
+            time.sleep(latency_ms / 1000)
+
+        dimensions = int(body.get("dimensions") or 768)
+        return {
+            "object": "list",
+            "model": body.get("model", "fake-embedding"),
+            "data": [
+                {"object": "embedding", "index": index, "embedding": fake_vector(text, dimensions)}
+                for index, text in enumerate(inputs)
+            ],
+            "usage": {"prompt_tokens": 0, "total_tokens": 0},
+        }
+
+    return app
+
+
+def start_fake_server(app: FastAPI, port: int = 0) -> str:
+    """가짜 서버를 별도 스레드에서 실행하고 base URL 반환"""
+    if not port:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+
+    while not server.started:
+        time.sleep(0.05)
+
+    return f"http://127.0.0.1:{port}/v1"
+
+
+class LegacyNewsEmbedder(NewsEmbedder):
+    """기존 방식: 건별 embed_text 호출 + 0.1초 대기"""
+
+    def embed_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
+        embeddings = []
+        for text in texts:
+            embeddings.append(self.embed_text(text))
+            time.sleep(0.1)
+        return embeddings
+
+
+def run_benchmark(embedder: NewsEmbedder, app: FastAPI, texts: List[str]) -> Dict[str, Any]:
+    """임베딩 처리량 측정"""
+    requests_before = app.state.request_count
+    started = time.perf_counter()
+    embeddings = embedder.embed_batch(texts)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "success": sum(1 for embedding in embeddings if embedding is not None),
+        "requests": app.state.request_count - requests_before,
+        "seconds": elapsed,
+        "rate": len(texts) / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="뉴스 임베딩 배치 벤치마크")
+    parser.add_argument("--news", type=int, default=100, help="뉴스 수")
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="가짜 서버 요청당 지연 (ms)")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="N번째 요청마다 429 응답 (0이면 없음)")
+    parser.add_argument("--bad", type=int, default=0, help="400 응답을 받는 잘못된 입력 수")
+    parser.add_argument("--serve", action="store_true", help="벤치마크 없이 가짜 서버만 실행")
+    parser.add_argument("--port", type=int, default=0, help="가짜 서버 포트 (--serve)")
+    args = parser.parse_args()
+
+    app = create_fake_embeddings_app(args.latency_ms, args.rate_limit_every)
+
+    if args.serve:
+        port = args.port or 8900
+        print(f"🧪 가짜 Embeddings 서버: http://127.0.0.1:{port}/v1/embeddings")
+        uvicorn.run(app, host="127.0.0.1", port=port, log_level="info")
+        return
+
+    base_url = start_fake_server(app)
+    texts = [
+        f"삼성전자 {i}번째 뉴스\n반도체 업황 개선 기대감에 외국인 순매수가 이어지고 있다. " * 5
+        for i in range(args.news)
+    ]
+    for i in range(min(args.bad, len(texts))):
+        texts[i * 7 % len(texts)] += "__bad__"
+
+    print("=" * 70)
+    print(f"📊 임베딩 벤치마크: 뉴스 {args.news}건 (서버 지연 {args.latency_ms}ms, "
+          f"429 주기 {args.rate_limit_every or '-'}, 잘못된 입력 {args.bad}건)")
+    print("=" * 70)
+
+    results = {}
+    for label, embedder_cls in (("before (건별 + 0.1초 대기)", LegacyNewsEmbedder), ("after (다중 입력 배치)", NewsEmbedder)):
+        embedder = embedder_cls()
+        embedder.openai_client = OpenAI(api_key="fake", base_url=base_url)
+        results[label] = run_benchmark(embedder, app, texts)
+
+    print(f"{'':28s}{'성공':>8s}{'요청 수':>10s}{'소요 (s)':>12s}{'건/s':>10s}")
+    for label, result in results.items():
+        print(
+            f"{label:28s}{result['success']:>8d}{result['requests']:>10d}"
+            f"{result['seconds']:>12.2f}{result['rate']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
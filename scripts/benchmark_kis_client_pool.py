@@ -0,0 +1,170 @@
+"""
+KISClient 연결 풀 벤치마크
+
+로컬 KIS 스텁 서버를 띄우고 get_minute_prices를 50개 종목에 대해 호출하여
+요청마다 새 AsyncClient를 만드는 기존 방식(before)과
+공유 연결 풀(after)의 처리량(req/s)과 p50/p99 지연을 비교합니다.
+
+- Rate Limiter와 토큰 발급(Redis)은 비교 대상이 아니므로 우회합니다.
+- 스텁 서버는 평문 HTTP이므로 실제 KIS(TLS) 환경에서는 차이가 더 커집니다.
+
+Usage:
+    uv run python scripts/benchmark_kis_client_pool.py
+    uv run python scripts/benchmark_kis_client_pool.py --stocks 50 --rounds 5 --concurrency 10
+"""
+import argparse
+import asyncio
+import logging
+import socket
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.crawlers.kis_client import KISClient, RateLimiter
+
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+
+def create_stub_app(latency_ms: float) -> FastAPI:
+    """1분봉 응답을 돌려주는 KIS 스텁 서버"""
+    app = FastAPI()
+
+    @app.get("/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice")
+    async def minute_prices(FID_INPUT_ISCD: str = ""):
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        return {
+            "rt_cd": "0",
+            "output1": {"prdt_type_cd": "300"},
+            "output2": [
+                {
+                    "stck_bsop_date": "20251109",
+                    "stck_cntg_hour": f"15{minute:02d}00",
+                    "stck_prpr": "59000",
+                    "stck_oprc": "59100",
+                    "stck_hgpr": "59200",
+                    "stck_lwpr": "58900",
+                    "cntg_vol": "123456",
+                }
+                for minute in range(30)
+            ],
+        }
+
+    return app
+
+
+def start_stub_server(latency_ms: float) -> str:
+    """스텁 서버를 별도 스레드에서 실행하고 base URL 반환"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    config = uvicorn.Config(create_stub_app(latency_ms), host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+
+    while not server.started:
+        time.sleep(0.05)
+
+    return f"http://127.0.0.1:{port}"
+
+
+class _StaticTokenManager:
+    """토큰 발급 우회용 (Redis/OAuth 호출 없음)"""
+
+    async def get_access_token(self, http_client: Optional[httpx.AsyncClient] = None) -> str:
+        return "stub-token"
+
+
+class UnpooledKISClient(KISClient):
+    """기존 방식: 요청마다 새 AsyncClient 생성 (TCP 연결 재수립)"""
+
+    async def _send(self, method, url, headers, params=None, data=None) -> httpx.Response:
+        async with httpx.AsyncClient() as client:
+            if method.upper() == "GET":
+                return await client.get(url, headers=headers, params=params, timeout=30.0)
+            return await client.post(url, headers=headers, json=data, timeout=30.0)
+
+
+def _prepare(client: KISClient, base_url: str) -> KISClient:
+    client.base_url = base_url
+    client.token_manager = _StaticTokenManager()
+    client.rate_limiter = RateLimiter(max_requests=1_000_000, window_seconds=1.0)
+    return client
+
+
+async def run_benchmark(
+    client: KISClient,
+    stock_codes: List[str],
+    rounds: int,
+    concurrency: int,
+) -> Dict[str, Any]:
+    """50개 종목 × rounds회 get_minute_prices 호출"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def call(stock_code: str) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await client.get_minute_prices(stock_code)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    # 워밍업 1회 (측정 제외)
+    await client.get_minute_prices(stock_codes[0])
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(*(call(code) for code in stock_codes))
+    elapsed = time.perf_counter() - started
+
+    await client.close()
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="KISClient 연결 풀 벤치마크")
+    parser.add_argument("--stocks", type=int, default=50, help="종목 수")
+    parser.add_argument("--rounds", type=int, default=5, help="반복 횟수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수 (수집기 batch_size)")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="스텁 서버 응답 지연 (ms)")
+    args = parser.parse_args()
+
+    base_url = start_stub_server(args.latency_ms)
+    stock_codes = [f"{i:06d}" for i in range(1, args.stocks + 1)]
+
+    print("=" * 70)
+    print(f"📊 KISClient 벤치마크: get_minute_prices × {args.stocks}종목 × {args.rounds}회 "
+          f"(동시 {args.concurrency}, 서버 지연 {args.latency_ms}ms)")
+    print("=" * 70)
+
+    results = {}
+    for label, client_cls in (("before (요청별 클라이언트)", UnpooledKISClient), ("after (공유 연결 풀)", KISClient)):
+        results[label] = await run_benchmark(
+            _prepare(client_cls(), base_url), stock_codes, args.rounds, args.concurrency
+        )
+
+    print(f"{'':28s}{'req/s':>10s}{'p50 (ms)':>12s}{'p99 (ms)':>12s}")
+    for label, result in results.items():
+        print(f"{label:28s}{result['rps']:>10.1f}{result['p50']:>12.2f}{result['p99']:>12.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
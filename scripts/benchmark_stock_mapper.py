@@ -0,0 +1,125 @@
+"""
+StockMapper 기업명 검색 벤치마크
+
+KRX 규모(2,500개)의 가짜 종목명과 10KB 뉴스 본문으로
+기존 방식(종목명마다 `in` 검색, 역방향은 전체 순회)과
+Aho–Corasick 오토마톤 + 역방향 dict의 처리 시간을 비교합니다.
+
+Usage:
+    uv run python scripts/benchmark_stock_mapper.py
+    uv run python scripts/benchmark_stock_mapper.py --names 2500 --body-kb 10 --articles 200
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.utils.stock_mapping import StockMapper
+
+
+SYLLABLES = list("가나다라마바사아자차카타파하강남동북서신한대우현기삼성엘지금융화학전자바이오제약건설중공업해운통신에너지")
+PREFIXES = ["", "", "", "SK", "LG", "CJ", "KB", "GS", "HD", "DB"]
+
+
+class LegacyStockMapper(StockMapper):
+    """기존 방식: 종목명마다 `in` 검색, 역방향은 전체 순회"""
+
+    def get_company_name(self, stock_code: str) -> Optional[str]:
+        for company_name, code in self._mapping.items():
+            if code == stock_code:
+                return company_name
+        return None
+
+    def find_stock_code_in_text(self, text: str) -> Optional[str]:
+        for company_name, stock_code in self._mapping.items():
+            if company_name in text:
+                return stock_code
+        return None
+
+    def find_stock_codes_in_text(self, text: str) -> List[str]:
+        return [stock_code for company_name, stock_code in self._mapping.items() if company_name in text]
+
+
+def make_mapping(count: int, rng: random.Random) -> Dict[str, str]:
+    mapping: Dict[str, str] = {}
+    while len(mapping) < count:
+        name = rng.choice(PREFIXES) + "".join(rng.choices(SYLLABLES, k=rng.randint(2, 5)))
+        mapping.setdefault(name, f"{len(mapping) + 1:06d}")
+    return mapping
+
+
+def make_body(names: List[str], size: int, rng: random.Random, mentions: int = 5) -> str:
+    """본문 크기만큼 일반 문장, 중간중간 종목명 삽입"""
+    words = ["시장", "투자자", "전망", "실적", "발표", "상승", "하락", "거래", "증권가", "분석", "업종", "외국인"]
+    parts: List[str] = []
+    length = 0
+    while length < size:
+        word = rng.choice(names) if rng.random() < mentions * 4 / size else rng.choice(words)
+        parts.append(word)
+        length += len(word.encode("utf-8")) + 1
+    return " ".join(parts)
+
+
+def measure(func: Callable[[str], object], inputs: List[str]) -> Dict[str, float]:
+    latencies = []
+    for value in inputs:
+        started = time.perf_counter()
+        func(value)
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="StockMapper 기업명 검색 벤치마크")
+    parser.add_argument("--names", type=int, default=2500, help="종목명 수")
+    parser.add_argument("--body-kb", type=int, default=10, help="본문 크기 (KB, UTF-8)")
+    parser.add_argument("--articles", type=int, default=200, help="본문 수")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    mapping = make_mapping(args.names, rng)
+    names = list(mapping)
+    bodies = [make_body(names, args.body_kb * 1024, rng) for _ in range(args.articles)]
+    codes = [rng.choice(list(mapping.values())) for _ in range(10000)]
+
+    with tempfile.TemporaryDirectory() as path:
+        mapping_file = Path(path) / "stock_codes.json"
+        mapping_file.write_text(json.dumps(mapping, ensure_ascii=False), encoding="utf-8")
+
+        started = time.perf_counter()
+        mapper = StockMapper(mapping_file=mapping_file, use_db=False)
+        build_seconds = time.perf_counter() - started
+        legacy = LegacyStockMapper(mapping_file=mapping_file, use_db=False)
+
+    print("=" * 70)
+    print(f"📊 StockMapper 벤치마크: 종목명 {args.names}개, 본문 {args.body_kb}KB × {args.articles}건")
+    print(f"   오토마톤 생성: {build_seconds * 1000:.1f}ms")
+    print("=" * 70)
+
+    results = {
+        "본문 첫 종목 (before)": measure(legacy.find_stock_code_in_text, bodies),
+        "본문 첫 종목 (after)": measure(mapper.find_stock_code_in_text, bodies),
+        "본문 전체 종목 (before)": measure(legacy.find_stock_codes_in_text, bodies),
+        "본문 전체 종목 (after)": measure(mapper.find_stock_codes_in_text, bodies),
+        "역방향 조회 (before)": measure(legacy.get_company_name, codes),
+        "역방향 조회 (after)": measure(mapper.get_company_name, codes),
+    }
+
+    print(f"{'':26s}{'p50 (ms)':>12s}{'p99 (ms)':>12s}")
+    for label, result in results.items():
+        print(f"{label:26s}{result['p50']:>12.4f}{result['p99']:>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+제목 중복 검사 벤치마크
+
+가짜 뉴스 제목 N건(5천/5만/50만)에 대해 기존 방식(전체 제목 SequenceMatcher 스캔)과
+MinHash/LSH 인덱스(후보만 SequenceMatcher 검증)의 검사당 지연과
+중복 검출 일치율(recall, 기존 방식 기준)을 비교합니다.
+
+- 쿼리의 절반은 기존 제목을 조금 바꾼 근사 중복, 절반은 새 제목
+- 기존 방식의 DB 조회 비용은 제외 (메모리 스캔만 측정, 실제 차이는 더 큼)
+- 큰 N에서 기존 방식은 --scan-queries 건만 측정
+
+Usage:
+    uv run python scripts/benchmark_title_dedup.py
+    uv run python scripts/benchmark_title_dedup.py --sizes 5000 50000 --queries 200
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.utils.deduplicator import NewsDuplicator
+
+
+COMPANIES = [
+    "삼성전자", "SK하이닉스", "LG에너지솔루션", "현대차", "기아", "NAVER", "카카오", "셀트리온",
+    "POSCO홀딩스", "삼성바이오로직스", "LG화학", "KB금융", "신한지주", "한화에어로스페이스", "HD현대중공업",
+]
+EVENTS = [
+    "분기 영업이익 {n}억원 기록", "목표주가 {n}만원으로 상향", "신규 수주 {n}억 규모 계약",
+    "외국인 {n}일 연속 순매수", "자사주 {n}억원 매입 결정", "{n}% 급등 마감", "{n}% 하락 출발",
+    "신공장 {n}조 투자 발표", "배당금 주당 {n}원 결정", "임원 {n}명 교체 인사",
+]
+TAILS = ["", " …시장 기대 상회", " 증권가 전망", " [속보]", " (종합)", " 투자자 관심 집중", " 업계 주목"]
+WORDS = (
+    "반도체 배터리 전기차 수출 환율 금리 실적 공시 규제 인수 합병 소송 파업 증설 감산 리콜 특허 "
+    "승인 임상 수주 적자 흑자 전환 가이던스 컨센서스 밸류업 공매도 유상증자 무상증자 분할 상장 "
+    "폐지 매각 지분 협력 제휴 개발 출시 점유율 경쟁 중국 미국 일본 유럽 인도 베트남 관세 보조금 "
+    "데이터센터 인공지능 로봇 바이오 조선 방산 원전 수소 태양광 2차전지 메모리 파운드리 디스플레이"
+).split()
+
+
+def make_title(rng: random.Random) -> str:
+    return (
+        f"{rng.choice(COMPANIES)}, {' '.join(rng.sample(WORDS, 2))} "
+        f"{rng.choice(EVENTS).format(n=rng.randint(1, 9999))}"
+        f"{rng.choice(TAILS)}"
+    )
+
+
+def make_near_duplicate(title: str, rng: random.Random) -> str:
+    """재보도 형태의 근사 중복 (말머리/꼬리 변경, 한두 글자 수정)"""
+    edit = rng.random()
+    if edit < 0.33:
+        return "[단독] " + title
+    if edit < 0.66:
+        return title.rstrip(" (종합)") + " (종합2보)"
+    position = rng.randrange(len(title))
+    return title[:position] + title[position + 1:]
+
+
+def run_queries(check: Callable[[str], Optional[int]], queries: List[str]) -> Dict[str, Any]:
+    latencies = []
+    results = []
+    for query in queries:
+        started = time.perf_counter()
+        results.append(check(query))
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+    return {
+        "results": results,
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="제목 중복 검사 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5000, 50000, 500000], help="인덱스 제목 수")
+    parser.add_argument("--queries", type=int, default=200, help="LSH 쿼리 수")
+    parser.add_argument("--scan-queries", type=int, default=20, help="50만 건 이상에서 기존 방식 쿼리 수")
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("📊 제목 중복 검사 벤치마크 (유사도 임계값 0.8)")
+    print("=" * 78)
+    print(f"{'제목 수':>10s}{'적재 (s)':>10s}{'스캔 p50':>12s}{'LSH p50':>12s}{'LSH p99':>12s}"
+          f"{'후보 평균':>10s}{'recall':>9s}")
+
+    for size in args.sizes:
+        rng = random.Random(size)
+        titles = [make_title(rng) for _ in range(size)]
+        queries = [
+            make_near_duplicate(rng.choice(titles), rng) if i % 2 == 0 else make_title(rng)
+            for i in range(args.queries)
+        ]
+
+        duplicator = NewsDuplicator()
+        started = time.perf_counter()
+        now = datetime.now()
+        for news_id, title in enumerate(titles, start=1):
+            duplicator.index.add(news_id, title, now)
+        load_seconds = time.perf_counter() - started
+
+        candidate_counts = []
+
+        def lsh_check(title: str) -> Optional[int]:
+            candidates = duplicator.index.candidates(title)
+            candidate_counts.append(len(candidates))
+            for news_id, existing in candidates:
+                if duplicator.is_duplicate(title, existing):
+                    return news_id
+            return None
+
+        def scan_check(title: str) -> Optional[int]:
+            for news_id, existing in enumerate(titles, start=1):
+                if duplicator.is_duplicate(title, existing):
+                    return news_id
+            return None
+
+        lsh = run_queries(lsh_check, queries)
+        scan_queries = queries if size < 500000 else queries[: args.scan_queries]
+        scan = run_queries(scan_check, scan_queries)
+
+        # recall: 기존 방식이 중복으로 판정한 쿼리 중 LSH도 중복으로 판정한 비율
+        expected = [i for i, result in enumerate(scan["results"]) if result is not None]
+        found = sum(1 for i in expected if lsh["results"][i] is not None)
+        recall = found / len(expected) if expected else 1.0
+
+        print(
+            f"{size:>10d}{load_seconds:>10.2f}{scan['p50']:>10.1f}ms{lsh['p50']:>10.3f}ms"
+            f"{lsh['p99']:>10.3f}ms{statistics.mean(candidate_counts):>10.1f}{recall:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
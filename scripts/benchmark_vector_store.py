@@ -0,0 +1,128 @@
+"""
+로컬 벡터 인덱스 벤치마크
+
+군집된 가짜 뉴스 임베딩 N건으로 LocalVectorStore(디스크 memmap)를 만들고,
+전체 정확 검색(brute force, NumPy 행렬곱)과 비교하여 검색 방식별
+recall@k와 쿼리당 지연(p50/p99)을 출력합니다.
+
+- 전체 검색: IVF 근사 검색 (분할 √N개 중 nprobe개만 비교)
+- 종목 필터 검색: 종목별 행만 정확 검색 (중복 검사 경로)
+
+Usage:
+    uv run python scripts/benchmark_vector_store.py
+    uv run python scripts/benchmark_vector_store.py --news 50000 --queries 200 --nprobe 16
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.llm.vector_store import LocalVectorStore
+
+
+def make_embeddings(count: int, dim: int, clusters: int, seed: int = 0) -> np.ndarray:
+    """군집된 단위 벡터 (비슷한 주제의 뉴스가 모인 분포)"""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    vectors = centers[rng.integers(0, clusters, count)] + 0.5 * rng.standard_normal((count, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def run_benchmark(search: Callable[[np.ndarray], List[int]], queries: np.ndarray, expected: List[List[int]]) -> Dict[str, Any]:
+    """쿼리별 검색 지연과 recall 측정"""
+    latencies = []
+    found = 0
+    for query, truth in zip(queries, expected):
+        started = time.perf_counter()
+        news_ids = search(query)
+        latencies.append((time.perf_counter() - started) * 1000)
+        found += len(set(news_ids) & set(truth))
+
+    latencies.sort()
+    return {
+        "recall": found / max(1, sum(len(truth) for truth in expected)),
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 벡터 인덱스 벤치마크")
+    parser.add_argument("--news", type=int, default=20000, help="인덱스 뉴스 수")
+    parser.add_argument("--dim", type=int, default=768, help="벡터 차원")
+    parser.add_argument("--stocks", type=int, default=200, help="종목 수")
+    parser.add_argument("--queries", type=int, default=100, help="쿼리 수")
+    parser.add_argument("--top-k", type=int, default=10, help="top-k")
+    parser.add_argument("--nprobe", type=int, default=8, help="IVF 비교 분할 수")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    vectors = make_embeddings(args.news, args.dim, clusters=max(1, args.news // 200))
+    stock_codes = np.array([f"{code:06d}" for code in rng.integers(0, args.stocks, args.news)])
+    news_ids = np.arange(1, args.news + 1)
+
+    # 인덱스 내 뉴스와 비슷한 쿼리 (재보도/유사 기사)
+    picks = rng.integers(0, args.news, args.queries)
+    queries = vectors[picks] + 0.02 * rng.standard_normal((args.queries, args.dim)).astype(np.float32)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+    print("=" * 70)
+    print(f"📊 로컬 벡터 인덱스 벤치마크: 뉴스 {args.news}건 × {args.dim}차원, "
+          f"종목 {args.stocks}개, 쿼리 {args.queries}건, top-{args.top_k}, nprobe {args.nprobe}")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as path:
+        started = time.perf_counter()
+        store = LocalVectorStore(path=path, dim=args.dim, window_days=None, nprobe=args.nprobe, ivf_min_size=1)
+        store.upsert(news_ids.tolist(), vectors, stock_codes.tolist(), [0] * args.news)
+        store.flush()
+        store = LocalVectorStore(path=path, dim=args.dim, window_days=None, nprobe=args.nprobe, ivf_min_size=1)
+        print(f"인덱스 생성 + memmap 로드: {time.perf_counter() - started:.2f}초\n")
+
+        norms = np.einsum("ij,ij->i", vectors, vectors)
+
+        def brute_force(query: np.ndarray, rows: np.ndarray = None) -> List[int]:
+            candidates = vectors if rows is None else vectors[rows]
+            candidate_norms = norms if rows is None else norms[rows]
+            distances = candidate_norms - 2.0 * (candidates @ query)
+            order = np.argsort(distances)[: args.top_k]
+            return news_ids[order if rows is None else rows[order]].tolist()
+
+        rows_by_stock = {code: np.flatnonzero(stock_codes == code) for code in np.unique(stock_codes)}
+        query_stocks = stock_codes[picks]
+
+        expected_all = [brute_force(query) for query in queries]
+        expected_stock = [brute_force(query, rows_by_stock[code]) for query, code in zip(queries, query_stocks)]
+
+        results = {
+            "brute force (전체)": run_benchmark(brute_force, queries, expected_all),
+            "IVF (전체)": run_benchmark(
+                lambda query: [hit.news_id for hit in store.search([query], args.top_k)[0]],
+                queries, expected_all,
+            ),
+        }
+
+        stock_iter = iter(query_stocks)
+        results["brute force (종목)"] = run_benchmark(
+            lambda query: brute_force(query, rows_by_stock[next(stock_iter)]), queries, expected_stock
+        )
+        stock_iter = iter(query_stocks)
+        results["종목 인덱스 (종목)"] = run_benchmark(
+            lambda query: [hit.news_id for hit in store.search([query], args.top_k, stock_code=next(stock_iter))[0]],
+            queries, expected_stock,
+        )
+
+    print(f"{'':24s}{'recall':>10s}{'p50 (ms)':>12s}{'p99 (ms)':>12s}")
+    for label, result in results.items():
+        print(f"{label:24s}{result['recall']:>10.3f}{result['p50']:>12.3f}{result['p99']:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
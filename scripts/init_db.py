@@ -5,6 +5,8 @@ PostgreSQL 데이터베이스 초기화 스크립트
 import sys
 from pathlib import Path
 
+from sqlalchemy import text
+
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -28,6 +30,9 @@ def init_database():
     try:
         # 테이블 생성
         print(f"\n📋 테이블 생성 중...")
+        # 뉴스 제목/본문 trigram 인덱스용 확장
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         Base.metadata.create_all(engine)
 
         print(f"   ✅ news_articles (뉴스 기사)")
@@ -36,7 +41,6 @@ def init_database():
         print(f"   ✅ telegram_users (텔레그램 사용자)")
 
         # 연결 테스트
-        from sqlalchemy import text
         from sqlalchemy.orm import sessionmaker
         Session = sessionmaker(bind=engine)
         session = Session()
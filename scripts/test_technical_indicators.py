@@ -6,6 +6,7 @@ Phase 1: 이동평균 & 거래량 분석 테스트
 import logging
 from backend.db.session import SessionLocal
 from backend.llm.predictor import StockPredictor
+from backend.services.indicator_store import get_indicator_store
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -19,15 +20,14 @@ def test_technical_indicators():
     print("=" * 80)
 
     db = SessionLocal()
-    predictor = StockPredictor()
 
     try:
         # 삼성전자 (005930) 테스트
         stock_code = "005930"
         logger.info(f"\n🔍 종목 코드: {stock_code} (삼성전자)")
 
-        # 기술적 지표 계산
-        technical = predictor._get_technical_indicators(stock_code)
+        # 기술적 지표 조회 (증분 갱신된 지표 저장소)
+        technical = get_indicator_store().get(stock_code, db)
 
         if not technical:
             logger.warning("⚠️ 기술적 지표 데이터 없음")
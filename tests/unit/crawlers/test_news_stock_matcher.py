@@ -0,0 +1,110 @@
+"""
+Unit tests for news_stock_matcher.py
+
+- 일괄 변동률 계산이 단건 계산(get_price_changes_for_news)과 같은 결과
+- run_daily_matching이 기존 매칭은 갱신, 신규 매칭은 삽입
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.crawlers.news_stock_matcher import (
+    calculate_price_changes_bulk,
+    get_price_changes_for_news,
+    run_daily_matching,
+)
+from backend.db.models.match import NewsStockMatch
+from backend.db.models.news import NewsArticle
+from backend.db.models.stock import StockPrice
+from backend.utils.business_days import is_business_day
+
+
+def _business_days(start: datetime, count: int):
+    days = []
+    current = start
+    while len(days) < count:
+        if is_business_day(current):
+            days.append(current)
+        current += timedelta(days=1)
+    return days
+
+
+def _add_prices(db, stock_code, days, base, skip=()):
+    for i, day in enumerate(days):
+        if day in skip:
+            continue
+        close = base + i * 10
+        db.add(StockPrice(
+            stock_code=stock_code, date=day, open=close, high=close, low=close, close=close,
+            volume=1, source="kis",
+        ))
+
+
+def _add_news(db, news_id, stock_code, published_at):
+    news = NewsArticle(
+        id=news_id, title=f"뉴스 {news_id}", content="본문", published_at=published_at,
+        source="test", stock_code=stock_code,
+    )
+    db.add(news)
+    return news
+
+
+def test_bulk_price_changes_match_single_article(db_session):
+    """
+    Test: 일괄 계산 결과가 단건 계산과 동일
+
+    Given: 연휴/주말을 포함한 2개 종목 일봉 (한 종목은 T+3 일자 누락),
+           평일/주말/일봉 범위 끝 근처에 발표된 뉴스
+    When: calculate_price_changes_bulk
+    Then: 모든 뉴스에서 get_price_changes_for_news와 같은 변동률
+    """
+    days = _business_days(datetime(2025, 9, 1), 40)
+    _add_prices(db_session, "005930", days, 1000)
+    _add_prices(db_session, "000660", days, 500, skip={days[8]})
+    # 같은 일자 fdr 소스 행 (kis 우선)
+    db_session.add(StockPrice(
+        stock_code="005930", date=days[1], open=1, high=1, low=1, close=1, volume=1, source="fdr",
+    ))
+
+    news_list = [
+        _add_news(db_session, 1, "005930", days[0] + timedelta(hours=9)),
+        _add_news(db_session, 2, "000660", days[5] + timedelta(hours=15)),
+        _add_news(db_session, 3, "005930", datetime(2025, 9, 6, 10)),  # 토요일 (T0 없음)
+        _add_news(db_session, 4, "000660", days[30]),  # T+10/T+20 범위 밖
+        _add_news(db_session, 5, "035720", days[2]),  # 주가 없음
+    ]
+    db_session.commit()
+
+    bulk = calculate_price_changes_bulk(news_list, db_session)
+
+    assert bulk[1]["1d"] == pytest.approx(1.0)
+    assert bulk[2]["3d"] is None
+    for news in news_list:
+        assert bulk[news.id] == get_price_changes_for_news(news, db_session)
+
+
+def test_run_daily_matching_upserts_matches(db_session):
+    """
+    Test: 일일 매칭 결과 일괄 저장
+
+    Given: 최근 뉴스 2건 (1건은 기존 매칭 존재), T0 주가 없는 뉴스 1건
+    When: run_daily_matching
+    Then: 성공 2건/실패 1건, 기존 매칭 갱신, 뉴스-종목당 1행
+    """
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    days = _business_days(today - timedelta(days=6), 3)
+    _add_prices(db_session, "005930", days, 1000)
+
+    _add_news(db_session, 1, "005930", days[0] + timedelta(hours=9))
+    _add_news(db_session, 2, "005930", days[1] + timedelta(hours=9))
+    _add_news(db_session, 3, "000660", days[0] + timedelta(hours=9))
+    db_session.add(NewsStockMatch(news_id=1, stock_code="005930", price_change_1d=99.0))
+    db_session.commit()
+
+    success_count, fail_count = run_daily_matching(db_session, lookback_days=7)
+
+    matches = {m.news_id: m for m in db_session.query(NewsStockMatch).all()}
+    assert (success_count, fail_count) == (2, 1)
+    assert sorted(matches) == [1, 2]
+    assert matches[1].price_change_1d == pytest.approx(1.0)
+    assert matches[2].price_change_1d == pytest.approx(round(10 / 1010 * 100, 2))
@@ -0,0 +1,97 @@
+"""
+Unit tests for kis_client.RateLimiter (token bucket)
+
+- 버킷 용량까지는 대기 없이 통과
+- 초과 요청은 부족한 토큰만큼 예약 대기 (대기끼리 직렬화되지 않음)
+- 공유 버킷(Redis Lua 스크립트): 여러 인스턴스가 하나의 예산 공유
+- Redis 장애 시 로컬 버킷으로 대체
+"""
+import asyncio
+
+import pytest
+import redis
+
+from backend.crawlers import kis_client
+from backend.crawlers.kis_client import RateLimiter
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+
+    async def fake_sleep(seconds):
+        recorded.append(seconds)
+
+    monkeypatch.setattr(kis_client.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+def test_burst_then_reserved_waits(sleeps):
+    """
+    Test: 용량 5, 초당 5건 버킷
+
+    Given: 가득 찬 버킷
+    When: 7건 동시 획득
+    Then: 5건은 즉시, 6·7번째는 0.2초/0.4초 예약 대기
+    """
+    limiter = RateLimiter(max_requests=5, window_seconds=1.0)
+
+    async def run():
+        await asyncio.gather(*(limiter.acquire() for _ in range(7)))
+
+    asyncio.run(run())
+
+    assert sleeps == [pytest.approx(0.2, abs=0.01), pytest.approx(0.4, abs=0.01)]
+    metrics = limiter.get_metrics()
+    assert metrics["acquired"] == 7
+    assert metrics["throttled"] == 2
+    assert metrics["max_wait_seconds"] == pytest.approx(0.4, abs=0.01)
+
+
+def test_redis_error_falls_back_to_local_bucket(sleeps):
+    """
+    Test: 공유 버킷 Redis 장애
+
+    Given: 연결 불가 Redis
+    When: 획득
+    Then: 로컬 버킷으로 즉시 통과, redis_errors 증가
+    """
+    client = redis.Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.1)
+    limiter = RateLimiter(max_requests=5, window_seconds=1.0, redis_client=client)
+
+    asyncio.run(limiter.acquire())
+    asyncio.run(limiter.acquire())
+
+    metrics = limiter.get_metrics()
+    assert sleeps == []
+    assert metrics["redis_errors"] == 1
+    assert metrics["shared"] is True
+
+
+def test_shared_bucket_lua_script(sleeps):
+    """
+    Test: 공유 버킷 (fakeredis로 Lua 스크립트 실행)
+
+    Given: 같은 Redis 키를 쓰는 RateLimiter 2개 (용량 5, 초당 5건)
+    When: 각각 3건씩 획득
+    Then: 합계 6건 중 5건은 즉시, 마지막 1건만 0.2초 대기 (로컬 버킷이 아닌 공유 예산 사용)
+    """
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+
+    client = fakeredis.FakeRedis(decode_responses=True)
+    limiters = [
+        RateLimiter(max_requests=5, window_seconds=1.0, redis_client=client, redis_key="kis:rate_limit:test")
+        for _ in range(2)
+    ]
+
+    async def run():
+        for limiter in limiters:
+            for _ in range(3):
+                await limiter.acquire()
+
+    asyncio.run(run())
+
+    assert sleeps == [pytest.approx(0.2, abs=0.05)]
+    assert float(client.hget("kis:rate_limit:test", "tokens")) == pytest.approx(-1, abs=0.05)
+    assert all(limiter.get_metrics()["redis_errors"] == 0 for limiter in limiters)
@@ -0,0 +1,66 @@
+"""
+Unit tests for bulk_upsert.py
+
+- 컬럼형 배치를 한 번에 upsert (기존 키는 갱신)
+- 신규 행만 삽입하고 삽입된 행만 반환
+"""
+from datetime import datetime
+
+from backend.db.bulk_upsert import insert_new_rows, upsert_rows
+from backend.db.models.stock import StockPrice, StockPriceMinute
+
+
+def test_upsert_rows_updates_existing_keys(db_session):
+    """
+    Test: 같은 (종목, 일자, 소스) 키는 갱신, 새 키는 삽입
+
+    Given: 기존 일봉 1건
+    When: 기존 일자 + 새 일자를 컬럼형 배치로 upsert
+    Then: 2건, 기존 일자 종가 갱신
+    """
+    day1, day2 = datetime(2025, 1, 2), datetime(2025, 1, 3)
+    db_session.add(StockPrice(
+        stock_code="005930", date=day1, open=1, high=1, low=1, close=1, volume=1, source="kis",
+    ))
+    db_session.commit()
+
+    saved = upsert_rows(db_session, StockPrice, {
+        "stock_code": ["005930", "005930"],
+        "date": [day1, day2],
+        "open": [100.0, 200.0],
+        "high": [100.0, 200.0],
+        "low": [100.0, 200.0],
+        "close": [100.0, 200.0],
+        "volume": [10, 20],
+        "source": ["kis", "kis"],
+    })
+    db_session.commit()
+
+    rows = db_session.query(StockPrice).order_by(StockPrice.date).all()
+    assert saved == 2
+    assert [(r.date, r.close) for r in rows] == [(day1, 100.0), (day2, 200.0)]
+
+
+def test_insert_new_rows_returns_only_inserted(db_session):
+    """
+    Test: 이미 있는 분봉은 스킵하고 신규 분봉만 반환
+
+    Given: 기존 분봉 1건
+    When: 기존 + 신규 분봉 배치 저장
+    Then: 신규 1건만 반환, 기존 값 유지
+    """
+    t1, t2 = datetime(2025, 1, 2, 9, 0), datetime(2025, 1, 2, 9, 1)
+    bar = {"stock_code": "005930", "open": 1.0, "high": 1.0, "low": 1.0, "source": "kis"}
+    db_session.add(StockPriceMinute(datetime=t1, close=1.0, volume=5, **bar))
+    db_session.commit()
+
+    inserted = insert_new_rows(
+        db_session,
+        StockPriceMinute,
+        [dict(bar, datetime=t1, close=9.0, volume=7), dict(bar, datetime=t2, close=2.0, volume=3)],
+        returning=("datetime", "close", "volume"),
+    )
+    db_session.commit()
+
+    assert inserted == [(t2, 2.0, 3)]
+    assert db_session.query(StockPriceMinute).filter_by(datetime=t1).one().close == 1.0
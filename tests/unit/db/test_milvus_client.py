@@ -0,0 +1,127 @@
+"""
+Unit tests for MilvusConnectionManager
+
+- alias 연결과 컬렉션 load()는 최초 1회만 수행
+- 연결 장애 시 재연결/재로드 후 1회 재시도, 비멱등 작업은 재시도 없이 예외 전파
+- 연결 장애가 아닌 오류는 재연결 없이 전파, 컬렉션 로드 중에도 다른 작업은 진행
+"""
+import threading
+
+import pytest
+from pymilvus.exceptions import MilvusException
+
+from backend.db import milvus_client
+from backend.db.milvus_client import MilvusConnectionManager
+
+
+class _FakeConnections:
+    def __init__(self):
+        self.connects = []
+        self.disconnects = []
+
+    def connect(self, alias, host, port):
+        self.connects.append(alias)
+
+    def disconnect(self, alias):
+        self.disconnects.append(alias)
+
+
+@pytest.fixture
+def fake_milvus(monkeypatch):
+    state = {"loads": 0, "failures": 0, "collections": 0}
+    fake_connections = _FakeConnections()
+
+    class FakeCollection:
+        def __init__(self, name, using):
+            state["collections"] += 1
+            self.name = name
+            self.using = using
+
+        def load(self):
+            gate = state.get("load_gate")
+            if gate is not None and self.name == "slow_collection":
+                state["load_started"].set()
+                gate.wait(5)
+            state["loads"] += 1
+
+        def search(self, **kwargs):
+            if state["failures"]:
+                state["failures"] -= 1
+                raise ConnectionError("channel closed")
+            return [self.using]
+
+    monkeypatch.setattr(milvus_client, "connections", fake_connections)
+    monkeypatch.setattr(milvus_client, "Collection", FakeCollection)
+    state["connections"] = fake_connections
+    return state
+
+
+def test_connects_and_loads_once(fake_milvus):
+    """
+    Test: pool_size 2, 검색 10회
+
+    Given: 정상 Milvus
+    When: execute(search) 10회
+    Then: alias 2개 각각 1회 연결, 컬렉션 핸들 2개, load() 1회, alias 라운드로빈
+    """
+    manager = MilvusConnectionManager("localhost", 19530, pool_size=2)
+
+    used = [manager.execute("news_embeddings", lambda c: c.search())[0] for _ in range(10)]
+
+    assert sorted(fake_milvus["connections"].connects) == ["craveny_pool_0", "craveny_pool_1"]
+    assert fake_milvus["collections"] == 2
+    assert fake_milvus["loads"] == 1
+    assert used.count("craveny_pool_0") == used.count("craveny_pool_1") == 5
+    assert fake_milvus["connections"].disconnects == []
+
+
+def test_reconnects_and_retries_on_failure(fake_milvus):
+    """
+    Test: 첫 검색 실패
+
+    Given: 검색 1회 실패 후 정상
+    When: execute(search), 이어서 retry=False 작업 실패
+    Then: 재연결·재로드 후 결과 반환, retry=False는 재연결 후 예외 전파
+    """
+    manager = MilvusConnectionManager("localhost", 19530, pool_size=1)
+    fake_milvus["failures"] = 1
+
+    assert manager.execute("news_embeddings", lambda c: c.search()) == ["craveny_pool_0"]
+    assert fake_milvus["connections"].disconnects == ["craveny_pool_0"]
+    assert fake_milvus["connections"].connects == ["craveny_pool_0", "craveny_pool_0"]
+    assert fake_milvus["loads"] == 2
+
+    fake_milvus["failures"] = 1
+    with pytest.raises(ConnectionError):
+        manager.execute("news_embeddings", lambda c: c.search(), load=False, retry=False)
+    assert len(fake_milvus["connections"].disconnects) == 2
+
+
+def test_non_connection_error_does_not_reconnect_and_load_is_not_global(fake_milvus):
+    """
+    Test: 잘못된 표현식 오류, 느린 컬렉션 로드
+
+    Given: 로드가 멈춰 있는 컬렉션
+    When: 다른 컬렉션 검색, 이어서 표현식 오류가 나는 작업 실행
+    Then: 다른 컬렉션 검색은 로드를 기다리지 않고 완료, 표현식 오류는 재연결 없이 전파
+    """
+    manager = MilvusConnectionManager("localhost", 19530, pool_size=1)
+    fake_milvus["load_gate"] = threading.Event()
+    fake_milvus["load_started"] = threading.Event()
+
+    loader = threading.Thread(target=manager.get_collection, args=("slow_collection",))
+    loader.start()
+    try:
+        assert fake_milvus["load_started"].wait(5)
+        assert manager.execute("news_embeddings", lambda c: c.search()) == ["craveny_pool_0"]
+    finally:
+        fake_milvus["load_gate"].set()
+        loader.join(5)
+
+    def bad_expression(collection):
+        raise MilvusException(message="cannot parse expression")
+
+    with pytest.raises(MilvusException):
+        manager.execute("news_embeddings", bad_expression)
+    assert fake_milvus["connections"].disconnects == []
+    assert fake_milvus["connections"].connects == ["craveny_pool_0"]
@@ -0,0 +1,134 @@
+"""
+Unit tests for NewsEmbedder.embed_batch (다중 입력 배치 임베딩)
+
+- 입력 수 한도에 맞춰 요청 분할, 입력 순서 유지
+- 429 응답은 Retry-After만큼 대기 후 재시도
+- 잘못된 입력(400)은 해당 항목만 None, 빈 텍스트는 요청하지 않음
+- 임베딩 캐시: embed_text/embed_batch 간 공유, 같은 텍스트는 한 번만 요청
+"""
+import json
+
+import httpx
+import pytest
+from openai import OpenAI
+
+from backend.llm import embedder as embedder_module
+from backend.llm.embedder import NewsEmbedder
+from backend.llm.embedding_cache import EmbeddingCache
+
+
+def _make_embedder(handler) -> NewsEmbedder:
+    embedder = NewsEmbedder.__new__(NewsEmbedder)
+    embedder.embedding_model = "text-embedding-3-small"
+    embedder.embedding_dim = 2
+    embedder.cache = EmbeddingCache(max_size=100)
+    embedder.openai_client = OpenAI(
+        api_key="test",
+        base_url="http://fake/v1",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    return embedder
+
+
+def _ok(inputs):
+    # 순서가 섞인 응답도 index 기준으로 정렬되는지 확인하기 위해 역순 반환
+    data = [
+        {"object": "embedding", "index": index, "embedding": [float(len(text)), float(index)]}
+        for index, text in enumerate(inputs)
+    ]
+    return httpx.Response(200, json={
+        "object": "list", "model": "m", "data": data[::-1],
+        "usage": {"prompt_tokens": 0, "total_tokens": 0},
+    })
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(embedder_module.time, "sleep", recorded.append)
+    return recorded
+
+
+def test_chunks_requests_and_retries_rate_limit(monkeypatch, sleeps):
+    """
+    Test: 입력 5건, 요청당 최대 2건
+
+    Given: 첫 요청은 429 (Retry-After 0.5)
+    When: embed_batch
+    Then: 3회 분할 요청(+재시도 1회), 결과는 입력 순서대로
+    """
+    monkeypatch.setattr(embedder_module.settings, "EMBEDDING_BATCH_MAX_INPUTS", 2)
+    requests = []
+
+    def handler(request):
+        inputs = json.loads(request.content)["input"]
+        requests.append(inputs)
+        if len(requests) == 1:
+            return httpx.Response(429, headers={"retry-after": "0.5"}, json={"error": {"message": "rate"}})
+        return _ok(inputs)
+
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+    embeddings = _make_embedder(handler).embed_batch(texts)
+
+    assert [inputs for inputs in requests] == [["a", "bb"], ["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+    assert sleeps == [0.5]
+    assert [embedding[0] for embedding in embeddings] == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_bad_input_is_isolated(sleeps):
+    """
+    Test: 입력 4건 중 1건은 400, 1건은 빈 텍스트
+
+    Given: "bad"가 포함된 요청은 400
+    When: embed_batch
+    Then: bad와 빈 텍스트만 None, 나머지는 성공
+    """
+    def handler(request):
+        inputs = json.loads(request.content)["input"]
+        if "bad" in inputs:
+            return httpx.Response(400, json={"error": {"message": "invalid input"}})
+        return _ok(inputs)
+
+    embeddings = _make_embedder(handler).embed_batch(["ok1", "bad", "", "ok2"])
+
+    assert embeddings[1] is None
+    assert embeddings[2] is None
+    assert embeddings[0] == [3.0, 0.0]
+    assert embeddings[3] is not None
+    assert sleeps == []
+
+
+def test_cache_embeds_each_text_once():
+    """
+    Test: embed_text 후 같은 텍스트(공백만 다름)를 포함한 embed_batch
+
+    Given: LRU 캐시 (Redis 연결 불가)
+    When: embed_text("뉴스 A") → embed_batch(["뉴스  A", "뉴스 B", "뉴스 B"])
+    Then: API 요청은 ["뉴스 A"], ["뉴스 B"] 두 번, Redis 오류는 집계 후 LRU로 동작
+    """
+    import redis
+
+    requests = []
+
+    def handler(request):
+        inputs = json.loads(request.content)["input"]
+        requests.append(inputs if isinstance(inputs, list) else [inputs])
+        return _ok(requests[-1])
+
+    embedder = _make_embedder(handler)
+    embedder.cache = EmbeddingCache(
+        max_size=100,
+        redis_client=redis.Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.1),
+    )
+
+    first = embedder.embed_text("뉴스 A")
+    embeddings = embedder.embed_batch(["뉴스  A", "뉴스 B", "뉴스 B"])
+
+    assert requests == [["뉴스 A"], ["뉴스 B"]]
+    assert embeddings[0] == first
+    assert embeddings[1] == embeddings[2]
+
+    metrics = embedder.cache.get_metrics()
+    assert metrics["lru_hits"] == 1
+    assert metrics["misses"] == 2
+    assert metrics["redis_errors"] == 1
@@ -0,0 +1,75 @@
+"""
+Unit tests for NewsEmbedder 임베딩 상태 (embedded_at) 관리
+
+- 미임베딩 조회는 embedded_at IS NULL 행만 대상
+- Milvus 저장 성공 후에만 embedded_at 기록, 실패 항목은 다음 실행에서 재처리
+- 백필은 ID 커서 청크로 진행, 재실행 시 남은 뉴스만 처리
+"""
+from datetime import datetime
+
+from backend.db.models.news import NewsArticle
+from backend.llm import embedder as embedder_module
+from backend.llm.embedder import NewsEmbedder
+
+
+class _FakeStore:
+    def __init__(self, fail_ids=()):
+        self.fail_ids = set(fail_ids)
+        self.upserted = []
+
+    def upsert(self, news_ids, embeddings, stock_codes, published_timestamps):
+        if self.fail_ids & set(news_ids):
+            raise RuntimeError("milvus down")
+        self.upserted.extend(news_ids)
+        return len(news_ids)
+
+
+def _make_embedder(bad_titles=()) -> NewsEmbedder:
+    embedder = NewsEmbedder.__new__(NewsEmbedder)
+    embedder.embed_batch = lambda texts: [
+        None if text.split("\n")[0] in bad_titles else [0.1, 0.2] for text in texts
+    ]
+    return embedder
+
+
+def test_backfill_marks_only_saved_news_and_resumes(db_session, monkeypatch):
+    """
+    Test: 뉴스 6건 (1건 기존 임베딩, 1건 임베딩 실패, 1건 Milvus 저장 실패 청크)
+
+    Given: chunk_size=2 백필
+    When: 백필 실행 후 장애 해소 뒤 재실행
+    Then: 첫 실행은 저장 성공분만 embedded_at 기록, 재실행은 남은 뉴스만 처리
+    """
+    for news_id in range(1, 7):
+        db_session.add(NewsArticle(
+            id=news_id,
+            title=f"뉴스{news_id}",
+            content="본문",
+            published_at=datetime(2025, 1, news_id),
+            source="t",
+            embedded_at=datetime(2025, 1, 1) if news_id == 1 else None,
+        ))
+    db_session.commit()
+
+    store = _FakeStore(fail_ids={5})
+    monkeypatch.setattr(embedder_module, "get_vector_store", lambda: store)
+    monkeypatch.setattr(embedder_module, "get_hot_vector_store", lambda: None)
+
+    embedder = _make_embedder(bad_titles={"뉴스3"})
+    result = embedder.backfill_embeddings(db_session, chunk_size=2)
+
+    # 청크: [2, 3] → 2만 저장, [4, 5] → Milvus 실패, [6] → 저장
+    assert result == {"success": 2, "failed": 3, "chunks": 3, "last_id": 6}
+    assert store.upserted == [2, 6]
+
+    pending = [news.id for news in embedder.get_unembedded_news(db_session, limit=10)]
+    assert pending == [5, 4, 3]
+
+    # 장애 해소 후 재실행: 남은 뉴스만 처리
+    store.fail_ids = set()
+    embedder = _make_embedder()
+    result = embedder.backfill_embeddings(db_session, chunk_size=2)
+
+    assert result["success"] == 3
+    assert sorted(store.upserted) == [2, 3, 4, 5, 6]
+    assert embedder.get_unembedded_news(db_session, limit=10) == []
@@ -0,0 +1,145 @@
+"""
+Unit tests for StockPredictor.predict_all_models (멀티모델 동시 예측)
+
+- 활성 모델을 스레드 풀에서 동시에 호출하되 프로바이더별 동시 호출 상한 준수
+- 요청 타임아웃은 모델별로 클라이언트에 전달 (상한 대기 시간은 포함하지 않음),
+  타임아웃된 모델은 error 결과로 대체하고 저장하지 않음
+- 성공한 예측은 하나의 트랜잭션으로 저장 (기존 예측 갱신 + 신규 추가)
+"""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from backend.db.models.prediction import Prediction
+from backend.llm import predictor as predictor_module
+from backend.llm.predictor import StockPredictor
+
+
+class FakeClient:
+    """OpenAI 클라이언트 대역 (요청 타임아웃/재시도 옵션 기록)"""
+
+    def __init__(self, delay, running, peak, lock, timeout_error=False):
+        self.delay = delay
+        self.running, self.peak, self.lock = running, peak, lock
+        self.timeout_error = timeout_error
+        self.options = {}
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def with_options(self, **options):
+        self.options.update(options)
+        return self
+
+    def create(self, model, timeout, **kwargs):
+        provider = "openai" if model.startswith("gpt") else "openrouter"
+        with self.lock:
+            self.running[provider] += 1
+            self.peak[provider] = max(self.peak[provider], self.running[provider])
+        try:
+            time.sleep(self.delay)
+            self.requests.append(timeout)
+            if self.timeout_error:
+                raise openai.APITimeoutError(request=httpx.Request("POST", "https://example.com"))
+            content = json.dumps({"sentiment_direction": "positive", "sentiment_score": 0.5})
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+        finally:
+            with self.lock:
+                self.running[provider] -= 1
+
+
+def _model(name, provider, client):
+    return {"name": name, "provider": provider, "model_identifier": name, "client": client}
+
+
+@pytest.fixture
+def predictor(monkeypatch):
+    monkeypatch.setattr(predictor_module, "_provider_semaphores", {})
+    monkeypatch.setattr(predictor_module.settings, "LLM_PROVIDER_CONCURRENCY", {"openai": 1, "openrouter": 2})
+
+    instance = StockPredictor.__new__(StockPredictor)
+    instance._executor = ThreadPoolExecutor(max_workers=8)
+    instance._build_prompt = lambda *args, **kwargs: "prompt"
+    yield instance
+    instance._executor.shutdown(wait=True)
+
+
+def test_fan_out_respects_provider_caps_and_request_timeout(predictor, monkeypatch):
+    """
+    Test: openai 3개(상한 1) + openrouter 2개(상한 2), 그중 1개는 요청 타임아웃
+
+    Given: 모델당 0.2초 호출 (openai는 상한 때문에 최대 0.4초 대기 후 시작)
+    When: predict_all_models
+    Then: 대기 시간과 무관하게 모든 openai 모델이 성공하고,
+          클라이언트 타임아웃이 난 모델만 error 결과로 저장 제외
+    """
+    monkeypatch.setattr(predictor_module.settings, "LLM_REQUEST_TIMEOUT", 0.5)
+    monkeypatch.setattr(predictor_module.settings, "LLM_REQUEST_MAX_RETRIES", 0)
+
+    running = {"openai": 0, "openrouter": 0}
+    peak = {"openai": 0, "openrouter": 0}
+    lock = threading.Lock()
+    clients = {
+        name: FakeClient(0.2, running, peak, lock, timeout_error=(name == "ds-slow"))
+        for name in ("gpt-a", "gpt-b", "gpt-c", "ds-a", "ds-slow")
+    }
+    predictor.active_models = {
+        1: _model("gpt-a", "openai", clients["gpt-a"]),
+        2: _model("gpt-b", "openai", clients["gpt-b"]),
+        3: _model("gpt-c", "openai", clients["gpt-c"]),
+        4: _model("ds-a", "openrouter", clients["ds-a"]),
+        5: _model("ds-slow", "openrouter", clients["ds-slow"]),
+    }
+
+    saved = {}
+    predictor._save_model_predictions = lambda news_id, stock_code, predictions: saved.update(predictions) or len(predictions)
+
+    results = predictor.predict_all_models({"stock_code": "005930"}, [], news_id=1)
+
+    assert peak == {"openai": 1, "openrouter": 2}
+    assert "timed out" in results[5]["error"]
+    assert set(saved) == {1, 2, 3, 4}
+    assert all(results[model_id]["model_id"] == model_id for model_id in results)
+    assert all(client.requests == [0.5] for client in clients.values())
+    assert all(client.options == {"max_retries": 0} for client in clients.values())
+
+
+def test_save_model_predictions_single_transaction(predictor, db_engine, db_session, monkeypatch):
+    """
+    Test: 기존 예측 1건 + 신규 예측 1건 일괄 저장
+
+    Given: model 1의 기존 예측
+    When: model 1, 2 예측을 _save_model_predictions로 저장
+    Then: model 1은 갱신, model 2는 추가 (커밋 1회)
+    """
+    db_session.add(Prediction(news_id=1, model_id=1, stock_code="005930", sentiment_direction="negative"))
+    db_session.commit()
+
+    commits = []
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+    def session_factory():
+        session = TestingSessionLocal()
+        original_commit = session.commit
+        session.commit = lambda: (commits.append(1), original_commit())[1]
+        return session
+
+    monkeypatch.setattr(predictor_module, "SessionLocal", session_factory)
+
+    saved_count = predictor._save_model_predictions(1, "005930", {
+        1: {"sentiment_direction": "positive", "sentiment_score": 0.7},
+        2: {"sentiment_direction": "neutral", "sentiment_score": 0.0},
+    })
+
+    db_session.expire_all()
+    rows = {p.model_id: p for p in db_session.query(Prediction).filter(Prediction.news_id == 1).all()}
+    assert saved_count == 2
+    assert commits == [1]
+    assert rows[1].sentiment_direction == "positive"
+    assert rows[2].sentiment_direction == "neutral"
@@ -0,0 +1,135 @@
+"""
+Unit tests for prompt_context.py
+
+- 여러 종목의 프롬프트 컨텍스트를 종목 수와 무관한 쿼리 수로 한 세션에서 조회
+- 시장/업종 지수는 실행 간 재사용
+- _build_prompt가 컨텍스트를 사용하고 별도 세션을 열지 않음
+"""
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from backend.db.models.market_data import IndexDailyPrice
+from backend.db.models.news import NewsArticle
+from backend.db.models.stock import Stock, StockPrice
+from backend.llm import predictor as predictor_module
+from backend.llm import prompt_context as prompt_context_module
+from backend.llm.predictor import StockPredictor
+from backend.llm.prompt_context import PromptContextLoader
+from backend.services.indicator_store import IndicatorStore
+
+
+@pytest.fixture
+def seeded(db_session, monkeypatch):
+    monkeypatch.setattr(prompt_context_module, "get_indicator_store", lambda: IndicatorStore())
+
+    db_session.add_all([
+        Stock(code="005930", name="삼성전자", priority=1),
+        Stock(code="000660", name="SK하이닉스", priority=2),
+    ])
+    for i, close in enumerate([50000, 51000, 52020]):
+        db_session.add(StockPrice(
+            stock_code="005930", date=datetime(2025, 11, 3 + i), open=close, high=close,
+            low=close, close=close, volume=100 + i, source="kis",
+        ))
+    db_session.add(StockPrice(
+        stock_code="000660", date=datetime(2025, 11, 5), open=1, high=1, low=1, close=100000,
+        volume=1, source="kis",
+    ))
+    for i in range(6):
+        db_session.add(NewsArticle(
+            title=f"공시 {i}", content="공시 본문" * 30, source="dart", stock_code="005930",
+            published_at=datetime.now() - timedelta(hours=i),
+        ))
+    day = date(2025, 11, 5)
+    db_session.add_all([
+        IndexDailyPrice(index_code="0001", date=day - timedelta(days=1), close=2500.0, change_rate=0.1),
+        IndexDailyPrice(index_code="0001", date=day, close=2550.123, change_rate=2.0),
+        IndexDailyPrice(index_code="1001", date=day, close=800.0, change_rate=-1.234),
+        *[
+            IndexDailyPrice(index_code=f"10{10 + i}", index_name=f"업종{i}", date=day,
+                            close=1000.0 + i, change_rate=float(i - 3))
+            for i in range(7)
+        ],
+    ])
+    db_session.commit()
+    return db_session
+
+
+def _count_queries(db, fn):
+    statements = []
+
+    def before_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", before_execute)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_execute)
+    return result, len(statements)
+
+
+def test_batched_load_and_shared_market_context(seeded):
+    """
+    Test: 종목 컨텍스트 일괄 조회 + 시장 지수 공유
+
+    Given: 종목 2개 (주가/공시/지수 데이터)
+    When: 두 종목을 한 번에 로드한 뒤, 한 종목만 다시 로드
+    Then: 종목별 값이 정확하고, 두 번째 로드는 시장/업종 지수 쿼리 없이 종목 데이터만 조회
+    """
+    loader = PromptContextLoader()
+
+    context, first_queries = _count_queries(
+        seeded, lambda: loader.load(["005930", "000660", None, "005930"], seeded)
+    )
+
+    samsung = context.for_stock("005930")
+    assert samsung.stock_info == {"code": "005930", "name": "삼성전자", "priority": 1}
+    assert samsung.stock_price["close"] == 52020
+    assert samsung.stock_price["change_rate"] == 2.0
+    assert [d["title"] for d in samsung.disclosures] == [f"공시 {i}" for i in range(5)]
+    assert samsung.disclosures[0]["content"].endswith("...")
+
+    hynix = context.for_stock("000660")
+    assert hynix.stock_price["change_rate"] == 0.0
+    assert hynix.disclosures == []
+
+    assert context.market_context["kospi"] == {"close": 2550.12, "change_pct": 2.0, "date": "2025-11-05"}
+    assert context.market_context["kosdaq"]["change_pct"] == -1.23
+    assert [s["name"] for s in context.sector_indices["top_sectors"]] == ["업종6", "업종5", "업종4"]
+    assert [s["name"] for s in context.sector_indices["bottom_sectors"]] == ["업종2", "업종1", "업종0"]
+
+    _, second_queries = _count_queries(seeded, lambda: loader.load(["005930"], seeded))
+    assert second_queries < first_queries
+
+
+def test_build_prompt_uses_preloaded_context(seeded, monkeypatch):
+    """
+    Test: 미리 조회한 컨텍스트로 프롬프트 생성
+
+    Given: 일괄 조회된 컨텍스트
+    When: _build_prompt 호출 (로더 재조회 금지)
+    Then: 종목명/주가/공시/시장 지수가 프롬프트에 포함
+    """
+    context = PromptContextLoader().load(["005930"], seeded)
+
+    def fail_load(*args, **kwargs):
+        raise AssertionError("컨텍스트가 있으면 다시 조회하지 않아야 함")
+
+    monkeypatch.setattr(
+        predictor_module, "get_prompt_context_loader",
+        lambda: type("Loader", (), {"load": staticmethod(fail_load)})(),
+    )
+
+    predictor = StockPredictor.__new__(StockPredictor)
+    prompt = predictor._build_prompt(
+        {"title": "삼성전자 실적 발표", "content": "본문", "stock_code": "005930"}, [], context
+    )
+
+    assert "삼성전자" in prompt
+    assert "52,020원" in prompt
+    assert "공시 0" in prompt
+    assert "업종6" in prompt
@@ -0,0 +1,74 @@
+"""
+Unit tests for NewsVectorSearch.search_similar_news_batch
+
+- 배치 임베딩 1회, 종목 코드 필터별 다중 벡터 검색 1회씩
+- 결과는 입력 순서대로, 임베딩/검색 실패 항목은 None (유사 뉴스 없음은 빈 리스트)
+"""
+from types import SimpleNamespace
+
+from backend.llm import vector_store as vector_store_module
+from backend.llm.vector_search import NewsVectorSearch
+from backend.llm.vector_store import MilvusVectorStore
+
+
+def _hit(news_id, distance, stock_code):
+    return SimpleNamespace(
+        distance=distance,
+        entity={"news_article_id": news_id, "stock_code": stock_code, "published_timestamp": 0},
+    )
+
+
+def test_batch_search_groups_by_stock_code(monkeypatch):
+    """
+    Test: 뉴스 6건 (005930 2건, 000660 1건, 임베딩 실패 1건, 검색 실패 1건, 유사 뉴스 없음 1건)
+
+    Given: 벡터 첫 값이 곧 유사 뉴스 ID인 가짜 Milvus (035720 검색은 실패)
+    When: search_similar_news_batch
+    Then: embed_batch 1회, 검색은 종목별 1회, 입력 순서대로 결과 (실패는 None, 결과 없음은 [])
+    """
+    embed_calls = []
+    searches = []
+
+    class FakeEmbedder:
+        def embed_batch(self, texts):
+            embed_calls.append(list(texts))
+            return [None if text == "fail" else [float(len(text)), 0.0] for text in texts]
+
+    class FakeCollection:
+        def search(self, data, anns_field, param, limit, expr, output_fields):
+            searches.append((expr, len(data)))
+            stock_code = expr.split('"')[1]
+            if stock_code == "035720":
+                raise ConnectionError("channel closed")
+            if stock_code == "051910":
+                return [[_hit(999, 100.0, stock_code)] for _ in data]
+            return [[_hit(int(vector[0]), 0.0, stock_code), _hit(999, 100.0, stock_code)] for vector in data]
+
+    class FakeManager:
+        def execute(self, collection_name, operation, load=True):
+            return operation(FakeCollection())
+
+    monkeypatch.setattr(vector_store_module, "get_milvus_manager", FakeManager)
+
+    search = NewsVectorSearch.__new__(NewsVectorSearch)
+    search.embedder = FakeEmbedder()
+    search.store = MilvusVectorStore()
+    search.hot_store = None
+
+    results = search.search_similar_news_batch(
+        ["a", "bbb", "cc", "fail", "dddd", "eeeee"],
+        ["005930", "000660", "005930", "005930", "035720", "051910"],
+        top_k=5,
+        similarity_threshold=0.5,
+    )
+
+    assert embed_calls == [["a", "bbb", "cc", "fail", "dddd", "eeeee"]]
+    assert sorted(searches) == [
+        ('stock_code == "000660"', 1),
+        ('stock_code == "005930"', 2),
+        ('stock_code == "035720"', 1),
+        ('stock_code == "051910"', 1),
+    ]
+    news_ids = [None if hits is None else [hit["news_id"] for hit in hits] for hits in results]
+    assert news_ids == [[1], [3], [2], None, None, []]
+    assert results[1][0]["stock_code"] == "000660"
@@ -0,0 +1,54 @@
+"""
+Unit tests for NewsVectorSearch.enrich_with_price_changes
+
+- 유사 뉴스 N건을 IN 쿼리 2회(뉴스, 매칭)로 보강, 본문은 200자 요약
+- 두 번째 호출은 TTL 캐시에서 응답 (DB에 없는 뉴스 포함, 쿼리 없음)
+"""
+from datetime import datetime
+
+from sqlalchemy import event
+
+from backend.db.models.match import NewsStockMatch
+from backend.db.models.news import NewsArticle
+from backend.llm.vector_search import NewsVectorSearch
+
+
+def test_enrich_uses_two_queries_then_cache(db_engine, db_session):
+    """
+    Test: 유사 뉴스 3건 (1건은 DB에 없음, 1건은 매칭 없음)
+
+    Given: 뉴스 2건, 뉴스 1의 매칭 2건 (005930, 000660)
+    When: enrich_with_price_changes 2회
+    Then: 첫 호출 SELECT 2회, 두 번째 호출 0회, 종목별 변동률/요약 일치
+    """
+    db_session.add_all([
+        NewsArticle(id=1, title="뉴스1", content="가" * 500, published_at=datetime(2025, 1, 1), source="t"),
+        NewsArticle(id=2, title="뉴스2", content="짧은 본문", published_at=datetime(2025, 1, 2), source="t"),
+        NewsStockMatch(news_id=1, stock_code="005930", price_change_1d=1.5, price_change_5d=3.0),
+        NewsStockMatch(news_id=1, stock_code="000660", price_change_1d=-2.0),
+    ])
+    db_session.commit()
+
+    search = NewsVectorSearch(detail_cache_ttl=300)
+
+    hits = [
+        {"news_id": 1, "similarity": 0.9, "stock_code": "005930"},
+        {"news_id": 99, "similarity": 0.8, "stock_code": "005930"},
+        {"news_id": 2, "similarity": 0.7, "stock_code": "005930"},
+    ]
+
+    statements = []
+    event.listen(db_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    first = search.enrich_with_price_changes(hits, db_session)
+    first_queries = len(statements)
+    second = search.enrich_with_price_changes(hits, db_session)
+
+    assert first_queries == 2
+    assert len(statements) == 2
+    assert first == second
+    assert [news["news_id"] for news in first] == [1, 2]
+    assert first[0]["news_content"] == "가" * 200 + "..."
+    assert first[0]["price_changes"]["1d"] == 1.5
+    assert first[0]["price_changes"]["5d"] == 3.0
+    assert first[1]["price_changes"] == {"1d": None, "2d": None, "3d": None, "5d": None, "10d": None, "20d": None}
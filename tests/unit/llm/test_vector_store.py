@@ -0,0 +1,82 @@
+"""
+Unit tests for LocalVectorStore (프로세스 내 NumPy 벡터 인덱스)
+
+- flush 후 디스크 memmap으로 다시 열어도 같은 결과, 종목 코드/발행 시각 필터
+- 같은 뉴스 ID upsert는 교체, 보관 기간이 지난 항목은 flush 시 제거
+- IVF 근사 검색 결과가 전체 정확 검색과 대부분 일치
+"""
+import time
+
+import numpy as np
+
+from backend.llm.vector_store import LocalVectorStore
+
+
+def _unit(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_local_store_persists_filters_and_replaces(tmp_path):
+    """
+    Test: 뉴스 4건 (005930 2건, 000660 1건, 보관 기간 지난 1건)
+
+    Given: upsert → flush 후 같은 경로로 다시 연 인덱스
+    When: 종목/발행 시각 필터 검색, 같은 ID 재저장
+    Then: memmap 로드, 필터 결과 일치, 재저장 벡터로 교체, 오래된 항목 제거
+    """
+    now = int(time.time())
+    vectors = _unit(np.eye(4, 8) + 0.01)
+
+    store = LocalVectorStore(path=str(tmp_path), dim=8, window_days=7)
+    store.upsert(
+        [1, 2, 3, 4],
+        vectors,
+        ["005930", "005930", "000660", "005930"],
+        [now - 3600, now - 7200, now - 3600, now - 30 * 86400],
+    )
+    store.flush()
+
+    reopened = LocalVectorStore(path=str(tmp_path), dim=8, window_days=7)
+    assert isinstance(reopened._segment.vectors, np.memmap)
+    assert len(reopened) == 3
+
+    hits = reopened.search(vectors[:1], top_k=5, stock_code="005930")[0]
+    assert [hit.news_id for hit in hits] == [1, 2]
+    assert hits[0].distance < 1e-5
+    assert hits[0].stock_code == "005930"
+
+    recent = reopened.search(vectors[:1], top_k=5, min_published_at=now - 5400)[0]
+    assert {hit.news_id for hit in recent} == {1, 3}
+
+    # 뉴스 2를 뉴스 1 벡터로 교체 (flush 전 버퍼에서도 반영)
+    reopened.upsert([2], vectors[:1], ["005930"], [now])
+    hits = reopened.search(vectors[:1], top_k=2, stock_code="005930")[0]
+    assert sorted(hit.news_id for hit in hits) == [1, 2]
+    assert all(hit.distance < 1e-5 for hit in hits)
+    assert len(reopened) == 3
+
+
+def test_ivf_search_matches_brute_force():
+    """
+    Test: 군집된 벡터 3000건, IVF 근사 검색 (분할 √N개 중 nprobe=8)
+
+    Given: ivf_min_size=1000 인덱스 (메모리 전용)
+    When: 인덱스 내 벡터 근처 쿼리 50건 top-5 검색
+    Then: 전체 정확 검색 대비 recall@5 ≥ 0.9
+    """
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((30, 32))
+    vectors = _unit(centers[rng.integers(0, 30, 3000)] + 0.3 * rng.standard_normal((3000, 32)))
+
+    store = LocalVectorStore(path=None, dim=32, window_days=None, ivf_min_size=1000, nprobe=8)
+    store.upsert(list(range(3000)), vectors, ["005930"] * 3000, [0] * 3000)
+    store.flush()
+    assert store._segment.ivf_centroids is not None
+
+    queries = _unit(vectors[:50] + 0.05 * rng.standard_normal((50, 32)))
+    exact = ((queries[:, None, :] - vectors[None, :, :]) ** 2).sum(axis=2).argsort(axis=1)[:, :5]
+
+    results = store.search(queries, top_k=5)
+    found = sum(len({hit.news_id for hit in hits} & set(expected)) for hits, expected in zip(results, exact))
+    assert found / exact.size >= 0.9
@@ -0,0 +1,194 @@
+"""
+Unit tests for the auto-notify pipeline
+
+- StagePipeline: 단계별 워커/큐로 전체 항목 처리, drop/실패 집계
+- process_new_news_notifications: 제한 없이 전체 적체분 처리,
+  같은 실행 안의 유사 뉴스는 한 건만 알림
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.db.base import Base
+from backend.db.models.news import NewsArticle
+from backend.llm.prompt_context import PromptContext
+from backend.notifications import auto_notify
+from backend.notifications.notify_pipeline import PipelineStage, StagePipeline
+
+
+class _FakeSession:
+    opened = 0
+    closed = 0
+
+    def __init__(self):
+        _FakeSession.opened += 1
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        _FakeSession.closed += 1
+
+
+def test_stage_pipeline_drains_all_items():
+    """
+    Test: 3단계 파이프라인 (워커 2/3/1, 큐 크기 2)
+
+    Given: 항목 0~19
+    When: 1단계에서 홀수 drop, 2단계에서 4 예외
+    Then: 나머지 짝수는 모두 완료, 단계별 집계 일치, 워커 세션 모두 종료
+    """
+    _FakeSession.opened = _FakeSession.closed = 0
+    errors = []
+
+    def drop_odd(item, db):
+        return None if item % 2 else item
+
+    def fail_on_four(item, db):
+        if item == 4:
+            raise ValueError("boom")
+        return item * 10
+
+    pipeline = StagePipeline(
+        [
+            PipelineStage("filter", drop_odd, workers=2),
+            PipelineStage("transform", fail_on_four, workers=3),
+            PipelineStage("sink", lambda item, db: item, workers=1),
+        ],
+        queue_size=2,
+        session_factory=_FakeSession,
+        on_error=lambda item, stage, error: errors.append((item, stage)),
+    )
+
+    completed = pipeline.run(range(20))
+
+    assert sorted(completed) == [0, 20, 60, 80, 100, 120, 140, 160, 180]
+    assert errors == [(4, "transform")]
+    assert pipeline.stats["filter"]["dropped"] == 10
+    assert pipeline.stats["transform"]["failed"] == 1
+    assert pipeline.stats["sink"]["processed"] == 9
+    assert all(stats["max_queue_depth"] <= 2 for stats in pipeline.stats.values())
+    assert 0 < _FakeSession.opened == _FakeSession.closed <= 6
+
+
+def test_stage_pipeline_survives_session_failure():
+    """
+    Test: 워커 세션 생성 실패
+
+    Given: 첫 세션 생성만 실패하는 session_factory, 큐 크기 1
+    When: 항목 0~9 처리
+    Then: 파이프라인이 멈추지 않고, 실패 1건을 제외한 나머지는 모두 완료
+    """
+    calls = []
+
+    def flaky_session():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("db down")
+        return _FakeSession()
+
+    pipeline = StagePipeline(
+        [PipelineStage("stage", lambda item, db: item, workers=1)],
+        queue_size=1,
+        session_factory=flaky_session,
+    )
+
+    completed = pipeline.run(range(10))
+
+    assert sorted(completed) == list(range(1, 10))
+    assert pipeline.stats["stage"]["failed"] == 1
+
+
+@pytest.fixture
+def file_session_factory(tmp_path):
+    """워커 스레드가 같은 DB를 보도록 파일 기반 SQLite 사용 (in-memory는 연결마다 별도 DB)"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'notify.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def test_process_new_news_notifies_one_of_duplicates(file_session_factory, monkeypatch):
+    """
+    Test: 미알림 뉴스 12건 (기존 10건 제한 초과), 그중 1·2번은 서로 유사
+
+    Given: 일괄 유사 뉴스 검색에서 1번과 2번이 서로를 중복 후보로 반환
+    When: process_new_news_notifications
+    Then: 일괄 검색 1회, 12건 모두 처리되고 1·2번 중 한 건만 전송, 모두 notified_at 기록
+    """
+    db_session = file_session_factory()
+    for news_id in range(1, 13):
+        db_session.add(NewsArticle(
+            id=news_id,
+            title=f"뉴스 {news_id}",
+            content="본문",
+            published_at=datetime.utcnow(),
+            source="test",
+            stock_code="005930",
+        ))
+    db_session.commit()
+
+    def hits_for(news_text):
+        if news_text.startswith("뉴스 1\n"):
+            return [{"news_id": 2, "similarity": 0.99, "stock_code": "005930"}]
+        if news_text.startswith("뉴스 2\n"):
+            return [{"news_id": 1, "similarity": 0.99, "stock_code": "005930"}]
+        return []
+
+    class FakeDeduplicator:
+        def select_notification_candidates(self, similar_news):
+            return [similar for similar in similar_news if similar["similarity"] >= 0.95][:3]
+
+        def check_recent_notification(self, candidates, stock_code, db, notification_lookback_hours=4):
+            return False, None, None
+
+    batch_calls = []
+
+    class FakeVectorSearch:
+        def search_similar_news_batch(self, news_texts, stock_codes, top_k, similarity_threshold):
+            batch_calls.append(len(news_texts))
+            return [hits_for(text) for text in news_texts]
+
+        def enrich_with_price_changes(self, similar_news, db):
+            return []
+
+    class FakePredictor:
+        def predict_all_models(self, **kwargs):
+            return {1: {}}
+
+        def get_ab_predictions(self, news_id):
+            return {"comparison": {}}
+
+    sent = []
+
+    class FakeNotifier:
+        def send_prediction(self, news_title, stock_code, prediction):
+            sent.append(news_title)
+            return True
+
+    class FakePromptContextLoader:
+        def load(self, stock_codes, db=None):
+            return PromptContext()
+
+    monkeypatch.setattr("backend.notifications.notify_pipeline.SessionLocal", file_session_factory)
+    monkeypatch.setattr(auto_notify, "get_embedding_deduplicator", FakeDeduplicator)
+    monkeypatch.setattr(auto_notify, "get_vector_search", FakeVectorSearch)
+    monkeypatch.setattr(auto_notify, "get_predictor", FakePredictor)
+    monkeypatch.setattr(auto_notify, "get_telegram_notifier", FakeNotifier)
+    monkeypatch.setattr(auto_notify, "get_prompt_context_loader", FakePromptContextLoader)
+
+    stats = auto_notify.process_new_news_notifications(db_session, lookback_minutes=15)
+
+    assert batch_calls == [12]
+    assert stats["processed"] == 12
+    assert stats["success"] == 11
+    assert stats["skipped"] == 1
+    assert len(sent) == 11
+    assert len({"뉴스 1", "뉴스 2"} & set(sent)) == 1
+    assert stats["stages"]["prediction"]["processed"] == 12
+
+    db_session.expire_all()
+    assert db_session.query(NewsArticle).filter(NewsArticle.notified_at.is_(None)).count() == 0
+    db_session.close()
@@ -0,0 +1,75 @@
+"""
+Unit tests for async_loop.py
+
+- 여러 번 실행해도 같은 이벤트 루프를 재사용
+- 첫 실행에서 만든 asyncio 락을 다음 실행에서 그대로 사용 가능
+- 시간 초과 시 코루틴 취소
+"""
+import asyncio
+import threading
+
+import pytest
+
+from backend.scheduler.async_loop import AsyncLoopThread
+
+
+def test_jobs_share_one_persistent_loop():
+    """
+    Test: 작업 간 이벤트 루프/락 재사용
+
+    Given: 영속 루프 스레드
+    When: 코루틴 작업 두 번 실행 (첫 작업에서 Lock 생성)
+    Then: 같은 루프, 락 재사용 시 오류 없음, 종료 시 정리 코루틴 실행
+    """
+    runner = AsyncLoopThread(name="test-loop")
+    state = {}
+
+    async def first():
+        state["lock"] = asyncio.Lock()
+        return asyncio.get_running_loop()
+
+    async def second():
+        async with state["lock"]:
+            await asyncio.sleep(0)
+        return asyncio.get_running_loop()
+
+    async def cleanup():
+        state["cleaned"] = True
+
+    try:
+        assert runner.run(first) is runner.run(second)
+    finally:
+        runner.stop(cleanup=cleanup)
+
+    assert state["cleaned"] is True
+    assert not runner.is_running
+
+
+def test_timeout_cancels_coroutine():
+    """
+    Test: 시간 초과
+
+    Given: 응답하지 않는 코루틴
+    When: timeout=0.05로 실행
+    Then: TimeoutError, 코루틴은 루프에서 취소되고 이후 작업은 정상 실행
+    """
+    runner = AsyncLoopThread(name="test-timeout-loop")
+    cancelled = threading.Event()
+
+    async def hang():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def ok():
+        return "ok"
+
+    try:
+        with pytest.raises(TimeoutError):
+            runner.run(hang, timeout=0.05)
+        assert cancelled.wait(1)
+        assert runner.run(ok, timeout=1) == "ok"
+    finally:
+        runner.stop()
@@ -0,0 +1,142 @@
+"""
+Unit tests for EvaluationService 배치 평가
+
+- evaluate_batch 결과가 단건 평가(evaluate_prediction)와 동일
+- 주가 데이터가 없는 항목은 저장하지 않음
+- 일괄 저장 실패 시 실패한 항목만 제외하고 나머지는 저장
+"""
+from datetime import datetime
+
+import pytest
+
+from backend.db.models.model_evaluation import ModelEvaluation
+from backend.db.models.prediction import Prediction
+from backend.db.models.stock import StockPrice
+from backend.services.evaluation_service import EvaluationService
+from tests.conftest import create_predictions
+
+
+COMPARED_COLUMNS = [
+    "prediction_id", "model_id", "stock_code", "predicted_at", "prediction_period",
+    "predicted_target_price", "predicted_support_price", "predicted_base_price",
+    "actual_high_1d", "actual_low_1d", "actual_close_1d",
+    "actual_high_5d", "actual_low_5d", "actual_close_5d",
+    "target_achieved", "target_achieved_days", "support_breached",
+    "target_accuracy_score", "timing_score", "risk_management_score", "final_score",
+]
+
+# 2025-10-02(목) 기준 T+1 ~ T+5 거래일 (추석 연휴 10/3 ~ 10/9 제외)
+SESSIONS = [datetime(2025, 10, d) for d in (10, 13, 14, 15, 16)]
+
+
+def _add_bars(db, stock_code, bars):
+    for day, (high, low, close) in zip(SESSIONS, bars):
+        if high is None:
+            continue
+        db.add(StockPrice(
+            stock_code=stock_code, date=day, open=close, high=high, low=low, close=close,
+            volume=1, source="kis",
+        ))
+
+
+def test_evaluate_batch_matches_single_evaluation(db_session):
+    """
+    Test: 배치 평가와 단건 평가 결과 일치
+
+    Given: 목표가 3일째 달성 / 손절가 이탈(T+3 주가 누락) / 주가 없음 예측
+    When: evaluate_batch 결과와 evaluate_prediction 결과 비교
+    Then: 저장 컬럼 전부 동일, 주가 없는 예측은 양쪽 모두 미저장
+    """
+    created_at = datetime(2025, 10, 2, 10, 0)
+    hit = create_predictions(db_session, "005930", 1, start_time=created_at)[0]
+    breach = create_predictions(db_session, "000660", 1, start_time=created_at)[0]
+    no_data = create_predictions(db_session, "035720", 1, start_time=created_at)[0]
+    hit.current_price = breach.current_price = no_data.current_price = 50000
+
+    _add_bars(db_session, "005930", [
+        (51000, 49000, 50500), (53000, 50000, 52000), (56000, 52000, 55500),
+        (55000, 53000, 54000), (57000, 54000, 56000),
+    ])
+    _add_bars(db_session, "000660", [
+        (50500, 46000, 47000), (48000, 44000, 45000), (None, None, None),
+        (47000, 43000, 46000), (48000, 45000, 47500),
+    ])
+    db_session.commit()
+
+    service = EvaluationService(db_session)
+    predictions = [hit, breach, no_data]
+
+    batch_rows = service.evaluate_batch([service.prediction_target(p) for p in predictions])
+    batch = {row["prediction_id"]: row for row in batch_rows}
+
+    db_session.query(ModelEvaluation).delete()
+    db_session.commit()
+    single = {}
+    for prediction in predictions:
+        evaluation = service.evaluate_prediction(prediction)
+        if evaluation:
+            single[prediction.id] = evaluation
+
+    assert sorted(batch) == sorted(single) == sorted([hit.id, breach.id])
+    assert batch[hit.id]["target_achieved_days"] == 3
+    assert batch[breach.id]["support_breached"] is True
+    for prediction_id, evaluation in single.items():
+        for column in COMPARED_COLUMNS:
+            expected = getattr(evaluation, column)
+            actual = batch[prediction_id][column]
+            if isinstance(expected, float):
+                assert actual == pytest.approx(expected), column
+            else:
+                assert actual == expected, column
+
+
+def test_evaluate_batch_inserts_rows(db_session):
+    """
+    Test: 배치 평가 결과를 model_evaluations에 저장
+
+    Given: 주가가 있는 예측 3건
+    When: evaluate_batch
+    Then: 3행 저장, 예측 ID 일치
+    """
+    predictions = create_predictions(db_session, "005930", 3, start_time=datetime(2025, 10, 2, 9))
+    _add_bars(db_session, "005930", [(60000, 40000, 50000)] * 5)
+    db_session.commit()
+
+    service = EvaluationService(db_session)
+    rows = service.evaluate_batch([service.prediction_target(p) for p in predictions])
+
+    saved = db_session.query(ModelEvaluation).order_by(ModelEvaluation.prediction_id).all()
+    assert len(rows) == 3
+    assert [e.prediction_id for e in saved] == sorted(p.id for p in predictions)
+    assert db_session.query(Prediction).count() == 3
+
+
+def test_evaluate_batch_isolates_failed_rows(db_session, caplog):
+    """
+    Test: 일괄 INSERT 중 한 행 오류
+
+    Given: 예측 3건 중 1건의 평가 행이 NOT NULL 제약 위반
+    When: evaluate_batch
+    Then: 나머지 2건은 저장, 실패한 prediction_id는 로그에 기록
+    """
+    predictions = create_predictions(db_session, "005930", 3, start_time=datetime(2025, 10, 2, 9))
+    _add_bars(db_session, "005930", [(60000, 40000, 50000)] * 5)
+    db_session.commit()
+
+    service = EvaluationService(db_session)
+    compute = service.compute_evaluations
+    bad_id = predictions[1].id
+
+    def compute_with_bad_row(targets, windows):
+        rows = compute(targets, windows)
+        for row in rows:
+            if row["prediction_id"] == bad_id:
+                row["predicted_base_price"] = None
+        return rows
+
+    service.compute_evaluations = compute_with_bad_row
+    rows = service.evaluate_batch(service.prediction_targets(predictions))
+
+    saved = [e.prediction_id for e in db_session.query(ModelEvaluation).order_by(ModelEvaluation.prediction_id)]
+    assert [row["prediction_id"] for row in rows] == saved == sorted(p.id for p in predictions if p.id != bad_id)
+    assert f"prediction_id=[{bad_id}]" in caplog.text
@@ -0,0 +1,164 @@
+"""
+Unit tests for indicator_store.py
+
+- 증분 상태 계산이 일괄 계산(행렬) 결과와 일치하는지 검증
+- 같은 일자 봉 재반영(장중 잠정 → 확정 일봉) 검증
+- 워밍업 후 캐시/스냅샷 조회 검증
+- 지표 갱신 실패/최초 행 동시 생성 시에도 가격 저장 유지 검증
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from backend.db.models.indicator import StockIndicatorState
+from backend.db.bulk_upsert import upsert_rows
+from backend.db.models.stock import Stock, StockPrice
+from backend.services.indicator_store import IndicatorStore, RollingIndicatorState
+from backend.services.technical_indicator_service import (
+    build_price_matrix,
+    calculate_indicator_matrix,
+    matrix_row,
+)
+
+
+START = datetime(2025, 1, 1)
+
+
+def _sample_closes(count: int, seed: int = 0) -> list:
+    rng = np.random.default_rng(seed)
+    return list(np.round(50000 + np.cumsum(rng.normal(0, 500, count)), 0))
+
+
+def _replay(closes: list) -> RollingIndicatorState:
+    state = RollingIndicatorState()
+    for i, close in enumerate(closes):
+        state.apply_bar(START + timedelta(days=i), close, 1000 + i)
+    return state
+
+
+def test_rolling_state_matches_matrix():
+    """
+    Test: 증분 계산 결과가 행렬 일괄 계산과 일치
+
+    Given: 60일 종가 (EMA 시드가 같도록 윈도우와 같은 길이)
+    When: 봉을 하나씩 반영
+    Then: MA/RSI/볼린저/MACD 값이 일괄 계산과 동일
+    """
+    closes = _sample_closes(60)
+    state = _replay(closes)
+
+    rows = [("005930", c, 1000 + i) for i, c in enumerate(closes)]
+    _, close_matrix, volume_matrix, _ = build_price_matrix(rows)
+    expected = matrix_row(calculate_indicator_matrix(close_matrix, volume_matrix), 0)
+
+    actual = state.values()
+    for key in ("ma5", "ma20", "ma60", "rsi", "bb_upper", "bb_lower",
+                "macd_line", "macd_signal", "avg_volume_20d", "change_20d"):
+        assert actual[key] == pytest.approx(expected[key]), key
+
+
+def test_same_day_bar_is_revised_and_survives_roundtrip():
+    """
+    Test: 같은 일자 봉 재반영 및 직렬화 복원
+
+    Given: 70일 상태에 잠정 봉을 반영한 뒤 JSON 복원
+    When: 같은 일자의 확정 봉 반영
+    Then: 처음부터 확정 봉으로 계산한 결과와 동일
+    """
+    closes = _sample_closes(70)
+    provisional = _replay(closes[:-1])
+    provisional.apply_bar(START + timedelta(days=69), closes[-1] + 1234, 1)
+
+    restored = RollingIndicatorState.from_dict(provisional.to_dict())
+    restored.apply_bar(START + timedelta(days=69), closes[-1], 1000 + 69)
+
+    assert restored.indicators() == _replay(closes).indicators()
+    assert restored.apply_bar(START, 1.0, 1) is False
+
+
+def test_store_warms_up_and_serves_snapshot(db_session):
+    """
+    Test: 상태 없는 종목 조회 시 워밍업 후 스냅샷 저장
+
+    Given: 일봉 40일, 상태 없음
+    When: get_many 호출 후 새 일봉 반영
+    Then: 스냅샷 행 생성, 새 일봉은 증분 반영되어 캐시에 즉시 적용
+    """
+    db_session.add(Stock(code="005930", name="삼성전자", priority=1, is_active=True))
+    closes = _sample_closes(41)
+    for i, close in enumerate(closes[:-1]):
+        db_session.add(StockPrice(
+            stock_code="005930", date=START + timedelta(days=i),
+            open=close, high=close, low=close, close=close, volume=1000 + i,
+        ))
+    db_session.commit()
+
+    store = IndicatorStore()
+    first = store.get_many(["005930", "999999"], db_session)
+
+    assert first["999999"] is None
+    assert first["005930"]["rsi"]["value"] is not None
+    assert db_session.query(StockIndicatorState).count() == 1
+
+    updated = store.apply_daily_bars(db_session, "005930", [(START + timedelta(days=40), closes[-1], 1040)])
+    db_session.commit()
+
+    assert updated == _replay(closes).indicators()
+    assert store.get("005930", db_session) == updated
+
+
+def test_indicator_failure_keeps_price_rows(db_session, monkeypatch):
+    """
+    Test: 지표 갱신 실패 시 SAVEPOINT만 롤백
+
+    Given: 같은 트랜잭션에서 일봉 upsert 후 지표 저장이 실패
+    When: apply_daily_bars 호출 후 커밋
+    Then: None 반환, 일봉은 커밋되고 캐시는 무효화
+    """
+    closes = _sample_closes(30)
+    upsert_rows(db_session, StockPrice, [
+        {"stock_code": "005930", "date": START + timedelta(days=i),
+         "open": c, "high": c, "low": c, "close": c, "volume": 1000, "source": "kis"}
+        for i, c in enumerate(closes)
+    ])
+
+    store = IndicatorStore()
+
+    def broken_save(*args, **kwargs):
+        raise ValueError("bad state")
+
+    monkeypatch.setattr(store, "_save", broken_save)
+    result = store.apply_daily_bars(db_session, "005930", [(START + timedelta(days=29), closes[-1], 1000)])
+    db_session.commit()
+
+    assert result is None
+    assert db_session.query(StockPrice).count() == 30
+    assert store._cache_get("005930") == (False, None)
+
+
+def test_save_tolerates_row_created_concurrently(db_session, monkeypatch):
+    """
+    Test: 최초 상태 행을 다른 writer가 먼저 생성한 경우
+
+    Given: 잠금 조회 시점에는 행이 없었지만 그 사이 다른 writer가 행을 생성
+    When: _save 호출
+    Then: 유니크 키 충돌 없이 기존 행을 잠근 뒤 갱신
+    """
+    db_session.add(StockIndicatorState(stock_code="005930", state={}))
+    db_session.commit()
+
+    store = IndicatorStore()
+    lock_row = IndicatorStore._lock_row
+    calls = []
+
+    def racing_lock_row(db, stock_code):
+        calls.append(stock_code)
+        return None if len(calls) == 1 else lock_row(db, stock_code)
+
+    monkeypatch.setattr(store, "_lock_row", racing_lock_row)
+    store._save(db_session, "005930", _replay(_sample_closes(30)))
+    db_session.commit()
+
+    row = db_session.query(StockIndicatorState).one()
+    assert row.state["bar_date"] == (START + timedelta(days=29)).date().isoformat()
@@ -0,0 +1,151 @@
+"""
+Unit tests for news_search.py
+
+- 키셋(커서) 페이지네이션이 OFFSET 페이지네이션과 같은 순서로 전체 결과를 반환
+- 뉴스별 최신 예측의 방향/신뢰도 조인
+- 전체 개수 캐시
+- 짧은 검색어도 기간 제한 없이 전체 결과 반환
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.db.models.news import NewsArticle
+from backend.db.models.prediction import Prediction
+from backend.services.news_search import (
+    NewsSearchFilters,
+    clear_count_cache,
+    search_news,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_count_cache():
+    clear_count_cache()
+    yield
+    clear_count_cache()
+
+
+def _add_news(db, count):
+    # 같은 created_at이 여러 건 있어도 (created_at, id) 순서로 고정되는지 확인
+    base = datetime(2025, 11, 3, 9, 0)
+    news = [
+        NewsArticle(
+            title=f"삼성전자 실적 뉴스 {i}" if i % 2 == 0 else f"시장 동향 {i}",
+            content="본문",
+            published_at=base + timedelta(minutes=i),
+            created_at=base + timedelta(minutes=i // 3),
+            source="naver",
+            stock_code="005930",
+        )
+        for i in range(count)
+    ]
+    db.add_all(news)
+    db.commit()
+    return news
+
+
+def test_cursor_pagination_matches_offset_order(db_session):
+    """
+    Test: 커서 페이지네이션 = OFFSET 페이지네이션
+
+    Given: created_at이 중복되는 뉴스 10건 (검색어 일치 5건)
+    When: 페이지 크기 3으로 next_cursor를 따라가며 조회
+    Then: 중복/누락 없이 OFFSET 조회와 같은 순서, 마지막 페이지의 next_cursor는 None
+    """
+    _add_news(db_session, 10)
+
+    for filters in (NewsSearchFilters(), NewsSearchFilters(search="삼성전자")):
+        by_offset = [
+            news.id
+            for page in range(1, 5)
+            for news, _, _ in search_news(db_session, filters, limit=3, page=page)["rows"]
+        ]
+
+        by_cursor, cursor = [], None
+        while True:
+            result = search_news(db_session, filters, limit=3, cursor=cursor)
+            by_cursor.extend(news.id for news, _, _ in result["rows"])
+            cursor = result["next_cursor"]
+            if cursor is None:
+                break
+
+        assert by_cursor == by_offset
+        assert len(set(by_cursor)) == len(by_cursor) == result["total"]
+
+
+def test_latest_prediction_and_invalid_cursor(db_session):
+    """
+    Test: 최신 예측 조인, 잘못된 커서
+
+    Given: 예측 2건(구/신 스키마)이 있는 뉴스, 예측 없는 뉴스
+    When: 뉴스 목록 조회
+    Then: 최신 예측의 방향/신뢰도 반환, 예측 없는 뉴스는 None, 정렬 조건이 다른 커서는 ValueError
+    """
+    news = _add_news(db_session, 2)
+    db_session.add_all([
+        Prediction(news_id=news[0].id, model_id=1, stock_code="005930",
+                   created_at=datetime(2025, 11, 3, 10), direction="up", confidence=0.8),
+        Prediction(news_id=news[0].id, model_id=2, stock_code="005930",
+                   created_at=datetime(2025, 11, 3, 11),
+                   sentiment_direction="negative", sentiment_score=-0.6),
+    ])
+    db_session.commit()
+
+    result = search_news(db_session, NewsSearchFilters(), limit=1, sort_by="id", sort_order="asc")
+    (first, direction, confidence), = result["rows"]
+    assert first.id == news[0].id
+    assert direction == "down"
+    assert confidence == pytest.approx(0.6)
+
+    (second, direction, confidence), = search_news(
+        db_session, NewsSearchFilters(), limit=1, sort_by="id", sort_order="asc",
+        cursor=result["next_cursor"],
+    )["rows"]
+    assert second.id == news[1].id
+    assert direction is None and confidence is None
+
+    with pytest.raises(ValueError):
+        search_news(db_session, NewsSearchFilters(), cursor=result["next_cursor"])
+    with pytest.raises(ValueError):
+        search_news(db_session, NewsSearchFilters(), cursor="not-a-cursor")
+
+
+def test_total_count_is_cached(db_session):
+    """
+    Test: 전체 개수 캐시
+
+    Given: 뉴스 3건 조회 후 1건 추가
+    When: TTL 이내에 같은 조건으로 다시 조회
+    Then: 캐시된 개수를 반환하고, 캐시 초기화 후에는 새 개수 반환
+    """
+    _add_news(db_session, 3)
+    filters = NewsSearchFilters(stock_code="005930")
+    assert search_news(db_session, filters)["total"] == 3
+
+    _add_news(db_session, 1)
+    assert search_news(db_session, filters)["total"] == 3
+
+    clear_count_cache()
+    assert search_news(db_session, filters)["total"] == 4
+
+
+def test_short_search_term_is_not_limited_by_date(db_session):
+    """
+    Test: 2글자 검색어 (trigram 인덱스 미사용)
+
+    Given: 최근 뉴스 1건, 1년 전 뉴스 1건 (둘 다 "삼성" 포함)
+    When: "삼성" / "삼성전자" 검색 (시작일 없음)
+    Then: 검색어 길이와 관계없이 전체 기간의 결과와 개수 반환
+    """
+    now = datetime.now()
+    db_session.add_all([
+        NewsArticle(title="삼성전자 신제품", content="본문", published_at=now - timedelta(days=1), source="naver"),
+        NewsArticle(title="삼성전자 과거 실적", content="본문", published_at=now - timedelta(days=365), source="naver"),
+    ])
+    db_session.commit()
+
+    for search in ("삼성", "삼성전자"):
+        result = search_news(db_session, NewsSearchFilters(search=search))
+        assert sorted(news.title for news, _, _ in result["rows"]) == ["삼성전자 과거 실적", "삼성전자 신제품"]
+        assert result["total"] == 2
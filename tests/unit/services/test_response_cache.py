@@ -0,0 +1,134 @@
+"""
+Unit tests for response_cache.py
+
+- 같은 키의 동시 요청은 한 번만 계산 (single-flight), 이후 요청은 캐시 히트
+- ETag / If-None-Match → 304
+- 태그 무효화 (계산 도중 무효화된 결과는 저장하지 않음)
+- 계산 실패 시 대체 응답은 캐시하지 않음 (시장 모멘텀)
+"""
+import asyncio
+import json
+
+from starlette.requests import Request
+
+from backend.services.response_cache import ResponseCache, stock_tag
+
+
+def _request(etag: str = None) -> Request:
+    headers = [(b"if-none-match", etag.encode())] if etag else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_concurrent_requests_share_one_computation():
+    """
+    Test: 동시 요청 병합 + 캐시 히트 + ETag
+
+    Given: 계산에 시간이 걸리는 응답
+    When: 같은 키로 동시 요청 5건, 이후 1건, If-None-Match 요청 1건
+    Then: 계산 1회, 동시 요청 4건 병합, 이후 요청은 HIT, ETag 일치 시 304
+    """
+    cache = ResponseCache(ttl_resolver=lambda: 60)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"value": len(calls)}
+
+    async def scenario():
+        responses = await asyncio.gather(*[
+            cache.respond(_request(), "dashboard:summary", compute) for _ in range(5)
+        ])
+        cached = await cache.respond(_request(), "dashboard:summary", compute)
+        not_modified = await cache.respond(
+            _request(cached.headers["etag"]), "dashboard:summary", compute
+        )
+        return responses, cached, not_modified
+
+    responses, cached, not_modified = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert {json.loads(r.body)["value"] for r in responses} == {1}
+    assert cached.headers["x-cache"] == "HIT"
+    assert not_modified.status_code == 304
+
+    metrics = cache.get_metrics()
+    assert metrics["misses"] == 1
+    assert metrics["coalesced"] == 4
+    assert metrics["hits"] == 2
+    assert metrics["not_modified"] == 1
+    assert metrics["hit_rate"] == round(6 / 7, 4)
+    assert metrics["saved_compute_seconds"] > 0
+
+
+def test_invalidation_by_tag():
+    """
+    Test: 태그 무효화
+
+    Given: 종목 두 개의 캐시된 상세 응답
+    When: 한 종목 태그 무효화, 계산 도중 무효화
+    Then: 해당 종목만 재계산, 계산 도중 무효화된 결과는 저장되지 않아 다음 요청에서 재계산
+    """
+    cache = ResponseCache(ttl_resolver=lambda: 60)
+    calls = {"005930": 0, "000660": 0}
+
+    def compute_for(stock_code, invalidate_during=False):
+        async def compute():
+            calls[stock_code] += 1
+            if invalidate_during:
+                cache.invalidate(stock_tag(stock_code))
+            return {"stock_code": stock_code, "calls": calls[stock_code]}
+        return compute
+
+    async def respond(stock_code, invalidate_during=False):
+        return await cache.respond(
+            _request(), f"stocks:{stock_code}",
+            compute_for(stock_code, invalidate_during), tags=(stock_tag(stock_code),),
+        )
+
+    async def scenario():
+        await respond("005930")
+        await respond("000660")
+        assert cache.invalidate(stock_tag("005930")) == 1
+        await respond("005930")
+        await respond("000660")
+
+        cache.invalidate(stock_tag("005930"))
+        await respond("005930", invalidate_during=True)  # 무효화되어 저장되지 않음
+        await respond("005930")
+
+    asyncio.run(scenario())
+
+    assert calls == {"005930": 4, "000660": 1}
+    assert cache.get_metrics()["entries"] == 2
+
+
+def test_market_momentum_fallback_is_not_cached(monkeypatch):
+    """
+    Test: 시장 모멘텀 KIS 오류
+
+    Given: 첫 계산은 KIS 오류, 두 번째는 정상
+    When: 시장 모멘텀 API 두 번 호출
+    Then: 첫 응답은 빈 데이터(캐시 안 함), 두 번째는 다시 계산한 정상 데이터
+    """
+    from backend.api import dashboard
+
+    cache = ResponseCache(ttl_resolver=lambda: 600)
+    monkeypatch.setattr(dashboard, "get_response_cache", lambda: cache)
+    calls = []
+
+    async def build(db):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("KIS rate limit")
+        return {"top_gainers": [{"stock_code": "005930"}]}
+
+    monkeypatch.setattr(dashboard, "_build_market_momentum", build)
+
+    first = asyncio.run(dashboard.get_market_momentum(_request(), db=None))
+    second = asyncio.run(dashboard.get_market_momentum(_request(), db=None))
+
+    assert first["top_gainers"] == []
+    assert json.loads(second.body)["top_gainers"] == [{"stock_code": "005930"}]
+    assert len(calls) == 2
+    assert cache.get_metrics()["entries"] == 1
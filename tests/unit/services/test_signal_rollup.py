@@ -0,0 +1,77 @@
+"""
+Unit tests for signal_rollup.py
+
+- 예측 저장(신규/수정) 시 증분 갱신한 집계가 predictions 전체 재계산 결과와 동일
+- 종목 목록 시그널 수 / TOP N 조회
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from backend.db.models.prediction import Prediction
+from backend.db.models.signal_rollup import PredictionSignalRollup
+from backend.llm import predictor as predictor_module
+from backend.llm.predictor import StockPredictor
+from backend.services.signal_rollup import (
+    get_signal_counts,
+    get_top_signal_stocks,
+    rebuild_signal_rollup,
+)
+
+
+def _snapshot(db):
+    db.expire_all()
+    return sorted(
+        (r.stock_code, r.date, r.total_count, r.positive_count, r.negative_count,
+         round(r.sentiment_sum, 6), r.sentiment_count)
+        for r in db.query(PredictionSignalRollup).all()
+        if r.total_count
+    )
+
+
+def test_incremental_rollup_matches_rebuild(db_engine, db_session, monkeypatch):
+    """
+    Test: 증분 집계 = 전체 재계산
+
+    Given: 어제 생성된 기존 예측 2건 (집계 재계산으로 초기화)
+    When: 기존 예측 1건 수정(부정 → 긍정, 오늘 날짜로 이동) + 신규 예측 2건 저장
+    Then: 증분 갱신 집계가 재계산 결과와 같고, 시그널 수 조회가 predictions 집계와 일치
+    """
+    yesterday = datetime.now() - timedelta(days=1)
+    db_session.add_all([
+        Prediction(news_id=1, model_id=1, stock_code="005930", created_at=yesterday,
+                   sentiment_direction="negative", sentiment_score=-0.4),
+        Prediction(news_id=2, model_id=1, stock_code="000660", created_at=yesterday,
+                   sentiment_direction="positive", sentiment_score=None),
+    ])
+    db_session.commit()
+    rebuild_signal_rollup(db_session)
+    db_session.commit()
+
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+    monkeypatch.setattr(predictor_module, "SessionLocal", TestingSessionLocal)
+    predictor = StockPredictor.__new__(StockPredictor)
+
+    predictor._save_model_predictions(1, "005930", {
+        1: {"sentiment_direction": "positive", "sentiment_score": 0.7},
+        2: {"sentiment_direction": "negative", "sentiment_score": -0.2},
+    })
+    predictor._save_model_predictions(3, "000660", {
+        1: {"sentiment_direction": "positive", "sentiment_score": 0.5},
+    })
+
+    incremental = _snapshot(db_session)
+    rebuild_signal_rollup(db_session)
+    db_session.commit()
+    assert incremental == _snapshot(db_session)
+
+    counts = get_signal_counts(db_session, ["005930", "000660", "035720"])
+    assert counts["005930"]["positive"] == 1
+    assert counts["005930"]["negative"] == 1
+    assert counts["005930"]["avg_sentiment"] == pytest.approx(0.25)
+    assert counts["000660"] == {"total": 2, "positive": 2, "negative": 0, "avg_sentiment": 0.5}
+    assert "035720" not in counts
+
+    top = get_top_signal_stocks(db_session, limit=1)
+    assert len(top) == 1 and top[0]["total"] == 2
@@ -0,0 +1,85 @@
+"""
+Unit tests for stock_prediction_stats.py
+
+- 예측 저장(신규/수정) 시 증분 갱신한 통계가 predictions 전체 재계산 결과와 동일
+- 종목 상세 통계 조회 (방향 분포, 신뢰도/패턴 평균)
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from backend.db.models.prediction import Prediction
+from backend.db.models.stock_prediction_stats import StockPredictionStats
+from backend.llm import predictor as predictor_module
+from backend.llm.predictor import StockPredictor
+from backend.services.stock_prediction_stats import (
+    COUNTER_COLUMNS,
+    get_stock_prediction_stats,
+    rebuild_stock_prediction_stats,
+)
+
+
+def _snapshot(db):
+    db.expire_all()
+    return sorted(
+        (r.stock_code, *(round(getattr(r, column), 6) for column in COUNTER_COLUMNS))
+        for r in db.query(StockPredictionStats).all()
+        if r.prediction_count
+    )
+
+
+def test_incremental_stats_match_rebuild(db_engine, db_session, monkeypatch):
+    """
+    Test: 증분 통계 = 전체 재계산, 상세 통계 조회
+
+    Given: 신뢰도 breakdown(문자열/변환 불가 값 포함)이 있는 기존 예측 2건 (재계산으로 초기화)
+    When: 기존 예측 1건 수정 + 신규 예측 1건 저장 (pattern_analysis의 0.0 포함)
+    Then: 증분 통계가 재계산 결과와 같고, 상세 통계가 기존 API 계산 규칙과 일치
+    """
+    db_session.add_all([
+        Prediction(news_id=1, model_id=1, stock_code="005930", created_at=datetime.now(),
+                   sentiment_direction="negative", sentiment_score=-0.4,
+                   confidence_breakdown={"similar_news_quality": "80", "pattern_consistency": "n/a"}),
+        Prediction(news_id=2, model_id=1, stock_code="005930", created_at=datetime.now(),
+                   sentiment_direction="neutral", sentiment_score=None,
+                   confidence_breakdown={"similar_news_quality": 60, "disclosure_impact": 30},
+                   pattern_analysis={"avg_1d": 1.5}),
+    ])
+    db_session.commit()
+    rebuild_stock_prediction_stats(db_session)
+    db_session.commit()
+
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+    monkeypatch.setattr(predictor_module, "SessionLocal", TestingSessionLocal)
+    predictor = StockPredictor.__new__(StockPredictor)
+
+    predictor._save_model_predictions(1, "005930", {
+        1: {"sentiment_direction": "positive", "sentiment_score": 0.6,
+            "pattern_analysis": {"avg_1d": 2.5, "avg_5d": 0.0}},
+        2: {"sentiment_direction": "positive", "sentiment_score": 0.2,
+            "pattern_analysis": {"avg_1d": "-1.0", "avg_5d": 3.0}},
+    })
+
+    incremental = _snapshot(db_session)
+    rebuild_stock_prediction_stats(db_session)
+    db_session.commit()
+    assert incremental == _snapshot(db_session)
+
+    stats = get_stock_prediction_stats(db_session, "005930")
+    assert stats["direction_distribution"] == {"up": 2, "down": 0, "hold": 1}
+    assert stats["total_predictions"] == 3
+    assert stats["avg_confidence"] == pytest.approx((0.4 + 1) / 2)
+    # 수정된 예측은 confidence_breakdown이 None으로 초기화됨
+    assert stats["confidence_breakdown_avg"] == {
+        "similar_news_quality": 60.0,
+        "pattern_consistency": None,
+        "disclosure_impact": 30.0,
+    }
+    assert stats["pattern_analysis_avg"]["avg_1d"] == pytest.approx(1.0)
+    assert stats["pattern_analysis_avg"]["avg_5d"] == pytest.approx(3.0)
+    assert stats["pattern_analysis_avg"]["avg_20d"] is None
+
+    empty = get_stock_prediction_stats(db_session, "035720")
+    assert empty["total_predictions"] == 0
+    assert empty["avg_confidence"] is None
@@ -0,0 +1,119 @@
+"""
+Unit tests for technical_indicator_service.py
+
+- 벡터화 계산 결과가 기존 종목별 루프 계산과 일치하는지 검증
+- 여러 종목을 단일 쿼리로 일괄 계산하는지 검증
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from backend.db.models.stock import Stock, StockPrice
+from backend.services.technical_indicator_service import (
+    build_price_matrix,
+    calculate_indicator_matrix,
+    get_technical_indicators,
+    load_technical_indicators,
+)
+
+
+def _sample_closes(count: int, seed: int = 0) -> list:
+    rng = np.random.default_rng(seed)
+    return list(np.round(50000 + np.cumsum(rng.normal(0, 500, count)), 0))
+
+
+def _add_prices(db_session, stock_code: str, closes: list, volume: int = 1000):
+    start = datetime(2025, 1, 1)
+    for i, close in enumerate(closes):
+        db_session.add(StockPrice(
+            stock_code=stock_code,
+            date=start + timedelta(days=i),
+            open=close, high=close, low=close, close=close,
+            volume=volume + i,
+        ))
+    db_session.commit()
+
+
+def test_matrix_matches_reference_calculation():
+    """
+    Test: MA/RSI(Wilder)/볼린저 밴드/모멘텀이 순수 Python 계산과 일치
+
+    Given: 60일 종가 데이터
+    When: 행렬 기반 일괄 계산
+    Then: 기존 공식과 동일한 값
+    """
+    closes = _sample_closes(60)
+    rows = [("005930", c, 1000) for c in closes]
+    _, close_matrix, volume_matrix, _ = build_price_matrix(rows)
+
+    matrix = calculate_indicator_matrix(close_matrix, volume_matrix)
+
+    assert matrix["ma5"][0] == pytest.approx(sum(closes[-5:]) / 5)
+    assert matrix["ma20"][0] == pytest.approx(sum(closes[-20:]) / 20)
+    assert matrix["ma60"][0] == pytest.approx(sum(closes) / 60)
+
+    changes = [closes[i] - closes[i - 1] for i in range(1, len(closes))]
+    avg_gain = sum(max(c, 0) for c in changes[:14]) / 14
+    avg_loss = sum(max(-c, 0) for c in changes[:14]) / 14
+    for c in changes[14:]:
+        avg_gain = (avg_gain * 13 + max(c, 0)) / 14
+        avg_loss = (avg_loss * 13 + max(-c, 0)) / 14
+    expected_rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+    assert matrix["rsi"][0] == pytest.approx(expected_rsi)
+
+    ma20 = sum(closes[-20:]) / 20
+    std = (sum((c - ma20) ** 2 for c in closes[-20:]) / 20) ** 0.5
+    assert matrix["bb_upper"][0] == pytest.approx(ma20 + 2 * std)
+    assert matrix["change_5d"][0] == pytest.approx((closes[-1] - closes[-6]) / closes[-6] * 100)
+
+
+def test_short_history_rows_are_padded():
+    """
+    Test: 데이터 일수가 다른 종목을 한 행렬에서 계산
+
+    Given: 60일 종목과 10일 종목
+    When: 일괄 계산
+    Then: 10일 종목은 MA20/RSI/MACD 없음, MA5는 계산됨
+    """
+    rows = [("A", c, 1000) for c in _sample_closes(60)] + [("B", c, 1000) for c in _sample_closes(10, seed=1)]
+    codes, close_matrix, volume_matrix, _ = build_price_matrix(rows)
+
+    matrix = calculate_indicator_matrix(close_matrix, volume_matrix)
+    b = codes.index("B")
+
+    assert not np.isnan(matrix["ma5"][b])
+    assert np.isnan(matrix["ma20"][b])
+    assert np.isnan(matrix["rsi"][b])
+    assert np.isnan(matrix["macd_line"][b])
+    assert not np.isnan(matrix["macd_signal"][codes.index("A")])
+
+
+def test_load_technical_indicators_bulk(db_session):
+    """
+    Test: 활성 종목 전체 지표를 일괄 조회
+
+    Given: 활성 종목 2개 (60일, 3일 데이터)
+    When: stock_codes 없이 load_technical_indicators 호출
+    Then: 데이터 충분한 종목만 지표 반환, 부족한 종목은 None
+    """
+    db_session.add_all([
+        Stock(code="005930", name="삼성전자", priority=1, is_active=True),
+        Stock(code="000660", name="SK하이닉스", priority=1, is_active=True),
+    ])
+    db_session.commit()
+    _add_prices(db_session, "005930", _sample_closes(70))
+    _add_prices(db_session, "000660", _sample_closes(3))
+
+    result = load_technical_indicators(db_session)
+
+    assert set(result.keys()) == {"005930", "000660"}
+    assert result["000660"] is None
+
+    samsung = result["005930"]
+    assert samsung["moving_averages"]["ma60"] is not None
+    assert samsung["volume_analysis"]["current_volume"] == 1069
+    assert samsung["macd"]["signal_line"] is not None
+    assert samsung["bollinger_bands"]["position"] in {"상단돌파", "하단돌파", "상단근접", "하단근접"}
+
+    assert get_technical_indicators("005930", db_session) == samsung
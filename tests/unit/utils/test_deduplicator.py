@@ -0,0 +1,54 @@
+"""
+Unit tests for NewsDuplicator (MinHash/LSH 제목 인덱스)
+
+- 최초 검사 시 최근 뉴스만 적재, 이후에는 새 ID만 추가 반영
+- 근사 중복 제목은 LSH 후보 → SequenceMatcher 검증으로 검출, 다른 제목은 통과
+- 시간 범위를 벗어난 뉴스는 후보에서 제외
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from backend.db.models.news import NewsArticle
+from backend.utils.deduplicator import NewsDuplicator
+
+
+def _news(news_id, title, created_at):
+    return NewsArticle(
+        id=news_id, title=title, content="본문", published_at=created_at, source="t", created_at=created_at,
+    )
+
+
+def test_find_duplicate_uses_incremental_index(db_engine, db_session):
+    """
+    Test: 최근 뉴스 2건, 오래된 뉴스 1건
+
+    Given: 인덱스 적재 후 다른 경로로 저장된 뉴스 1건
+    When: 근사 중복/새 제목/오래된 제목과 같은 제목 검사
+    Then: 근사 중복만 검출, 두 번째 검사부터는 새 ID만 조회
+    """
+    now = datetime.now()
+    db_session.add_all([
+        _news(1, "삼성전자, 3분기 영업이익 10조원 돌파", now - timedelta(hours=1)),
+        _news(2, "카카오, 신규 AI 서비스 출시 발표", now - timedelta(hours=2)),
+        _news(3, "현대차, 미국 전기차 공장 착공", now - timedelta(hours=30)),
+    ])
+    db_session.commit()
+
+    duplicator = NewsDuplicator(similarity_threshold=0.8, lookback_hours=24)
+
+    assert duplicator.find_duplicate_in_db("[단독] 삼성전자, 3분기 영업이익 10조원 돌파", db_session) == (True, 1)
+    assert duplicator.find_duplicate_in_db("현대차, 미국 전기차 공장 착공", db_session) == (False, None)
+    assert len(duplicator.index) == 2
+
+    # 다른 프로세스가 저장한 뉴스 → 다음 검사 때 워터마크 이후 ID만 조회하여 반영
+    db_session.add(_news(4, "LG화학, 배터리 소재 증설 투자", now))
+    db_session.commit()
+
+    statements = []
+    event.listen(db_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    assert duplicator.find_duplicate_in_db("LG화학, 배터리 소재 증설 투자 (종합)", db_session) == (True, 4)
+    assert duplicator.find_duplicate_in_db("SK하이닉스, HBM 공급 계약 체결", db_session) == (False, None)
+    assert len(statements) == 2
+    assert all("news_articles.id >" in statement for statement in statements)
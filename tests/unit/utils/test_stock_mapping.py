@@ -0,0 +1,114 @@
+"""
+Unit tests for StockMapper (Aho–Corasick 기업명 검색, 역방향 조회)
+
+- 겹치는 기업명은 최장 일치, 결과는 본문 출현 위치 순
+- 영문 기업명은 영문/숫자 경계에서만 인정
+- 종목코드 → 기업명 역방향 조회, reload 시 인덱스 재구성
+- 재구성 실패 시 기존 인덱스 유지 (예외 전파/JSON 대체 없음)
+"""
+import json
+
+from backend.utils import stock_mapping
+from backend.utils.stock_mapping import StockMapper
+
+
+def _write_mapping(path, mapping):
+    path.write_text(json.dumps(mapping, ensure_ascii=False), encoding="utf-8")
+
+
+def test_mentions_are_longest_and_position_ordered(tmp_path):
+    """
+    Test: "LG"/"LG화학", "SK"/"SK하이닉스", "삼성전자" 매핑
+
+    Given: 본문에 SK하이닉스 → 삼성전자 → LG화학 → LG 순으로 언급, "SKT"는 언급 아님
+    When: find_stock_mentions / find_stock_codes_in_text / find_stock_code_in_text
+    Then: 위치 순 최장 일치, SKT의 SK 제외, 첫 종목은 가장 앞의 SK하이닉스
+    """
+    mapping_file = tmp_path / "stock_codes.json"
+    _write_mapping(mapping_file, {
+        "삼성전자": "005930",
+        "LG": "003550",
+        "LG화학": "051910",
+        "SK": "034730",
+        "SK하이닉스": "000660",
+    })
+    mapper = StockMapper(mapping_file=mapping_file, use_db=False)
+
+    text = "SKT 실적 발표 후 SK하이닉스와 삼성전자가 상승했고, LG화학은 하락했다. LG는 보합."
+
+    mentions = mapper.find_stock_mentions(text)
+    assert [(m.company_name, m.stock_code) for m in mentions] == [
+        ("SK하이닉스", "000660"),
+        ("삼성전자", "005930"),
+        ("LG화학", "051910"),
+        ("LG", "003550"),
+    ]
+    assert text[mentions[1].start:mentions[1].end] == "삼성전자"
+    assert mapper.find_stock_code_in_text(text) == "000660"
+    assert mapper.find_stock_codes_in_text(text + " 삼성전자") == ["000660", "005930", "051910", "003550"]
+    assert mapper.find_stock_code_in_text("관련 종목 없음") is None
+
+
+def test_reverse_lookup_and_reload(tmp_path):
+    """
+    Test: 역방향 조회 후 매핑 파일 변경
+
+    Given: 삼성전자 매핑
+    When: reload (종목 추가/삭제)
+    Then: 새 종목은 조회/검색되고, 삭제된 종목은 조회되지 않음
+    """
+    mapping_file = tmp_path / "stock_codes.json"
+    _write_mapping(mapping_file, {"삼성전자": "005930"})
+    mapper = StockMapper(mapping_file=mapping_file, use_db=False)
+
+    assert mapper.get_company_name("005930") == "삼성전자"
+    assert mapper.get_company_name("000660") is None
+
+    _write_mapping(mapping_file, {"SK하이닉스": "000660"})
+    mapper.reload()
+
+    assert mapper.get_company_name("000660") == "SK하이닉스"
+    assert mapper.get_company_name("005930") is None
+    assert mapper.find_stock_code_in_text("SK하이닉스 HBM 공급") == "000660"
+    assert mapper.find_stock_code_in_text("삼성전자 반도체") is None
+
+
+def test_failed_reload_keeps_previous_index(tmp_path, monkeypatch):
+    """
+    Test: DB 모드 재구성 중 DB 오류
+
+    Given: DB에서 삼성전자를 로드한 매퍼, 존재하지 않는 JSON 파일
+    When: DB 오류 상태에서 reload / 주기적 변경 확인
+    Then: 예외 없이 기존 인덱스 유지 (JSON 대체 없음)
+    """
+    class FakeQuery:
+        def filter(self, *args):
+            return self
+
+        def all(self):
+            return [type("Row", (), {"name": "삼성전자", "code": "005930"})()]
+
+        def one(self):
+            return (1, None)
+
+    class FakeSession:
+        def query(self, *args):
+            return FakeQuery()
+
+        def close(self):
+            pass
+
+    def broken_session():
+        raise ConnectionError("database unavailable")
+
+    monkeypatch.setattr(stock_mapping, "SessionLocal", FakeSession)
+    mapper = StockMapper(mapping_file=tmp_path / "missing.json", use_db=True)
+    assert mapper.get_company_name("005930") == "삼성전자"
+
+    monkeypatch.setattr(stock_mapping, "SessionLocal", broken_session)
+    mapper.reload()
+    mapper._checked_at -= StockMapper.REFRESH_INTERVAL_SECONDS
+    mapper._refresh_if_changed()
+
+    assert mapper.get_company_name("005930") == "삼성전자"
+    assert mapper.find_stock_code_in_text("삼성전자 반도체") == "005930"
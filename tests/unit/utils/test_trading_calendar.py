@@ -0,0 +1,72 @@
+"""
+Unit tests for trading_calendar.py
+
+- KRX 휴장일/주말을 건너뛰는 거래일 이동과 구간 거래일 수
+- 배열 API가 스칼라 API와 같은 결과
+- business_days 함수가 달력에 위임
+"""
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from backend.utils.business_days import add_business_days, get_business_days_between, is_business_day
+from backend.utils.trading_calendar import TradingCalendar, get_trading_calendar
+
+
+def test_sessions_skip_weekends_and_holidays():
+    """
+    Test: 추석 연휴(2025-10-03 ~ 10-09)를 건너뛴 거래일 계산
+
+    Given: KRX 거래일 달력
+    When: 연휴 전후로 거래일 이동/판정/구간 계산
+    Then: 10/2(목) 다음 거래일은 10/10(금), 연휴 중 거래일 없음
+    """
+    calendar = get_trading_calendar()
+
+    assert calendar.is_session(datetime(2025, 10, 2, 15, 0))
+    assert not calendar.is_session(date(2025, 10, 6))
+    assert calendar.add_sessions(datetime(2025, 10, 2, 15, 0), 1) == datetime(2025, 10, 10)
+    assert calendar.add_sessions(datetime(2025, 10, 10), -1) == datetime(2025, 10, 2)
+    # 휴장일 기준: 다음/이전 첫 거래일이 1 거래일
+    assert calendar.add_sessions(date(2025, 10, 4), 1) == datetime(2025, 10, 10)
+    assert calendar.add_sessions(date(2025, 10, 4), -1) == datetime(2025, 10, 2)
+    assert calendar.sessions_between(date(2025, 10, 2), date(2025, 10, 10)) == 1
+    assert calendar.has_holiday_data(date(2026, 1, 2))
+
+
+def test_array_api_matches_scalar_api():
+    """
+    Test: 배열 API와 스칼라 API 결과 일치
+
+    Given: 2025년 전체(주말/휴장일 포함) 날짜와 -7 ~ +20 거래일 이동
+    When: is_session_array / add_sessions_array / sessions_between_array
+    Then: 각 날짜의 스칼라 결과와 동일
+    """
+    calendar = TradingCalendar({date(2025, 1, 1): "신정", date(2025, 10, 6): "추석"})
+    days = [date(2025, 1, 1) + timedelta(days=i) for i in range(365)]
+    array = np.array(days, dtype="datetime64[D]")
+
+    assert calendar.is_session_array(array).tolist() == [calendar.is_session(d) for d in days]
+    for count in (-7, -1, 0, 1, 5, 20):
+        expected = [calendar.add_sessions(d, count).date() for d in days]
+        assert calendar.add_sessions_array(array, count).astype(date).tolist() == expected
+
+    ends = array + 10
+    assert calendar.sessions_between_array(array, ends).tolist() == [
+        calendar.sessions_between(d, d + timedelta(days=10)) for d in days
+    ]
+
+
+def test_business_days_delegate_to_calendar():
+    """
+    Test: business_days 함수가 KRX 달력 사용
+
+    Given: 2024-12-31(연말 휴장일), 2025-01-01(신정)
+    When: 영업일 판정/이동 (휴장일 포함/미포함)
+    Then: 휴장일 포함 시 01-02로 이동, 미포함 시 주말만 제외
+    """
+    assert not is_business_day(datetime(2024, 12, 31))
+    assert is_business_day(datetime(2024, 12, 31), include_holidays=False)
+    assert add_business_days(datetime(2024, 12, 30), days=1) == datetime(2025, 1, 2)
+    assert add_business_days(datetime(2024, 12, 30), days=1, include_holidays=False) == datetime(2024, 12, 31)
+    assert get_business_days_between(datetime(2024, 12, 27), datetime(2025, 1, 3)) == 3